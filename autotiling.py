@@ -4,7 +4,12 @@ Handles automatic tile variant selection based on neighboring tiles.
 Supports both path-style (roads, walls) and blob-style (dirt, grass) autotiling.
 """
 
-from typing import Optional, Set
+from typing import FrozenSet, Optional, Set
+
+from tile_registry import (
+    AUTOTILE_GROUPS, CONNECT_MATCH, CONNECT_OVERLAY, CONNECT_SETS,
+    connect_set_id, tile_connect_set, tile_id, tile_info,
+)
 
 
 def get_autotile_variant(grid, x: int, y: int, z: int, tile_type: str, connect_to: Optional[Set[str]] = None) -> int:
@@ -25,21 +30,20 @@ def get_autotile_variant(grid, x: int, y: int, z: int, tile_type: str, connect_t
         Variant index (0-16)
     """
     # If no connection set specified, only connect to same tile type
-    if connect_to is None:
-        connect_to = {tile_type}
+    set_id = connect_set_id((tile_type,) if connect_to is None else connect_to)
     
     # Determine if this is a patch (blob) or path (line)
-    is_patch = "overlay_autotile" in tile_type
+    is_patch = tile_info(tile_type).is_overlay
     
     # Check all 8 neighbors
-    n = _is_connected(grid, x, y - 1, z, connect_to)
-    s = _is_connected(grid, x, y + 1, z, connect_to)
-    e = _is_connected(grid, x + 1, y, z, connect_to)
-    w = _is_connected(grid, x - 1, y, z, connect_to)
-    ne = _is_connected(grid, x + 1, y - 1, z, connect_to)
-    nw = _is_connected(grid, x - 1, y - 1, z, connect_to)
-    se = _is_connected(grid, x + 1, y + 1, z, connect_to)
-    sw = _is_connected(grid, x - 1, y + 1, z, connect_to)
+    n = _is_connected(grid, x, y - 1, z, set_id)
+    s = _is_connected(grid, x, y + 1, z, set_id)
+    e = _is_connected(grid, x + 1, y, z, set_id)
+    w = _is_connected(grid, x - 1, y, z, set_id)
+    ne = _is_connected(grid, x + 1, y - 1, z, set_id)
+    nw = _is_connected(grid, x - 1, y - 1, z, set_id)
+    se = _is_connected(grid, x + 1, y + 1, z, set_id)
+    sw = _is_connected(grid, x - 1, y + 1, z, set_id)
     
     # For blobs, use proper blob autotiling
     if is_patch:
@@ -206,70 +210,32 @@ def _get_path_variant(n: bool, s: bool, e: bool, w: bool) -> int:
     return 0
 
 
-def _is_connected(grid, x: int, y: int, z: int, connect_to: Set[str]) -> bool:
-    """Check if tile at position connects to the given tile types."""
+def _is_connected(grid, x: int, y: int, z: int, set_id: int) -> bool:
+    """Check if tile at position connects to the given connection set."""
     if not grid.in_bounds(x, y, z):
         return False
     
     # For overlay tiles, check the overlay layer
     # For regular tiles, check the base tile layer
-    is_checking_overlay = any("overlay_autotile" in ct for ct in connect_to)
-    
-    if is_checking_overlay:
-        # Check overlay layer
+    if CONNECT_OVERLAY[set_id]:
         tile = grid.get_overlay_tile(x, y, z)
         if tile is None:
             return False  # No overlay at this position
+        tid = tile_id(tile)
     else:
-        # Check base tile layer
-        tile = grid.get_tile(x, y, z)
-    
-    # Check if tile matches any in the connection set
-    for connect_type in connect_to:
-        if connect_type in tile:
-            return True
-    
-    return False
-
-
-# Autotile connection groups - defines which tile types connect to each other
-AUTOTILE_GROUPS = {
-    # Roads connect to all road types
-    "street": {"street", "road", "street_autotile"},
-    "road": {"street", "road", "street_autotile"},
-    
-    # Walls connect to walls (autotiled)
-    "finished_wall": {"finished_wall", "finished_wall_autotile"},
-    "wall": {"wall", "finished_wall", "finished_wall_autotile"},
-    "finished_wall_autotile": {"finished_wall", "finished_wall_autotile"},
-    
-    # Bridges connect to bridges
-    "finished_bridge": {"finished_bridge"},
+        tid = grid.tile_ids[z][y * grid.width + x]
     
-    # Floors connect to floors
-    "finished_floor": {"finished_floor"},
-    
-    # Ground overlays connect to same material type
-    "ground_dirt_overlay_autotile": {"ground_dirt_overlay_autotile"},
-    "ground_rubble_overlay_autotile": {"ground_rubble_overlay_autotile"},
-    "ground_overgrown_overlay_autotile": {"ground_overgrown_overlay_autotile"},
-}
+    # Registry precomputes which tile IDs match the set
+    return CONNECT_MATCH[set_id][tid] == 1
 
 
-def get_connection_set(tile_type: str) -> Set[str]:
+def get_connection_set(tile_type: str) -> FrozenSet[str]:
     """Get the set of tile types that this tile connects to for autotiling."""
-    # Check each group
-    for key, group in AUTOTILE_GROUPS.items():
-        if key in tile_type:
-            return group
-    
-    # Default: only connect to same type
-    return {tile_type}
+    # Group lookup is cached per tile ID in the registry (see AUTOTILE_GROUPS)
+    return CONNECT_SETS[tile_connect_set(tile_id(tile_type))]
 
 
 def should_autotile(tile_type: str) -> bool:
     """Check if this tile type should use autotiling."""
-    # Autotile roads, walls, bridges, floors, and ground overlays
-    # Walls use autotiling when they have _autotile suffix
-    autotile_keywords = ["street", "road", "bridge", "path", "overlay_autotile", "_autotile"]
-    return any(keyword in tile_type for keyword in autotile_keywords)
+    # Roads, walls, bridges, floors, and ground overlays (see tile_registry)
+    return tile_info(tile_type).autotiled
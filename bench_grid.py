@@ -0,0 +1,138 @@
+"""Benchmark Grid storage: nested Python lists vs tile ID / env arrays.
+
+Generates a CityGenerator map headlessly, then rebuilds the old nested-list
+layout from it (tiles[z][y][x] strings, walkable[z][y][x] bools and one env
+dict per tile) to compare against the array-backed Grid (dense ground level,
+upper levels in chunks allocated on first write):
+
+- memory: bytes allocated for each layout (tracemalloc)
+- full scan: count one tile type, count walkable tiles and sum interference
+  over the whole map
+
+Usage:
+    python bench_grid.py [repeats]
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+import tracemalloc
+
+import grid as grid_module
+from grid import Grid, ENV_FIELDS
+from city_generator import CityGenerator
+from tile_registry import TILE_IDS, tile_id
+
+
+def _measure(build):
+    """Return (result, bytes allocated while building it)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def _legacy_layout(grid):
+    """Nested lists the way Grid stored them before (strings, bools, dicts)."""
+    tiles = [[[grid.get_tile(x, y, z) for x in range(grid.width)] for y in range(grid.height)]
+             for z in range(grid.depth)]
+    walkable = [[[grid.is_walkable(x, y, z) for x in range(grid.width)] for y in range(grid.height)]
+                for z in range(grid.depth)]
+    env_data = [[[grid.get_env_data(x, y, z) for x in range(grid.width)] for y in range(grid.height)]
+                for z in range(grid.depth)]
+    return tiles, walkable, env_data
+
+
+def _array_layout(grid):
+    """A fresh Grid holding the same map (dense ground, chunked upper levels)."""
+    copy = Grid(grid.width, grid.height, grid.depth)
+    for z in range(grid.depth):
+        tiles = copy.tile_ids[z]
+        for x, y, tile in grid.iter_tiles(z):
+            if tile != "empty":
+                tiles[y * grid.width + x] = tile_id(tile)
+        copy.walkable_flat[z][:] = grid.walkable_flat[z]
+        for field, levels in grid.env.items():
+            default = ENV_FIELDS[field][1]
+            for x0, y0, x1, y1 in grid.iter_chunks(z):
+                for y in range(y0, y1):
+                    for i in range(y * grid.width + x0, y * grid.width + x1):
+                        if levels[z][i] != default:
+                            copy.env[field][z][i] = levels[z][i]
+    return copy
+
+
+def _scan_legacy(tiles, walkable, env_data, tile_type):
+    count = 0
+    open_tiles = 0
+    interference = 0.0
+    for z_tiles, z_walk, z_env in zip(tiles, walkable, env_data):
+        for row_tiles, row_walk, row_env in zip(z_tiles, z_walk, z_env):
+            for tile in row_tiles:
+                if tile == tile_type:
+                    count += 1
+            for walk in row_walk:
+                if walk:
+                    open_tiles += 1
+            for env in row_env:
+                interference += env["interference"]
+    return count, open_tiles, interference
+
+
+def _scan_arrays(grid, tile_type):
+    tid = TILE_IDS.get(tile_type, -1)
+    count = 0
+    interference = 0.0
+    for z in range(grid.depth):
+        if z < grid_module.DENSE_Z_LEVELS and grid.tile_id_block is not None:
+            count += int((grid.tile_id_block[z] == tid).sum())
+            interference += float(grid.env_blocks["interference"][z].sum(dtype=grid_module.np.float64))
+            continue
+        count += grid.tile_ids[z].count(tid)
+        levels = grid.env["interference"][z]
+        for x0, y0, x1, y1 in grid.iter_chunks(z):
+            for y in range(y0, y1):
+                interference += sum(levels[i] for i in range(y * grid.width + x0, y * grid.width + x1))
+    return count, sum(level.count(1) for level in grid.walkable_flat), interference
+
+
+def run(repeats: int = 3) -> None:
+    random.seed(0)
+    grid = Grid()
+    with contextlib.redirect_stdout(io.StringIO()):
+        CityGenerator(grid).generate_city()
+    tile_type = "finished_wall_autotile"
+
+    legacy, legacy_bytes = _measure(lambda: _legacy_layout(grid))
+    _, array_bytes = _measure(lambda: _array_layout(grid))
+
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        legacy_result = _scan_legacy(*legacy, tile_type)
+    legacy_scan = (time.perf_counter() - t0) / repeats
+
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        array_result = _scan_arrays(grid, tile_type)
+    array_scan = (time.perf_counter() - t0) / repeats
+
+    tiles = grid.width * grid.height * grid.depth
+    backend = "numpy" if grid_module.HAS_NUMPY else "array module"
+    print("=" * 60)
+    print(f"GRID STORAGE BENCHMARK: {grid.width}x{grid.height}x{grid.depth} ({tiles} tiles), {backend}")
+    print("=" * 60)
+    print(f"memory     nested lists: {legacy_bytes / 1e6:8.1f} MB  arrays: {array_bytes / 1e6:6.1f} MB  "
+          f"({legacy_bytes / max(array_bytes, 1):.0f}x smaller)")
+    print(f"full scan  nested lists: {legacy_scan * 1000:8.1f} ms  arrays: {array_scan * 1000:6.1f} ms  "
+          f"({legacy_scan / max(array_scan, 1e-9):.0f}x faster)")
+    matches = legacy_result[:2] == array_result[:2] and abs(legacy_result[2] - array_result[2]) < 1e-3
+    print(f"scan results match: {matches} {array_result}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:2]]
+    run(*args)
@@ -0,0 +1,168 @@
+"""Benchmark large-map mode: a LARGE_MAP_SIZE city with 50 colonists.
+
+Switches config to large-map mode before any game module is imported, then
+generates the city the way main.py does (lazily: only the area around spawn
+up front) and runs the headless game tick - the systems main.py runs every
+tick, without rendering - with a starter stockpile and a few walls to build.
+Chunks near colonists are generated as they move, like in the game. Reports:
+
+- startup: city generation time and generation chunks done/pending
+- memory: Grid storage per million tiles, and the process peak RSS
+- tick rate: mean ticks/s, the 99th percentile and slowest tick, and how many
+  ticks went over the 60 ticks/s budget (16.7 ms)
+
+The tick budget assumes numpy is installed: without it env fields for newly
+generated chunks are computed in Python, and the ticks that generate a chunk
+run over budget.
+
+Usage:
+    python bench_large_map.py [ticks] [colonists]
+"""
+
+import config
+
+config.LARGE_MAP = True
+config.GRID_W = config.LARGE_MAP_SIZE
+config.GRID_H = config.LARGE_MAP_SIZE
+
+import contextlib
+import io
+import random
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+import grid as grid_module
+from grid import Grid
+from city_generator import CityGenerator, GEN_CHUNK_SIZE
+
+TICK_BUDGET = 1.0 / 60
+
+
+def _level_bytes(level) -> int:
+    """Bytes held by one per-tile level (dense buffer or allocated chunks)."""
+    if isinstance(level, grid_module._ChunkedLevel):
+        return sum(chunk.itemsize * len(chunk) for chunk in level.chunks if chunk is not None)
+    if hasattr(level, "nbytes"):
+        return level.nbytes
+    return level.itemsize * len(level) if hasattr(level, "itemsize") else len(level)
+
+
+def grid_bytes(grid: Grid) -> int:
+    """Bytes of per-tile storage held by a Grid (tiles, walkability, versions, env)."""
+    total = sum(_level_bytes(level) for level in grid.tile_ids)
+    total += sum(len(level) for level in grid.walkable_flat)
+    total += sum(_level_bytes(level) for level in grid.tile_versions)
+    for levels in grid.env.values():
+        total += sum(_level_bytes(level) for level in levels)
+    total += sum(versions.itemsize * len(versions) for versions in grid.chunk_versions)
+    return total
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_tick(grid, colonists, tick: int, worldgen) -> None:
+    """One game tick, in main.py's order (no rendering, notifications or audio)."""
+    import jobs as jobs_module
+    import zones as zones_module
+    import rooms as rooms_module
+    from animals import update_animals
+    from buildings import update_doors, update_windows, process_crafting_jobs, process_supply_jobs
+    from colonist import update_colonists
+    from crops import tick_crop_growth
+    from items import process_equipment_haul_jobs, process_auto_equip
+    from job_assignment import update_job_assignment
+    from path_scheduler import update_path_scheduler
+    from recreation import spawn_recreation_jobs
+    from resources import update_resource_nodes, process_auto_haul_jobs
+    from time_system import tick_time
+    from timer_wheel import update_timers
+    from training import spawn_training_jobs
+
+    tick_time()
+    grid.game_tick = tick
+    update_timers()
+    if tick % config.LARGE_MAP_GEN_INTERVAL == 0:
+        worldgen.generate_around([(c.x, c.y) for c in colonists])
+    update_path_scheduler(grid, tick)
+    update_colonists(colonists, grid, tick)
+    update_job_assignment(colonists, grid, tick)
+    update_animals(grid, tick)
+    tick_crop_growth(tick)
+    update_resource_nodes(grid)
+    update_doors()
+    update_windows()
+    rooms_module.process_dirty_rooms(grid)
+    jobs_module.update_job_timers()
+    process_auto_haul_jobs(jobs_module, zones_module)
+    process_supply_jobs(jobs_module, zones_module)
+    process_crafting_jobs(jobs_module, zones_module)
+    if tick % 10 == 0:
+        process_equipment_haul_jobs(jobs_module, zones_module)
+        zones_module.process_stockpile_relocation(jobs_module)
+        zones_module.process_filter_mismatch_relocation(jobs_module)
+    if tick % 60 == 0:
+        process_auto_equip(colonists, zones_module, jobs_module)
+        spawn_recreation_jobs(colonists, grid, tick)
+        spawn_training_jobs(colonists, grid, tick)
+
+
+def run(ticks: int = 1800, colonist_count: int = 50) -> None:
+    from animals import spawn_random_animals
+    from buildings import place_wall
+    from colonist import create_colonists
+    from resources import _create_starter_stockpile
+
+    random.seed(0)
+    size = config.LARGE_MAP_SIZE
+    t0 = time.perf_counter()
+    grid = Grid(size, size, config.GRID_Z)
+    with contextlib.redirect_stdout(io.StringIO()):
+        worldgen = CityGenerator(grid)
+        spawn_x, spawn_y = worldgen.generate_city()
+        colonists = create_colonists(colonist_count, spawn_x, spawn_y)
+        _create_starter_stockpile(grid, (spawn_x, spawn_y))
+        spawn_random_animals(grid, count=20)
+        for i in range(12):
+            place_wall(grid, spawn_x + 6 + i, spawn_y + 6, 0)
+    startup = time.perf_counter() - t0
+    chunks_total = ((size + GEN_CHUNK_SIZE - 1) // GEN_CHUNK_SIZE) ** 2
+
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for tick in range(1, ticks + 1):
+            t0 = time.perf_counter()
+            _run_tick(grid, colonists, tick, worldgen)
+            times.append(time.perf_counter() - t0)
+
+    total = sum(times)
+    ranked = sorted(times)
+    p99 = ranked[min(len(ranked) - 1, int(len(ranked) * 0.99))]
+    over = sum(1 for t in times if t > TICK_BUDGET)
+    storage = grid_bytes(grid)
+    plane_millions = size * size / 1e6
+
+    print("=" * 60)
+    print(f"LARGE MAP BENCHMARK: {size}x{size}x{grid.depth}, {colonist_count} colonists, {ticks} ticks")
+    print("=" * 60)
+    print(f"startup    {startup:6.2f} s  chunks generated {chunks_total - len(worldgen.pending_chunks)}"
+          f"/{chunks_total}")
+    print(f"memory     grid {storage / 1e6:6.1f} MB ({storage / 1e6 / plane_millions:.1f} MB per million tiles)  "
+          f"peak RSS {_peak_rss_mb():6.1f} MB")
+    print(f"tick rate  {ticks / total:6.1f} ticks/s  p99 {p99 * 1000:5.1f} ms  slowest {ranked[-1] * 1000:6.1f} ms  "
+          f"over budget {over}/{ticks}")
+    print(f"60 ticks/s sustained: {ticks / total >= 60 and p99 <= TICK_BUDGET}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    run(*args)
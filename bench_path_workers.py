@@ -0,0 +1,77 @@
+"""Benchmark the path worker pool against in-process solving.
+
+Generates a CityGenerator map headlessly, picks random walkable start/goal
+pairs on Z=0 and solves the whole batch in-process, then on a PathWorkerPool
+with 1..N workers (default: one per CPU), reporting throughput and speedup.
+Paths from the pool are checked against the in-process ones.
+
+Usage:
+    python bench_path_workers.py [pairs] [max_workers]
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+from grid import Grid
+from city_generator import CityGenerator
+from pathfinding import find_path
+from path_workers import PathWorkerPool, HAS_WORKER_POOL
+
+
+def _random_walkable(grid, rng):
+    while True:
+        x = rng.randrange(grid.width)
+        y = rng.randrange(grid.height)
+        if grid.is_walkable(x, y, 0):
+            return (x, y, 0)
+
+
+def run(pairs: int = 400, max_workers: int = 0) -> None:
+    max_workers = max_workers or os.cpu_count() or 1
+    random.seed(0)
+    grid = Grid()
+    with contextlib.redirect_stdout(io.StringIO()):
+        CityGenerator(grid).generate_city()
+
+    rng = random.Random(1000)
+    requests = [(_random_walkable(grid, rng), _random_walkable(grid, rng)) for _ in range(pairs)]
+
+    t0 = time.perf_counter()
+    expected = [find_path(grid, start, goal) for start, goal in requests]
+    baseline = time.perf_counter() - t0
+
+    print("=" * 60)
+    print(f"PATH WORKER BENCHMARK: {pairs} searches, {os.cpu_count()} CPUs")
+    print("=" * 60)
+    print(f"in-process: {pairs / baseline:8.1f} searches/s")
+    if not HAS_WORKER_POOL:
+        print("Worker pool unavailable on this platform")
+        return
+
+    for workers in range(1, max_workers + 1):
+        pool = PathWorkerPool(grid, workers)
+        if not pool.enabled:
+            print("Worker pool could not be started")
+            return
+        # Warm up so process start-up isn't timed
+        for future in [pool.submit(*requests[0]) for _ in range(workers)]:
+            future.result()
+
+        t0 = time.perf_counter()
+        futures = [pool.submit(start, goal) for start, goal in requests]
+        paths = [pool.collect(future) for future in futures]
+        elapsed = time.perf_counter() - t0
+        pool.shutdown()
+
+        mismatches = sum(1 for a, b in zip(paths, expected) if a != b)
+        print(f"{workers:>2} worker(s): {pairs / elapsed:8.1f} searches/s  "
+              f"{baseline / elapsed:5.2f}x in-process  mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    run(*args)
@@ -0,0 +1,82 @@
+"""Benchmark A* against Jump Point Search on generated city maps.
+
+Generates CityGenerator maps headlessly, picks random walkable start/goal
+pairs on Z=0 and runs both search modes on each, comparing node expansions
+and wall-clock time. Path costs are checked to match.
+
+Usage:
+    python bench_pathfinding.py [maps] [pairs_per_map]
+"""
+
+import contextlib
+import io
+import random
+import sys
+import time
+
+from grid import Grid
+from city_generator import CityGenerator
+from pathfinding import find_path, octile_distance
+
+
+def _path_cost(start, path):
+    cost = 0.0
+    prev = start
+    for step in path:
+        cost += octile_distance(*prev, *step)
+        prev = step
+    return cost
+
+
+def _random_walkable(grid, rng):
+    while True:
+        x = rng.randrange(grid.width)
+        y = rng.randrange(grid.height)
+        if grid.is_walkable(x, y, 0):
+            return (x, y, 0)
+
+
+def run(maps: int = 3, pairs: int = 40) -> None:
+    totals = {mode: {"expanded": 0, "time": 0.0} for mode in ("astar", "jps")}
+    searches = 0
+    mismatches = 0
+
+    for seed in range(maps):
+        random.seed(seed)
+        grid = Grid()
+        with contextlib.redirect_stdout(io.StringIO()):
+            CityGenerator(grid).generate_city()
+
+        rng = random.Random(1000 + seed)
+        for _ in range(pairs):
+            start = _random_walkable(grid, rng)
+            goal = _random_walkable(grid, rng)
+            costs = {}
+            for mode in ("astar", "jps"):
+                stats = {}
+                t0 = time.perf_counter()
+                path = find_path(grid, start, goal, mode=mode, stats=stats)
+                totals[mode]["time"] += time.perf_counter() - t0
+                totals[mode]["expanded"] += stats.get("expanded", 0)
+                costs[mode] = round(_path_cost(start, path), 6) if path else None
+            if costs["astar"] != costs["jps"]:
+                mismatches += 1
+            searches += 1
+
+    print("=" * 60)
+    print(f"PATHFINDING BENCHMARK: {maps} maps x {pairs} pairs ({searches} searches)")
+    print("=" * 60)
+    for mode in ("astar", "jps"):
+        t = totals[mode]
+        print(f"{mode:>6}: {t['expanded'] / searches:9.1f} expansions/search  "
+              f"{t['time'] * 1000 / searches:7.2f} ms/search")
+    a, j = totals["astar"], totals["jps"]
+    if j["expanded"] and j["time"]:
+        print(f"JPS: {a['expanded'] / j['expanded']:.1f}x fewer expansions, "
+              f"{a['time'] / j['time']:.2f}x wall-clock speedup")
+    print(f"Cost mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    run(*args)
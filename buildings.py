@@ -12,7 +12,8 @@ from typing import Dict, Tuple, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from grid import Grid
 
-from jobs import add_job, remove_job_at
+from jobs import JOB_QUEUE, add_job, remove_job_at
+from timer_wheel import TIMERS
 import resources
 import zones
 
@@ -352,13 +353,18 @@ BUILDING_TYPES = {
 }
 
 # Track door states (open/closed)
-# Key: (x, y, z), Value: {"open": bool, "close_timer": int}
+# Key: (x, y, z), Value: {"open": bool}
+# Auto-close countdowns live on the shared timer wheel (DOOR_CLOSE_TIMER)
 _DOOR_STATES: Dict[Coord3D, dict] = {}
 
 # Track window states (open/closed) - similar to doors but slower
-# Key: (x, y, z), Value: {"open": bool, "close_timer": int}
+# Key: (x, y, z), Value: {"open": bool}
 _WINDOW_STATES: Dict[Coord3D, dict] = {}
 
+# Timer wheel kinds for door/window auto-close (keyed by (x, y, z))
+DOOR_CLOSE_TIMER = "door_close"
+WINDOW_CLOSE_TIMER = "window_close"
+
 # Ticks before door auto-closes after being opened
 DOOR_CLOSE_DELAY = 30
 # Ticks before window auto-closes (longer than doors)
@@ -373,6 +379,13 @@ _CONSTRUCTION_SITES: Dict[Coord3D, dict] = {}
 # Key: (x, y, z), Value: {"platform_dir": (dx, dy), "platform_pos": (px, py), "z": z, "complete": bool}
 _FIRE_ESCAPES: Dict[Coord3D, dict] = {}
 
+# Vertical transition graph built from completed fire escapes (see get_platform_transitions)
+# Key: (px, py, z) platform position, Value: Z-level it links to
+# Rebuilt whenever a fire escape is placed, completed, demolished or loaded;
+# the version lets path caches notice changes in vertical connectivity
+_PLATFORM_TRANSITIONS: Dict[Coord3D, int] = {}
+_TRANSITIONS_VERSION = 0
+
 # Track workstations (Salvager's Bench, etc.)
 # Key: (x, y, z), Value: {"type": str, "reserved": bool, "working": bool, "progress": int, "input_items": {}}
 _WORKSTATIONS: Dict[Coord3D, dict] = {}
@@ -636,6 +649,7 @@ def place_building(grid: Grid, x: int, y: int, building_type: str, z: int = 0) -
         "z": z,
     }
     _CONSTRUCTION_SITES[(x, y, z)] = site
+    mark_site_needs_supply(x, y, z)
     
     # Get size for multi-tile structures
     width, height = building_def.get("size", (1, 1))
@@ -692,7 +706,7 @@ def place_door(grid: Grid, x: int, y: int, z: int = 0) -> bool:
     """Place a door construction site at (x, y, z)."""
     if place_building(grid, x, y, "door", z):
         # Initialize door state as closed
-        _DOOR_STATES[(x, y, z)] = {"open": False, "close_timer": 0}
+        _DOOR_STATES[(x, y, z)] = {"open": False}
         return True
     return False
 
@@ -701,7 +715,7 @@ def place_bar_door(grid: Grid, x: int, y: int, z: int = 0) -> bool:
     """Place a bar door construction site at (x, y, z)."""
     if place_building(grid, x, y, "bar_door", z):
         # Initialize door state as closed
-        _DOOR_STATES[(x, y, z)] = {"open": False, "close_timer": 0}
+        _DOOR_STATES[(x, y, z)] = {"open": False}
         return True
     return False
 
@@ -1063,10 +1077,12 @@ def demolish_tile(grid: Grid, x: int, y: int, z: int = 0) -> bool:
     # Remove door state if it was a door
     if (x, y, z) in _DOOR_STATES:
         del _DOOR_STATES[(x, y, z)]
+        TIMERS.cancel(DOOR_CLOSE_TIMER, (x, y, z))
     
     # Remove window state if it was a window
     if (x, y, z) in _WINDOW_STATES:
         del _WINDOW_STATES[(x, y, z)]
+        TIMERS.cancel(WINDOW_CLOSE_TIMER, (x, y, z))
     
     # Remove fire escape data if applicable
     if (x, y, z) in _FIRE_ESCAPES:
@@ -1081,6 +1097,7 @@ def demolish_tile(grid: Grid, x: int, y: int, z: int = 0) -> bool:
             if grid.get_tile(px, py, z + 1) == "fire_escape_platform":
                 grid.set_tile(px, py, "empty", z=z + 1)
         del _FIRE_ESCAPES[(x, y, z)]
+        _rebuild_platform_transitions()
     
     # Set tile back to empty
     grid.set_tile(x, y, "empty", z=z)
@@ -1184,6 +1201,7 @@ def place_fire_escape(grid: Grid, x: int, y: int, z: int = 0) -> bool:
         "z": z,
     }
     _CONSTRUCTION_SITES[(x, y, z)] = site
+    mark_site_needs_supply(x, y, z)
     
     # Set tile to fire_escape (under construction)
     grid.set_tile(x, y, "fire_escape", z=z)
@@ -1195,6 +1213,7 @@ def place_fire_escape(grid: Grid, x: int, y: int, z: int = 0) -> bool:
         "z": z,
         "complete": False,
     }
+    _rebuild_platform_transitions()
     
     # Create construction job
     from jobs import add_job
@@ -1226,10 +1245,41 @@ def is_fire_escape_complete(x: int, y: int, z: int = 0) -> bool:
     return escape.get("complete", False)
 
 
+def _rebuild_platform_transitions() -> None:
+    """Recompute the vertical transition graph, bumping its version if it changed."""
+    global _PLATFORM_TRANSITIONS, _TRANSITIONS_VERSION
+    platform_transitions = {}
+    for (wx, wy, wz), escape_data in _FIRE_ESCAPES.items():
+        if escape_data.get("complete", False):
+            platform_pos = escape_data.get("platform_pos")
+            if platform_pos:
+                px, py = platform_pos
+                platform_transitions[(px, py, wz)] = wz + 1  # Go up
+                platform_transitions[(px, py, wz + 1)] = wz  # Go down
+    if platform_transitions != _PLATFORM_TRANSITIONS:
+        _PLATFORM_TRANSITIONS = platform_transitions
+        _TRANSITIONS_VERSION += 1
+
+
+def get_platform_transitions() -> Dict[Coord3D, int]:
+    """Get Z-level links for completed fire escapes as {(x, y, z): other_z}.
+    
+    Each fire escape connects its platform at Z with the tile above at Z+1.
+    Returns the prebuilt shared mapping - treat it as read-only.
+    """
+    return _PLATFORM_TRANSITIONS
+
+
+def get_transitions_version() -> int:
+    """Get the version of the transition graph (changes whenever it does)."""
+    return _TRANSITIONS_VERSION
+
+
 def mark_fire_escape_complete(x: int, y: int, z: int = 0) -> None:
     """Mark a fire escape as complete after construction finishes."""
     if (x, y, z) in _FIRE_ESCAPES:
         _FIRE_ESCAPES[(x, y, z)]["complete"] = True
+        _rebuild_platform_transitions()
 
 
 def get_fire_escape_platform(x: int, y: int, z: int = 0) -> Optional[Tuple[int, int]]:
@@ -1319,6 +1369,7 @@ def place_bridge(grid: Grid, x: int, y: int, z: int = 0) -> bool:
         "materials_delivered": {},
         "z": z,
     }
+    mark_site_needs_supply(x, y, z)
     
     # Create construction job
     from jobs import add_job
@@ -1354,7 +1405,7 @@ def open_door(x: int, y: int, z: int = 0) -> None:
     door = _DOOR_STATES.get((x, y, z))
     if door is not None:
         door["open"] = True
-        door["close_timer"] = DOOR_CLOSE_DELAY
+        TIMERS.schedule(DOOR_CLOSE_TIMER, (x, y, z), DOOR_CLOSE_DELAY)
 
 
 def close_door(x: int, y: int, z: int = 0) -> None:
@@ -1362,16 +1413,15 @@ def close_door(x: int, y: int, z: int = 0) -> None:
     door = _DOOR_STATES.get((x, y, z))
     if door is not None:
         door["open"] = False
-        door["close_timer"] = 0
+        TIMERS.cancel(DOOR_CLOSE_TIMER, (x, y, z))
 
 
 def update_doors() -> None:
-    """Update door timers and auto-close doors. Call once per tick."""
-    for (x, y, z), door in _DOOR_STATES.items():
-        if door["open"] and door["close_timer"] > 0:
-            door["close_timer"] -= 1
-            if door["close_timer"] <= 0:
-                door["open"] = False
+    """Auto-close doors whose close timer came due. Call once per tick."""
+    for coord in TIMERS.pop_due(DOOR_CLOSE_TIMER):
+        door = _DOOR_STATES.get(coord)
+        if door is not None:
+            door["open"] = False
 
 
 def get_all_door_states() -> Dict[Coord3D, dict]:
@@ -1383,7 +1433,7 @@ def get_all_door_states() -> Dict[Coord3D, dict]:
 
 def register_window(x: int, y: int, z: int = 0) -> None:
     """Register a new window at (x, y, z). Called when window construction completes."""
-    _WINDOW_STATES[(x, y, z)] = {"open": False, "close_timer": 0}
+    _WINDOW_STATES[(x, y, z)] = {"open": False}
 
 
 def is_window(x: int, y: int, z: int = 0) -> bool:
@@ -1402,7 +1452,7 @@ def open_window(x: int, y: int, z: int = 0) -> None:
     window = _WINDOW_STATES.get((x, y, z))
     if window is not None:
         window["open"] = True
-        window["close_timer"] = WINDOW_CLOSE_DELAY
+        TIMERS.schedule(WINDOW_CLOSE_TIMER, (x, y, z), WINDOW_CLOSE_DELAY)
 
 
 def close_window(x: int, y: int, z: int = 0) -> None:
@@ -1410,16 +1460,15 @@ def close_window(x: int, y: int, z: int = 0) -> None:
     window = _WINDOW_STATES.get((x, y, z))
     if window is not None:
         window["open"] = False
-        window["close_timer"] = 0
+        TIMERS.cancel(WINDOW_CLOSE_TIMER, (x, y, z))
 
 
 def update_windows() -> None:
-    """Update window timers and auto-close windows. Call once per tick."""
-    for (x, y, z), window in _WINDOW_STATES.items():
-        if window["open"] and window["close_timer"] > 0:
-            window["close_timer"] -= 1
-            if window["close_timer"] <= 0:
-                window["open"] = False
+    """Auto-close windows whose close timer came due. Call once per tick."""
+    for coord in TIMERS.pop_due(WINDOW_CLOSE_TIMER):
+        window = _WINDOW_STATES.get(coord)
+        if window is not None:
+            window["open"] = False
 
 
 def get_all_window_states() -> Dict[Coord3D, dict]:
@@ -1434,7 +1483,44 @@ def get_construction_site(x: int, y: int, z: int = 0) -> Optional[dict]:
 
 def remove_construction_site(x: int, y: int, z: int = 0) -> None:
     """Remove construction site when building is complete."""
-    _CONSTRUCTION_SITES.pop((x, y, z), None)
+    if _CONSTRUCTION_SITES.pop((x, y, z), None) is not None:
+        _set_construction_jobs_ready(x, y, z, True)
+        _SUPPLY_DIRTY_SITES.pop((x, y, z), None)
+
+
+def is_construction_ready(x: int, y: int, z: int = 0) -> bool:
+    """Check if a construction site can be built: materials in, stockpile cleared.
+    
+    Uses the site's cached "ready" flag, which deliver_material,
+    clear_stockpile_wait and site removal keep current.
+    """
+    site = get_construction_site(x, y, z)
+    if site is None:
+        return True
+    ready = site.get("ready")
+    if ready is None:
+        ready = _refresh_site_ready(x, y, z)
+    return ready
+
+
+def _refresh_site_ready(x: int, y: int, z: int = 0) -> bool:
+    """Recompute a site's ready flag and push it to its construction jobs."""
+    site = get_construction_site(x, y, z)
+    if site is None:
+        ready = True
+    else:
+        ready = (has_required_materials(x, y, z)
+                 and not site.get("awaiting_stockpile_clear", False))
+        site["ready"] = ready
+    _set_construction_jobs_ready(x, y, z, ready)
+    return ready
+
+
+def _set_construction_jobs_ready(x: int, y: int, z: int, ready: bool) -> None:
+    from jobs import JOB_QUEUE
+    for job in JOB_QUEUE.at(x, y, z):
+        if job.type == "construction":
+            job.ready = ready
 
 
 def is_awaiting_stockpile_clear(x: int, y: int, z: int = 0) -> bool:
@@ -1448,8 +1534,9 @@ def is_awaiting_stockpile_clear(x: int, y: int, z: int = 0) -> bool:
 def clear_stockpile_wait(x: int, y: int, z: int = 0) -> None:
     """Clear the awaiting_stockpile_clear flag after items are relocated."""
     site = get_construction_site(x, y, z)
-    if site is not None:
+    if site is not None and site.get("awaiting_stockpile_clear", False):
         site["awaiting_stockpile_clear"] = False
+        _refresh_site_ready(x, y, z)
 
 
 def has_required_materials(x: int, y: int, z: int = 0) -> bool:
@@ -1504,6 +1591,11 @@ def deliver_material(x: int, y: int, resource_type: str, amount: int, z: int = 0
     
     if actual_delivered > 0:
         site["materials_delivered"][resource_type] = delivered + actual_delivered
+        if actual_delivered == still_need:
+            _refresh_site_ready(x, y, z)
+        else:
+            # Partial delivery - plan a supply run for the rest
+            mark_site_needs_supply(x, y, z)
     
     return actual_delivered
 
@@ -1515,8 +1607,30 @@ def get_all_construction_sites() -> Dict[Coord3D, dict]:
 
 # Track supply jobs that have been created to avoid duplicates
 # Key: (construction_x, construction_y, construction_z, resource_type)
+# Kept current by supply job creation, completion and removal from the
+# job board (_on_job_removed) rather than rediscovered from JOB_QUEUE.
 _PENDING_SUPPLY_JOBS: set = set()
 
+# Sites whose supply needs must be re-planned (ordered set).
+# Filled when a site is created, partially delivered, a supply job for it
+# ends, or stock of a resource it's waiting on shows up.
+_SUPPLY_DIRTY_SITES: Dict[Coord3D, None] = {}
+
+# Sites that found no stockpile with a resource: resource -> {site: None},
+# plus the zones stock version seen when they were parked
+_SUPPLY_WAITING: Dict[str, Dict[Coord3D, None]] = {}
+_SUPPLY_WAITING_VERSIONS: Dict[str, int] = {}
+
+# Parked sites are also re-planned after this many ticks, in case the
+# stock was there but out of reach (timer wheel kind SUPPLY_RETRY_TIMER)
+SUPPLY_RETRY_DELAY = 120
+SUPPLY_RETRY_TIMER = "supply_retry"
+
+
+def mark_site_needs_supply(x: int, y: int, z: int = 0) -> None:
+    """Queue a construction site for supply planning on the next pass."""
+    _SUPPLY_DIRTY_SITES[(x, y, z)] = None
+
 
 def mark_supply_job_created(dest_x: int, dest_y: int, dest_z: int, resource_type: str) -> None:
     """Mark that a supply job has been created for this site/resource."""
@@ -1524,8 +1638,29 @@ def mark_supply_job_created(dest_x: int, dest_y: int, dest_z: int, resource_type
 
 
 def mark_supply_job_completed(dest_x: int, dest_y: int, dest_z: int, resource_type: str) -> None:
-    """Mark that a supply job has been completed."""
-    _PENDING_SUPPLY_JOBS.discard((dest_x, dest_y, dest_z, resource_type))
+    """Mark that a supply job has been completed (or cancelled).
+    
+    The site is re-planned in case it still needs materials.
+    """
+    key = (dest_x, dest_y, dest_z, resource_type)
+    if key in _PENDING_SUPPLY_JOBS:
+        _PENDING_SUPPLY_JOBS.discard(key)
+        if (dest_x, dest_y, dest_z) in _CONSTRUCTION_SITES:
+            mark_site_needs_supply(dest_x, dest_y, dest_z)
+
+
+def _on_job_removed(job) -> None:
+    """Job board listener: release pending flags of supply jobs that end."""
+    if job.type != "supply":
+        return
+    if job.delivery_queue:
+        for site_x, site_y, site_z, _ in job.delivery_queue:
+            mark_supply_job_completed(site_x, site_y, site_z, job.resource_type)
+    elif job.dest_x is not None and job.dest_y is not None:
+        mark_supply_job_completed(job.dest_x, job.dest_y, job.dest_z, job.resource_type)
+
+
+JOB_QUEUE.add_remove_listener(_on_job_removed)
 
 
 def has_pending_supply_job(dest_x: int, dest_y: int, dest_z: int, resource_type: str) -> bool:
@@ -1549,22 +1684,28 @@ def debug_supply_status() -> None:
 def process_supply_jobs(jobs_module, zones_module) -> int:
     """Create batch supply jobs for construction sites that need materials.
     
-    Called each tick from main loop.
+    Called each tick from main loop, but only re-plans sites in
+    _SUPPLY_DIRTY_SITES (see mark_site_needs_supply).
     Batches multiple construction sites needing the same resource into one job.
     A colonist will pick up a stack and deliver to multiple sites in sequence.
     
     Returns number of jobs created.
     """
-    # First, clean up stale pending flags for jobs that no longer exist
-    _cleanup_stale_pending_jobs(jobs_module)
+    _wake_waiting_sites(zones_module)
+    if not _SUPPLY_DIRTY_SITES:
+        return 0
     
+    dirty = list(_SUPPLY_DIRTY_SITES)
+    _SUPPLY_DIRTY_SITES.clear()
     jobs_created = 0
     
     # Group sites by resource type and Z-level for batching
     # Key: (resource_type, z_level), Value: list of (x, y, z, amount_needed)
     sites_by_resource: dict[tuple[str, int], list[tuple[int, int, int, int]]] = {}
     
-    for (x, y, z), site in _CONSTRUCTION_SITES.items():
+    for (x, y, z) in dirty:
+        if (x, y, z) not in _CONSTRUCTION_SITES:
+            continue
         missing = get_missing_materials(x, y, z)
         
         for resource_type, amount_needed in missing.items():
@@ -1584,9 +1725,10 @@ def process_supply_jobs(jobs_module, zones_module) -> int:
         if not sites:
             continue
         
-        # Find stockpile with this resource (prefer same Z-level)
-        source = zones_module.find_stockpile_with_resource(resource_type, z=z_level)
+        # Find the stockpile with this resource nearest the sites on foot
+        source = zones_module.find_stockpile_with_resource(resource_type, z=z_level, from_pos=sites[0][:3])
         if source is None:
+            _park_waiting_sites(zones_module, resource_type, sites)
             continue
         
         source_x, source_y, source_z = source
@@ -1658,26 +1800,28 @@ def _create_batch_supply_job(
         mark_supply_job_created(site_x, site_y, site_z, resource_type)
 
 
-def _cleanup_stale_pending_jobs(jobs_module) -> None:
-    """Remove pending flags for supply jobs that no longer exist in the queue."""
-    # Build set of actual supply jobs in queue (including all sites in delivery_queue)
-    actual_supply_jobs = set()
-    for job in jobs_module.JOB_QUEUE:
-        if job.type == "supply":
-            # Check delivery_queue for batch jobs
-            if job.delivery_queue:
-                for site_x, site_y, site_z, _ in job.delivery_queue:
-                    actual_supply_jobs.add((site_x, site_y, site_z, job.resource_type))
-            elif job.dest_x is not None and job.dest_y is not None:
-                # Legacy single-destination job
-                actual_supply_jobs.add((job.dest_x, job.dest_y, job.dest_z, job.resource_type))
-    
-    # Find stale pending flags
-    stale = _PENDING_SUPPLY_JOBS - actual_supply_jobs
-    
-    # Remove stale flags
-    for key in stale:
-        _PENDING_SUPPLY_JOBS.discard(key)
+def _park_waiting_sites(zones_module, resource_type: str,
+                        sites: list[tuple[int, int, int, int]]) -> None:
+    """Park sites that found no stock until it shows up (or the retry timer fires)."""
+    waiting = _SUPPLY_WAITING.setdefault(resource_type, {})
+    _SUPPLY_WAITING_VERSIONS[resource_type] = zones_module.get_stock_version(resource_type)
+    for site_x, site_y, site_z, _ in sites:
+        coord = (site_x, site_y, site_z)
+        waiting[coord] = None
+        if not TIMERS.is_scheduled(SUPPLY_RETRY_TIMER, coord):
+            TIMERS.schedule(SUPPLY_RETRY_TIMER, coord, SUPPLY_RETRY_DELAY)
+
+
+def _wake_waiting_sites(zones_module) -> None:
+    """Move parked sites back to the dirty set when their resource was stocked."""
+    for resource_type in list(_SUPPLY_WAITING):
+        version = zones_module.get_stock_version(resource_type)
+        if version != _SUPPLY_WAITING_VERSIONS.get(resource_type):
+            _SUPPLY_DIRTY_SITES.update(_SUPPLY_WAITING.pop(resource_type))
+            _SUPPLY_WAITING_VERSIONS.pop(resource_type, None)
+    for coord in TIMERS.pop_due(SUPPLY_RETRY_TIMER):
+        if coord in _CONSTRUCTION_SITES:
+            _SUPPLY_DIRTY_SITES[coord] = None
 
 
 # ============================================================================
@@ -1836,9 +1980,8 @@ def process_crafting_jobs(jobs_module, zones_module) -> int:
 def _cleanup_stale_crafting_jobs(jobs_module) -> None:
     """Remove pending flags for crafting jobs that no longer exist."""
     actual_crafting_jobs = set()
-    for job in jobs_module.JOB_QUEUE:
-        if job.type == "crafting":
-            actual_crafting_jobs.add((job.x, job.y, job.z))
+    for job in jobs_module.get_jobs_by_type("crafting"):
+        actual_crafting_jobs.add((job.x, job.y, job.z))
     
     stale = _PENDING_CRAFTING_JOBS - actual_crafting_jobs
     for key in stale:
@@ -1876,7 +2019,7 @@ def get_save_state() -> dict:
         key = f"{coord[0]},{coord[1]},{coord[2]}"
         doors_data[key] = {
             "open": bool(door.get("open", False)),
-            "close_timer": int(door.get("close_timer", 0)),
+            "close_timer": TIMERS.remaining(DOOR_CLOSE_TIMER, coord),
         }
 
     windows_data = {}
@@ -1884,7 +2027,7 @@ def get_save_state() -> dict:
         key = f"{coord[0]},{coord[1]},{coord[2]}"
         windows_data[key] = {
             "open": bool(window.get("open", False)),
-            "close_timer": int(window.get("close_timer", 0)),
+            "close_timer": TIMERS.remaining(WINDOW_CLOSE_TIMER, coord),
         }
     
     # Fire escapes
@@ -1916,8 +2059,14 @@ def load_save_state(state: dict):
     _WORKSTATIONS.clear()
     _DOOR_STATES.clear()
     _WINDOW_STATES.clear()
+    TIMERS.clear(DOOR_CLOSE_TIMER)
+    TIMERS.clear(WINDOW_CLOSE_TIMER)
     _FIRE_ESCAPES.clear()
     _PENDING_SUPPLY_JOBS.clear()
+    _SUPPLY_DIRTY_SITES.clear()
+    _SUPPLY_WAITING.clear()
+    _SUPPLY_WAITING_VERSIONS.clear()
+    TIMERS.clear(SUPPLY_RETRY_TIMER)
     _PENDING_CRAFTING_JOBS.clear()
     
     # Restore construction sites
@@ -1929,6 +2078,7 @@ def load_save_state(state: dict):
             "materials_delivered": site_data.get("materials_delivered", {}),
             "work_progress": site_data.get("work_progress", 0),
         }
+        mark_site_needs_supply(*coord)
     
     # Restore workstations
     for key, ws_data in state.get("workstations", {}).items():
@@ -1945,19 +2095,19 @@ def load_save_state(state: dict):
     for key, door_data in state.get("doors", {}).items():
         parts = key.split(",")
         coord = (int(parts[0]), int(parts[1]), int(parts[2]))
-        _DOOR_STATES[coord] = {
-            "open": bool(door_data.get("open", False)),
-            "close_timer": int(door_data.get("close_timer", door_data.get("timer", 0))),
-        }
+        _DOOR_STATES[coord] = {"open": bool(door_data.get("open", False))}
+        close_timer = int(door_data.get("close_timer", door_data.get("timer", 0)))
+        if _DOOR_STATES[coord]["open"] and close_timer > 0:
+            TIMERS.schedule(DOOR_CLOSE_TIMER, coord, close_timer)
     
     # Restore windows
     for key, window_data in state.get("windows", {}).items():
         parts = key.split(",")
         coord = (int(parts[0]), int(parts[1]), int(parts[2]))
-        _WINDOW_STATES[coord] = {
-            "open": bool(window_data.get("open", False)),
-            "close_timer": int(window_data.get("close_timer", window_data.get("timer", 0))),
-        }
+        _WINDOW_STATES[coord] = {"open": bool(window_data.get("open", False))}
+        close_timer = int(window_data.get("close_timer", window_data.get("timer", 0)))
+        if _WINDOW_STATES[coord]["open"] and close_timer > 0:
+            TIMERS.schedule(WINDOW_CLOSE_TIMER, coord, close_timer)
     
     # Restore fire escapes
     for key, escape_data in state.get("fire_escapes", {}).items():
@@ -1969,3 +2119,4 @@ def load_save_state(state: dict):
             "z": escape_data.get("z", coord[2]),
             "complete": escape_data.get("complete", False),
         }
+    _rebuild_platform_transitions()
@@ -10,7 +10,11 @@ Generates a realistic ruined cyberpunk city with:
 
 import random
 from typing import List, Tuple, Set, Dict, Optional
-from config import GRID_W, GRID_H
+from config import LARGE_MAP, LARGE_MAP_GEN_RADIUS
+
+# Lazy generation (large maps): the city is populated in GEN_CHUNK_SIZE x
+# GEN_CHUNK_SIZE areas as they are first needed, see CityGenerator.ensure_generated
+GEN_CHUNK_SIZE = 16
 
 
 class RoadNetwork:
@@ -359,17 +363,29 @@ class RoadNetwork:
 class CityGenerator:
     """Main city generation coordinator."""
     
-    def __init__(self, grid):
+    def __init__(self, grid, lazy: Optional[bool] = None):
         self.grid = grid
-        self.road_network = RoadNetwork(GRID_W, GRID_H)
+        self.road_network = RoadNetwork(grid.width, grid.height)
         self.buildings: List[Dict] = []
         self.landmarks: List[Dict] = []
         
+        # Lazy mode (default in large-map mode) lays out roads and blocks for the
+        # whole map but only populates the area around spawn up front. Blocks and
+        # road tiles still to place wait here per generation chunk: (cx, cy) -> (blocks, roads)
+        self.lazy = LARGE_MAP if lazy is None else lazy
+        self.pending_chunks: Dict[Tuple[int, int], Tuple[List[Dict], List[Tuple[int, int]]]] = {}
+        
     def generate_city(self) -> Tuple[int, int]:
         """Generate a complete city with curves and alleys.
         
         Returns (spawn_x, spawn_y) for colonist placement.
         """
+        # Tile callbacks and exit counts run once per tile when generation ends
+        with self.grid.batch():
+            return self._generate_city()
+    
+    def _generate_city(self) -> Tuple[int, int]:
+        """Generation steps for generate_city (runs inside a grid batch)."""
         print("[CityGen] Generating procedural city...")
         
         # Step 1: Generate road network (FEWER roads = BIGGER blocks = BIGGER buildings)
@@ -389,19 +405,143 @@ class CityGenerator:
         blocks = self.road_network.get_city_blocks()
         print(f"[CityGen] Identified {len(blocks)} city blocks")
         
-        # Step 5: Fill empty spaces with ground tiles based on zone
-        print("[CityGen] Placing base layer ground tiles...")
-        ground_tiles_placed = self._place_ground_layer(blocks)
+        # Step 5: Find spawn location (near center, on a road)
+        spawn_x, spawn_y = self._find_spawn_location()
+        
+        # Steps 6-10: Ground, roads, buildings, landmarks and resources
+        if self.lazy:
+            self._queue_chunks(blocks)
+            radius = LARGE_MAP_GEN_RADIUS
+            chunks = self.ensure_generated(spawn_x - radius, spawn_y - radius,
+                                           spawn_x + radius + 1, spawn_y + radius + 1)
+        else:
+            building_count, wood_count, mineral_count, food_count, scrap_count = self._populate(
+                blocks, self.road_network.roads, (0, 0, self.grid.width, self.grid.height)
+            )
         
-        # Step 6: Place roads on grid (autotiling will handle corners/curves)
-        # Roads go OVER ground tiles
-        print(f"[CityGen] Placing {len(self.road_network.roads)} road tiles...")
+        print(f"[CityGen] City generation complete!")
+        print(f"[CityGen]   Roads: {len(self.road_network.roads)} tiles")
+        print(f"[CityGen]   Blocks: {len(blocks)}")
+        if self.lazy:
+            print(f"[CityGen]   Chunks: {chunks} generated around spawn, {len(self.pending_chunks)} left for later")
+        else:
+            print(f"[CityGen]   Buildings: {building_count}")
+        print(f"[CityGen]   Curves & Alleys: Added for organic layout")
+        if not self.lazy:
+            print(f"[CityGen]   Resources: {wood_count} wood, {mineral_count} mineral, {food_count} food, {scrap_count} scrap")
+        print(f"[CityGen]   Spawn: ({spawn_x}, {spawn_y})")
+        
+        return spawn_x, spawn_y
+    
+    # --- Lazy generation (large maps) ---
+    
+    def _queue_chunks(self, blocks: List[Dict]):
+        """Bucket blocks and road tiles by generation chunk for ensure_generated.
+        
+        A block belongs to the chunk holding its top-left tile and is generated
+        whole with it. Landmark blocks are picked for the whole map up front.
+        """
+        if len(blocks) >= 5:
+            for block in random.sample(blocks, min(3, len(blocks) // 10)):
+                block["landmark"] = random.choice(["plaza", "park", "ruins"])
+        
+        chunks_x = (self.grid.width + GEN_CHUNK_SIZE - 1) // GEN_CHUNK_SIZE
+        chunks_y = (self.grid.height + GEN_CHUNK_SIZE - 1) // GEN_CHUNK_SIZE
+        for cy in range(chunks_y):
+            for cx in range(chunks_x):
+                self.pending_chunks[(cx, cy)] = ([], [])
+        for block in blocks:
+            key = (block["x"] // GEN_CHUNK_SIZE, block["y"] // GEN_CHUNK_SIZE)
+            if key in self.pending_chunks:
+                self.pending_chunks[key][0].append(block)
         for x, y in self.road_network.roads:
+            if self.grid.in_bounds(x, y, 0):
+                self.pending_chunks[(x // GEN_CHUNK_SIZE, y // GEN_CHUNK_SIZE)][1].append((x, y))
+    
+    def ensure_generated(self, x0: int, y0: int, x1: int, y1: int,
+                         max_chunks: Optional[int] = None) -> int:
+        """Generate the pending chunks overlapping tiles [x0, x1) x [y0, y1).
+        
+        Chunks nearest the middle of the area go first; max_chunks caps how
+        many are generated this call (the rest stay pending). Returns the
+        number of chunks generated.
+        """
+        mid = ((x0 + x1) / 2, (y0 + y1) / 2)
+        keys = self._pending_keys(x0, y0, x1, y1)
+        keys.sort(key=lambda key: self._chunk_distance(key, *mid))
+        return self._generate_chunks(keys[:max_chunks] if max_chunks is not None else keys)
+    
+    def generate_around(self, positions: List[Tuple[int, int]], radius: int = LARGE_MAP_GEN_RADIUS,
+                        max_chunks: int = 1) -> int:
+        """Generate up to max_chunks pending chunks within radius tiles of any position.
+        
+        Meant to be called every few ticks with colonist positions so the city
+        is in place before anyone walks into it. Returns chunks generated.
+        """
+        if not self.pending_chunks:
+            return 0
+        nearest: Dict[Tuple[int, int], float] = {}
+        for x, y in positions:
+            for key in self._pending_keys(x - radius, y - radius, x + radius + 1, y + radius + 1):
+                distance = self._chunk_distance(key, x, y)
+                if distance < nearest.get(key, float("inf")):
+                    nearest[key] = distance
+        keys = sorted(nearest, key=nearest.get)
+        return self._generate_chunks(keys[:max_chunks])
+    
+    def _pending_keys(self, x0: int, y0: int, x1: int, y1: int) -> List[Tuple[int, int]]:
+        """Pending chunks overlapping tiles [x0, x1) x [y0, y1) (clipped to the map)."""
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, self.grid.width), min(y1, self.grid.height)
+        if not self.pending_chunks or x0 >= x1 or y0 >= y1:
+            return []
+        return [
+            (cx, cy)
+            for cy in range(y0 // GEN_CHUNK_SIZE, (y1 - 1) // GEN_CHUNK_SIZE + 1)
+            for cx in range(x0 // GEN_CHUNK_SIZE, (x1 - 1) // GEN_CHUNK_SIZE + 1)
+            if (cx, cy) in self.pending_chunks
+        ]
+    
+    def _chunk_distance(self, key: Tuple[int, int], x: float, y: float) -> float:
+        """Squared distance from (x, y) to the middle of a chunk."""
+        dx = (key[0] + 0.5) * GEN_CHUNK_SIZE - x
+        dy = (key[1] + 0.5) * GEN_CHUNK_SIZE - y
+        return dx * dx + dy * dy
+    
+    def _generate_chunks(self, keys: List[Tuple[int, int]]) -> int:
+        """Populate pending chunks, one grid batch each. Returns how many."""
+        for cx, cy in keys:
+            blocks, roads = self.pending_chunks.pop((cx, cy))
+            area = (cx * GEN_CHUNK_SIZE, cy * GEN_CHUNK_SIZE,
+                    min((cx + 1) * GEN_CHUNK_SIZE, self.grid.width),
+                    min((cy + 1) * GEN_CHUNK_SIZE, self.grid.height))
+            with self.grid.batch():
+                self._populate(blocks, roads, area, verbose=False)
+        return len(keys)
+    
+    def _populate(self, blocks: List[Dict], roads, area: Tuple[int, int, int, int],
+                  verbose: bool = True) -> Tuple[int, int, int, int, int]:
+        """Place ground, roads, buildings, landmarks and resources for some blocks.
+        
+        area (x0, y0, x1, y1) bounds the tiles outside blocks that get ground.
+        Returns (buildings, wood, mineral, food, scrap).
+        """
+        # Step 6: Fill empty spaces with ground tiles based on zone
+        if verbose:
+            print("[CityGen] Placing base layer ground tiles...")
+        ground_tiles_placed = self._place_ground_layer(blocks, area, verbose)
+        
+        # Step 7: Place roads on grid (autotiling will handle corners/curves)
+        # Roads go OVER ground tiles
+        if verbose:
+            print(f"[CityGen] Placing {len(roads)} road tiles...")
+        for x, y in roads:
             if self.grid.in_bounds(x, y, 0):
                 self.grid.set_tile(x, y, "street", z=0)
         
-        # Step 6: Place buildings in blocks - dense placement with new tile system
-        print("[CityGen] Placing buildings...")
+        # Step 8: Place buildings in blocks - dense placement with new tile system
+        if verbose:
+            print("[CityGen] Placing buildings...")
         building_count = 0
         
         for block in blocks:
@@ -429,30 +569,28 @@ class CityGenerator:
             if self._place_building_new_system(bx, by, bldg_width, bldg_height):
                 building_count += 1
         
-        # Step 7: Add landmarks (plazas, parks, major structures)
-        print("[CityGen] Adding landmarks...")
-        self._add_landmarks(blocks)
+        # Step 9: Add landmarks (plazas, parks, major structures)
+        if verbose:
+            print("[CityGen] Adding landmarks...")
+        if self.lazy:
+            for block in blocks:
+                if "landmark" in block:
+                    self._build_landmark(block, block["landmark"])
+        else:
+            self._add_landmarks(blocks)
         
-        # Step 8: Spawn resources throughout city (zone-based intelligent placement)
-        print("[CityGen] Spawning resources (zone-based)...")
+        # Step 10: Spawn resources throughout city (zone-based intelligent placement)
+        if verbose:
+            print("[CityGen] Spawning resources (zone-based)...")
         wood_count, mineral_count, food_count, scrap_count = self._spawn_resources_intelligent(blocks)
         
-        # Step 9: Find spawn location (near center, on a road)
-        spawn_x, spawn_y = self._find_spawn_location()
-        
-        print(f"[CityGen] City generation complete!")
-        print(f"[CityGen]   Roads: {len(self.road_network.roads)} tiles")
-        print(f"[CityGen]   Blocks: {len(blocks)}")
-        print(f"[CityGen]   Buildings: {building_count}")
-        print(f"[CityGen]   Curves & Alleys: Added for organic layout")
-        print(f"[CityGen]   Resources: {wood_count} wood, {mineral_count} mineral, {food_count} food, {scrap_count} scrap")
-        print(f"[CityGen]   Spawn: ({spawn_x}, {spawn_y})")
-        
-        return spawn_x, spawn_y
+        return building_count, wood_count, mineral_count, food_count, scrap_count
     
-    def _place_ground_layer(self, blocks: List[Dict]) -> int:
+    def _place_ground_layer(self, blocks: List[Dict], area: Tuple[int, int, int, int],
+                            verbose: bool = True) -> int:
         """Fill empty spaces with ground tiles based on zone type.
         
+        Tiles outside blocks are filled within area (x0, y0, x1, y1).
         Returns number of ground tiles placed.
         """
         tiles_placed = 0
@@ -496,8 +634,9 @@ class CityGenerator:
                     tiles_placed += 1
         
         # Fill any remaining empty tiles outside blocks
-        for x in range(self.grid.width):
-            for y in range(self.grid.height):
+        x0, y0, x1, y1 = area
+        for x in range(x0, x1):
+            for y in range(y0, y1):
                 if not self.grid.in_bounds(x, y, 0):
                     continue
                 
@@ -508,10 +647,12 @@ class CityGenerator:
                     tiles_placed += 1
         
         # Generate zone-aware organic dirt patches
-        print("[CityGen] Generating zone-aware dirt patches...")
+        if verbose:
+            print("[CityGen] Generating zone-aware dirt patches...")
         dirt_count = self._place_dirt_intelligent(blocks)
         
-        print(f"[CityGen] Placed {dirt_count} dirt overlay tiles (zone-aware)")
+        if verbose:
+            print(f"[CityGen] Placed {dirt_count} dirt overlay tiles (zone-aware)")
         
         return tiles_placed
     
@@ -768,29 +909,32 @@ class CityGenerator:
         
         for block in landmark_blocks:
             landmark_type = random.choice(["plaza", "park", "ruins"])
-            
-            if landmark_type == "plaza":
-                # Open paved area
-                for dx in range(block["width"]):
-                    for dy in range(block["height"]):
-                        x = block["x"] + dx
-                        y = block["y"] + dy
-                        if self.grid.in_bounds(x, y, 0):
-                            self.grid.set_tile(x, y, "finished_floor", z=0)
-            
-            elif landmark_type == "park":
-                # Green space with trees
-                # TODO: Add vegetation
-                pass
-            
-            elif landmark_type == "ruins":
-                # Heavily damaged area with debris
-                for dx in range(block["width"]):
-                    for dy in range(block["height"]):
-                        x = block["x"] + dx
-                        y = block["y"] + dy
-                        if self.grid.in_bounds(x, y, 0) and random.random() < 0.3:
-                            self.grid.set_tile(x, y, "debris", z=0)
+            self._build_landmark(block, landmark_type)
+    
+    def _build_landmark(self, block: Dict, landmark_type: str):
+        """Turn one block into a plaza, park or ruins landmark."""
+        if landmark_type == "plaza":
+            # Open paved area
+            for dx in range(block["width"]):
+                for dy in range(block["height"]):
+                    x = block["x"] + dx
+                    y = block["y"] + dy
+                    if self.grid.in_bounds(x, y, 0):
+                        self.grid.set_tile(x, y, "finished_floor", z=0)
+        
+        elif landmark_type == "park":
+            # Green space with trees
+            # TODO: Add vegetation
+            pass
+        
+        elif landmark_type == "ruins":
+            # Heavily damaged area with debris
+            for dx in range(block["width"]):
+                for dy in range(block["height"]):
+                    x = block["x"] + dx
+                    y = block["y"] + dy
+                    if self.grid.in_bounds(x, y, 0) and random.random() < 0.3:
+                        self.grid.set_tile(x, y, "debris", z=0)
     
     def _OLD_spawn_resources(self, blocks: List[Dict]) -> Dict[str, int]:
         """Spawn harvestable resources throughout the city.
@@ -930,8 +1074,8 @@ class CityGenerator:
     
     def _find_spawn_location(self) -> Tuple[int, int]:
         """Find a good spawn location near center on a road."""
-        center_x = GRID_W // 2
-        center_y = GRID_H // 2
+        center_x = self.grid.width // 2
+        center_y = self.grid.height // 2
         
         # Find nearest road to center
         best_dist = float('inf')
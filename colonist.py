@@ -25,12 +25,19 @@ from config import (
     COLOR_COLONIST_ETHER,
 )
 from grid import Grid
-from jobs import Job, request_job, remove_job, get_next_available_job, get_all_available_jobs, remove_designation, should_take_job, get_job_priority, is_job_in_queue
+from jobs import Job, request_job, remove_job, get_next_available_job, get_nearby_available_jobs, get_open_job_categories, remove_designation, should_take_job, get_job_priority, is_job_in_queue
 from resources import complete_gathering_job, set_node_state, NodeState, harvest_tick, pickup_resource_item, add_to_stockpile, spend_from_stockpile
 import buildings
 from buildings import deliver_material, mark_supply_job_completed, has_required_materials, is_door, is_door_open, open_door, is_window, is_window_open, open_window, register_window
 import zones
 from rooms import mark_rooms_dirty
+from pathfinding import find_path, get_transition_cache
+from path_hierarchy import get_path_hierarchy, HIERARCHY_MIN_DISTANCE, HIERARCHY_SEGMENT_MAX_NODES
+from path_regions import get_region_index, is_reachable, nearest_reachable
+from path_cache import get_path_cache
+from flow_fields import get_flow_fields
+from path_scheduler import get_path_scheduler, PathPending, PATH_PRIORITY_NORMAL, PATH_PRIORITY_URGENT
+from job_assignment import is_job_assignment_active
 
 
 # Colonist states
@@ -649,10 +656,21 @@ class Colonist:
         self.stuck_timer = 0
         self.max_stuck_time = 30  # ticks before giving up on current path
         
-        # Path cache - store recently calculated paths to avoid redundant BFS
-        # Key: (target_x, target_y, target_z), Value: (path, tick_calculated)
-        self._path_cache: dict[tuple[int, int, int], tuple[list[tuple[int, int, int]], int]] = {}
-        self._path_cache_max_age = 300  # Cache paths for 5 seconds (300 ticks)
+        # Goal of the most recent _calculate_path call. Long trips follow one
+        # hierarchical segment at a time, so current_path[-1] is not always the goal.
+        self._path_goal: tuple[int, int, int] | None = None
+        
+        # Grid.walk_version the current path was planned against. While the grid's
+        # version still matches, the path needs no re-check at all.
+        self._path_version = 0
+        
+        # Time-sliced searches (see path_scheduler.py). Inside update() a search the
+        # scheduler can't finish this tick parks the colonist in the "planning" state;
+        # once it's done the interrupted state is re-run and picks up the result.
+        self._defer_paths = False
+        self._path_request = None
+        self._path_results: dict = {}
+        self._planning_resume_state: str | None = None
         
         # Recovery state - brief pause after interruption before returning to idle
         self.recovery_timer = 0
@@ -1656,8 +1674,11 @@ class Colonist:
         
         Also updates colonist affinities based on experienced environment.
         """
-        # Get environmental data from current tile
-        env_data = grid.get_env_data(self.x, self.y, self.z).copy()
+        # Read the current tile straight from the env field arrays
+        grid.update_env_fields()
+        env = grid.env
+        z = self.z
+        i = self.y * grid.width + self.x
         
         # Count nearby colonists (radius 2)
         nearby_count = self._count_nearby_colonists(all_colonists or [])
@@ -1667,13 +1688,13 @@ class Colonist:
             "tick": game_tick,
             "x": self.x,
             "y": self.y,
-            "z": self.z,
-            "interference": env_data.get("interference", 0.0),
-            "echo": env_data.get("echo", 0.0),
-            "integrity": env_data.get("integrity", 1.0),
-            "is_outside": env_data.get("is_outside", True),
-            "room_id": env_data.get("room_id"),
-            "exit_count": env_data.get("exit_count", 0),
+            "z": z,
+            "interference": float(env["interference"][z][i]),
+            "echo": float(env["echo"][z][i]),
+            "integrity": float(env["integrity"][z][i]),
+            "is_outside": bool(env["is_outside"][z][i]),
+            "room_id": int(env["room_id"][z][i]) or None,
+            "exit_count": int(env["exit_count"][z][i]),
             "nearby_colonists": nearby_count,
         }
         
@@ -2390,35 +2411,39 @@ class Colonist:
         """Calculate bonus based on job tile's environment matching preferences."""
         bonus = 0.0
         
-        # Get environment data for the job tile
-        env_data = grid.get_env_data(x, y, z)
+        # Read the job tile straight from the env field arrays
+        if not grid.in_bounds(x, y, z):
+            return bonus
+        grid.update_env_fields()
+        env = grid.env
+        i = y * grid.width + x
         
         # Check each preference against the tile's environment
         # Interference
-        tile_interference = env_data.get('interference', 0.0)
+        tile_interference = float(env["interference"][z][i])
         if abs(tile_interference) > 0.1:
             pref = self.preferences.get("likes_interference", 0.0)
             bonus += pref * tile_interference * 0.02  # Small effect
         
         # Echo
-        tile_echo = env_data.get('echo', 0.0)
+        tile_echo = float(env["echo"][z][i])
         if abs(tile_echo) > 0.1:
             pref = self.preferences.get("likes_echo", 0.0)
             bonus += pref * tile_echo * 0.02
         
         # Pressure
-        tile_pressure = env_data.get('pressure', 0.0)
+        tile_pressure = float(env["pressure"][z][i])
         if abs(tile_pressure) > 0.1:
             pref = self.preferences.get("likes_pressure", 0.0)
             bonus += pref * tile_pressure * 0.02
         
         # Integrity
-        tile_integrity = env_data.get('integrity', 1.0)
+        tile_integrity = float(env["integrity"][z][i])
         pref = self.preferences.get("likes_integrity", 0.0)
         bonus += pref * (tile_integrity - 0.5) * 0.04  # Center around 0.5
         
         # Outside
-        is_outside = 1.0 if env_data.get('is_outside', True) else 0.0
+        is_outside = 1.0 if env["is_outside"][z][i] else 0.0
         pref = self.preferences.get("likes_outside", 0.0)
         bonus += pref * (is_outside - 0.5) * 0.04  # Center around 0.5
         
@@ -2522,6 +2547,58 @@ class Colonist:
         
         return True
 
+    def find_job_candidates(self, grid: Grid = None) -> list[Job]:
+        """Return the open jobs this colonist would consider taking.
+        
+        Only the nearest few jobs of each category are returned, so idle
+        colonists don't walk the whole job board. Jobs must be of a category
+        this colonist can perform, match the current schedule period, and be
+        walkable (not enclosed, or on a level with no finished fire escape).
+        """
+        if grid is not None:
+            get_region_index(grid)
+        here = (self.x, self.y, self.z)
+        
+        # Whole categories are filtered up front so the search can stop early
+        categories = {
+            category for category in get_open_job_categories()
+            if self.can_perform_job_category(category)
+            and self.should_accept_job_by_schedule(category)
+        }
+        if not categories:
+            return []
+        
+        def reachable(job: Job) -> bool:
+            return grid is None or is_reachable(here, (job.x, job.y, job.z))
+        
+        return get_nearby_available_jobs(
+            self.x, self.y, self.z,
+            skip_unready_construction=True,
+            accept=reachable,
+            categories=categories,
+        )
+    
+    def score_job(self, job: Job, grid: Grid = None) -> float:
+        """Score a job for this colonist (higher = take it first).
+        
+        Priority order: crafting > construction > haul > harvest
+        Within construction: workstation > door > wall > floor
+        Role bonuses: colonists prefer jobs matching their role
+        """
+        priority = get_job_priority(job)
+        
+        # Add role priority bonus (colonists prefer jobs matching their role)
+        priority += self.get_role_job_priority_bonus(job.category)
+        
+        # Add small desirability bonus for tie-breaking (personality flavor)
+        desirability = self.calculate_job_desirability(
+            job.category, 
+            job.x, job.y, job.z,
+            grid=grid
+        )
+        # Priority dominates, desirability is tie-breaker (scaled down)
+        return priority + (desirability * 0.1)
+    
     def _try_take_job(self, grid: Grid = None) -> None:
         """Claim a job from the global queue if available.
         
@@ -2530,20 +2607,13 @@ class Colonist:
         2. If urgent job found and should_take_job() returns True, take it
         3. Otherwise use normal desirability scoring
         
+        Once the main loop runs the batch assignment phase (job_assignment.py)
+        idle colonists are matched to jobs there instead.
+        
         Args:
             grid: Optional grid for environment-based desirability scoring
         """
-        # Get all available jobs
-        available_jobs = get_all_available_jobs(skip_types=[], skip_unready_construction=True)
-        
-        if not available_jobs:
-            return
-        
-        # Filter to jobs this colonist can perform
-        valid_jobs = [j for j in available_jobs if self.can_perform_job_category(j.category)]
-        
-        # Filter by schedule - only take jobs that match current time period
-        valid_jobs = [j for j in valid_jobs if self.should_accept_job_by_schedule(j.category)]
+        valid_jobs = self.find_job_candidates(grid)
         
         if not valid_jobs:
             return
@@ -2570,33 +2640,8 @@ class Colonist:
         if self.current_job is not None:
             return
         
-        # Score each job by priority (higher = more important)
-        # Priority order: crafting > construction > haul > harvest
-        # Within construction: workstation > door > wall > floor
-        # Role bonuses: colonists prefer jobs matching their role
-        scored_jobs = []
-        for job in valid_jobs:
-            priority = get_job_priority(job)
-            
-            # Add role priority bonus (colonists prefer jobs matching their role)
-            role_priority_bonus = self.get_role_job_priority_bonus(job.category)
-            priority += role_priority_bonus
-            
-            # Add small desirability bonus for tie-breaking (personality flavor)
-            desirability = self.calculate_job_desirability(
-                job.category, 
-                job.x, job.y, job.z,
-                grid=grid
-            )
-            # Priority dominates, desirability is tie-breaker (scaled down)
-            score = priority + (desirability * 0.1)
-            scored_jobs.append((score, job))
-        
-        # Sort by score descending
-        scored_jobs.sort(key=lambda x: x[0], reverse=True)
-        
-        # Take the highest-priority job
-        _, job = scored_jobs[0]
+        # Take the highest-scoring job
+        job = max(valid_jobs, key=lambda j: self.score_job(j, grid))
         self._assign_job(job, grid)
     
     def _assign_job(self, job: Job, grid: Grid = None) -> None:
@@ -2668,8 +2713,11 @@ class Colonist:
     def _calculate_path(self, grid: Grid, target_x: int, target_y: int, target_z: int = 0, game_tick: int = 0) -> list[tuple[int, int, int]]:
         """Calculate path to target using A* pathfinding with z-level support.
         
-        Uses Manhattan distance heuristic to guide search toward goal.
-        Path caching avoids redundant searches for recently calculated paths.
+        Delegates the search to pathfinding.find_path (Jump Point Search within a level,
+        A* across fire escapes).
+        Results go through the colony-wide path cache, shared by all colonists.
+        Inside update() the search itself is time-sliced by the path scheduler and
+        may raise PathPending (see _search_path).
         
         Returns list of (x, y, z) positions to follow.
         
@@ -2684,123 +2732,94 @@ class Colonist:
         if start == goal:
             return []
         
-        # Check path cache for recently calculated paths
-        if goal in self._path_cache:
-            cached_path, cached_tick = self._path_cache[goal]
-            # Use cached path if it's recent (within 5 seconds)
-            if game_tick - cached_tick < self._path_cache_max_age:
-                # Verify cached path is still valid from current position
-                # If we're on the cached path, return the remaining portion
-                if start in cached_path:
-                    start_idx = cached_path.index(start)
-                    return cached_path[start_idx + 1:]
-                # Otherwise recalculate (we've deviated from cached path)
-        
-        # Clean old cache entries periodically (every 300 ticks)
-        if game_tick % 300 == 0:
-            expired_goals = [g for g, (_, tick) in self._path_cache.items() 
-                           if game_tick - tick >= self._path_cache_max_age]
-            for g in expired_goals:
-                del self._path_cache[g]
-        
-        # Get fire escape locations for z-level transitions
-        from buildings import get_all_fire_escapes, is_fire_escape_complete
-        fire_escapes = get_all_fire_escapes()
-        
-        # Build a map of (platform_x, platform_y, z) -> fire escape data
-        # Fire escapes connect Z to Z+1 at the platform position
-        platform_transitions = {}
-        for (wx, wy, wz), escape_data in fire_escapes.items():
-            if is_fire_escape_complete(wx, wy, wz):
-                platform_pos = escape_data.get("platform_pos")
-                if platform_pos:
-                    px, py = platform_pos
-                    # Platform at Z can go up to Z+1
-                    # Platform at Z+1 can go down to Z
-                    platform_transitions[(px, py, wz)] = wz + 1  # Go up
-                    platform_transitions[(px, py, wz + 1)] = wz  # Go down
-        
-        # A* pathfinding to find shortest path across z-levels
-        # Uses Manhattan distance heuristic to prioritize tiles closer to goal
-        import heapq
-        
-        def manhattan_distance(pos1, pos2):
-            """Calculate Manhattan distance between two 3D positions."""
-            return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1]) + abs(pos1[2] - pos2[2]) * 10
-        
-        # Priority queue: (f_score, counter, current_pos, path)
-        # f_score = g_score (cost so far) + h_score (heuristic to goal)
-        counter = 0  # Tie-breaker for equal f_scores
-        start_h = manhattan_distance(start, goal)
-        heap = [(start_h, counter, start, [start])]
-        visited = {start}
-        g_scores = {start: 0}  # Cost from start to each position
-        
-        while heap:
-            f_score, _, (cx, cy, cz), path = heapq.heappop(heap)
-            current_g = g_scores[(cx, cy, cz)]
-            
-            # Regular 2D movement on current z-level (cardinal + diagonal)
-            # Diagonals cost 1.4 (sqrt(2)) vs 1.0 for cardinal to prefer straight paths
-            for dx, dy, move_cost in [(1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
-                                       (1, 1, 1.4), (1, -1, 1.4), (-1, 1, 1.4), (-1, -1, 1.4)]:
-                nx, ny, nz = cx + dx, cy + dy, cz
-                
-                if (nx, ny, nz) in visited:
-                    continue
-                
-                # Can move to target or any walkable tile on this z-level
-                is_goal = (nx, ny, nz) == goal
-                is_walkable = grid.is_walkable(nx, ny, nz)
-                
-                if is_goal or is_walkable:
-                    new_path = path + [(nx, ny, nz)]
-                    new_g = current_g + move_cost  # Cost to move (1.0 cardinal, 1.4 diagonal)
-                    
-                    if is_goal:
-                        # Cache the full path before returning
-                        result_path = new_path[1:]
-                        self._path_cache[goal] = (result_path, game_tick)
-                        return result_path
-                    
-                    # Only explore if this is a better path to this neighbor
-                    if (nx, ny, nz) not in g_scores or new_g < g_scores[(nx, ny, nz)]:
-                        g_scores[(nx, ny, nz)] = new_g
-                        h_score = manhattan_distance((nx, ny, nz), goal)
-                        f_score = new_g + h_score
-                        counter += 1
-                        heapq.heappush(heap, (f_score, counter, (nx, ny, nz), new_path))
-                        visited.add((nx, ny, nz))
-            
-            # Z-level transition via fire escape platforms
-            # Fire escapes allow vertical movement between adjacent Z-levels
-            if (cx, cy, cz) in platform_transitions:
-                other_z = platform_transitions[(cx, cy, cz)]
-                if (cx, cy, other_z) not in visited:
-                    other_tile = grid.get_tile(cx, cy, other_z)
-                    # Can transition to platform on other Z (or any walkable tile)
-                    if other_tile == "fire_escape_platform" or grid.is_walkable(cx, cy, other_z):
-                        is_goal = (cx, cy, other_z) == goal
-                        new_path = path + [(cx, cy, other_z)]
-                        new_g = current_g + 10  # Z-level transitions cost more (10 tiles worth)
-                        
-                        if is_goal:
-                            # Cache the full path before returning
-                            result_path = new_path[1:]
-                            self._path_cache[goal] = (result_path, game_tick)
-                            return result_path
-                        
-                        # Only explore if this is a better path to this neighbor
-                        if (cx, cy, other_z) not in g_scores or new_g < g_scores[(cx, cy, other_z)]:
-                            g_scores[(cx, cy, other_z)] = new_g
-                            h_score = manhattan_distance((cx, cy, other_z), goal)
-                            f_score = new_g + h_score
-                            counter += 1
-                            heapq.heappush(heap, (f_score, counter, (cx, cy, other_z), new_path))
-                            visited.add((cx, cy, other_z))
-        
-        # No path found
-        return []
+        self._path_goal = goal
+        self._path_version = grid.walk_version
+        
+        # Fire escapes connect Z to Z+1 at the platform position. buildings keeps the
+        # graph prebuilt and versioned, so unchanged links are never re-indexed here.
+        platform_transitions = buildings.get_platform_transitions()
+        transitions_version = buildings.get_transitions_version()
+        transitions = get_transition_cache(grid)
+        transitions.update(platform_transitions, transitions_version)
+        
+        # Shared colony-wide cache (see path_cache.py)
+        path_cache = get_path_cache(grid)
+        cached_path = path_cache.get(start, goal, game_tick, platform_transitions, transitions_version)
+        if cached_path is not None:
+            return cached_path
+        
+        # Walled-off goals fail here instead of flooding the reachable area
+        regions = get_region_index(grid)
+        regions.set_transitions(platform_transitions, transitions_version)
+        if not regions.is_reachable(start, goal):
+            return []
+        
+        # Shared destinations (stockpiles, meals, beds) are a flow field descent, no search
+        field_path = get_flow_fields(grid).path_to_goal(start, goal, game_tick)
+        if field_path:
+            return field_path
+        
+        # Long trips: plan on the cluster graph first and refine only the segment
+        # into the next cluster. Arriving at its end empties the path, and the
+        # caller's normal replan asks the hierarchy again from there.
+        result_path = []
+        if abs(start[0] - goal[0]) + abs(start[1] - goal[1]) >= HIERARCHY_MIN_DISTANCE or start[2] != goal[2]:
+            hierarchy = get_path_hierarchy(grid)
+            waypoints = hierarchy.find_waypoints(start, goal, platform_transitions, transitions_version)
+            if waypoints:
+                segment_target = hierarchy.next_segment_target(start, waypoints)
+                result_path = self._search_path(grid, start, segment_target, HIERARCHY_SEGMENT_MAX_NODES,
+                                                transitions.index)
+        
+        # JPS or A* over flat walkability arrays with parent pointers (see pathfinding.py)
+        if not result_path:
+            result_path = self._search_path(grid, start, goal, None, transitions.index)
+        # Searches spread over several ticks may have been planned on an older map.
+        # The cache only drops paths on walkability changes after put(), so those
+        # stay out of it (our own _path_version still makes us re-check them).
+        if self._path_version >= grid.walk_version:
+            path_cache.put(start, goal, result_path, game_tick)
+        return result_path
+
+    def _search_path(self, grid: Grid, start: tuple, target: tuple, max_nodes: int | None,
+                     transition_index: dict) -> list[tuple[int, int, int]]:
+        """Run one search for _calculate_path, time-sliced through the path scheduler.
+        
+        Outside update() (or before the main loop drives the scheduler) the search
+        runs synchronously. Inside update() a search that doesn't fit in this tick's
+        node budget raises PathPending.
+        """
+        key = (start, target, max_nodes)
+        if key in self._path_results:
+            request = self._path_results[key]
+            self._path_version = min(self._path_version, request.walk_version)
+            return request.result
+        
+        scheduler = get_path_scheduler(grid)
+        if not self._defer_paths or not scheduler.active:
+            return find_path(grid, start, target, max_nodes=max_nodes, transition_index=transition_index)
+        
+        if self._path_request is not None and not self._path_request.done:
+            # Still waiting on this very search - don't count ourselves twice
+            if self._path_request.key == key:
+                raise PathPending(self._path_request)
+            # A different search is still queued for us - we won't read it now,
+            # but other colonists may share the handle (see PathScheduler.release)
+            scheduler.release(self._path_request)
+        
+        request = scheduler.submit(start, target, self._path_priority(), max_nodes, transition_index)
+        if request.done:
+            self._path_request = None
+            self._path_version = min(self._path_version, request.walk_version)
+            return request.result
+        self._path_request = request
+        raise PathPending(request)
+
+    def _path_priority(self) -> int:
+        """Scheduler priority for this colonist's searches."""
+        if self.in_combat or self.hunger > 60 or self.tiredness > 80:
+            return PATH_PRIORITY_URGENT
+        return PATH_PRIORITY_NORMAL
 
     def _move_towards_job(self, grid: Grid, game_tick: int = 0) -> None:
         """Move along committed path toward job location."""
@@ -3076,7 +3095,7 @@ class Colonist:
                     width, height = buildings.get_building_size("generator")
                     for dy in range(height):
                         for dx in range(width):
-                            grid.walkable[job.z][job.y + dy][job.x + dx] = False
+                            grid.set_walkable(job.x + dx, job.y + dy, job.z, False)
                     # Register as workstation
                     buildings.register_workstation(job.x, job.y, job.z, "generator")
                 elif current_tile == "stove":
@@ -3085,7 +3104,7 @@ class Colonist:
                     width, height = buildings.get_building_size("stove")
                     for dy in range(height):
                         for dx in range(width):
-                            grid.walkable[job.z][job.y + dy][job.x + dx] = False
+                            grid.set_walkable(job.x + dx, job.y + dy, job.z, False)
                     # Register as workstation
                     buildings.register_workstation(job.x, job.y, job.z, "stove")
                 elif current_tile == "gutter_forge":
@@ -3106,7 +3125,7 @@ class Colonist:
                     width, height = buildings.get_building_size("bio_matter_salvage_station")
                     for dy in range(height):
                         for dx in range(width):
-                            grid.walkable[job.z][job.y + dy][job.x + dx] = False
+                            grid.set_walkable(job.x + dx, job.y + dy, job.z, False)
                     buildings.register_workstation(job.x, job.y, job.z, "bio_matter_salvage_station")
                 elif current_tile == "gutter_still":
                     grid.set_tile(job.x, job.y, "finished_gutter_still", z=job.z)
@@ -3123,7 +3142,7 @@ class Colonist:
                     width, height = buildings.get_building_size("plant_bed")
                     for dy in range(height):
                         for dx in range(width):
-                            grid.walkable[job.z][job.y + dy][job.x + dx] = False
+                            grid.set_walkable(job.x + dx, job.y + dy, job.z, False)
                     buildings.register_workstation(job.x, job.y, job.z, "plant_bed")
                 elif current_tile == "scrap_bar_counter":
                     grid.set_tile(job.x, job.y, "finished_scrap_bar_counter", z=job.z)
@@ -3337,7 +3356,8 @@ class Colonist:
                 item = zones.remove_from_tile_storage(job.x, job.y, job.z, pickup_amount)
                 if item is None and job.resource_type:
                     # Original tile empty - try to find another tile with this resource
-                    alt_source = zones.find_stockpile_with_resource(job.resource_type, z=job.z)
+                    alt_source = zones.find_stockpile_with_resource(job.resource_type, z=job.z,
+                                                                    from_pos=(self.x, self.y, self.z))
                     if alt_source is not None:
                         # Redirect to new source
                         job.x, job.y, job.z = alt_source
@@ -3785,22 +3805,31 @@ class Colonist:
     def _check_path_still_valid(self, grid: Grid) -> bool:
         """Check if current path is still walkable.
         
-        Returns False if any tile in the path is now blocked.
+        Returns False if any tile in the path is now blocked. Unchanged grids
+        cost one version comparison; otherwise only path tiles whose version is
+        newer than the path's are looked at.
         """
         if not self.current_path:
             return True  # No path to check
         
-        for px, py, pz in self.current_path:
-            # Skip the final destination (might be a workstation or resource node)
-            if self.current_path.index((px, py, pz)) == len(self.current_path) - 1:
+        version = grid.walk_version
+        if version == self._path_version:
+            return True
+        
+        since = self._path_version
+        tile_versions = grid.tile_versions
+        width = grid.width
+        # Skip the final destination (might be a workstation or resource node)
+        for px, py, pz in self.current_path[:-1]:
+            if tile_versions[pz][py * width + px] <= since:
                 continue
-            
             if not grid.is_walkable(px, py, pz):
                 # Check if it's a door/window we can open
                 if is_door(px, py, pz) or is_window(px, py, pz):
                     continue
                 return False
         
+        self._path_version = version
         return True
 
     # --- Crafting behavior ---------------------------------------------------
@@ -3928,7 +3957,8 @@ class Colonist:
             have = resource_inputs_have.get(res_type, 0)
             if have < amount_needed:
                 # Find stockpile with this resource
-                source = zones.find_stockpile_with_resource(res_type, z=job.z)
+                source = zones.find_stockpile_with_resource(res_type, z=job.z, from_pos=(self.x, self.y, self.z),
+                                                            prefer=self._path_goal)
                 if source is None:
                     # No resource available - wait, but timeout after 300 ticks (~5 seconds)
                     self._crafting_wait_time += 1
@@ -3972,7 +4002,7 @@ class Colonist:
                     return
                 
                 # Move towards stockpile
-                if not self.current_path or self.current_path[-1] != (source_x, source_y, source_z):
+                if not self.current_path or self._path_goal != (source_x, source_y, source_z):
                     self.current_path = self._calculate_path(grid, source_x, source_y, source_z, game_tick)
                 
                 if self.current_path:
@@ -3988,7 +4018,8 @@ class Colonist:
             have = item_inputs_have.get(item_type, 0)
             if have < amount_needed:
                 # Find stockpile with this item in equipment storage
-                source = zones.find_stockpile_with_resource(item_type, z=job.z)
+                source = zones.find_stockpile_with_resource(item_type, z=job.z, from_pos=(self.x, self.y, self.z),
+                                                            prefer=self._path_goal)
                 if source is None:
                     # No item available - wait, but timeout after 300 ticks (~5 seconds)
                     self._crafting_wait_time += 1
@@ -4053,7 +4084,7 @@ class Colonist:
                     return
                 
                 # Move towards stockpile
-                if not self.current_path or self.current_path[-1] != (source_x, source_y, source_z):
+                if not self.current_path or self._path_goal != (source_x, source_y, source_z):
                     self.current_path = self._calculate_path(grid, source_x, source_y, source_z, game_tick)
                 
                 if self.current_path:
@@ -4394,8 +4425,13 @@ class Colonist:
         """Try to find and eat a cooked meal."""
         import zones
         
-        # Look for cooked_meal in stockpiles (check all Z levels)
-        meal_tile = zones.find_stockpile_with_resource("cooked_meal", z=None)
+        # Nearest cooked_meal by walking distance (food flow field, all Z levels)
+        meal_path = get_flow_fields(grid).path_to_group("food", (self.x, self.y, self.z), game_tick)
+        if meal_path is not None:
+            meal_tile = meal_path[-1] if meal_path else (self.x, self.y, self.z)
+        else:
+            # Look for cooked_meal in stockpiles (check all Z levels)
+            meal_tile = zones.find_stockpile_with_resource("cooked_meal", z=None, from_pos=(self.x, self.y, self.z))
         if meal_tile is None:
             # No food available anywhere
             return
@@ -4412,7 +4448,8 @@ class Colonist:
                 print(f"[Eat] Colonist ate a meal at ({mx},{my}), hunger now {self.hunger:.0f}")
         else:
             # Need to walk to food - enter eating state
-            self.current_path = self._calculate_path(grid, mx, my, mz, game_tick)
+            self.current_path = meal_path or self._calculate_path(grid, mx, my, mz, game_tick)
+            self._path_goal = meal_tile
             if self.current_path:
                 self.state = "eating"
                 self._eating_target = (mx, my, mz)
@@ -4603,6 +4640,7 @@ class Colonist:
         if all_beds:
             best_bed = None
             best_score = -999
+            scored_beds = []
             
             # Check if colonist is injured (for hospital bed priority)
             is_injured = False
@@ -4678,13 +4716,18 @@ class Colonist:
                             else:
                                 score = 5  # Neutral
                 
-                # Prefer closer beds
-                dist = abs(self.x - pos[0]) + abs(self.y - pos[1])
-                score -= dist * 0.1
-                
-                if score > best_score:
+                scored_beds.append((score, pos))
+            
+            # Best score wins; among equally good beds, the nearest on foot
+            for score in sorted({score for score, _ in scored_beds}, reverse=True):
+                if score <= -10:
+                    break
+                nearest = nearest_reachable((self.x, self.y, self.z),
+                                            [pos for bed_score, pos in scored_beds if bed_score == score])
+                if nearest is not None:
+                    best_bed = nearest
                     best_score = score
-                    best_bed = pos
+                    break
             
             # Claim the best bed if score is acceptable
             if best_bed and best_score > -10:
@@ -5042,6 +5085,51 @@ class Colonist:
         else:
             self.fidget_offset = 0
         
+        self._defer_paths = True
+        try:
+            # Needs and combat run every tick, even while a search is queued
+            planning = self.state == "planning"
+            self._update_needs(grid, all_colonists, game_tick)
+            if planning and self.state != "planning":
+                # A need took over (passed out, went to bed) - drop the queued search
+                self._abandon_planning(grid)
+            
+            # Waiting on a time-sliced path search (see path_scheduler.py)
+            if self.state == "planning" and not self._resume_after_planning():
+                return
+            
+            self._update_behavior(grid, all_colonists, game_tick)
+        except PathPending:
+            # Search queued - sit out until it's done, then re-run this state
+            if self.state != "planning":
+                self._planning_resume_state = self.state
+                self.state = "planning"
+        else:
+            self._path_results.clear()
+        finally:
+            self._defer_paths = False
+
+    def _resume_after_planning(self) -> bool:
+        """Leave the "planning" state once the queued search is done. Returns True if resumed."""
+        request = self._path_request
+        if request is not None and not request.done:
+            return False
+        if request is not None and not request.cancelled:
+            self._path_results[request.key] = request
+        self._path_request = None
+        self.state = self._planning_resume_state or "idle"
+        self._planning_resume_state = None
+        return True
+
+    def _abandon_planning(self, grid: Grid) -> None:
+        """Stop waiting on the queued search after something else changed our state."""
+        if self._path_request is not None:
+            get_path_scheduler(grid).release(self._path_request)
+            self._path_request = None
+        self._planning_resume_state = None
+
+    def _update_needs(self, grid: Grid, all_colonists: list, game_tick: int) -> None:
+        """Combat, hunger, tiredness and healing - run every tick, even while planning."""
         # Process combat
         self._update_combat(all_colonists or [], game_tick)
         
@@ -5054,7 +5142,9 @@ class Colonist:
         # Natural body healing (slow, every ~10 seconds)
         if game_tick % 600 == 0:
             self._heal_body(game_tick)
-        
+
+    def _update_behavior(self, grid: Grid, all_colonists: list, game_tick: int) -> None:
+        """The state machine for one tick (waits while a path search is planning)."""
         # If sleeping, skip other updates
         if self.is_sleeping:
             return
@@ -5091,7 +5181,8 @@ class Colonist:
         if self.state == "idle":
             # If chasing a combat target, don't take jobs or wander
             if not self._chase_combat_target(grid, self._all_colonists, game_tick):
-                self._try_take_job(grid)
+                if not is_job_assignment_active():
+                    self._try_take_job(grid)
                 if self.state == "idle":
                     self._maybe_wander_when_idle(grid)
         elif self.state == "moving_to_job":
@@ -12,6 +12,25 @@ GRID_W = 200
 GRID_H = 200
 GRID_Z = 10  # Number of Z-levels (0 = ground, 1+ = upper floors)
 
+# Large-map mode: LARGE_MAP_SIZE x LARGE_MAP_SIZE cities for long campaigns
+# (bench_large_map.py checks the tick rate and memory). Memory budget per
+# million tiles (one Z=0 plane; upper levels only cost where something is built):
+#   Grid tiles, walkability, versions, env fields   40 MB
+#   Region labels (path_regions)                     4 MB per Z-level
+#   Flow fields, path cache, hierarchy              <10 MB (bounded, not per tile)
+#   Renderer sprites                                 RENDER_CHUNK_CACHE chunks only
+# which keeps a 1000x1000x10 city under 200 MB of process memory.
+LARGE_MAP = False
+LARGE_MAP_SIZE = 1000
+# Tiles around spawn generated at startup; the rest of the city is generated
+# in chunks as the camera and colonists get near (CityGenerator.ensure_generated)
+LARGE_MAP_GEN_RADIUS = 96
+# Ticks between generating the next chunk near colonists (CityGenerator.generate_around)
+LARGE_MAP_GEN_INTERVAL = 10
+if LARGE_MAP:
+    GRID_W = LARGE_MAP_SIZE
+    GRID_H = LARGE_MAP_SIZE
+
 # Screen dimensions - 1080p (fits all screens)
 SCREEN_W = 1920
 SCREEN_H = 1080
@@ -20,6 +39,9 @@ SCREEN_H = 1080
 
 COLONIST_COUNT = 10
 
+# Worker processes for path searches (0 = solve in-process, see path_workers.py)
+PATH_WORKERS = 0
+
 COLOR_BG_NORMAL = (20, 20, 20)
 COLOR_BG_ETHER = (15, 0, 25)
 
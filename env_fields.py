@@ -0,0 +1,199 @@
+"""Environment field engine.
+
+Grid.set_tile used to write each placed tile's env values one at a time and
+only refresh that tile's own exit count, so neighbours kept stale counts.
+Here the fields are derived from the tile and walkability arrays for whole
+regions instead:
+
+- interference, echo: each tile's source value (tile_registry env defaults)
+  spread over a 3x3 binomial kernel, so ruins bleed into the tiles around
+  them and a uniform area keeps its value
+- integrity, is_outside: the tile's source value
+- exit_count: walkable 4-neighbours, a neighbour-count convolution of
+  Grid.walkable_flat. Room interiors keep the room-level count rooms.py gives
+  them.
+- pressure has no tile sources yet and is left alone.
+
+Grid marks ENV_REGION_SIZE regions dirty when a tile or its walkability
+changes (including the regions a kernel reaches into) and recompute() redoes
+only those. Grid.update_env_fields() runs it before env reads and when a
+batch() closes.
+
+With numpy the dense ground level is computed with array slicing; chunked
+upper levels and installs without numpy use the same kernels in Python.
+"""
+
+from typing import List, Set, Tuple
+
+from tile_registry import TILE_INFO
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+    print("[EnvFields] numpy not installed - env fields are computed with Python loops")
+
+# Dirty regions are tracked in ENV_REGION_SIZE x ENV_REGION_SIZE blocks
+ENV_REGION_SHIFT = 4
+ENV_REGION_SIZE = 1 << ENV_REGION_SHIFT
+
+# Spreading kernel for interference and echo: (dx, dy, weight), weights sum to 1.
+# Off-map neighbours reuse the edge tile.
+SPREAD_KERNEL: List[Tuple[int, int, float]] = [
+    (dx, dy, (2 - abs(dx)) * (2 - abs(dy)) / 16.0)
+    for dy in (-1, 0, 1)
+    for dx in (-1, 0, 1)
+]
+
+# Source values for tiles without env defaults (the ENV_FIELDS defaults)
+_PLAIN_SOURCE = {"interference": 0.0, "echo": 0.0, "integrity": 1.0, "is_outside": True}
+
+# Source field -> index in the per-tile-ID source table
+_SOURCE_FIELDS = ("interference", "echo", "integrity", "is_outside")
+
+
+class EnvFieldEngine:
+    """Recomputes a grid's derived env fields for dirty regions."""
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.regions_x = (grid.width + ENV_REGION_SIZE - 1) >> ENV_REGION_SHIFT
+        self.regions_y = (grid.height + ENV_REGION_SIZE - 1) >> ENV_REGION_SHIFT
+        self.dirty: Set[Tuple[int, int, int]] = set()  # (z, rx, ry)
+
+        # Per tile ID source values, rebuilt when new tile names are registered
+        self._sources: List[tuple] = []
+        self._np_sources = None
+
+        # Stats for debugging/benchmarks
+        self.regions_recomputed = 0
+
+    # --- Dirty tracking ---
+
+    def mark_dirty(self, x: int, y: int, z: int) -> None:
+        """A tile changed: dirty every region its kernels reach (x +- 1, y +- 1)."""
+        rx0 = max(x - 1, 0) >> ENV_REGION_SHIFT
+        rx1 = min(x + 1, self.grid.width - 1) >> ENV_REGION_SHIFT
+        ry0 = max(y - 1, 0) >> ENV_REGION_SHIFT
+        ry1 = min(y + 1, self.grid.height - 1) >> ENV_REGION_SHIFT
+        dirty = self.dirty
+        dirty.add((z, rx0, ry0))
+        if rx1 != rx0 or ry1 != ry0:
+            for ry in range(ry0, ry1 + 1):
+                for rx in range(rx0, rx1 + 1):
+                    dirty.add((z, rx, ry))
+
+    def mark_rect_dirty(self, z: int, x0: int, y0: int, x1: int, y1: int) -> None:
+        """Dirty every region overlapping tiles [x0, x1) x [y0, y1)."""
+        for ry in range(y0 >> ENV_REGION_SHIFT, ((y1 - 1) >> ENV_REGION_SHIFT) + 1):
+            for rx in range(x0 >> ENV_REGION_SHIFT, ((x1 - 1) >> ENV_REGION_SHIFT) + 1):
+                self.dirty.add((z, rx, ry))
+
+    # --- Recompute ---
+
+    def recompute(self) -> int:
+        """Recompute all dirty regions. Returns how many were redone."""
+        if not self.dirty:
+            return 0
+        dirty = sorted(self.dirty)
+        self.dirty.clear()
+        self._refresh_sources()
+        grid = self.grid
+        for z, rx, ry in dirty:
+            x0 = rx << ENV_REGION_SHIFT
+            y0 = ry << ENV_REGION_SHIFT
+            x1 = min(x0 + ENV_REGION_SIZE, grid.width)
+            y1 = min(y0 + ENV_REGION_SIZE, grid.height)
+            if HAS_NUMPY and grid.tile_id_block is not None and z < len(grid.tile_id_block):
+                self._recompute_numpy(z, x0, y0, x1, y1)
+            else:
+                self._recompute_python(z, x0, y0, x1, y1)
+        self.regions_recomputed += len(dirty)
+        return len(dirty)
+
+    def _refresh_sources(self) -> None:
+        """Extend the per tile ID source table to cover newly registered tiles."""
+        sources = self._sources
+        if len(sources) == len(TILE_INFO):
+            return
+        for info in TILE_INFO[len(sources):]:
+            values = info.env_defaults or _PLAIN_SOURCE
+            sources.append(tuple(float(values[field]) for field in _SOURCE_FIELDS))
+        if HAS_NUMPY:
+            self._np_sources = np.array(sources, dtype=np.float32)
+
+    def _recompute_python(self, z: int, x0: int, y0: int, x1: int, y1: int) -> None:
+        grid = self.grid
+        width, height = grid.width, grid.height
+        ids = grid.tile_ids[z]
+        walkable = grid.walkable_flat[z]
+        env = grid.env
+        interference, echo = env["interference"][z], env["echo"][z]
+        integrity, is_outside = env["integrity"][z], env["is_outside"][z]
+        exit_count, room_id = env["exit_count"][z], env["room_id"][z]
+        sources = self._sources
+        max_x, max_y = width - 1, height - 1
+
+        for y in range(y0, y1):
+            row = y * width
+            for x in range(x0, x1):
+                i = row + x
+                spread_interference = 0.0
+                spread_echo = 0.0
+                for dx, dy, weight in SPREAD_KERNEL:
+                    sx = min(max(x + dx, 0), max_x)
+                    sy = min(max(y + dy, 0), max_y)
+                    source = sources[ids[sy * width + sx]]
+                    spread_interference += weight * source[0]
+                    spread_echo += weight * source[1]
+                source = sources[ids[i]]
+                interference[i] = spread_interference
+                echo[i] = spread_echo
+                integrity[i] = source[2]
+                is_outside[i] = 1 if source[3] else 0
+
+                if room_id[i]:
+                    continue  # Room interiors keep the room-level exit count
+                exits = 0
+                if y > 0 and walkable[i - width]:
+                    exits += 1
+                if y < max_y and walkable[i + width]:
+                    exits += 1
+                if x > 0 and walkable[i - 1]:
+                    exits += 1
+                if x < max_x and walkable[i + 1]:
+                    exits += 1
+                exit_count[i] = exits
+
+    def _recompute_numpy(self, z: int, x0: int, y0: int, x1: int, y1: int) -> None:
+        grid = self.grid
+        width, height = grid.width, grid.height
+        # Input window: the region plus a one tile halo where the map has one
+        hx0, hy0 = max(x0 - 1, 0), max(y0 - 1, 0)
+        hx1, hy1 = min(x1 + 1, width), min(y1 + 1, height)
+        pad = ((1 - (y0 - hy0), 1 - (hy1 - y1)), (1 - (x0 - hx0), 1 - (hx1 - x1)))
+
+        ids = grid.tile_id_block[z].reshape(height, width)[hy0:hy1, hx0:hx1]
+        sources = np.pad(self._np_sources[ids], pad + ((0, 0),), mode="edge")
+        spread = np.zeros((y1 - y0, x1 - x0, 2), dtype=np.float32)
+        for dx, dy, weight in SPREAD_KERNEL:
+            spread += weight * sources[1 + dy:1 + dy + (y1 - y0), 1 + dx:1 + dx + (x1 - x0), :2]
+        center = sources[1:-1, 1:-1]
+
+        walkable = np.frombuffer(grid.walkable_flat[z], dtype=np.uint8).reshape(height, width)
+        walk = np.pad(walkable[hy0:hy1, hx0:hx1], pad, mode="constant")
+        exits = walk[:-2, 1:-1] + walk[2:, 1:-1] + walk[1:-1, :-2] + walk[1:-1, 2:]
+
+        views = {
+            field: block[z].reshape(height, width)[y0:y1, x0:x1]
+            for field, block in grid.env_blocks.items()
+        }
+        views["interference"][:] = spread[:, :, 0]
+        views["echo"][:] = spread[:, :, 1]
+        views["integrity"][:] = center[:, :, 2]
+        views["is_outside"][:] = center[:, :, 3]
+        # Room interiors keep the room-level exit count
+        exit_view = views["exit_count"]
+        exit_view[:] = np.where(views["room_id"] != 0, exit_view, exits)
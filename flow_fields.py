@@ -0,0 +1,383 @@
+"""Flow fields toward the colony's busiest shared destinations.
+
+Most movement converges on a few kinds of places: stockpiles, cooked meals,
+assigned beds, the colony center (wanderers, fixers) and the map edge (anyone
+leaving). For each destination group a single multi-source Dijkstra from all
+of its tiles gives every reachable tile a distance and a next step, so any
+number of agents can walk downhill to the nearest member in O(1) per step
+without running their own search.
+
+Groups:
+- "stockpile": every stockpile zone tile
+- "food": stockpile tiles holding cooked meals
+- "beds": beds with at least one assigned colonist
+- "colony_center": set by the caller (set_static_sources)
+- "map_edge": the outer ring of Z=0
+
+Fields follow the same movement rules as pathfinding.find_path (8-connected,
+fire escape transitions between Z-levels, destination tiles may be
+unwalkable) and are rebuilt lazily on the next query. A rebuild is a
+Dijkstra over everything reachable, so it is rate limited:
+- right away when the fire escape links change
+- after the group's tiles change, at most once every
+  FLOW_FIELD_MEMBER_REBUILD_INTERVAL ticks; in between, descents that end on
+  a tile that has left the group return None, and new tiles aren't reached
+  until the rebuild
+- after walkability changes, at most once every FLOW_FIELD_REBUILD_INTERVAL
+  ticks; in between, a descent that runs into a newly blocked tile returns
+  None so the caller can fall back to A*
+- at most one field is rebuilt per tick; other stale fields wait their turn
+
+Distances and next steps are kept per reached tile. On large maps
+(config.LARGE_MAP) the search stops FLOW_FIELD_LARGE_MAP_RADIUS tiles of
+walking out from the group, so a rebuild costs the same on a 1000x1000 city as
+on a small one; agents farther out fall back to A* like unreachable ones.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, TYPE_CHECKING
+
+import config
+from pathfinding import NEIGHBOR_OFFSETS, Z_TRANSITION_COST, TransitionCache
+
+if TYPE_CHECKING:
+    from grid import Grid
+
+Coord3D = Tuple[int, int, int]  # (x, y, z)
+
+# Minimum ticks between walkability-triggered rebuilds of the same field
+FLOW_FIELD_REBUILD_INTERVAL = 300
+
+# Minimum ticks between rebuilds of the same field after its group's tiles
+# change (meal stacks appearing and running out, stockpiles drawn)
+FLOW_FIELD_MEMBER_REBUILD_INTERVAL = 120
+
+# Walking distance (tiles) a field covers around its group on large maps
+FLOW_FIELD_LARGE_MAP_RADIUS = 48
+
+# Fields store integer costs (x10) so the 1.0 / 1.4 / 10 move costs stay exact
+_COST_SCALE = 10
+_NEIGHBOR_COSTS = tuple((dx, dy, int(round(cost * _COST_SCALE))) for dx, dy, cost in NEIGHBOR_OFFSETS)
+_Z_COST = int(round(Z_TRANSITION_COST * _COST_SCALE))
+_UNREACHED = 2 ** 31 - 1
+
+
+class FlowField:
+    """Distance and next-step maps toward the nearest tile of one group."""
+
+    def __init__(self, grid: Grid, sources: FrozenSet[Coord3D], transitions: Dict[int, int],
+                 walk_version: int, game_tick: int, max_distance: Optional[float] = None):
+        self.grid = grid
+        self.sources = sources
+        self.transitions = transitions
+        self.walk_version = walk_version
+        self.built_tick = game_tick
+
+        self.width = grid.width
+        self.height = grid.height
+        self.plane = grid.width * grid.height
+        # Tiles farther than this (path cost) from the group are left unreached
+        self.max_cost = _UNREACHED - 1 if max_distance is None else int(max_distance * _COST_SCALE)
+        # node -> cost and node -> downhill node, reached tiles only
+        self.dist: Dict[int, int] = {}
+        self.next_node: Dict[int, int] = {}
+        self._build()
+
+    def _build(self) -> None:
+        """Multi-source Dijkstra outward from the group's tiles.
+
+        Runs on the reversed move graph: a tile is entered from a walkable
+        neighbour, or from the far end of a fire escape link leading to it.
+        """
+        width = self.width
+        height = self.height
+        plane = self.plane
+        walkable_flat = self.grid.walkable_flat
+        dist = self.dist
+        next_node = self.next_node
+        max_cost = self.max_cost
+
+        # node -> nodes whose fire escape leads onto it
+        incoming: Dict[int, List[int]] = {}
+        for node, other in self.transitions.items():
+            incoming.setdefault(other, []).append(node)
+
+        heap = []
+        for x, y, z in self.sources:
+            if self.grid.in_bounds(x, y, z):
+                node = z * plane + y * width + x
+                dist[node] = 0
+                heap.append((0, node))
+        heapq.heapify(heap)
+        pop = heapq.heappop
+        push = heapq.heappush
+
+        while heap:
+            d, node = pop(heap)
+            if d > dist[node]:
+                continue
+            z, rem = divmod(node, plane)
+            y, x = divmod(rem, width)
+            base = z * plane
+            walk = walkable_flat[z]
+            for dx, dy, cost in _NEIGHBOR_COSTS:
+                nx = x + dx
+                ny = y + dy
+                if nx < 0 or ny < 0 or nx >= width or ny >= height:
+                    continue
+                local = ny * width + nx
+                if not walk[local]:
+                    continue
+                neighbor = base + local
+                nd = d + cost
+                if nd <= max_cost and nd < dist.get(neighbor, _UNREACHED):
+                    dist[neighbor] = nd
+                    next_node[neighbor] = node
+                    push(heap, (nd, neighbor))
+            for neighbor in incoming.get(node, ()):
+                nd = d + _Z_COST
+                if nd <= max_cost and nd < dist.get(neighbor, _UNREACHED):
+                    dist[neighbor] = nd
+                    next_node[neighbor] = node
+                    push(heap, (nd, neighbor))
+
+    def _node(self, x: int, y: int, z: int) -> int:
+        return z * self.plane + y * self.width + x
+
+    def _coord(self, node: int) -> Coord3D:
+        z, rem = divmod(node, self.plane)
+        y, x = divmod(rem, self.width)
+        return (x, y, z)
+
+    def distance(self, x: int, y: int, z: int) -> Optional[float]:
+        """Path cost from (x, y, z) to the nearest group tile, or None if unreachable."""
+        if not self.grid.in_bounds(x, y, z):
+            return None
+        d = self.dist.get(self._node(x, y, z))
+        return None if d is None else d / _COST_SCALE
+
+    def next_step(self, x: int, y: int, z: int) -> Optional[Coord3D]:
+        """Return the downhill neighbour of (x, y, z), or None at a group tile / unreachable."""
+        if not self.grid.in_bounds(x, y, z):
+            return None
+        nxt = self.next_node.get(self._node(x, y, z))
+        return None if nxt is None else self._coord(nxt)
+
+    def _entry_node(self, x: int, y: int, z: int) -> Optional[int]:
+        """Node to start descending from: the tile itself, or its best neighbour if unreached."""
+        node = self._node(x, y, z)
+        if node in self.dist:
+            return node
+        # Standing somewhere the field doesn't cover (e.g. an unwalkable tile) - step off it
+        best = None
+        best_d = _UNREACHED
+        for dx, dy, cost in _NEIGHBOR_COSTS:
+            nx = x + dx
+            ny = y + dy
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                neighbor = self._node(nx, ny, z)
+                d = self.dist.get(neighbor, _UNREACHED)
+                if d + cost < best_d:
+                    best = neighbor
+                    best_d = d + cost
+        return best
+
+    def path_from(self, start: Coord3D, goal: Optional[Coord3D] = None) -> Optional[List[Coord3D]]:
+        """Walk downhill from start to the nearest group tile.
+
+        Returns the steps (start excluded, like find_path), [] when start is
+        already a group tile, or None if unreachable, if the descent hits a
+        tile that has become unwalkable since the last rebuild, or if goal is
+        given and the descent ends somewhere else.
+        """
+        if not self.grid.in_bounds(*start):
+            return None
+        node = self._entry_node(*start)
+        if node is None:
+            return None
+
+        path: List[Coord3D] = []
+        start_node = self._node(*start)
+        if node != start_node:
+            path.append(self._coord(node))
+        walkable_flat = self.grid.walkable_flat
+        plane = self.plane
+        next_node = self.next_node
+        while True:
+            nxt = next_node.get(node)
+            if nxt is None:
+                break
+            if nxt in next_node and not walkable_flat[nxt // plane][nxt % plane]:
+                return None
+            path.append(self._coord(nxt))
+            node = nxt
+
+        end = self._coord(node)
+        if end not in self.sources:
+            return None
+        if goal is not None and end != goal:
+            return None
+        return path
+
+
+class FlowFields:
+    """Lazily rebuilt flow fields for each destination group on a grid."""
+
+    def __init__(self, grid: Grid):
+        self.grid = grid
+        self._fields: Dict[str, FlowField] = {}
+        self._providers: Dict[str, Callable[[], FrozenSet[Coord3D]]] = {}
+        self._static_sources: Dict[str, FrozenSet[Coord3D]] = {}
+        self._sources_memo: Dict[str, Tuple[int, FrozenSet[Coord3D]]] = {}
+
+        # Fire escape links shared by all fields
+        self._transition_cache = TransitionCache(grid)
+
+        # Fields cover the whole map, or a fixed radius around their group on large maps
+        self.max_distance: Optional[float] = FLOW_FIELD_LARGE_MAP_RADIUS if config.LARGE_MAP else None
+
+        # Tick of the last rebuild (at most one per tick)
+        self._rebuilt_tick: Optional[int] = None
+
+        # Stats for debugging/benchmarks
+        self.rebuilds = 0
+
+        self.register_group("stockpile", _stockpile_sources)
+        self.register_group("food", _food_sources)
+        self.register_group("beds", _bed_sources)
+        self.set_static_sources("map_edge", _edge_sources(grid))
+
+        grid.add_walkability_listener(self.on_walkability_changed)
+
+    def on_walkability_changed(self, x: int, y: int, z: int, walkable: bool) -> None:
+        """Grid listener: re-check fire escape links touching the tile."""
+        self._transition_cache.on_walkability_changed(x, y, z, walkable)
+
+    # --- Groups ---
+
+    def register_group(self, group: str, provider: Callable[[], FrozenSet[Coord3D]]) -> None:
+        """Register a destination group whose tiles come from provider()."""
+        self._providers[group] = provider
+
+    def set_static_sources(self, group: str, tiles) -> None:
+        """Set (or replace) the tiles of a caller-managed group."""
+        self._static_sources[group] = frozenset(tiles)
+
+    def get_sources(self, group: str, game_tick: int = 0) -> FrozenSet[Coord3D]:
+        """Return the current tiles of a group (providers run at most once per tick)."""
+        if group in self._static_sources:
+            return self._static_sources[group]
+        provider = self._providers.get(group)
+        if provider is None:
+            return frozenset()
+        memo = self._sources_memo.get(group)
+        if memo is not None and memo[0] == game_tick:
+            return memo[1]
+        sources = provider()
+        self._sources_memo[group] = (game_tick, sources)
+        return sources
+
+    def groups(self) -> List[str]:
+        """Return the names of all known groups."""
+        return list(self._providers) + [g for g in self._static_sources if g not in self._providers]
+
+    # --- Fields ---
+
+    def get_field(self, group: str, game_tick: int = 0) -> Optional[FlowField]:
+        """Return the field for a group, rebuilding it if its inputs changed.
+
+        A stale field may be returned while its rebuild is rate limited (see
+        the module docstring); path_to_group/path_to_goal check the current
+        group tiles, direct users should too.
+        """
+        sources = self.get_sources(group, game_tick)
+        if not sources:
+            return None
+        from buildings import get_platform_transitions, get_transitions_version
+        self._transition_cache.update(get_platform_transitions(), get_transitions_version())
+        transitions = self._transition_cache.index
+
+        field = self._fields.get(group)
+        if field is not None and field.transitions is transitions:
+            same_sources = field.sources == sources
+            if same_sources and field.walk_version == self.grid.walk_version:
+                return field
+            interval = FLOW_FIELD_REBUILD_INTERVAL if same_sources else FLOW_FIELD_MEMBER_REBUILD_INTERVAL
+            if game_tick - field.built_tick < interval and game_tick >= field.built_tick:
+                return field
+            if self._rebuilt_tick == game_tick:
+                return field
+
+        field = FlowField(self.grid, sources, transitions, self.grid.walk_version, game_tick,
+                          self.max_distance)
+        self._fields[group] = field
+        self._rebuilt_tick = game_tick
+        self.rebuilds += 1
+        return field
+
+    def path_to_group(self, group: str, start: Coord3D, game_tick: int = 0) -> Optional[List[Coord3D]]:
+        """Path from start to the nearest tile of group, or None."""
+        field = self.get_field(group, game_tick)
+        if field is None:
+            return None
+        path = field.path_from(start)
+        # A field waiting on its rebuild may lead to a tile that left the group
+        if path is None or (path[-1] if path else start) not in self.get_sources(group, game_tick):
+            return None
+        return path
+
+    def path_to_goal(self, start: Coord3D, goal: Coord3D, game_tick: int = 0) -> Optional[List[Coord3D]]:
+        """Path from start to goal if goal belongs to a group and is the nearest tile of it.
+
+        Returns None when no field applies (the caller should search instead).
+        """
+        for group in self.groups():
+            if goal in self.get_sources(group, game_tick):
+                field = self.get_field(group, game_tick)
+                if field is None:
+                    continue
+                path = field.path_from(start, goal)
+                if path:
+                    return path
+        return None
+
+
+# --- Group providers ---
+
+def _stockpile_sources() -> FrozenSet[Coord3D]:
+    import zones
+    return frozenset(zones.get_all_stockpile_tiles())
+
+
+def _food_sources() -> FrozenSet[Coord3D]:
+    import zones
+    return frozenset(
+        coord for coord, storage in zones.get_all_tile_storage().items()
+        if storage and storage.get("type") == "cooked_meal" and storage.get("amount", 0) > 0
+    )
+
+
+def _bed_sources() -> FrozenSet[Coord3D]:
+    from beds import get_all_beds
+    return frozenset(pos for pos, data in get_all_beds() if data.get("assigned"))
+
+
+def _edge_sources(grid: Grid) -> FrozenSet[Coord3D]:
+    w, h = grid.width, grid.height
+    edge = {(x, 0, 0) for x in range(w)} | {(x, h - 1, 0) for x in range(w)}
+    edge |= {(0, y, 0) for y in range(h)} | {(w - 1, y, 0) for y in range(h)}
+    return frozenset(edge)
+
+
+# Module-level fields for the active grid (built lazily)
+_FLOW_FIELDS: Optional[FlowFields] = None
+
+
+def get_flow_fields(grid: Grid) -> FlowFields:
+    """Return the flow field service for grid, building it on first use."""
+    global _FLOW_FIELDS
+    if _FLOW_FIELDS is None or _FLOW_FIELDS.grid is not grid:
+        _FLOW_FIELDS = FlowFields(grid)
+    return _FLOW_FIELDS
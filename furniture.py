@@ -160,10 +160,10 @@ def place_furniture_direct(grid: Grid, x: int, y: int, z: int, item_id: str) ->
             # Mark as walkable or not based on furniture type
             # Beds and large furniture block movement
             if item_id in ("crash_bed", "comfort_chair", "storage_locker", "drum_kit", "synth"):
-                grid.walkable[z][tile_y][tile_x] = False
+                grid.set_walkable(tile_x, tile_y, z, False)
             else:
                 # Small items like stools, guitars, harmonicas don't block
-                grid.walkable[z][tile_y][tile_x] = True
+                grid.set_walkable(tile_x, tile_y, z, True)
     
     # Place the furniture tile ONLY on origin (multi-tile renderer handles the rest)
     grid.set_tile(x, y, tile_type, z=z)
@@ -9,6 +9,11 @@ The tile representation is intentionally simple (string markers) so it can be
 extended later to richer objects (rooms, zones, buildings, etc.).
 """
 
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice
+
 import config
 
 from config import (
@@ -65,6 +70,190 @@ import resources
 import zones
 import buildings
 import rooms
+from tile_registry import TILE_INFO, TILE_NAMES, tile_id
+from env_fields import EnvFieldEngine
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+    print("[Grid] numpy not installed - tile and env arrays use the array module")
+
+
+# Per-tile environmental fields: name -> (array typecode, default)
+# room_id 0 means "no room" (room IDs start at 1); exposed as None by get_env_data
+ENV_FIELDS = {
+    "interference": ("f", 0.0),
+    "pressure": ("f", 0.0),
+    "echo": ("f", 0.0),
+    "integrity": ("f", 1.0),
+    "is_outside": ("B", 1),
+    "room_id": ("i", 0),
+    "exit_count": ("B", 0),
+}
+
+_NUMPY_DTYPES = {"B": "uint8", "H": "uint16", "i": "int32", "I": "uint32", "f": "float32"}
+
+# Z-levels below this are stored dense; the ground is full from the start
+DENSE_Z_LEVELS = 1
+
+# Upper Z-levels are mostly empty sky, so their per-tile arrays are split into
+# CHUNK_SIZE x CHUNK_SIZE chunks that are only allocated on first write
+CHUNK_SHIFT = 4
+CHUNK_SIZE = 1 << CHUNK_SHIFT
+CHUNK_MASK = CHUNK_SIZE - 1
+
+# Tile changes kept in Grid.change_log; older ones fall off (see changes_since)
+CHANGE_LOG_SIZE = 8192
+
+
+def _alloc_levels(depth: int, plane: int, typecode: str, fill):
+    """Allocate per-Z flat storage of plane cells each.
+    
+    Returns (block, levels): with numpy, block is one (depth, plane) array and
+    levels are its rows (views); without it, block is None and levels are
+    array.array buffers. Either way levels[z][y * width + x] reads and writes
+    one tile.
+    """
+    if HAS_NUMPY:
+        block = np.full((depth, plane), fill, dtype=_NUMPY_DTYPES[typecode])
+        return block, [block[z] for z in range(depth)]
+    return None, [array(typecode, [fill]) * plane for _ in range(depth)]
+
+
+class _ChunkedLevel:
+    """Sparse per-tile storage for one upper Z-level.
+    
+    Indexed like the dense levels: level[y * width + x]. Tiles in chunks that
+    were never written read as the default, and writing the default into an
+    absent chunk doesn't allocate it.
+    """
+
+    __slots__ = ("width", "height", "default", "chunks_x", "chunks_y", "chunks", "_template")
+
+    def __init__(self, width: int, height: int, typecode: str, default):
+        self.width = width
+        self.height = height
+        self.default = default
+        self.chunks_x = (width + CHUNK_MASK) >> CHUNK_SHIFT
+        self.chunks_y = (height + CHUNK_MASK) >> CHUNK_SHIFT
+        self.chunks: list = [None] * (self.chunks_x * self.chunks_y)
+        self._template = array(typecode, [default]) * (CHUNK_SIZE * CHUNK_SIZE)
+
+    def __getitem__(self, i: int):
+        y, x = divmod(i, self.width)
+        chunk = self.chunks[(y >> CHUNK_SHIFT) * self.chunks_x + (x >> CHUNK_SHIFT)]
+        if chunk is None:
+            return self.default
+        return chunk[((y & CHUNK_MASK) << CHUNK_SHIFT) | (x & CHUNK_MASK)]
+
+    def __setitem__(self, i: int, value) -> None:
+        y, x = divmod(i, self.width)
+        c = (y >> CHUNK_SHIFT) * self.chunks_x + (x >> CHUNK_SHIFT)
+        chunk = self.chunks[c]
+        if chunk is None:
+            if value == self.default:
+                return
+            chunk = self.chunks[c] = self._template[:]
+        chunk[((y & CHUNK_MASK) << CHUNK_SHIFT) | (x & CHUNK_MASK)] = value
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def __iter__(self):
+        for i in range(self.width * self.height):
+            yield self[i]
+
+    def chunk_bounds(self, c: int) -> tuple[int, int, int, int]:
+        """Tile bounds (x0, y0, x1, y1) of chunk c, clipped to the level."""
+        x0 = (c % self.chunks_x) << CHUNK_SHIFT
+        y0 = (c // self.chunks_x) << CHUNK_SHIFT
+        return x0, y0, min(x0 + CHUNK_SIZE, self.width), min(y0 + CHUNK_SIZE, self.height)
+
+    def allocated(self) -> list[int]:
+        """Indices of the chunks that have been written to."""
+        return [c for c, chunk in enumerate(self.chunks) if chunk is not None]
+
+    def count(self, value) -> int:
+        """Number of tiles holding value (like array.count)."""
+        total = 0
+        for c, chunk in enumerate(self.chunks):
+            x0, y0, x1, y1 = self.chunk_bounds(c)
+            if chunk is None:
+                if value == self.default:
+                    total += (x1 - x0) * (y1 - y0)
+                continue
+            for y in range(y0, y1):
+                row = (y & CHUNK_MASK) << CHUNK_SHIFT
+                total += chunk[row:row + (x1 - x0)].count(value)
+        return total
+
+
+def _alloc_grid_levels(width: int, height: int, depth: int, typecode: str, fill):
+    """Per-Z storage for one per-tile field: dense below DENSE_Z_LEVELS, chunked above.
+    
+    Returns (block, levels) like _alloc_levels; block only covers the dense levels.
+    """
+    dense = min(depth, DENSE_Z_LEVELS)
+    block, levels = _alloc_levels(dense, width * height, typecode, fill)
+    levels += [_ChunkedLevel(width, height, typecode, fill) for _ in range(dense, depth)]
+    return block, levels
+
+
+class _TileRowView:
+    """grid.tiles[z][y] compatibility view: [x] reads/writes a tile name."""
+
+    __slots__ = ("_ids", "_base", "_width")
+
+    def __init__(self, ids, base: int, width: int):
+        self._ids = ids
+        self._base = base
+        self._width = width
+
+    def __getitem__(self, x: int) -> str:
+        return TILE_NAMES[self._ids[self._base + x]]
+
+    def __setitem__(self, x: int, value: str) -> None:
+        # Raw write like the old nested lists: no walkability/env/renderer updates
+        self._ids[self._base + x] = tile_id(value)
+
+    def __len__(self) -> int:
+        return self._width
+
+
+class _TileLevelView:
+    """grid.tiles[z] compatibility view: [y] returns a row view."""
+
+    __slots__ = ("_ids", "_width", "_height")
+
+    def __init__(self, ids, width: int, height: int):
+        self._ids = ids
+        self._width = width
+        self._height = height
+
+    def __getitem__(self, y: int) -> _TileRowView:
+        return _TileRowView(self._ids, y * self._width, self._width)
+
+    def __len__(self) -> int:
+        return self._height
+
+
+class _TileLayersView:
+    """grid.tiles compatibility view over the tile ID arrays: tiles[z][y][x] is a name."""
+
+    __slots__ = ("_grid",)
+
+    def __init__(self, grid: "Grid"):
+        self._grid = grid
+
+    def __getitem__(self, z: int) -> _TileLevelView:
+        grid = self._grid
+        return _TileLevelView(grid.tile_ids[z], grid.width, grid.height)
+
+    def __len__(self) -> int:
+        return self._grid.depth
 
 
 class Grid:
@@ -94,30 +283,85 @@ class Grid:
         # Callback for tile changes (used by Arcade renderer)
         self.on_tile_change = None  # Function(x, y, z) called when tile changes
         
-        # 3D tile array: tiles[z][y][x]
-        self.tiles: list[list[list[str]]] = [
-            [["empty" for _ in range(self.width)] for _ in range(self.height)]
-            for _ in range(self.depth)
-        ]
+        # Listeners for walkability changes (used by pathfinding layers)
+        # Each is called as fn(x, y, z, walkable) only when the value actually flips
+        self._walkability_listeners: list = []
+        
+        plane = self.width * self.height
+        
+        # Tile IDs (tile_registry) per Z-level: tile_ids[z][y * width + x]
+        # uint16, numpy when available. Levels from DENSE_Z_LEVELS up are
+        # _ChunkedLevel (see iter_chunks). tile_id_block is the numpy array behind
+        # the dense levels for whole-map passes (None without numpy).
+        self.tile_id_block, self.tile_ids = _alloc_grid_levels(self.width, self.height, self.depth, "H", 0)
         
-        # 3D walkability map: walkable[z][y][x]
+        # Compatibility view: tiles[z][y][x] reads/writes tile names
+        self.tiles = _TileLayersView(self)
+        
+        # Flat walkability per Z-level: walkable_flat[z][y * width + x] (1 = walkable)
         # Z=0 (ground) defaults to walkable
         # Z>0 (upper levels) default to NOT walkable - must be explicitly allowed
-        self.walkable: list[list[list[bool]]] = []
-        for z in range(self.depth):
-            if z == 0:
-                # Ground level - all tiles walkable by default
-                self.walkable.append([[True for _ in range(self.width)] for _ in range(self.height)])
-            else:
-                # Upper levels - all tiles blocked by default until allowed
-                self.walkable.append([[False for _ in range(self.width)] for _ in range(self.height)])
+        # Always write through set_walkable()
+        self.walkable_flat: list[bytearray] = [
+            bytearray([1 if z == 0 else 0]) * plane
+            for z in range(self.depth)
+        ]
+        
+        # Read-only walkable[z][y][x] view of the same bytes (numpy bool arrays when
+        # available, memoryview rows otherwise)
+        if HAS_NUMPY:
+            self.walkable = [
+                np.frombuffer(level, dtype=np.bool_).reshape(self.height, self.width)
+                for level in self.walkable_flat
+            ]
+        else:
+            self.walkable = [
+                [memoryview(level)[y * self.width:(y + 1) * self.width] for y in range(self.height)]
+                for level in self.walkable_flat
+            ]
+        
+        # Walkability change counter, and per tile the walk_version at which it last
+        # changed: tile_versions[z][y * width + x] (0 = never). A path planned at
+        # version v is still valid if no tile on it has a version above v.
+        self.walk_version = 0
+        _, self.tile_versions = _alloc_grid_levels(self.width, self.height, self.depth, "I", 0)
+        
+        # Environmental parameters, one array per field (see ENV_FIELDS):
+        # env[field][z][y * width + x], chunked like tile_ids. env_blocks holds the
+        # numpy blocks. get_env_data() assembles the old per-tile dict on demand.
+        self.env: dict = {}
+        self.env_blocks: dict = {}
+        for field, (typecode, default) in ENV_FIELDS.items():
+            self.env_blocks[field], self.env[field] = _alloc_grid_levels(
+                self.width, self.height, self.depth, typecode, default
+            )
         
-        # Environmental parameters for each tile: env_data[z][y][x]
-        # Each tile has: interference, pressure, echo, integrity, is_outside, room_id, exit_count
-        self.env_data: list[list[list[dict]]] = [
-            [[self._default_env_data() for _ in range(self.width)] for _ in range(self.height)]
+        # Tile change tracking (set_tile only; raw grid.tiles writes aren't seen):
+        # version counts tile changes, chunk_versions[z][c] is the version of the
+        # last change in CHUNK_SIZE chunk c (row-major, chunks_x per row) and
+        # change_log keeps the latest (version, tick, x, y, z, old, new) entries.
+        # game_tick is set by the main loop.
+        self.version = 0
+        self.game_tick = 0
+        self.chunks_x = (self.width + CHUNK_MASK) >> CHUNK_SHIFT
+        self.chunks_y = (self.height + CHUNK_MASK) >> CHUNK_SHIFT
+        self.chunk_versions: list[array] = [
+            array("I", [0]) * (self.chunks_x * self.chunks_y)
             for _ in range(self.depth)
         ]
+        self.change_log: deque = deque(maxlen=CHANGE_LOG_SIZE)
+        
+        # Open batch() blocks, and the tiles set_tile touched inside them:
+        # (x, y, z) -> whether autotiled neighbours need a refresh
+        self._batch_depth = 0
+        self._batch_tiles: dict[tuple[int, int, int], bool] = {}
+        
+        # Derived env fields (interference, echo, integrity, is_outside, exit_count)
+        # are recomputed for dirty regions, see env_fields.py
+        self.env_engine = EnvFieldEngine(self)
+        
+        # Params outside ENV_FIELDS set via set_env_param: (x, y, z) -> {param: value}
+        self._env_extra: dict[tuple[int, int, int], dict] = {}
         
         # Base tiles under furniture - stores original tile type before furniture placement
         # Key: (x, y, z), Value: original tile type (e.g., "finished_floor", "finished_stage")
@@ -147,23 +391,56 @@ class Grid:
         }
     
     def get_env_data(self, x: int, y: int, z: int = 0) -> dict:
-        """Get environmental data for a tile."""
+        """Get environmental data for a tile.
+        
+        Returns a new dict built from the env arrays - write with
+        set_env_param()/update_env_data(), not into the dict.
+        """
         if not self.in_bounds(x, y, z):
             return self._default_env_data()
-        return self.env_data[z][y][x]
+        if self.env_engine.dirty:
+            self.env_engine.recompute()
+        i = y * self.width + x
+        env = self.env
+        data = {
+            "interference": float(env["interference"][z][i]),
+            "pressure": float(env["pressure"][z][i]),
+            "echo": float(env["echo"][z][i]),
+            "integrity": float(env["integrity"][z][i]),
+            "is_outside": bool(env["is_outside"][z][i]),
+            "room_id": int(env["room_id"][z][i]) or None,
+            "exit_count": int(env["exit_count"][z][i]),
+        }
+        extra = self._env_extra.get((x, y, z))
+        if extra:
+            data.update(extra)
+        return data
     
     def set_env_param(self, x: int, y: int, z: int, param: str, value) -> None:
         """Set a specific environmental parameter for a tile."""
         if not self.in_bounds(x, y, z):
             return
-        self.env_data[z][y][x][param] = value
+        levels = self.env.get(param)
+        if levels is None:
+            self._env_extra.setdefault((x, y, z), {})[param] = value
+            return
+        if param == "room_id":
+            value = value or 0
+        elif param == "exit_count":
+            value = min(int(value), 255)
+        levels[z][y * self.width + x] = value
     
     def update_env_data(self, x: int, y: int, z: int, **kwargs) -> None:
         """Update multiple environmental parameters for a tile."""
         if not self.in_bounds(x, y, z):
             return
         for key, value in kwargs.items():
-            self.env_data[z][y][x][key] = value
+            self.set_env_param(x, y, z, key, value)
+    
+    def update_env_fields(self) -> None:
+        """Bring derived env fields up to date. Call before reading self.env directly."""
+        if self.env_engine.dirty:
+            self.env_engine.recompute()
     
     def calculate_exit_count(self, x: int, y: int, z: int) -> int:
         """Calculate number of adjacent walkable tiles."""
@@ -174,104 +451,231 @@ class Grid:
                 count += 1
         return count
 
+    def iter_chunks(self, z: int, halo: bool = False):
+        """Yield tile bounds (x0, y0, x1, y1) on level z that can hold non-default data.
+        
+        A dense level is a single rectangle covering the whole map. On chunked
+        levels only chunks something was written to (tiles or env) are
+        yielded, so whole-level scans skip empty sky. With halo, the chunks
+        around those are included too (for scans that look at the tiles next
+        to what was built, like room interiors).
+        """
+        tiles = self.tile_ids[z]
+        if not isinstance(tiles, _ChunkedLevel):
+            yield 0, 0, self.width, self.height
+            return
+        used = set(tiles.allocated())
+        for levels in self.env.values():
+            used.update(levels[z].allocated())
+        if halo:
+            cw, ch = tiles.chunks_x, tiles.chunks_y
+            for c in list(used):
+                cy, cx = divmod(c, cw)
+                for ny in range(max(cy - 1, 0), min(cy + 2, ch)):
+                    for nx in range(max(cx - 1, 0), min(cx + 2, cw)):
+                        used.add(ny * cw + nx)
+        for c in sorted(used):
+            yield tiles.chunk_bounds(c)
+    
+    def iter_tiles(self, z: int):
+        """Yield (x, y, tile) for level z, skipping chunks that were never written.
+        
+        Tiles in skipped chunks are all "empty".
+        """
+        ids = self.tile_ids[z]
+        names = TILE_NAMES
+        width = self.width
+        for x0, y0, x1, y1 in self.iter_chunks(z):
+            for y in range(y0, y1):
+                row = y * width
+                for x in range(x0, x1):
+                    yield x, y, names[ids[row + x]]
+
+    def _record_change(self, x: int, y: int, z: int, old: str | None, new: str) -> None:
+        """Bump the tile version and log a change made by set_tile."""
+        self.version += 1
+        self.chunk_versions[z][(y >> CHUNK_SHIFT) * self.chunks_x + (x >> CHUNK_SHIFT)] = self.version
+        self.change_log.append((self.version, self.game_tick, x, y, z, old, new))
+    
+    def changes_since(self, version: int) -> list[tuple] | None:
+        """Tile changes after version, oldest first, as (version, tick, x, y, z, old, new).
+        
+        Consumers remember grid.version when they last caught up and replay
+        only what changed since. Returns None if the log no longer reaches back
+        that far - the caller has to rescan instead.
+        """
+        if version >= self.version:
+            return []
+        log = self.change_log
+        first = log[0][0] if log else self.version + 1
+        if version + 1 < first:
+            return None
+        return list(islice(log, version + 1 - first, None))
+    
+    def chunks_changed_since(self, z: int, version: int):
+        """Yield tile bounds (x0, y0, x1, y1) of chunks on level z changed after version."""
+        for c, chunk_version in enumerate(self.chunk_versions[z]):
+            if chunk_version > version:
+                x0 = (c % self.chunks_x) << CHUNK_SHIFT
+                y0 = (c // self.chunks_x) << CHUNK_SHIFT
+                yield x0, y0, min(x0 + CHUNK_SIZE, self.width), min(y0 + CHUNK_SIZE, self.height)
+
     def in_bounds(self, x: int, y: int, z: int = 0) -> bool:
         """Return True if (x, y, z) lies inside the grid."""
         return 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.depth
 
+    def set_walkable(self, x: int, y: int, z: int, walkable: bool) -> None:
+        """Set walkability for a tile, keeping the flat pathfinding map in sync.
+        
+        Bumps walk_version and the tile's version and notifies walkability
+        listeners when the value changes.
+        """
+        if not self.in_bounds(x, y, z):
+            return
+        flat = self.walkable_flat[z]
+        i = y * self.width + x
+        if flat[i] == walkable:
+            return
+        flat[i] = 1 if walkable else 0
+        self.env_engine.mark_dirty(x, y, z)
+        self.walk_version += 1
+        self.tile_versions[z][y * self.width + x] = self.walk_version
+        for listener in self._walkability_listeners:
+            listener(x, y, z, walkable)
+    
+    def add_walkability_listener(self, listener) -> None:
+        """Register fn(x, y, z, walkable) to be called when a tile's walkability changes."""
+        if listener not in self._walkability_listeners:
+            self._walkability_listeners.append(listener)
+
+    @contextmanager
+    def batch(self):
+        """Defer set_tile's per-tile fan-out until the block ends.
+        
+        Inside the block set_tile stores tiles, walkability and env defaults
+        right away, but renderer callbacks and neighbour autotile refreshes run
+        once per affected tile, and env fields once per dirty region, when the
+        outermost batch closes. Use for world generation and loading.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_batch()
+    
+    def reset(self) -> None:
+        """Return tiles, walkability and env data to a fresh grid's (e.g. before loading a save).
+        
+        Tiles and walkability change through set_tile/set_walkable, so the
+        renderer, walkability listeners and the change log see every tile that
+        actually changes. Env arrays are reallocated at their defaults. Wrap in
+        batch() together with whatever is restored next.
+        """
+        for z in range(self.depth):
+            for x, y, tile in list(self.iter_tiles(z)):
+                if tile != "empty":
+                    self.set_tile(x, y, "empty", z)
+            # Ground defaults to walkable, upper levels to blocked
+            off_default = 0 if z == 0 else 1
+            flat = self.walkable_flat[z]
+            i = flat.find(off_default)
+            while i >= 0:
+                y, x = divmod(i, self.width)
+                self.set_walkable(x, y, z, not off_default)
+                i = flat.find(off_default, i + 1)
+        for field, (typecode, default) in ENV_FIELDS.items():
+            self.env_blocks[field], self.env[field] = _alloc_grid_levels(
+                self.width, self.height, self.depth, typecode, default
+            )
+        self._env_extra.clear()
+    
+    def set_tiles_bulk(self, tiles) -> None:
+        """Set many tiles at once: tiles is an iterable of (x, y, z, value)."""
+        with self.batch():
+            for x, y, z, value in tiles:
+                self.set_tile(x, y, value, z)
+    
+    def _flush_batch(self) -> None:
+        """Apply the deferred set_tile work for every tile touched in a batch."""
+        touched = self._batch_tiles
+        self._batch_tiles = {}
+        self.update_env_fields()
+        
+        if not self.on_tile_change:
+            return
+        notified = set(touched)
+        for key in touched:
+            self.on_tile_change(*key)
+        for (x, y, z), refresh in touched.items():
+            if not refresh:
+                continue
+            tiles = self.tile_ids[z]
+            for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+                nx, ny = x + dx, y + dy
+                if (nx, ny, z) in notified or not self.in_bounds(nx, ny, z):
+                    continue
+                if TILE_INFO[tiles[ny * self.width + nx]].refresh_neighbours:
+                    notified.add((nx, ny, z))
+                    self.on_tile_change(nx, ny, z)
+    
     def set_tile(self, x: int, y: int, value: str, z: int = 0) -> None:
         """Set the logical value of a tile if coordinates are valid.
         
-        Automatically updates walkability for building tiles and initializes environmental parameters.
+        Automatically updates walkability for building tiles and marks environmental parameters
+        for recomputation (see env_fields.py).
         Calls on_tile_change callback if set (for Arcade renderer updates).
+        Actual changes bump version and go into change_log (see changes_since).
+        Inside batch() the callbacks are deferred.
         
         Overlay tiles (dirt, grass, rubble) are stored separately and don't replace base tiles.
         """
         if self.in_bounds(x, y, z):
+            tid = tile_id(value)
+            info = TILE_INFO[tid]
             # Check if this is an overlay tile (dirt, grass, rubble)
-            if "overlay_autotile" in value:
+            if info.is_overlay:
                 # Store in overlay layer, don't replace base tile
+                old = self.overlay_tiles.get((x, y, z))
                 self.overlay_tiles[(x, y, z)] = value
+                if old != value:
+                    self._record_change(x, y, z, old, value)
             else:
-                # Regular tile - store in main tile array
-                self.tiles[z][y][x] = value
+                # Regular tile - store its ID in the tile array
+                tiles = self.tile_ids[z]
+                i = y * self.width + x
+                old_id = tiles[i]
+                if old_id != tid:
+                    tiles[i] = tid
+                    self._record_change(x, y, z, TILE_NAMES[old_id], value)
+                    # Env fields follow the tile (recomputed on the next env read)
+                    self.env_engine.mark_dirty(x, y, z)
             
+            if self._batch_depth:
+                # Callbacks and neighbour refreshes run when the batch closes
+                key = (x, y, z)
+                self._batch_tiles[key] = self._batch_tiles.get(key, False) or info.refresh_neighbours
             # Notify renderer of tile change (Arcade only)
-            if self.on_tile_change:
+            elif self.on_tile_change:
                 self.on_tile_change(x, y, z)
                 
                 # For autotiled tiles (walls, roads), also update neighbors so they recalculate variants
                 # This ensures corners/T-junctions update when adjacent tiles are placed
-                if "_autotile" in value or "wall" in value or "road" in value or "street" in value:
+                if info.refresh_neighbours:
+                    tiles = self.tile_ids[z]
                     # Update 4 cardinal neighbors
                     for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
                         nx, ny = x + dx, y + dy
                         if self.in_bounds(nx, ny, z):
-                            neighbor_tile = self.get_tile(nx, ny, z)
                             # Only update if neighbor is also an autotiled type
-                            if neighbor_tile and ("_autotile" in neighbor_tile or "wall" in neighbor_tile or "road" in neighbor_tile or "street" in neighbor_tile):
+                            if TILE_INFO[tiles[ny * self.width + nx]].refresh_neighbours:
                                 self.on_tile_change(nx, ny, z)
             # Only finished buildings/walls block movement, not those under construction
-            # Doors are handled specially - they can be opened
-            # Fire escapes are walkable (they're transition points)
-            # Roofs are now walkable by default (no need for allow tool)
-            if value in ("finished_building", "finished_wall", "finished_wall_autotile", "finished_wall_advanced", "finished_salvagers_bench", "finished_generator", "finished_stove", "finished_gutter_forge", "finished_skinshop_loom", "finished_cortex_spindle", "finished_barracks"):
-                self.walkable[z][y][x] = False
-            elif value == "finished_window":
-                # Windows are passable (like doors) - colonists can climb through
-                self.walkable[z][y][x] = True
-            elif value in ("empty", "building", "wall", "wall_advanced", "door", "floor", "finished_floor", "roof", "roof_floor", "roof_access", "fire_escape", "finished_fire_escape", "window_tile", "fire_escape_platform", "window", "bridge", "finished_bridge", "salvagers_bench", "generator", "stove", "gutter_forge", "skinshop_loom", "cortex_spindle", "barracks", "street", "street_cracked", "street_scar", "street_ripped", "street_designated", "sidewalk", "sidewalk_designated", "debris", "weeds", "prop_barrel", "prop_sign", "prop_scrap", "dirt", "grass", "rock", "scorched", "gutter_slab", "crash_bed"):
-                # window_tile: passable wall with fire escape window
-                # fire_escape_platform: external platform for fire escape
-                # roof: walkable rooftop tile (now walkable by default)
-                # roof_access/roof_floor: legacy walkable roof (kept for compatibility)
-                # bridge/finished_bridge: walkable connections between buildings
-                # street/street_designated: walkable city streets
-                # sidewalk/debris/weeds/props: decorative, walkable
-                # dirt/grass/rock: natural ground tiles
-                self.walkable[z][y][x] = True
-            
-            # Initialize environmental parameters based on tile type
-            self._init_env_params_for_tile(x, y, z, value)
+            # (see tile_registry.BLOCKING_TILES / WALKABLE_TILES; other tiles keep their walkability)
+            if info.walkable is not None:
+                self.set_walkable(x, y, z, info.walkable)
     
-    def _init_env_params_for_tile(self, x: int, y: int, z: int, tile_type: str) -> None:
-        """Initialize environmental parameters based on tile type."""
-        # Ruins have degraded environmental values
-        if tile_type in ("debris", "weeds", "prop_barrel", "prop_sign", "prop_scrap"):
-            self.update_env_data(x, y, z,
-                echo=0.3,
-                integrity=0.4,
-                interference=0.1,
-                is_outside=True
-            )
-        # New construction has clean values
-        elif tile_type in ("building", "wall", "wall_advanced", "floor", "door", "window",
-                          "salvagers_bench", "generator", "stove", "gutter_forge", "skinshop_loom", "cortex_spindle", "bridge", "fire_escape", "gutter_slab", "crash_bed"):
-            self.update_env_data(x, y, z,
-                echo=0.0,
-                integrity=1.0,
-                interference=0.0,
-                is_outside=False  # Construction is typically inside
-            )
-        # Finished construction maintains clean values
-        elif tile_type in ("finished_building", "finished_wall", "finished_wall_advanced",
-                          "finished_floor", "finished_window", "finished_bridge",
-                          "finished_salvagers_bench", "finished_generator", "finished_stove",
-                          "finished_gutter_forge", "finished_skinshop_loom", "finished_cortex_spindle"):
-            self.update_env_data(x, y, z,
-                echo=0.0,
-                integrity=1.0,
-                interference=0.0,
-                is_outside=False  # Finished buildings are inside
-            )
-        # Outside tiles keep defaults
-        else:
-            # Already has default values, but ensure is_outside is True
-            self.set_env_param(x, y, z, "is_outside", True)
-        
-        # Update exit count
-        exit_count = self.calculate_exit_count(x, y, z)
-        self.set_env_param(x, y, z, "exit_count", exit_count)
-
     def get_tile(self, x: int, y: int, z: int = 0) -> str | None:
         """Get the tile value or None if out of bounds.
         
@@ -279,7 +683,7 @@ class Grid:
         Use get_overlay_tile() to check for overlay tiles.
         """
         if self.in_bounds(x, y, z):
-            return self.tiles[z][y][x]
+            return TILE_NAMES[self.tile_ids[z][y * self.width + x]]
         return None
     
     def get_overlay_tile(self, x: int, y: int, z: int = 0) -> str | None:
@@ -290,7 +694,7 @@ class Grid:
         """Return True if colonists can walk on this tile."""
         if not self.in_bounds(x, y, z):
             return False
-        return self.walkable[z][y][x]
+        return self.walkable_flat[z][y * self.width + x] == 1
     
     def set_current_z(self, z: int) -> None:
         """Set the current view Z-level."""
@@ -944,7 +1348,7 @@ class Grid:
                 temp_y = (y - start_y) * tile_size
                 temp_rect = pygame.Rect(temp_x, temp_y, tile_size, tile_size)
                 
-                tile = self.tiles[below_z][y][x]
+                tile = self.get_tile(x, y, below_z)
                 
                 # Try to draw sprite first, fallback to dimmed procedural
                 sprite_drawn = False
@@ -1053,7 +1457,7 @@ class Grid:
                     tile_size,
                 )
 
-                tile = self.tiles[z][y][x]
+                tile = self.get_tile(x, y, z)
 
                 # Draw base ground tiles first (beneath everything else)
                 # On upper floors, skip empty tiles so layer below shows through
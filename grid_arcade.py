@@ -3,17 +3,36 @@ Arcade-based grid rendering for Fractured City.
 
 This module handles converting the Grid's tile data into Arcade sprites
 for GPU-accelerated rendering.
+
+On large maps (config.LARGE_MAP) a Z-level is too big to hold as one
+SpriteList, so sprites are kept per RENDER_CHUNK_SIZE chunk instead: chunks
+are built when the camera first sees them and the least recently seen are
+dropped once more than RENDER_CHUNK_CACHE are held. The tinted copies drawn
+for the level below are dropped and copied again when the grid's change
+log (Grid.changes_since, or Grid.chunks_changed_since once the log has moved
+on) shows a tile change in their chunk.
 """
 
+from collections import OrderedDict
+
 import arcade
+import config
 from config import TILE_SIZE
 from grid import Grid
 from autotiling import get_autotile_variant, get_connection_set, should_autotile
+from tile_registry import (
+    LAYER_FLOOR, LAYER_RESOURCE, LAYER_ROAD, LAYER_STRUCTURE, tile_info,
+)
 from tileset_loader import get_tile_texture as get_tileset_texture
 
 # Global reference to grid renderer for dirty tile marking
 _GRID_RENDERER = None
 
+# Chunked sprite storage (large maps): chunk size in tiles (even, so coarse 2x2
+# road cells never straddle chunks) and how many chunk sprite lists to keep
+RENDER_CHUNK_SIZE = 32
+RENDER_CHUNK_CACHE = 64
+
 def mark_tile_dirty_global(x: int, y: int, z: int):
     """Mark a tile as dirty for re-rendering. Called from external modules."""
     global _GRID_RENDERER
@@ -46,6 +65,18 @@ class GridRenderer:
         # Track which Z-levels have been built
         self.z_levels_built = set()
         
+        # Large maps: sprite lists per chunk instead of per Z-level.
+        # (z, cx, cy) -> SpriteList, least recently drawn first
+        self.chunked = config.LARGE_MAP
+        self.chunk_sprite_lists = OrderedDict()
+        self.chunk_tinted_lists = {}
+        # z -> Grid.version that level's tinted chunks were last checked against
+        self.tinted_seen_versions = {}
+        # Chunk range (cx0, cy0, cx1, cy1) the camera sees, set by set_view()
+        self.view_chunks = (0, 0, 0, 0)
+        # Trash particles live in their own list (chunk lists come and go)
+        self.particle_sprite_list = arcade.SpriteList()
+        
         # Current Z-level being viewed
         self.current_z = 0
         
@@ -116,48 +147,8 @@ class GridRenderer:
         # Map construction tiles to finished_ versions FIRST (before autotiling check)
         # During construction: tile_type is "wall" -> maps to "finished_wall_autotile" (will be darkened)
         # After construction: tile_type is "finished_wall_autotile" -> stays "finished_wall_autotile" (normal)
-        construction_to_finished = {
-            # Structures
-            "wall": "finished_wall_autotile",
-            "wall_advanced": "finished_wall_autotile",
-            "floor": "finished_floor",
-            "door": "finished_door",
-            "bar_door": "finished_bar_door",
-            "window": "finished_window",
-            "bridge": "finished_bridge",
-            "fire_escape": "window_tile",  # Fire escape under construction shows window_tile sprite
-            "stage": "finished_stage",
-            "stage_stairs": "finished_stage_stairs",
-            "building": "finished_building",
-            # Workstations - ALL use finished_ sprites
-            "gutter_still": "finished_gutter_still",
-            "spark_bench": "finished_spark_bench",
-            "tinker_station": "finished_tinker_station",
-            "salvagers_bench": "finished_salvagers_bench",
-            "generator": "finished_generator",
-            "stove": "finished_stove",
-            "gutter_forge": "finished_gutter_forge",
-            "skinshop_loom": "finished_skinshop_loom",
-            "cortex_spindle": "finished_cortex_spindle",
-            "barracks": "finished_barracks",
-            "plant_bed": "finished_plant_bed",
-            # Furniture
-            "scrap_bar_counter": "finished_scrap_bar_counter",
-            "crash_bed": "finished_crash_bed",
-            "comfort_chair": "finished_comfort_chair",
-            "bar_stool": "finished_bar_stool",
-            "storage_locker": "finished_storage_locker",
-            "dining_table": "finished_dining_table",
-            "wall_lamp": "finished_wall_lamp",
-            "workshop_table": "finished_workshop_table",
-            "tool_rack": "finished_tool_rack",
-            "weapon_rack": "finished_weapon_rack",
-            "gutter_slab": "finished_gutter_slab",
-        }
-        
-        # Map construction tiles to finished versions (for darkening during construction)
-        if tile_type in construction_to_finished:
-            tile_type = construction_to_finished[tile_type]
+        tile_type = tile_info(tile_type).finished
+        info = tile_info(tile_type)
         
         # Debug: Log first street tile
         if tile_type == "street" and not hasattr(self, '_street_logged'):
@@ -165,7 +156,7 @@ class GridRenderer:
             print(f"[GridRenderer] Processing street tile at ({x}, {y}), should_autotile={should_autotile(tile_type)}")
         
         # Check if this tile type should use autotiling
-        if should_autotile(tile_type):
+        if info.autotiled:
             variant = get_autotile_variant(
                 self.grid, x, y, z, tile_type, 
                 connect_to=get_connection_set(tile_type)
@@ -347,6 +338,12 @@ class GridRenderer:
         """
         self.current_z = z_level
         
+        # Chunked storage builds chunks as they come into view (see draw)
+        if self.chunked:
+            if force_rebuild:
+                self._drop_chunks(z_level)
+            return
+        
         # Check if this Z-level already built
         if z_level in self.z_levels_built and not force_rebuild:
             print(f"[GridRenderer] Z={z_level} already built, switching to it")
@@ -375,7 +372,7 @@ class GridRenderer:
         
         print(f"[GridRenderer] Built {len(sprite_list)} sprites for Z={z_level}")
     
-    def _build_z_level_sprites(self, z_level: int, sprite_list: arcade.SpriteList):
+    def _build_z_level_sprites(self, z_level: int, sprite_list: arcade.SpriteList, area=None):
         """Build sprites for a specific Z-level.
         
         Creates new sprite instances for each tile on this Z-level.
@@ -385,7 +382,9 @@ class GridRenderer:
         Args:
             z_level: Z-level to build
             sprite_list: SpriteList to add sprites to
+            area: Optional tile bounds (x0, y0, x1, y1) to build only part of the level
         """
+        x0, y0, x1, y1 = area if area is not None else (0, 0, self.grid.width, self.grid.height)
         # Initialize tracking set for multi-tile structures
         self._rendered_multitile_tiles = set()
         
@@ -437,43 +436,40 @@ class GridRenderer:
                 sprite_list.append(sprite)
         
         # Pass 1: Concrete base
-        for y in range(self.grid.height):
-            for x in range(self.grid.width):
-                tile_type = self.grid.get_tile(x, y, z_level)
-                if tile_type:
-                    if z_level > 0 and tile_type not in walkable_roof_tiles:
-                        continue
-                    add_to_cache(x, y, z_level, "ground_concrete")
+        # (iter_tiles skips unbuilt chunks of upper levels - those are all empty sky)
+        for x, y, tile_type in self._iter_area_tiles(z_level, area):
+            if tile_type:
+                if z_level > 0 and tile_type not in walkable_roof_tiles:
+                    continue
+                add_to_cache(x, y, z_level, "ground_concrete")
         
         # Pass 2: Overlays (Z0 only)
         if z_level == 0:
-            for y in range(self.grid.height):
-                for x in range(self.grid.width):
+            for y in range(y0, y1):
+                for x in range(x0, x1):
                     overlay_type = self.grid.get_overlay_tile(x, y, z_level)
                     if overlay_type:
                         add_to_cache(x, y, z_level, overlay_type)
         
         # Pass 3: Roads (Z0 only) - COARSE GRID 2x2 rendering
         if z_level == 0:
-            self._render_coarse_roads(z_level, sprite_list)
+            self._render_coarse_roads(z_level, sprite_list, area)
         
         # Pass 4: Floors
         floor_count = 0
         floor_texture_fails = 0
-        for y in range(self.grid.height):
-            for x in range(self.grid.width):
-                tile_type = self.grid.get_tile(x, y, z_level)
-                if tile_type and ("floor" in tile_type):
-                    if z_level > 0 and tile_type not in walkable_roof_tiles:
-                        continue
-                    # Test if texture loads
-                    test_texture = self.get_tile_texture(tile_type, x, y, z_level)
-                    if not test_texture:
-                        floor_texture_fails += 1
-                        if floor_texture_fails == 1:
-                            print(f"[GridRenderer] FAILED to load floor texture for '{tile_type}' at ({x},{y})")
-                    add_to_cache(x, y, z_level, tile_type)
-                    floor_count += 1
+        for x, y, tile_type in self._iter_area_tiles(z_level, area):
+            if tile_type and tile_info(tile_type).render_layer == LAYER_FLOOR:
+                if z_level > 0 and tile_type not in walkable_roof_tiles:
+                    continue
+                # Test if texture loads
+                test_texture = self.get_tile_texture(tile_type, x, y, z_level)
+                if not test_texture:
+                    floor_texture_fails += 1
+                    if floor_texture_fails == 1:
+                        print(f"[GridRenderer] FAILED to load floor texture for '{tile_type}' at ({x},{y})")
+                add_to_cache(x, y, z_level, tile_type)
+                floor_count += 1
         if not hasattr(self, '_floor_render_logged'):
             self._floor_render_logged = True
             print(f"[GridRenderer] Pass 4: Found {floor_count} floor tiles to render ({floor_texture_fails} texture load failures)")
@@ -481,10 +477,10 @@ class GridRenderer:
         # Pass 5: Resource nodes and salvage objects (overlay above floors)
         if z_level == 0:
             resource_count = 0
-            for y in range(self.grid.height):
-                for x in range(self.grid.width):
+            for y in range(y0, y1):
+                for x in range(x0, x1):
                     tile_type = self.grid.get_tile(x, y, z_level)
-                    if tile_type and (tile_type == "resource_node" or tile_type == "salvage_object"):
+                    if tile_type and tile_info(tile_type).render_layer == LAYER_RESOURCE:
                         add_to_cache(x, y, z_level, tile_type)
                         resource_count += 1
             if not hasattr(self, '_resource_render_logged'):
@@ -492,24 +488,34 @@ class GridRenderer:
                 print(f"[GridRenderer] Pass 5: Found {resource_count} resource tiles to render")
         
         # Pass 6: Walls and structures
-        for y in range(self.grid.height):
-            for x in range(self.grid.width):
-                tile_type = self.grid.get_tile(x, y, z_level)
-                if tile_type and not ("street" in tile_type or "road" in tile_type or "ground_" in tile_type or "floor" in tile_type or tile_type == "resource_node" or tile_type == "salvage_object"):
-                    if z_level > 0 and tile_type not in walkable_roof_tiles:
-                        continue
-                    # Use _add_structure_sprite for proper multi-tile handling
-                    self._add_structure_sprite(x, y, z_level, tile_type, 255, sprite_list)
+        for x, y, tile_type in self._iter_area_tiles(z_level, area):
+            if tile_type and tile_info(tile_type).render_layer == LAYER_STRUCTURE:
+                if z_level > 0 and tile_type not in walkable_roof_tiles:
+                    continue
+                # Use _add_structure_sprite for proper multi-tile handling
+                self._add_structure_sprite(x, y, z_level, tile_type, 255, sprite_list)
         
         # Pass 7: Construction footprint highlighting
         # (Now drawn as outlines in _draw_construction_footprints() method)
         
-        print(f"[GridRenderer] Cached {len(sprite_list)} sprites for Z={z_level}")
+        if area is None:
+            print(f"[GridRenderer] Cached {len(sprite_list)} sprites for Z={z_level}")
         
         # Index all sprites by position for fast lookup
         self._index_sprites(z_level, sprite_list)
     
-    def _render_coarse_roads(self, z_level: int, sprite_list: arcade.SpriteList):
+    def _iter_area_tiles(self, z_level: int, area):
+        """Yield (x, y, tile_type) for a whole level, or for tile bounds (x0, y0, x1, y1)."""
+        if area is None:
+            yield from self.grid.iter_tiles(z_level)
+            return
+        x0, y0, x1, y1 = area
+        get_tile = self.grid.get_tile
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                yield x, y, get_tile(x, y, z_level)
+    
+    def _render_coarse_roads(self, z_level: int, sprite_list: arcade.SpriteList, area=None):
         """Render roads on a coarse 2×2 grid using 128×128 sprites.
         
         Each coarse grid cell corresponds to a 2×2 block of fine tiles.
@@ -519,10 +525,13 @@ class GridRenderer:
         Args:
             z_level: Z-level to render (should be 0 for roads)
             sprite_list: SpriteList to add road sprites to
+            area: Optional tile bounds (x0, y0, x1, y1), corners on even tiles
         """
+        x0, y0, x1, y1 = area if area is not None else (0, 0, self.grid.width, self.grid.height)
+        
         # Iterate coarse grid (every 2 tiles)
-        for coarse_y in range(0, self.grid.height, 2):
-            for coarse_x in range(0, self.grid.width, 2):
+        for coarse_y in range(y0, y1, 2):
+            for coarse_x in range(x0, x1, 2):
                 # Check if any tile in this 2×2 block is a road
                 has_road = False
                 for dy in range(2):
@@ -532,7 +541,7 @@ class GridRenderer:
                         if not self.grid.in_bounds(fine_x, fine_y, z_level):
                             continue
                         tile_type = self.grid.get_tile(fine_x, fine_y, z_level)
-                        if tile_type and ("street" in tile_type or "road" in tile_type):
+                        if tile_type and tile_info(tile_type).render_layer == LAYER_ROAD:
                             has_road = True
                             break
                     if has_road:
@@ -610,7 +619,7 @@ class GridRenderer:
                 if not self.grid.in_bounds(fine_x, fine_y, z):
                     continue
                 tile_type = self.grid.get_tile(fine_x, fine_y, z)
-                if tile_type and ("street" in tile_type or "road" in tile_type):
+                if tile_type and tile_info(tile_type).render_layer == LAYER_ROAD:
                     return True
         return False
     
@@ -644,10 +653,17 @@ class GridRenderer:
         # Rebuild tiles for each Z-level
         for z_level, tiles in tiles_by_z.items():
             sprite_list = self.z_level_sprite_lists.get(z_level)
-            if sprite_list is None:
+            if sprite_list is None and not self.chunked:
                 continue
             
             for x, y in tiles:
+                if self.chunked:
+                    # Chunks not built yet pick the change up when they are
+                    key = (z_level, x // RENDER_CHUNK_SIZE, y // RENDER_CHUNK_SIZE)
+                    sprite_list = self.chunk_sprite_lists.get(key)
+                    if sprite_list is None:
+                        continue
+                
                 # Remove old sprites at this position
                 key = (x, y, z_level)
                 if key in self.sprite_index:
@@ -699,21 +715,18 @@ class GridRenderer:
             if overlay_type:
                 add_sprite(overlay_type)
         
-        # Layer 3: Roads (if applicable)
-        if z == 0 and ("street" in tile_type or "road" in tile_type):
+        # Layers 3-6: Roads (Z0 only), floors, resources (Z0 only) or structures
+        render_layer = tile_info(tile_type).render_layer
+        if z == 0 and render_layer == LAYER_ROAD:
             add_sprite(tile_type)
         
-        # Layer 4: Floors
-        if "floor" in tile_type:
+        if render_layer == LAYER_FLOOR:
             add_sprite(tile_type)
         
-        # Layer 5: Resources
-        if z == 0 and tile_type in ("resource_node", "salvage_object"):
+        if z == 0 and render_layer == LAYER_RESOURCE:
             add_sprite(tile_type)
         
-        # Layer 6: Structures (walls, buildings, etc.)
-        if not ("street" in tile_type or "road" in tile_type or "ground_" in tile_type or 
-                "floor" in tile_type or tile_type in ("resource_node", "salvage_object")):
+        if render_layer == LAYER_STRUCTURE:
             # Use _add_structure_sprite for proper multi-tile handling
             self._add_structure_sprite(x, y, z, tile_type, 255, sprite_list)
         
@@ -845,6 +858,9 @@ class GridRenderer:
         Args:
             z_level: Specific Z-level to invalidate, or None to clear all
         """
+        if self.chunked:
+            self._drop_chunks(z_level)
+            return
         if z_level is not None:
             if z_level in self.z_levels_built:
                 self.z_levels_built.discard(z_level)
@@ -1357,6 +1373,12 @@ class GridRenderer:
         tinted_list.clear()
         
         # Create tinted copies of all sprites
+        self._fill_tinted(sprite_list, tinted_list)
+        
+        print(f"[GridRenderer] Built {len(tinted_list)} tinted sprites for Z={z_level}")
+    
+    def _fill_tinted(self, sprite_list: arcade.SpriteList, tinted_list: arcade.SpriteList):
+        """Append dark-tinted copies of every sprite in sprite_list to tinted_list."""
         for sprite in sprite_list:
             tinted_sprite = arcade.Sprite()
             tinted_sprite.texture = sprite.texture
@@ -1367,8 +1389,95 @@ class GridRenderer:
             # Apply dark tint (40% brightness)
             tinted_sprite.color = (80, 80, 90)  # Dark blue-gray
             tinted_list.append(tinted_sprite)
+    
+    # --- Chunked sprite storage (large maps) ---
+    
+    def set_view(self, left: float, bottom: float, right: float, top: float):
+        """Set the world-space rectangle the camera sees (chunked storage only).
         
-        print(f"[GridRenderer] Built {len(tinted_list)} tinted sprites for Z={z_level}")
+        Call before draw() each frame; chunks overlapping it are drawn, built
+        first if needed.
+        """
+        span = RENDER_CHUNK_SIZE * TILE_SIZE
+        chunks_x = (self.grid.width + RENDER_CHUNK_SIZE - 1) // RENDER_CHUNK_SIZE
+        chunks_y = (self.grid.height + RENDER_CHUNK_SIZE - 1) // RENDER_CHUNK_SIZE
+        self.view_chunks = (
+            max(int(left // span), 0), max(int(bottom // span), 0),
+            min(int(right // span) + 1, chunks_x), min(int(top // span) + 1, chunks_y),
+        )
+    
+    def _get_chunk_lists(self, z_level: int, tinted: bool = False):
+        """Sprite lists of the chunks in view on one Z-level, building missing ones."""
+        cx0, cy0, cx1, cy1 = self.view_chunks
+        lists = []
+        for cy in range(cy0, cy1):
+            for cx in range(cx0, cx1):
+                key = (z_level, cx, cy)
+                sprite_list = self.chunk_sprite_lists.get(key)
+                if sprite_list is None:
+                    sprite_list = self._build_chunk(key)
+                self.chunk_sprite_lists.move_to_end(key)
+                if tinted:
+                    tinted_list = self.chunk_tinted_lists.get(key)
+                    if tinted_list is None:
+                        tinted_list = arcade.SpriteList(use_spatial_hash=True)
+                        self._fill_tinted(sprite_list, tinted_list)
+                        self.chunk_tinted_lists[key] = tinted_list
+                    lists.append(tinted_list)
+                else:
+                    lists.append(sprite_list)
+        
+        # Drop the least recently drawn chunks past the cache size (never the
+        # ones in view, even zoomed far out)
+        limit = max(RENDER_CHUNK_CACHE, 2 * (cx1 - cx0) * (cy1 - cy0))
+        while len(self.chunk_sprite_lists) > limit:
+            self._drop_chunk(next(iter(self.chunk_sprite_lists)))
+        return lists
+    
+    def _build_chunk(self, key) -> arcade.SpriteList:
+        """Build the sprite list for one (z, cx, cy) chunk."""
+        z_level, cx, cy = key
+        area = (cx * RENDER_CHUNK_SIZE, cy * RENDER_CHUNK_SIZE,
+                min((cx + 1) * RENDER_CHUNK_SIZE, self.grid.width),
+                min((cy + 1) * RENDER_CHUNK_SIZE, self.grid.height))
+        sprite_list = arcade.SpriteList(use_spatial_hash=True)
+        self._build_z_level_sprites(z_level, sprite_list, area)
+        self.chunk_sprite_lists[key] = sprite_list
+        return sprite_list
+    
+    def _drop_chunk(self, key):
+        """Free one chunk's sprite lists and forget its sprites."""
+        z_level, cx, cy = key
+        sprite_list = self.chunk_sprite_lists.pop(key)
+        self.chunk_tinted_lists.pop(key, None)
+        x0, y0 = cx * RENDER_CHUNK_SIZE, cy * RENDER_CHUNK_SIZE
+        for y in range(y0, y0 + RENDER_CHUNK_SIZE):
+            for x in range(x0, x0 + RENDER_CHUNK_SIZE):
+                self.sprite_index.pop((x, y, z_level), None)
+        dropped = set(map(id, sprite_list))
+        if self.tree_sprites:
+            self.tree_sprites = [(sprite, offset) for sprite, offset in self.tree_sprites
+                                 if id(sprite) not in dropped]
+    
+    def _refresh_tinted_chunks(self, z_level: int):
+        """Drop tinted copies on z_level whose tiles changed since the last check."""
+        seen = self.tinted_seen_versions.get(z_level, 0)
+        if seen == self.grid.version:
+            return
+        changes = self.grid.changes_since(seen)
+        if changes is None:
+            # Log no longer reaches back that far - fall back to chunk versions
+            tiles = [(x0, y0) for x0, y0, _, _ in self.grid.chunks_changed_since(z_level, seen)]
+        else:
+            tiles = [(x, y) for _, _, x, y, z, _, _ in changes if z == z_level]
+        for x, y in tiles:
+            self.chunk_tinted_lists.pop((z_level, x // RENDER_CHUNK_SIZE, y // RENDER_CHUNK_SIZE), None)
+        self.tinted_seen_versions[z_level] = self.grid.version
+    
+    def _drop_chunks(self, z_level: int = None):
+        """Drop every chunk on one Z-level (or all levels) so they rebuild on next view."""
+        for key in [key for key in self.chunk_sprite_lists if z_level is None or key[0] == z_level]:
+            self._drop_chunk(key)
     
     def draw(self):
         """Draw sprites for current Z-level with Z-1 below (tinted).
@@ -1378,6 +1487,10 @@ class GridRenderer:
         
         Performance: Uses pre-built tinted sprite list for Z-1.
         """
+        if self.chunked:
+            self._draw_chunked()
+            return
+        
         # Build entire Z-level if never built
         if self.current_z not in self.z_levels_built:
             self.build_tile_sprites(self.current_z, force_rebuild=True)
@@ -1407,6 +1520,21 @@ class GridRenderer:
         # Draw construction footprint outlines on top
         self._draw_construction_footprints()
     
+    def _draw_chunked(self):
+        """draw() for chunked storage: only the chunks in view (set_view)."""
+        if self.dirty_tiles:
+            self._rebuild_dirty_tiles()
+        
+        if self.current_z > 0:
+            self._refresh_tinted_chunks(self.current_z - 1)
+            for tinted_list in self._get_chunk_lists(self.current_z - 1, tinted=True):
+                tinted_list.draw()
+        for sprite_list in self._get_chunk_lists(self.current_z):
+            sprite_list.draw()
+        self.particle_sprite_list.draw()
+        
+        self._draw_construction_footprints()
+    
     def update_animations(self, delta_time: float):
         """Update animated sprites (trees swaying, particles, etc.).
         
@@ -1553,8 +1681,11 @@ class GridRenderer:
         sprite.scale = random.uniform(0.5, 1.0)
         
         # Add to appropriate sprite list based on current Z-level
-        current_list = self.z_level_sprite_lists.get(self.current_z)
-        if current_list:
+        if self.chunked:
+            current_list = self.particle_sprite_list
+        else:
+            current_list = self.z_level_sprite_lists.get(self.current_z)
+        if current_list is not None:
             current_list.append(sprite)
         
         # Track particle (no lifetime - only despawns when off-screen)
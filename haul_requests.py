@@ -0,0 +1,77 @@
+"""Queue of item tiles waiting for a haul job.
+
+resources.process_auto_haul_jobs and items.process_equipment_haul_jobs used
+to scan every loose item for haul_requested ones. Instead, the places that
+create or release loose items push the tile here (spawning, marking for
+hauling, a haul job ending with the item still on the ground) and the
+producers only look at what was pushed:
+
+- push(coord) queues a tile; pop() hands the producer this tick's tiles.
+- defer(coord) parks a tile that found no stockpile. It comes back after
+  HAUL_RETRY_BASE ticks, doubling per failed attempt up to HAUL_RETRY_MAX
+  (timer wheel kind set per queue), or right away when the zones layout
+  changes (zones.get_zone_version - a new stockpile, a filter toggled,
+  space freed).
+- done(coord) forgets a tile's backoff once it got its job.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from timer_wheel import TIMERS
+
+Coord3D = Tuple[int, int, int]  # (x, y, z)
+
+# Backoff for tiles with no stockpile to go to (ticks)
+HAUL_RETRY_BASE = 30
+HAUL_RETRY_MAX = 480
+
+
+class HaulRequestQueue:
+    """Pending haul requests for one kind of loose item."""
+
+    def __init__(self, timer_kind: str):
+        self.timer_kind = timer_kind
+        self.pending: Dict[Coord3D, None] = {}  # Ordered set
+        self.attempts: Dict[Coord3D, int] = {}  # Parked tiles -> failed tries
+        self.zone_version = -1
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def push(self, coord: Coord3D) -> None:
+        self.pending[coord] = None
+
+    def pop(self, zones_module) -> List[Coord3D]:
+        """Take every tile that is due: new requests, retries, and all parked
+        tiles if the stockpile layout changed since they were parked."""
+        for coord in TIMERS.pop_due(self.timer_kind):
+            self.pending[coord] = None
+        if self.attempts:
+            version = zones_module.get_zone_version()
+            if version != self.zone_version:
+                for coord in self.attempts:
+                    TIMERS.cancel(self.timer_kind, coord)
+                    self.pending[coord] = None
+        coords = list(self.pending)
+        self.pending.clear()
+        return coords
+
+    def defer(self, coord: Coord3D, zones_module) -> None:
+        """Park a tile that found no destination, with exponential backoff."""
+        tries = self.attempts.get(coord, 0)
+        self.attempts[coord] = tries + 1
+        self.zone_version = zones_module.get_zone_version()
+        delay = min(HAUL_RETRY_BASE << tries, HAUL_RETRY_MAX)
+        TIMERS.schedule(self.timer_kind, coord, delay)
+
+    def done(self, coord: Coord3D) -> None:
+        """Drop a tile's backoff (it got a job, or its items are gone)."""
+        if self.attempts.pop(coord, None) is not None:
+            TIMERS.cancel(self.timer_kind, coord)
+
+    def clear(self) -> None:
+        self.pending.clear()
+        self.attempts.clear()
+        TIMERS.clear(self.timer_kind)
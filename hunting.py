@@ -25,8 +25,8 @@ def spawn_hunt_jobs(colonists: List) -> int:
     
     # Check which animals already have hunt jobs (assigned or unassigned)
     existing_hunt_jobs = set()
-    for job in jobs_module.JOB_QUEUE:
-        if job.category == "hunt" and hasattr(job, 'animal_uid'):
+    for job in jobs_module.get_jobs_by_category("hunt"):
+        if hasattr(job, 'animal_uid'):
             existing_hunt_jobs.add(job.animal_uid)
     
     jobs_created = 0
@@ -19,6 +19,9 @@ from __future__ import annotations
 from typing import Dict, Tuple, Optional, List
 from dataclasses import dataclass, field
 
+from haul_requests import HaulRequestQueue
+from jobs import JOB_QUEUE
+
 
 # ============================================================================
 # Item Definition
@@ -817,6 +820,10 @@ Coord3D = Tuple[int, int, int]
 # World items registry - items on the ground awaiting pickup
 _WORLD_ITEMS: Dict[Coord3D, List[dict]] = {}
 
+# Tiles with world items to haul since the last process_equipment_haul_jobs
+# pass (see haul_requests.py)
+_HAUL_REQUESTS = HaulRequestQueue("equipment_haul_retry")
+
 
 def spawn_world_item(x: int, y: int, z: int, item_id: str, count: int = 1) -> bool:
     """Spawn an item on the ground at the given position.
@@ -839,6 +846,7 @@ def spawn_world_item(x: int, y: int, z: int, item_id: str, count: int = 1) -> bo
             "slot": item_def.slot,
             "haul_requested": True,  # Auto-mark for hauling
         })
+    _HAUL_REQUESTS.push(coord)
     
     return True
 
@@ -868,6 +876,7 @@ def get_all_world_items() -> Dict[Coord3D, List[dict]]:
 def clear_world_items() -> None:
     """Clear all world items (for testing/reset)."""
     _WORLD_ITEMS.clear()
+    _HAUL_REQUESTS.clear()
 
 
 # ============================================================================
@@ -958,26 +967,27 @@ def add_item_metadata(item_instance: dict, source_species: str = None,
 
 
 def process_equipment_haul_jobs(jobs_module, zones_module) -> int:
-    """Create haul jobs for all items on the ground.
+    """Create haul jobs for items on the ground.
     
-    Called each tick from main loop. Finds items needing haul and creates
-    jobs to move them to stockpile zones. Handles equipment, components, 
-    instruments, and other crafted items.
+    Called from the main loop (every 10 ticks). Only looks at tiles pushed
+    onto _HAUL_REQUESTS since the last pass (plus retries that came due) and
+    creates jobs to move their items to stockpile zones. Handles equipment,
+    components, instruments, and other crafted items.
     
     Returns number of jobs created.
     """
     jobs_created = 0
     
-    for (x, y, z), items in list(_WORLD_ITEMS.items()):
-        if not items:
-            continue
+    for (x, y, z) in _HAUL_REQUESTS.pop(zones_module):
+        items = _WORLD_ITEMS.get((x, y, z))
         
         # Check first item (we haul one at a time)
-        item = items[0]
-        if not item.get("haul_requested", False):
+        if not items or not items[0].get("haul_requested", False):
+            _HAUL_REQUESTS.done((x, y, z))
             continue
+        item = items[0]
         
-        # Already has a job at this location
+        # Already has a job - _on_job_removed re-queues the tile when it ends
         if jobs_module.get_job_at(x, y, z) is not None:
             continue
         
@@ -1028,7 +1038,8 @@ def process_equipment_haul_jobs(jobs_module, zones_module) -> int:
             )
         
         if dest is None:
-            # No valid stockpile zone exists - skip
+            # No valid stockpile zone exists - try again later
+            _HAUL_REQUESTS.defer((x, y, z), zones_module)
             continue
         
         dest_x, dest_y, dest_z = dest
@@ -1045,11 +1056,27 @@ def process_equipment_haul_jobs(jobs_module, zones_module) -> int:
             dest_z=dest_z,
             z=z,
         )
+        _HAUL_REQUESTS.done((x, y, z))
         jobs_created += 1
     
     return jobs_created
 
 
+def _on_job_removed(job) -> None:
+    """Job board listener: re-queue tiles that still hold items to haul.
+    
+    Covers haul jobs that ended (failed, or finished with more items left on
+    the tile) and other jobs on the tile that made a request wait.
+    """
+    coord = (job.x, job.y, job.z)
+    items = _WORLD_ITEMS.get(coord)
+    if items and items[0].get("haul_requested", False):
+        _HAUL_REQUESTS.push(coord)
+
+
+JOB_QUEUE.add_remove_listener(_on_job_removed)
+
+
 # ============================================================================
 # Tag-Based Item Matching (Phase 3)
 # ============================================================================
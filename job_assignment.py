@@ -0,0 +1,244 @@
+"""Batch job assignment, run once per game tick.
+
+Idle colonists used to pick work one at a time inside Colonist.update, each
+scoring its own candidate jobs and taking its favourite. Colonists updated
+early in a tick got first pick, and two colonists near the same job had no
+way to settle who should get it.
+
+Here the main loop matches all idle colonists at once:
+
+- Each idle colonist contributes a row of a sparse score matrix: its
+  candidate jobs (Colonist.find_job_candidates - the nearest few per
+  category) scored by Colonist.score_job minus JOB_DISTANCE_WEIGHT per tile
+  of travel.
+- Rows are cached per colonist with the colonist's position and a key of
+  everything find_job_candidates reads besides it: the job board's
+  open_version, the grid's walk_version (reachability) and the game hour
+  (schedules switch on the hour). A cached row is reused while both are
+  unchanged. A colonist that just became idle or moved is rescored right
+  away; one whose row only went stale because the key changed waits for its
+  stagger tick (the same i % 3 == tick % 3 groups update_colonists uses), so
+  a busy board or a building spree costs about a third of the idle colonists
+  per tick, not all of them.
+- Rescoring stops once JOB_ASSIGN_BUDGET_MS is spent. Colonists that didn't
+  fit are first in line next tick.
+- The matrix is solved greedily: highest scoring (colonist, job) pair first,
+  skipping pairs whose colonist or job is already matched.
+
+Until update_job_assignment() has been called once (headless scripts, tests)
+the phase is inactive and colonists keep taking jobs themselves.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from jobs import JOB_QUEUE, JOB_Z_DISTANCE, Job
+from time_system import get_game_time
+
+if TYPE_CHECKING:
+    from colonist import Colonist
+    from grid import Grid
+
+# Wall-clock milliseconds per tick spent building score rows
+JOB_ASSIGN_BUDGET_MS = 2.0
+
+# Idle colonists with stale rows are rescored every this many ticks (matches
+# the update_colonists stagger)
+JOB_ASSIGN_STAGGER = 3
+
+# Score lost per tile between a colonist and a job. Small next to the
+# category priority gaps, so it mostly decides between jobs of one kind.
+JOB_DISTANCE_WEIGHT = 0.05
+
+
+def travel_distance(colonist: Colonist, job: Job) -> int:
+    """Tiles between a colonist and a job, as JobBoard.nearest_open measures them."""
+    return (max(abs(job.x - colonist.x), abs(job.y - colonist.y))
+            + abs(job.z - colonist.z) * JOB_Z_DISTANCE)
+
+
+def is_idle(colonist: Colonist) -> bool:
+    """Whether a colonist is free to be given a job this tick."""
+    return (colonist.state == "idle"
+            and colonist.current_job is None
+            and not colonist.is_dead
+            and not colonist.is_sleeping
+            and not (colonist.in_combat and colonist.combat_target))
+
+
+class JobAssigner:
+    """Matches idle colonists to open jobs once per tick."""
+
+    def __init__(self, budget_ms: float = JOB_ASSIGN_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self.active = False
+
+        # Colonist uid -> tick it was first seen idle
+        self._idle_since: Dict[int, int] = {}
+        # Colonists whose rows didn't fit the budget, by uid
+        self._deferred: List[int] = []
+        # Colonist uid -> ((open_version, walk_version, hour), position, [(score, distance, job)])
+        self._rows: Dict[int, Tuple[Tuple[int, int, int], Tuple[int, int, int], List[Tuple[float, int, Job]]]] = {}
+
+        # Stats for debugging/UI
+        self.ms_last_tick = 0.0
+        self.max_ms = 0.0
+        self.assigned_last_tick = 0
+        self.distance_last_tick = 0
+        self.assigned = 0
+        self.total_distance = 0
+        self.total_wait_ticks = 0
+        self.max_wait_ticks = 0
+        self.deferred = 0
+        self.rescored_last_tick = 0
+        self.rescored = 0
+        self.cached_rows = 0
+
+    def assign(self, colonists: Iterable[Colonist], grid: Grid, game_tick: int) -> List[Tuple[Colonist, Job]]:
+        """Match this tick's idle colonists to jobs and hand the jobs out.
+
+        Returns the (colonist, job) pairs assigned.
+        """
+        self.active = True
+        started = time.perf_counter()
+        deadline = started + self.budget_ms / 1000.0
+
+        stagger_group = game_tick % JOB_ASSIGN_STAGGER
+        idle = [(i, c) for i, c in enumerate(colonists) if is_idle(c)]
+        idle_uids = {c.uid for _, c in idle}
+        for uid in list(self._idle_since):
+            if uid not in idle_uids:
+                del self._idle_since[uid]
+                self._rows.pop(uid, None)
+        newly_idle = set()
+        for _, c in idle:
+            if c.uid not in self._idle_since:
+                self._idle_since[c.uid] = game_tick
+                newly_idle.add(c.uid)
+
+        # Colonists deferred last tick go first
+        first = {uid: i for i, uid in enumerate(self._deferred)}
+        idle.sort(key=lambda ic: first.get(ic[1].uid, len(first)))
+
+        # Sparse score matrix: (score, -distance, row, job) per candidate pair
+        walk_version = grid.walk_version if grid is not None else 0
+        key = (JOB_QUEUE.open_version, walk_version, get_game_time().hour)
+        pairs: List[Tuple[float, int, int, Job]] = []
+        row_colonists: List[Colonist] = []
+        deferred: List[int] = []
+        rescored = 0
+        for i, c in idle:
+            position = (c.x, c.y, c.z)
+            cached = self._rows.get(c.uid)
+            if cached is not None and cached[0] == key and cached[1] == position:
+                scored = cached[2]
+            elif (cached is None or cached[1] != position or c.uid in newly_idle
+                  or c.uid in first or i % JOB_ASSIGN_STAGGER == stagger_group):
+                if (rescored or deferred) and time.perf_counter() >= deadline:
+                    deferred.append(c.uid)
+                    continue
+                scored = []
+                for job in c.find_job_candidates(grid):
+                    distance = travel_distance(c, job)
+                    score = c.score_job(job, grid) - distance * JOB_DISTANCE_WEIGHT
+                    scored.append((score, distance, job))
+                self._rows[c.uid] = (key, position, scored)
+                rescored += 1
+            else:
+                # Board, walls or hour changed since this row was scored; wait for the stagger tick
+                continue
+            row = len(row_colonists)
+            row_colonists.append(c)
+            for score, distance, job in scored:
+                pairs.append((score, -distance, row, job))
+        self._deferred = deferred
+        self.deferred += len(deferred)
+        self.rescored_last_tick = rescored
+        self.rescored += rescored
+        self.cached_rows = len(self._rows)
+
+        # Greedy matching, best pair first (ties: shorter walk, earlier row)
+        pairs.sort(key=lambda p: (-p[0], -p[1], p[2]))
+        matched: List[Tuple[Colonist, Job]] = []
+        taken_rows = set()
+        taken_jobs = set()
+        for _, _, row, job in pairs:
+            if row in taken_rows or job.id in taken_jobs:
+                continue
+            taken_rows.add(row)
+            taken_jobs.add(job.id)
+            matched.append((row_colonists[row], job))
+
+        distance_total = 0
+        for c, job in matched:
+            distance_total += travel_distance(c, job)
+            wait = game_tick - self._idle_since.pop(c.uid, game_tick)
+            self._rows.pop(c.uid, None)
+            self.total_wait_ticks += wait
+            self.max_wait_ticks = max(self.max_wait_ticks, wait)
+            c._assign_job(job, grid)
+
+        elapsed = (time.perf_counter() - started) * 1000.0
+        self.ms_last_tick = elapsed
+        self.max_ms = max(self.max_ms, elapsed)
+        self.assigned_last_tick = len(matched)
+        self.distance_last_tick = distance_total
+        self.assigned += len(matched)
+        self.total_distance += distance_total
+        return matched
+
+    def clear(self) -> None:
+        """Forget idle and deferred colonists (e.g. after loading a save)."""
+        self._idle_since.clear()
+        self._deferred.clear()
+        self._rows.clear()
+
+    def get_stats(self) -> dict:
+        """Return latency and travel counters for debugging/UI."""
+        return {
+            "budget_ms": self.budget_ms,
+            "ms_last_tick": self.ms_last_tick,
+            "max_ms": self.max_ms,
+            "assigned_last_tick": self.assigned_last_tick,
+            "distance_last_tick": self.distance_last_tick,
+            "assigned": self.assigned,
+            "total_distance": self.total_distance,
+            "avg_distance": self.total_distance / self.assigned if self.assigned else 0.0,
+            "avg_wait_ticks": self.total_wait_ticks / self.assigned if self.assigned else 0.0,
+            "max_wait_ticks": self.max_wait_ticks,
+            "deferred": self.deferred,
+            "rescored_last_tick": self.rescored_last_tick,
+            "rescored": self.rescored,
+            "cached_rows": self.cached_rows,
+        }
+
+
+# Module-level assigner for the running game
+_JOB_ASSIGNER: Optional[JobAssigner] = None
+
+
+def get_job_assigner() -> JobAssigner:
+    """Return the job assigner, building it on first use."""
+    global _JOB_ASSIGNER
+    if _JOB_ASSIGNER is None:
+        _JOB_ASSIGNER = JobAssigner()
+    return _JOB_ASSIGNER
+
+
+def update_job_assignment(colonists: Iterable[Colonist], grid: Grid, game_tick: int) -> None:
+    """Main loop hook: match idle colonists to open jobs."""
+    get_job_assigner().assign(colonists, grid, game_tick)
+
+
+def is_job_assignment_active() -> bool:
+    """Whether the main loop assigns jobs (colonists shouldn't pick their own)."""
+    return _JOB_ASSIGNER is not None and _JOB_ASSIGNER.active
+
+
+def get_job_assignment_stats() -> dict:
+    """Return the assigner's stats (empty before the first assignment phase)."""
+    if _JOB_ASSIGNER is None:
+        return {}
+    return _JOB_ASSIGNER.get_stats()
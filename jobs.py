@@ -1,25 +1,42 @@
 """Global job queue and basic construction job logic.
 
-This module owns the list of active jobs and provides simple helpers for
+This module owns the board of active jobs and provides simple helpers for
 adding, assigning, and completing jobs. For now only a single job type is
 supported: "construction".
 
-The queue is intentionally minimal so it can later be replaced with a more
-sophisticated scheduler without changing callers.
+The board (JobBoard) indexes jobs by ID, type, category, assignment state,
+readiness and position, so the module-level helpers below are lookups rather
+than scans of every job.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Dict
+import heapq
+from typing import Callable, Collection, Dict, Iterator, List, Optional, Tuple
+
+from config import GRID_Z
+from timer_wheel import TIMERS
+
+# Open jobs are bucketed into JOB_CELL_SIZE x JOB_CELL_SIZE cells per Z-level
+# for nearest-job queries (JobBoard.nearest_open)
+JOB_CELL_SIZE = 16
+
+# Tiles of distance counted per Z-level between a colonist and a job
+JOB_Z_DISTANCE = 10
+
+# Nearest open jobs per category a colonist scores when looking for work
+JOB_CANDIDATES_PER_CATEGORY = 8
+
+# Timer wheel kind for job wait timers (keyed by the Job itself)
+JOB_WAIT_TIMER = "job_wait"
 
 
-@dataclass
 class Job:
     """Job anchored at a tile.
 
     Attributes
     -----------
+    id:             Unique job ID (assigned when the job is created).
     type:           Job type (e.g. "construction", "gathering", "haul").
     category:       Job category for grouping (e.g. "harvest", "construction", "wall", "haul").
     x, y:           Target grid coordinates (pickup location for haul jobs).
@@ -30,44 +47,455 @@ class Job:
     pressure:       Urgency level 1-10 (higher = more urgent, overrides normal priority).
     subtype:        Specific job subtype for priority within category (e.g. "wall", "door", "floor").
     dest_x, dest_y, dest_z: Destination coordinates (for haul/supply jobs).
+
+    ready:          Construction jobs only - site has its materials and no
+                    stockpile left to clear (kept current by buildings.py).
+
+    assigned, wait_timer, ready and x/y/z are properties: changing them updates
+    the JobBoard indexes of the board holding the job. wait_timer is backed by
+    the shared timer wheel - reading it gives the ticks left.
+    """
+
+    __slots__ = (
+        "id", "type", "category", "_x", "_y", "_z", "progress", "required",
+        "_assigned", "_wait_timer", "_ready", "pressure", "subtype", "resource_type",
+        "dest_x", "dest_y", "dest_z", "delivery_queue", "pickup_amount",
+        "furniture_item", "furniture_tile",
+        "animal_uid",  # Hunt jobs only - left unset otherwise (callers test hasattr)
+        "_board",
+    )
+
+    _next_id = 1
+
+    def __init__(
+        self,
+        type: str,
+        category: str,
+        x: int,
+        y: int,
+        z: int = 0,  # Z-level (0=ground, 1=rooftop)
+        progress: int = 0,
+        required: int = 100,
+        assigned: bool = False,
+        wait_timer: int = 0,  # Ticks to wait before reassigning (e.g., waiting for materials)
+        pressure: int = 1,  # Urgency 1-10 (1=baseline, 10=critical)
+        subtype: str | None = None,  # Specific type for priority (e.g. "workstation", "door", "wall", "floor")
+        # Optional extra data for specific job types (e.g. gathering).
+        resource_type: str | None = None,
+        # Destination for haul/supply jobs
+        dest_x: int | None = None,
+        dest_y: int | None = None,
+        dest_z: int = 0,  # Destination Z-level
+        # Batch delivery queue for supply jobs: list of (x, y, z, amount) tuples
+        # Colonist picks up total amount and delivers to each site in sequence
+        delivery_queue: List[Tuple[int, int, int, int]] | None = None,
+        # Total amount to pick up for batch supply jobs
+        pickup_amount: int = 1,
+        # Furniture placement job metadata
+        furniture_item: str | None = None,  # Item ID for furniture (e.g., "crash_bed")
+        furniture_tile: str | None = None,  # Tile type for furniture (e.g., "crash_bed")
+    ):
+        self.id = Job._next_id
+        Job._next_id += 1
+        self._board: JobBoard | None = None
+        self.type = type
+        self.category = category
+        self._x = x
+        self._y = y
+        self._z = z
+        self.progress = progress
+        self.required = required
+        self._assigned = assigned
+        self._wait_timer = 0
+        self._ready = True
+        self.pressure = pressure
+        self.subtype = subtype
+        self.resource_type = resource_type
+        self.dest_x = dest_x
+        self.dest_y = dest_y
+        self.dest_z = dest_z
+        self.delivery_queue = delivery_queue if delivery_queue is not None else []
+        self.pickup_amount = pickup_amount
+        self.furniture_item = furniture_item
+        self.furniture_tile = furniture_tile
+        if wait_timer > 0:
+            self.wait_timer = wait_timer
+
+    def __repr__(self) -> str:
+        return (f"Job(id={self.id}, type={self.type!r}, category={self.category!r}, "
+                f"x={self._x}, y={self._y}, z={self._z}, assigned={self._assigned})")
+
+    # --- Indexed attributes ---
+
+    @property
+    def assigned(self) -> bool:
+        return self._assigned
+
+    @assigned.setter
+    def assigned(self, value: bool) -> None:
+        changed = bool(value) != bool(self._assigned)
+        self._assigned = value
+        if changed and self._board is not None:
+            self._board._index_state(self)
+
+    @property
+    def wait_timer(self) -> int:
+        if self._wait_timer <= 0:
+            return 0
+        return TIMERS.remaining(JOB_WAIT_TIMER, self)
+
+    @wait_timer.setter
+    def wait_timer(self, value: int) -> None:
+        changed = (value > 0) != (self._wait_timer > 0)
+        self._wait_timer = value
+        if value > 0:
+            TIMERS.schedule(JOB_WAIT_TIMER, self, value)
+        else:
+            TIMERS.cancel(JOB_WAIT_TIMER, self)
+        if changed and self._board is not None:
+            self._board._index_state(self)
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    @ready.setter
+    def ready(self, value: bool) -> None:
+        value = bool(value)
+        if value == self._ready:
+            return
+        self._ready = value
+        if self._board is not None:
+            self._board._index_ready(self, changed=True)
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self._move(value, self._y, self._z)
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self._move(self._x, value, self._z)
+
+    @property
+    def z(self) -> int:
+        return self._z
+
+    @z.setter
+    def z(self, value: int) -> None:
+        self._move(self._x, self._y, value)
+
+    def _move(self, x: int, y: int, z: int) -> None:
+        board = self._board
+        if board is not None:
+            board._unindex_position(self)
+        self._x, self._y, self._z = x, y, z
+        if board is not None:
+            board._index_position(self)
+
+
+class JobBoard:
+    """All active jobs, keyed by ID, with secondary indexes.
+
+    Indexes (each a dict of job ID -> Job, so membership and removal are O(1)
+    and iteration follows insertion order):
+    - by type and by category
+    - unassigned jobs, waiting jobs (wait_timer > 0, assigned or not), and
+      open jobs (unassigned and not waiting - what colonists can take)
+    - by tile position (x, y, z)
+    - open jobs by JOB_CELL_SIZE cell (z, cx, cy), for nearest_open()
+    - construction jobs whose site is ready to build (ready_construction)
+
+    Iterating the board (or len / in) covers every job in creation order, so
+    code that used to walk the JOB_QUEUE list keeps working. Jobs keep the
+    indexes current themselves when assigned, wait_timer or x/y/z change.
+
+    Removal listeners (add_remove_listener) are called with each job that
+    leaves the board, however it was removed.
     """
 
-    type: str
-    category: str
-    x: int
-    y: int
-    z: int = 0  # Z-level (0=ground, 1=rooftop)
-    progress: int = 0
-    required: int = 100
-    assigned: bool = False
-    wait_timer: int = 0  # Ticks to wait before reassigning (e.g., waiting for materials)
-    pressure: int = 1  # Urgency 1-10 (1=baseline, 10=critical)
-    subtype: str | None = None  # Specific type for priority (e.g. "workstation", "door", "wall", "floor")
-    # Optional extra data for specific job types (e.g. gathering).
-    resource_type: str | None = None
-    # Destination for haul/supply jobs
-    dest_x: int | None = None
-    dest_y: int | None = None
-    dest_z: int = 0  # Destination Z-level
-    # Batch delivery queue for supply jobs: list of (x, y, z, amount) tuples
-    # Colonist picks up total amount and delivers to each site in sequence
-    delivery_queue: List[Tuple[int, int, int, int]] = field(default_factory=list)
-    # Total amount to pick up for batch supply jobs
-    pickup_amount: int = 1
-    # Furniture placement job metadata
-    furniture_item: str | None = None  # Item ID for furniture (e.g., "crash_bed")
-    furniture_tile: str | None = None  # Tile type for furniture (e.g., "crash_bed")
-    # Additional metadata (faction, priority, etc.) can be added later via
-    # new fields.
-
-
-# Global job queue for the prototype. In a larger system this could be owned
-# by a world or simulation controller object.
-JOB_QUEUE: List[Job] = []
-
-# Spatial cache for fast job lookups by position
-# Key: (x, y, z), Value: Job
-_JOB_POSITION_CACHE: Dict[Tuple[int, int, int], Job] = {}
+    def __init__(self):
+        self.jobs: Dict[int, Job] = {}
+        self.by_type: Dict[str, Dict[int, Job]] = {}
+        self.by_category: Dict[str, Dict[int, Job]] = {}
+        self.unassigned: Dict[int, Job] = {}
+        self.waiting: Dict[int, Job] = {}
+        self.open: Dict[int, Job] = {}
+        self.by_position: Dict[Tuple[int, int, int], Dict[int, Job]] = {}
+        self.open_cells: Dict[Tuple[int, int, int], Dict[int, Job]] = {}
+        # Number of open jobs per Z-level and per (category, type, startable)
+        self.open_levels: Dict[int, int] = {}
+        self.open_kinds: Dict[Tuple[str, str, bool], int] = {}
+        # Bumped whenever the set of open jobs (or their kinds) changes, so
+        # callers can tell whether cached candidate lists are still good
+        self.open_version = 0
+        self.ready_construction: Dict[int, Job] = {}
+        self._remove_listeners: List[Callable[[Job], None]] = []
+
+    def add_remove_listener(self, listener: Callable[[Job], None]) -> None:
+        """Call listener(job) whenever a job is removed or the board is cleared."""
+        if listener not in self._remove_listeners:
+            self._remove_listeners.append(listener)
+
+    def __iter__(self) -> Iterator[Job]:
+        return iter(list(self.jobs.values()))
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def __contains__(self, job) -> bool:
+        return self.jobs.get(getattr(job, "id", None)) is job
+
+    def add(self, job: Job) -> None:
+        """Add a job and index it."""
+        self.jobs[job.id] = job
+        job._board = self
+        self.by_type.setdefault(job.type, {})[job.id] = job
+        self.by_category.setdefault(job.category, {})[job.id] = job
+        self._index_state(job)
+        self._index_position(job)
+        self._index_ready(job)
+
+    def remove(self, job: Job) -> bool:
+        """Remove a job from the board and every index. Returns True if it was there."""
+        if job not in self:
+            return False
+        del self.jobs[job.id]
+        self._discard(self.by_type, job.type, job.id)
+        self._discard(self.by_category, job.category, job.id)
+        self._unindex_state(job)
+        self._unindex_position(job)
+        self.ready_construction.pop(job.id, None)
+        TIMERS.cancel(JOB_WAIT_TIMER, job)
+        job._board = None
+        for listener in self._remove_listeners:
+            listener(job)
+        return True
+
+    def clear(self) -> None:
+        """Remove every job."""
+        removed = list(self.jobs.values())
+        for job in removed:
+            job._board = None
+        TIMERS.clear(JOB_WAIT_TIMER)
+        for index in (self.jobs, self.by_type, self.by_category, self.unassigned,
+                      self.waiting, self.open, self.by_position, self.open_cells,
+                      self.open_levels, self.open_kinds, self.ready_construction):
+            index.clear()
+        self.open_version += 1
+        for job in removed:
+            for listener in self._remove_listeners:
+                listener(job)
+
+    def of_type(self, job_type: str) -> List[Job]:
+        """Jobs of one type, assigned or not."""
+        return list(self.by_type.get(job_type, {}).values())
+
+    def of_category(self, category: str) -> List[Job]:
+        """Jobs of one category, assigned or not."""
+        return list(self.by_category.get(category, {}).values())
+
+    def at(self, x: int, y: int, z: int) -> List[Job]:
+        """Jobs anchored at a tile, oldest first."""
+        jobs = self.by_position.get((x, y, z))
+        return list(jobs.values()) if jobs else []
+
+    def nearest_open(self, x: int, y: int, z: int, per_category: int = JOB_CANDIDATES_PER_CATEGORY,
+                     accept: Optional[Callable[[Job], bool]] = None,
+                     categories: Optional[Collection[str]] = None,
+                     skip_types: Collection[str] = (),
+                     startable_only: bool = False) -> List[Job]:
+        """Up to per_category nearest open jobs of each category, nearest first.
+        
+        Distance is Chebyshev distance on the level plus JOB_Z_DISTANCE per
+        Z-level apart. Cells are searched in growing square rings around
+        (x, y) and the search stops once every category has its quota and no
+        unsearched cell can hold anything closer. Jobs accept() rejects don't
+        count toward a quota.
+        
+        categories, skip_types and startable_only (see is_startable) filter
+        jobs before accept() sees them. Jobs they exclude aren't waited on, so
+        pass them for whole categories or types the caller can't take -
+        otherwise the search keeps going until it has seen every such job.
+        """
+        if not self.open:
+            return []
+        cell_x, cell_y = x // JOB_CELL_SIZE, y // JOB_CELL_SIZE
+        levels = sorted(self.open_levels)
+        
+        def allowed(category: str, job_type: str, startable: bool) -> bool:
+            return ((categories is None or category in categories)
+                    and job_type not in skip_types
+                    and (startable or not startable_only))
+        
+        # Open jobs per category still unseen, counting only allowed ones
+        remaining: Dict[str, int] = {}
+        for (category, job_type, startable), count in self.open_kinds.items():
+            if allowed(category, job_type, startable):
+                remaining[category] = remaining.get(category, 0) + count
+        unseen = sum(remaining.values())
+        # Category -> max-heap (negated distance) of its nearest accepted jobs
+        best: Dict[str, List[Tuple[int, int, Job]]] = {}
+        ring = 0
+        while unseen:
+            # Nothing in this ring or beyond is closer than this
+            bound = (ring - 1) * JOB_CELL_SIZE + 1 if ring else 0
+            if bound and all(
+                count == 0 or (len(best.get(category, ())) >= per_category
+                               and -best[category][0][0] < bound)
+                for category, count in remaining.items()
+            ):
+                break
+            for level in levels:
+                for cx, cy in _ring_cells(cell_x, cell_y, ring):
+                    cell = self.open_cells.get((level, cx, cy))
+                    if not cell:
+                        continue
+                    for job in cell.values():
+                        category = job.category
+                        if not allowed(category, job.type, self._startable(job)):
+                            continue
+                        unseen -= 1
+                        remaining[category] -= 1
+                        if accept is not None and not accept(job):
+                            continue
+                        distance = max(abs(job._x - x), abs(job._y - y)) + abs(job._z - z) * JOB_Z_DISTANCE
+                        heap = best.setdefault(category, [])
+                        entry = (-distance, -job.id, job)
+                        if len(heap) < per_category:
+                            heapq.heappush(heap, entry)
+                        elif entry > heap[0]:
+                            heapq.heapreplace(heap, entry)
+            ring += 1
+        found = [entry for heap in best.values() for entry in heap]
+        found.sort(key=lambda entry: (-entry[0], -entry[1]))
+        return [job for _, _, job in found]
+
+    # --- Index upkeep (called by Job property setters) ---
+
+    def _index_state(self, job: Job) -> None:
+        """Put a job in the assignment/readiness indexes matching its state."""
+        job_id = job.id
+        if job._wait_timer > 0:
+            self.waiting[job_id] = job
+        else:
+            self.waiting.pop(job_id, None)
+        if job._assigned:
+            self.unassigned.pop(job_id, None)
+            self._close(job)
+            return
+        self.unassigned[job_id] = job
+        if job._wait_timer > 0:
+            self._close(job)
+        elif job_id not in self.open:
+            self.open[job_id] = job
+            self._add_to_cell(job)
+
+    def _unindex_state(self, job: Job) -> None:
+        self.unassigned.pop(job.id, None)
+        self.waiting.pop(job.id, None)
+        self._close(job)
+
+    def _index_ready(self, job: Job, changed: bool = False) -> None:
+        if job.type == "construction" and job._ready:
+            self.ready_construction[job.id] = job
+        else:
+            self.ready_construction.pop(job.id, None)
+        if changed and job.id in self.open:
+            # Move the open count over to the job's new kind
+            self._decrement(self.open_kinds, (job.category, job.type, not self._startable(job)))
+            kind = self._kind(job)
+            self.open_kinds[kind] = self.open_kinds.get(kind, 0) + 1
+            self.open_version += 1
+
+    def is_startable(self, job: Job) -> bool:
+        """Whether a job can be started now: anything but unready construction."""
+        return job.type != "construction" or job.id in self.ready_construction
+
+    @staticmethod
+    def _startable(job: Job) -> bool:
+        return job.type != "construction" or job._ready
+
+    def _kind(self, job: Job) -> Tuple[str, str, bool]:
+        return (job.category, job.type, self._startable(job))
+
+    def _close(self, job: Job) -> None:
+        """Drop a job from the open index (and its cell) if it's there."""
+        if self.open.pop(job.id, None) is not None:
+            self._remove_from_cell(job)
+
+    def _index_position(self, job: Job) -> None:
+        self.by_position.setdefault((job._x, job._y, job._z), {})[job.id] = job
+        if job.id in self.open:
+            self._add_to_cell(job)
+
+    def _unindex_position(self, job: Job) -> None:
+        self._discard(self.by_position, (job._x, job._y, job._z), job.id)
+        if job.id in self.open:
+            self._remove_from_cell(job)
+
+    def _add_to_cell(self, job: Job) -> None:
+        cell = self.open_cells.setdefault(
+            (job._z, job._x // JOB_CELL_SIZE, job._y // JOB_CELL_SIZE), {})
+        if job.id not in cell:
+            cell[job.id] = job
+            self.open_levels[job._z] = self.open_levels.get(job._z, 0) + 1
+            kind = self._kind(job)
+            self.open_kinds[kind] = self.open_kinds.get(kind, 0) + 1
+            self.open_version += 1
+
+    def _remove_from_cell(self, job: Job) -> None:
+        key = (job._z, job._x // JOB_CELL_SIZE, job._y // JOB_CELL_SIZE)
+        cell = self.open_cells.get(key)
+        if cell is None or cell.pop(job.id, None) is None:
+            return
+        if not cell:
+            del self.open_cells[key]
+        self._decrement(self.open_levels, job._z)
+        self._decrement(self.open_kinds, self._kind(job))
+        self.open_version += 1
+
+    @staticmethod
+    def _discard(index: dict, key, job_id: int) -> None:
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(job_id, None)
+            if not bucket:
+                del index[key]
+
+    @staticmethod
+    def _decrement(counts: dict, key) -> None:
+        count = counts[key] - 1
+        if count:
+            counts[key] = count
+        else:
+            del counts[key]
+
+
+def _ring_cells(cx: int, cy: int, ring: int):
+    """Cells on the square ring at Chebyshev distance ring around (cx, cy)."""
+    if ring == 0:
+        yield cx, cy
+        return
+    for dx in range(-ring, ring + 1):
+        yield cx + dx, cy - ring
+        yield cx + dx, cy + ring
+    for dy in range(-ring + 1, ring):
+        yield cx - ring, cy + dy
+        yield cx + ring, cy + dy
+
+
+# Global job board for the prototype. In a larger system this could be owned
+# by a world or simulation controller object. Iterating it yields every job,
+# like the plain list it replaced.
+JOB_QUEUE: JobBoard = JobBoard()
 
 # Designation tracking - tiles that are designated for work but may not have active jobs yet
 # Key: (x, y, z), Value: {"type": "harvest"|"salvage"|"haul", "category": str}
@@ -197,28 +625,32 @@ def add_job(
         furniture_item=furniture_item,
         furniture_tile=furniture_tile,
     )
-    JOB_QUEUE.append(job)
-    # Update spatial cache
-    _JOB_POSITION_CACHE[(x, y, z)] = job
+    if job_type == "construction":
+        # Import here to avoid circular import
+        from buildings import is_construction_ready
+        job._ready = is_construction_ready(x, y, z)
+    JOB_QUEUE.add(job)
     return job
 
 
 def get_next_job() -> Optional[Job]:
     """Return the next *unassigned* job in the queue, without modifying it.
 
-    This is a simple FIFO scan. If all jobs are assigned or the queue is
-    empty, returns None.
+    Jobs come in the order they became unassigned. If all jobs are assigned
+    or the queue is empty, returns None.
     """
 
-    for job in JOB_QUEUE:
-        if not job.assigned:
-            return job
-    return None
+    return next(iter(JOB_QUEUE.unassigned.values()), None)
 
 
 def get_jobs_by_type(job_type: str) -> List[Job]:
     """Return all jobs of a specific type (assigned or not)."""
-    return [j for j in JOB_QUEUE if j.type == job_type]
+    return JOB_QUEUE.of_type(job_type)
+
+
+def get_jobs_by_category(category: str) -> List[Job]:
+    """Return all jobs of a specific category (assigned or not)."""
+    return JOB_QUEUE.of_category(category)
 
 
 def get_next_available_job(
@@ -234,26 +666,16 @@ def get_next_available_job(
         skip_unready_construction: If True, skip construction jobs that don't
             have all materials delivered yet, or are awaiting stockpile clear
     """
-    # Import here to avoid circular import
-    if skip_unready_construction:
-        from buildings import has_required_materials, is_awaiting_stockpile_clear
-    
     if skip_types is None:
         skip_types = []
     
-    for job in JOB_QUEUE:
-        if job.assigned:
-            continue
-        if job.wait_timer > 0:
-            continue  # Skip jobs that are waiting (e.g., for materials)
+    # Open jobs are unassigned and not waiting (e.g., for materials)
+    for job in JOB_QUEUE.open.values():
         if job.type in skip_types:
             continue
         # Skip construction jobs without materials or awaiting stockpile clear
-        if skip_unready_construction and job.type == "construction":
-            if not has_required_materials(job.x, job.y, job.z):
-                continue
-            if is_awaiting_stockpile_clear(job.x, job.y, job.z):
-                continue
+        if skip_unready_construction and not JOB_QUEUE.is_startable(job):
+            continue
         return job
     return None
 
@@ -272,31 +694,57 @@ def get_all_available_jobs(
     Returns:
         List of available Job objects (not assigned, not waiting)
     """
-    # Import here to avoid circular import
-    if skip_unready_construction:
-        from buildings import has_required_materials, is_awaiting_stockpile_clear
-    
     if skip_types is None:
         skip_types = []
     
     available = []
-    for job in JOB_QUEUE:
-        if job.assigned:
-            continue
-        if job.wait_timer > 0:
-            continue
+    for job in JOB_QUEUE.open.values():
         if job.type in skip_types:
             continue
-        if skip_unready_construction and job.type == "construction":
-            if not has_required_materials(job.x, job.y, job.z):
-                continue
-            if is_awaiting_stockpile_clear(job.x, job.y, job.z):
-                continue
+        if skip_unready_construction and not JOB_QUEUE.is_startable(job):
+            continue
         available.append(job)
     
     return available
 
 
+def get_open_job_categories() -> List[str]:
+    """Categories that currently have at least one open job."""
+    return list({category for category, _, _ in JOB_QUEUE.open_kinds})
+
+
+def get_nearby_available_jobs(
+    x: int, y: int, z: int,
+    per_category: int = JOB_CANDIDATES_PER_CATEGORY,
+    skip_types: list[str] | None = None,
+    skip_unready_construction: bool = False,
+    accept: Optional[Callable[[Job], bool]] = None,
+    categories: Optional[Collection[str]] = None,
+) -> List[Job]:
+    """Return the nearest available jobs of each category around (x, y, z).
+    
+    Like get_all_available_jobs, but only the per_category nearest jobs that
+    pass the filters are returned, nearest first, so callers can score a
+    handful of candidates instead of every open job.
+    
+    Args:
+        x, y, z: Position to search around
+        per_category: Max jobs returned per job category
+        skip_types: List of job types to skip
+        skip_unready_construction: If True, skip construction jobs that don't
+            have all materials delivered yet, or are awaiting stockpile clear
+        accept: Optional extra filter; rejected jobs don't use up a slot
+        categories: If given, only jobs of these categories are considered.
+            Pass the categories the caller can take rather than rejecting
+            whole categories in accept, so the search can stop early.
+    """
+    return JOB_QUEUE.nearest_open(
+        x, y, z, per_category=per_category, accept=accept, categories=categories,
+        skip_types=set(skip_types) if skip_types else (),
+        startable_only=skip_unready_construction,
+    )
+
+
 def should_take_job(colonist_needs_of_the_many: int, new_job: Job, current_job: Job | None) -> bool:
     """Determine if a colonist should take/switch to a new job based on needs rules.
     
@@ -334,10 +782,11 @@ def should_take_job(colonist_needs_of_the_many: int, new_job: Job, current_job:
 
 
 def update_job_timers() -> None:
-    """Tick down wait timers on jobs. Call once per game tick."""
-    for job in JOB_QUEUE:
-        if job.wait_timer > 0:
-            job.wait_timer -= 1
+    """Release jobs whose wait timer came due. Call once per game tick,
+    after timer_wheel.update_timers().
+    """
+    for job in TIMERS.pop_due(JOB_WAIT_TIMER):
+        job.wait_timer = 0
 
 
 def request_job() -> Optional[Job]:
@@ -355,10 +804,7 @@ def request_job() -> Optional[Job]:
 def remove_job(job: Job) -> None:
     """Remove a job from the queue if it is present."""
 
-    if job in JOB_QUEUE:
-        JOB_QUEUE.remove(job)
-        # Update spatial cache
-        _JOB_POSITION_CACHE.pop((job.x, job.y, job.z), None)
+    JOB_QUEUE.remove(job)
 
 
 def is_job_in_queue(job: Job) -> bool:
@@ -375,23 +821,23 @@ def get_job_at(x: int, y: int, z: int = None) -> Optional[Job]:
         x, y: Tile coordinates
         z: Z-level. If None, matches any Z-level (legacy behavior).
     """
-    # Fast path: Use spatial cache for exact coordinate lookup
+    by_position = JOB_QUEUE.by_position
     if z is not None:
-        return _JOB_POSITION_CACHE.get((x, y, z))
+        jobs = by_position.get((x, y, z))
+        return next(reversed(jobs.values())) if jobs else None
     
-    # Legacy path: Check all Z-levels (slower, but maintains compatibility)
-    for job in JOB_QUEUE:
-        if job.x == x and job.y == y:
-            return job
+    # Legacy path: Check all Z-levels
+    for level in range(GRID_Z):
+        jobs = by_position.get((x, y, level))
+        if jobs:
+            return next(reversed(jobs.values()))
     return None
 
 
 def has_job_of_type_at(x: int, y: int, z: int, job_type: str) -> bool:
     """Check if there's a job of a specific type at (x, y, z)."""
-    for job in JOB_QUEUE:
-        if job.x == x and job.y == y and job.z == z and job.type == job_type:
-            return True
-    return False
+    jobs = JOB_QUEUE.by_position.get((x, y, z))
+    return bool(jobs) and any(job.type == job_type for job in jobs.values())
 
 
 def remove_job_at(x: int, y: int, z: int = None) -> bool:
@@ -408,8 +854,6 @@ def remove_job_at(x: int, y: int, z: int = None) -> bool:
         # Unassign colonist if assigned
         job.assigned = False
         JOB_QUEUE.remove(job)
-        # Update spatial cache
-        _JOB_POSITION_CACHE.pop((job.x, job.y, job.z), None)
         return True
     return False
 
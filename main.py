@@ -6,7 +6,7 @@ Game logic from the original main.py will be integrated here.
 """
 
 import arcade
-from config import SCREEN_W, SCREEN_H, TILE_SIZE, GRID_W, GRID_H, COLONIST_COUNT
+from config import SCREEN_W, SCREEN_H, TILE_SIZE, GRID_W, GRID_H, COLONIST_COUNT, LARGE_MAP_GEN_INTERVAL
 
 # Global debug flag for skipping sleep/recreation
 DEBUG_SKIP_SLEEP = False
@@ -14,6 +14,8 @@ from grid import Grid
 from grid_arcade import GridRenderer
 from colonist_arcade import ColonistRenderer
 from colonist import create_colonists, update_colonists
+from path_scheduler import update_path_scheduler, get_path_scheduler_stats
+from job_assignment import update_job_assignment, get_job_assignment_stats
 from ui_arcade_tile_info import get_tile_info_panel
 
 # Note: pygame is initialized by audio.py for mixer only
@@ -40,6 +42,7 @@ class FracturedCityWindow(arcade.Window):
         
         # Game state
         self.grid = None
+        self.worldgen = None
         self.grid_renderer = None
         self.colonist_renderer = None
         self.colonists = []
@@ -220,6 +223,8 @@ class FracturedCityWindow(arcade.Window):
         from city_generator import CityGenerator
         worldgen = CityGenerator(self.grid)
         spawn_x, spawn_y = worldgen.generate_city()
+        # Kept for large maps, which generate the rest of the city as it is approached
+        self.worldgen = worldgen
         
         print(f"[Arcade] World generated with colonist spawn at ({spawn_x}, {spawn_y})")
         
@@ -317,6 +322,8 @@ class FracturedCityWindow(arcade.Window):
         
         # Draw tiles using GPU batching (existing system)
         if self.grid_renderer:
+            if self.grid_renderer.chunked:
+                self.grid_renderer.set_view(*self._view_bounds())
             self.grid_renderer.draw()
         
         # Draw shadows AFTER grid but BEFORE entities
@@ -495,6 +502,8 @@ class FracturedCityWindow(arcade.Window):
             },
             "colonist_objects": [c for c in self.colonists if not c.is_dead],
             "job_count": len(jobs_module.get_all_available_jobs()),
+            "path_scheduler": get_path_scheduler_stats(),
+            "job_assignment": get_job_assignment_stats(),
         }
         
         # Draw top bar and bottom action bar
@@ -947,6 +956,17 @@ class FracturedCityWindow(arcade.Window):
         
         self.camera.position = (cam_x, cam_y)
         
+        # Large maps: generate pending city chunks the camera is about to show,
+        # a couple per frame so fast panning doesn't stall
+        if self.worldgen is not None and self.worldgen.pending_chunks:
+            left, bottom, right, top = self._view_bounds()
+            margin = 8 * TILE_SIZE
+            self.worldgen.ensure_generated(
+                int((left - margin) // TILE_SIZE), int((bottom - margin) // TILE_SIZE),
+                int((right + margin) // TILE_SIZE) + 1, int((top + margin) // TILE_SIZE) + 1,
+                max_chunks=2,
+            )
+        
         # Update game logic at current speed (skip if paused)
         if not self.paused:
             for _ in range(self.game_speed):
@@ -957,6 +977,13 @@ class FracturedCityWindow(arcade.Window):
         if self.grid_renderer:
             self.grid_renderer.update_animations(delta_time)
     
+    def _view_bounds(self):
+        """World-space (left, bottom, right, top) the game camera shows."""
+        cam_x, cam_y = self.camera.position
+        half_w = SCREEN_W / self.zoom_level / 2
+        half_h = SCREEN_H / self.zoom_level / 2
+        return cam_x - half_w, cam_y - half_h, cam_x + half_w, cam_y + half_h
+    
     def _run_game_tick(self):
         """Run a single game tick - called multiple times per frame based on game_speed."""
         # Import all game systems
@@ -966,6 +993,7 @@ class FracturedCityWindow(arcade.Window):
         from recreation import spawn_recreation_jobs
         from training import spawn_training_jobs
         from time_system import tick_time
+        from timer_wheel import update_timers
         from notifications import update_notifications
         import jobs as jobs_module
         import zones as zones_module
@@ -976,10 +1004,20 @@ class FracturedCityWindow(arcade.Window):
         
         # Game simulation (not paused for now - will add pause later)
         tick_time()  # Advance game time
+        self.grid.game_tick = self.tick_count  # Stamped on grid change log entries
+        update_timers()  # Job waits, door/window closes and regrowth come due here
+        
+        # Large maps: keep the city generated ahead of the colonists
+        if self.worldgen is not None and self.tick_count % LARGE_MAP_GEN_INTERVAL == 0:
+            self.worldgen.generate_around([(c.x, c.y) for c in self.colonists])
         
-        # Update colonists
+        # Spend this tick's path search budget on queued requests, then update colonists
+        update_path_scheduler(self.grid, self.tick_count)
         update_colonists(self.colonists, self.grid, self.tick_count)
         
+        # Hand open jobs to whoever is still idle
+        update_job_assignment(self.colonists, self.grid, self.tick_count)
+        
         # Update sprite positions after colonist logic
         if self.colonist_renderer:
             self.colonist_renderer.update_positions()
@@ -0,0 +1,197 @@
+"""Colony-wide shared path cache.
+
+Colonists walking between the same places (spawn -> stockpile, beds ->
+kitchen) share their searches here instead of each keeping a private cache.
+
+Entries are keyed by (start region, goal), where the start region is the
+PATH_CACHE_REGION_SIZE square cell the search started in. A colonist standing
+on a cached path reuses the rest of it; one elsewhere in the same cell walks a
+short bounded A* to the path's start and follows it from there.
+
+Every cached path is listed in a reverse index under each tile it crosses.
+When a tile's walkability changes (Grid.set_walkable), exactly the paths over
+that tile are dropped, so a new wall invalidates the routes through it
+immediately while every other route stays cached. The cache is also bounded
+(least recently used entries are evicted) and entries expire after
+PATH_CACHE_MAX_AGE ticks so newly opened shortcuts get picked up.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from pathfinding import find_path, get_transition_cache
+
+if TYPE_CHECKING:
+    from grid import Grid
+
+Coord3D = Tuple[int, int, int]  # (x, y, z)
+CacheKey = Tuple[Tuple[int, int, int], Coord3D]  # ((region_x, region_y, z), goal)
+
+# Edge length of the start regions paths are shared across
+PATH_CACHE_REGION_SIZE = 8
+
+# Max cached paths before least recently used ones are evicted
+PATH_CACHE_MAX_ENTRIES = 512
+
+# Entries older than this (ticks) are recomputed even if still valid
+PATH_CACHE_MAX_AGE = 300
+
+# Expansion cap for the short walk from a colonist to a shared path's start
+PATH_CACHE_JOIN_MAX_NODES = 4 * PATH_CACHE_REGION_SIZE * PATH_CACHE_REGION_SIZE
+
+
+class PathCache:
+    """LRU cache of paths shared by all colonists, invalidated per tile."""
+
+    def __init__(self, grid: Grid, max_entries: int = PATH_CACHE_MAX_ENTRIES):
+        self.grid = grid
+        self.max_entries = max_entries
+
+        # key -> (path including its start tile, tick cached)
+        self._entries: "OrderedDict[CacheKey, Tuple[List[Coord3D], int]]" = OrderedDict()
+
+        # Reverse index: tile -> keys of cached paths that cross it
+        self._by_tile: Dict[Coord3D, Set[CacheKey]] = {}
+
+        # Fire escape graph version the cached paths were planned with
+        self._transitions_version: Optional[int] = None
+
+        # Stats for debugging/UI
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+        grid.add_walkability_listener(self.on_walkability_changed)
+
+    def region_of(self, x: int, y: int, z: int) -> Tuple[int, int, int]:
+        """Return the start region containing tile (x, y, z)."""
+        return (x // PATH_CACHE_REGION_SIZE, y // PATH_CACHE_REGION_SIZE, z)
+
+    # --- Lookup / store ---
+
+    def get(
+        self,
+        start: Coord3D,
+        goal: Coord3D,
+        game_tick: int = 0,
+        platform_transitions: Dict[Coord3D, int] | None = None,
+        transitions_version: int | None = None,
+    ) -> Optional[List[Coord3D]]:
+        """Return a cached path from start toward goal (start excluded), or None on a miss.
+
+        A new transitions_version (fire escapes built or removed) drops every
+        cached path, since vertical connectivity can change any route.
+        """
+        if transitions_version is not None and transitions_version != self._transitions_version:
+            if self._transitions_version is not None:
+                self.invalidations += len(self._entries)
+                self.clear()
+            self._transitions_version = transitions_version
+        key = (self.region_of(*start), goal)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        path, cached_tick = entry
+        if game_tick - cached_tick >= PATH_CACHE_MAX_AGE:
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        try:
+            # Already on the shared path - follow the rest of it
+            remaining = path[path.index(start) + 1:]
+        except ValueError:
+            # Elsewhere in the region - walk over to where the shared path starts,
+            # on the shared transition index (only re-indexed when its version moves)
+            transitions = get_transition_cache(self.grid)
+            transitions.update(platform_transitions, transitions_version)
+            join = find_path(self.grid, start, path[0], platform_transitions,
+                             max_nodes=PATH_CACHE_JOIN_MAX_NODES,
+                             transition_index=transitions.index)
+            remaining = join + path[1:] if join else []
+
+        if not remaining:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return remaining
+
+    def put(self, start: Coord3D, goal: Coord3D, path: List[Coord3D], game_tick: int = 0) -> None:
+        """Cache a freshly searched path (start excluded, as find_path returns it)."""
+        if not path:
+            return
+        key = (self.region_of(*start), goal)
+        if key in self._entries:
+            self._remove(key)
+
+        full_path = [start] + path
+        self._entries[key] = (full_path, game_tick)
+        for tile in full_path:
+            self._by_tile.setdefault(tile, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tile in entry[0]:
+            keys = self._by_tile.get(tile)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tile[tile]
+
+    # --- Invalidation ---
+
+    def on_walkability_changed(self, x: int, y: int, z: int, walkable: bool) -> None:
+        """Grid listener: drop every cached path that crosses the changed tile."""
+        self.invalidate_tile(x, y, z)
+
+    def invalidate_tile(self, x: int, y: int, z: int) -> None:
+        """Drop every cached path that crosses tile (x, y, z)."""
+        keys = self._by_tile.get((x, y, z))
+        if not keys:
+            return
+        for key in list(keys):
+            self._remove(key)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all cached paths (e.g. after loading a save)."""
+        self._entries.clear()
+        self._by_tile.clear()
+
+    def get_stats(self) -> dict:
+        """Return cache counters for debugging/UI."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+        }
+
+
+# Module-level cache for the active grid (built lazily)
+_PATH_CACHE: Optional[PathCache] = None
+
+
+def get_path_cache(grid: Grid) -> PathCache:
+    """Return the shared path cache for grid, building it on first use."""
+    global _PATH_CACHE
+    if _PATH_CACHE is None or _PATH_CACHE.grid is not grid:
+        _PATH_CACHE = PathCache(grid)
+    return _PATH_CACHE
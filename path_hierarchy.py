@@ -0,0 +1,371 @@
+"""Hierarchical pathfinding (HPA*) layer over the world grid.
+
+The map is split into fixed CLUSTER_SIZE x CLUSTER_SIZE clusters per Z-level.
+Each pair of neighbouring clusters is connected through entrance nodes placed
+on walkable runs of their shared border, and fire escape platforms add
+inter-level edges between the clusters they join. Inside a cluster, distances
+between its nodes are found with a search bounded to the cluster.
+
+A long trip is first planned on this small abstract graph; the caller then
+refines only the segment that leaves its current cluster with a local A* and
+asks again once it gets there.
+
+Walkability changes (Grid.set_walkable) patch the affected borders right away
+and mark the touched clusters dirty; dirty clusters recompute their internal
+distances the next time a query reaches them. Nothing is ever rebuilt map-wide.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from pathfinding import (
+    NEIGHBOR_OFFSETS,
+    CARDINAL_COST,
+    Z_TRANSITION_COST,
+    TransitionCache,
+    octile_distance,
+)
+
+if TYPE_CHECKING:
+    from grid import Grid
+
+Coord3D = Tuple[int, int, int]  # (x, y, z)
+ClusterKey = Tuple[int, int, int]  # (cluster_x, cluster_y, z)
+
+# Cluster edge length in tiles
+CLUSTER_SIZE = 16
+
+# Border runs longer than this get an entrance at each end instead of one in the middle
+MAX_SINGLE_ENTRANCE_RUN = 6
+
+# Trips shorter than this (Manhattan, same Z) skip the hierarchy and use plain A*
+HIERARCHY_MIN_DISTANCE = 2 * CLUSTER_SIZE
+
+# Expansion cap for refining one segment (a segment spans at most two clusters)
+HIERARCHY_SEGMENT_MAX_NODES = 8 * CLUSTER_SIZE * CLUSTER_SIZE
+
+
+class PathHierarchy:
+    """Abstract entrance graph over a Grid, patched incrementally."""
+
+    def __init__(self, grid: Grid, cluster_size: int = CLUSTER_SIZE):
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.width = grid.width
+        self.height = grid.height
+        self.plane = grid.width * grid.height
+        self.clusters_x = (grid.width + cluster_size - 1) // cluster_size
+        self.clusters_y = (grid.height + cluster_size - 1) // cluster_size
+
+        # Border entrances: (cluster_a, cluster_b) -> [(node_a, node_b), ...]
+        # cluster_a is always the west/north cluster of the pair
+        self._borders: Dict[Tuple[ClusterKey, ClusterKey], List[Tuple[int, int]]] = {}
+
+        # Edges between clusters (border crossings and fire escapes): node -> {other: cost}
+        self._inter_edges: Dict[int, Dict[int, float]] = {}
+
+        # Edges inside a cluster: node -> {other: cost}
+        self._intra_edges: Dict[int, Dict[int, float]] = {}
+
+        # Nodes registered in each cluster as of its last intra rebuild
+        self._cluster_nodes: Dict[ClusterKey, Set[int]] = {}
+
+        # Clusters whose intra edges need recomputing before use
+        self._dirty: Set[ClusterKey] = set()
+
+        # Fire escape links currently in the graph: node -> other node
+        self._transition_cache = TransitionCache(grid)
+        self._transitions: Dict[int, int] = {}
+
+        # Stats for debugging/benchmarks
+        self.cluster_rebuilds = 0
+
+        for z in range(grid.depth):
+            for cy in range(self.clusters_y):
+                for cx in range(self.clusters_x):
+                    if cx + 1 < self.clusters_x:
+                        self._build_border((cx, cy, z), (cx + 1, cy, z))
+                    if cy + 1 < self.clusters_y:
+                        self._build_border((cx, cy, z), (cx, cy + 1, z))
+                    self._dirty.add((cx, cy, z))
+
+        grid.add_walkability_listener(self.on_walkability_changed)
+
+    # --- Node helpers ---
+
+    def _node(self, x: int, y: int, z: int) -> int:
+        return z * self.plane + y * self.width + x
+
+    def _coord(self, node: int) -> Coord3D:
+        z, rem = divmod(node, self.plane)
+        y, x = divmod(rem, self.width)
+        return (x, y, z)
+
+    def cluster_of(self, x: int, y: int, z: int) -> ClusterKey:
+        """Return the cluster key containing tile (x, y, z)."""
+        return (x // self.cluster_size, y // self.cluster_size, z)
+
+    def _cluster_bounds(self, key: ClusterKey) -> Tuple[int, int, int, int]:
+        """Return (x0, y0, x1, y1) with x1/y1 exclusive."""
+        cx, cy, _ = key
+        size = self.cluster_size
+        return (cx * size, cy * size, min((cx + 1) * size, self.width), min((cy + 1) * size, self.height))
+
+    # --- Borders and entrances ---
+
+    def _build_border(self, a: ClusterKey, b: ClusterKey) -> None:
+        """(Re)compute entrances on the border between clusters a and b."""
+        for node_a, node_b in self._borders.get((a, b), []):
+            self._inter_edges.get(node_a, {}).pop(node_b, None)
+            self._inter_edges.get(node_b, {}).pop(node_a, None)
+
+        z = a[2]
+        walk = self.grid.walkable_flat[z]
+        width = self.width
+        ax0, ay0, ax1, ay1 = self._cluster_bounds(a)
+
+        # Pairs of facing tiles along the border
+        if a[0] != b[0]:
+            # Vertical border: a's east column faces b's west column
+            pairs = [((ax1 - 1, y), (ax1, y)) for y in range(ay0, ay1)]
+        else:
+            # Horizontal border: a's south row faces b's north row
+            pairs = [((x, ay1 - 1), (x, ay1)) for x in range(ax0, ax1)]
+
+        entrances: List[Tuple[int, int]] = []
+        run: List[Tuple[Tuple[int, int], Tuple[int, int]]] = []
+        for pair in pairs + [None]:
+            if pair is not None:
+                (x1, y1), (x2, y2) = pair
+                if walk[y1 * width + x1] and walk[y2 * width + x2]:
+                    run.append(pair)
+                    continue
+            if run:
+                if len(run) > MAX_SINGLE_ENTRANCE_RUN:
+                    chosen = [run[0], run[-1]]
+                else:
+                    chosen = [run[len(run) // 2]]
+                for (x1, y1), (x2, y2) in chosen:
+                    entrances.append((self._node(x1, y1, z), self._node(x2, y2, z)))
+                run = []
+
+        self._borders[(a, b)] = entrances
+        for node_a, node_b in entrances:
+            self._inter_edges.setdefault(node_a, {})[node_b] = CARDINAL_COST
+            self._inter_edges.setdefault(node_b, {})[node_a] = CARDINAL_COST
+
+    def _neighbor_borders(self, key: ClusterKey) -> List[Tuple[ClusterKey, ClusterKey]]:
+        """Return the border keys touching a cluster."""
+        cx, cy, z = key
+        borders = []
+        if cx > 0:
+            borders.append(((cx - 1, cy, z), key))
+        if cx + 1 < self.clusters_x:
+            borders.append((key, (cx + 1, cy, z)))
+        if cy > 0:
+            borders.append(((cx, cy - 1, z), key))
+        if cy + 1 < self.clusters_y:
+            borders.append((key, (cx, cy + 1, z)))
+        return borders
+
+    def on_walkability_changed(self, x: int, y: int, z: int, walkable: bool) -> None:
+        """Grid listener: patch borders around a changed tile and dirty its clusters."""
+        self._transition_cache.on_walkability_changed(x, y, z, walkable)
+        key = self.cluster_of(x, y, z)
+        x0, y0, x1, y1 = self._cluster_bounds(key)
+        on_edge = x in (x0, x1 - 1) or y in (y0, y1 - 1)
+        self._dirty.add(key)
+        if on_edge:
+            for a, b in self._neighbor_borders(key):
+                self._build_border(a, b)
+                self._dirty.add(a)
+                self._dirty.add(b)
+
+    # --- Fire escape transitions ---
+
+    def set_transitions(self, platform_transitions: Dict[Coord3D, int] | None, version: int | None = None) -> None:
+        """Sync fire escape inter-level edges with the current transition map.
+
+        With the buildings transition version, unchanged maps are skipped without re-indexing.
+        """
+        if not self._transition_cache.update(platform_transitions, version):
+            return
+        transitions = self._transition_cache.index
+
+        for node, other in self._transitions.items():
+            self._inter_edges.get(node, {}).pop(other, None)
+            self._dirty.add(self.cluster_of(*self._coord(node)))
+        for node, other in transitions.items():
+            self._inter_edges.setdefault(node, {})[other] = Z_TRANSITION_COST
+            self._dirty.add(self.cluster_of(*self._coord(node)))
+        self._transitions = transitions
+
+    # --- Cluster-local searches ---
+
+    def _local_costs(self, source: int, key: ClusterKey, targets: Set[int]) -> Dict[int, float]:
+        """Dijkstra from source restricted to one cluster; returns costs to reachable targets."""
+        x0, y0, x1, y1 = self._cluster_bounds(key)
+        z = key[2]
+        width = self.width
+        base = z * self.plane
+        walk = self.grid.walkable_flat[z]
+
+        dist: Dict[int, float] = {source: 0.0}
+        found: Dict[int, float] = {}
+        heap = [(0.0, source)]
+        remaining = len(targets)
+        while heap and remaining:
+            d, node = heapq.heappop(heap)
+            if d > dist[node]:
+                continue
+            if node in targets and node not in found:
+                found[node] = d
+                remaining -= 1
+            y, x = divmod(node - base, width)
+            for dx, dy, cost in NEIGHBOR_OFFSETS:
+                nx = x + dx
+                ny = y + dy
+                if nx < x0 or ny < y0 or nx >= x1 or ny >= y1:
+                    continue
+                local = ny * width + nx
+                if not walk[local]:
+                    continue
+                neighbor = base + local
+                nd = d + cost
+                if nd < dist.get(neighbor, float("inf")):
+                    dist[neighbor] = nd
+                    heapq.heappush(heap, (nd, neighbor))
+        return found
+
+    def _collect_cluster_nodes(self, key: ClusterKey) -> Set[int]:
+        """Gather entrance and transition nodes that lie inside a cluster."""
+        nodes: Set[int] = set()
+        for a, b in self._neighbor_borders(key):
+            side = 0 if a == key else 1
+            for pair in self._borders.get((a, b), []):
+                nodes.add(pair[side])
+        for node in self._transitions:
+            if self.cluster_of(*self._coord(node)) == key:
+                nodes.add(node)
+        return nodes
+
+    def _ensure_cluster(self, key: ClusterKey) -> None:
+        """Recompute intra-cluster edges if the cluster is dirty."""
+        if key not in self._dirty:
+            return
+        self._dirty.discard(key)
+        self.cluster_rebuilds += 1
+
+        for node in self._cluster_nodes.get(key, set()):
+            self._intra_edges.pop(node, None)
+
+        nodes = self._collect_cluster_nodes(key)
+        self._cluster_nodes[key] = nodes
+        for node in nodes:
+            others = nodes - {node}
+            self._intra_edges[node] = self._local_costs(node, key, others) if others else {}
+
+    # --- Queries ---
+
+    def find_waypoints(
+        self,
+        start: Coord3D,
+        goal: Coord3D,
+        platform_transitions: Dict[Coord3D, int] | None = None,
+        transitions_version: int | None = None,
+    ) -> Optional[List[Coord3D]]:
+        """Plan a route on the abstract graph.
+
+        Returns the list of abstract waypoints after start, ending with goal;
+        [] if the abstract graph has no route; or None when start and goal share
+        a cluster (the caller should just run a local search).
+        """
+        self.set_transitions(platform_transitions, transitions_version)
+
+        start_key = self.cluster_of(*start)
+        goal_key = self.cluster_of(*goal)
+        if start_key == goal_key:
+            return None
+
+        self._ensure_cluster(start_key)
+        self._ensure_cluster(goal_key)
+
+        start_node = self._node(*start)
+        goal_node = self._node(*goal)
+        start_edges = self._local_costs(start_node, start_key, self._cluster_nodes[start_key])
+        # Paths are symmetric, so searching out from the goal gives costs into it
+        goal_edges = self._local_costs(goal_node, goal_key, self._cluster_nodes[goal_key])
+        if not start_edges or not goal_edges:
+            return []
+
+        gx, gy, gz = goal
+        GOAL = -1
+        g_score: Dict[int, float] = {start_node: 0.0}
+        parent: Dict[int, int] = {start_node: -2}
+        closed: Set[int] = set()
+        counter = 0
+        heap = [(0.0, counter, start_node)]
+
+        while heap:
+            _, _, node = heapq.heappop(heap)
+            if node in closed:
+                continue
+            if node == GOAL:
+                waypoints: List[Coord3D] = [goal]
+                node = parent[GOAL]
+                while node != start_node:
+                    waypoints.append(self._coord(node))
+                    node = parent[node]
+                waypoints.reverse()
+                return waypoints
+            closed.add(node)
+
+            if node == start_node:
+                edges = dict(start_edges)
+                edges.update(self._inter_edges.get(node, {}))
+            else:
+                self._ensure_cluster(self.cluster_of(*self._coord(node)))
+                edges = dict(self._intra_edges.get(node, {}))
+                edges.update(self._inter_edges.get(node, {}))
+                if node in goal_edges:
+                    edges[GOAL] = goal_edges[node]
+
+            current_g = g_score[node]
+            for other, cost in edges.items():
+                if other in closed:
+                    continue
+                new_g = current_g + cost
+                if new_g < g_score.get(other, float("inf")):
+                    g_score[other] = new_g
+                    parent[other] = node
+                    if other == GOAL:
+                        h = 0.0
+                    else:
+                        ox, oy, oz = self._coord(other)
+                        h = octile_distance(ox, oy, oz, gx, gy, gz)
+                    counter += 1
+                    heapq.heappush(heap, (new_g + h, counter, other))
+
+        return []
+
+    def next_segment_target(self, start: Coord3D, waypoints: List[Coord3D]) -> Coord3D:
+        """Return the first waypoint outside start's cluster (the next cluster's entry)."""
+        start_key = self.cluster_of(*start)
+        for waypoint in waypoints:
+            if self.cluster_of(*waypoint) != start_key:
+                return waypoint
+        return waypoints[-1]
+
+
+# Module-level hierarchy for the active grid (built lazily)
+_HIERARCHY: Optional[PathHierarchy] = None
+
+
+def get_path_hierarchy(grid: Grid) -> PathHierarchy:
+    """Return the hierarchy for grid, building it on first use."""
+    global _HIERARCHY
+    if _HIERARCHY is None or _HIERARCHY.grid is not grid:
+        _HIERARCHY = PathHierarchy(grid)
+    return _HIERARCHY
@@ -0,0 +1,499 @@
+"""Connected-region index for fast reachability checks.
+
+Every walkable tile carries a region label: tiles share a label when they are
+8-connected on the same Z-level (the same moves pathfinding.find_path allows).
+Completed fire escapes join the regions on either side of their platform, so
+two tiles are reachable from each other exactly when their labels resolve to
+the same root.
+
+This lets colonists reject walled-off jobs in O(1) instead of flooding the
+whole reachable area with A* before giving up. nearest_reachable() builds on
+it to pick the closest of several destinations by walking distance.
+
+Labels are kept up to date from Grid.set_walkable:
+- A tile becoming walkable joins its neighbours' region, merging regions by
+  relabelling the smaller one when it bridges several.
+- A tile becoming unwalkable can only split its region if its walkable
+  neighbours are not already connected around it. In that case the pieces are
+  flooded in lockstep; fronts that meet are merged and any front that runs out
+  of tiles on its own becomes a new region.
+Work per change is capped; past REGION_UPDATE_BUDGET tiles the Z-level is
+simply relabelled in full on the next query.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from pathfinding import TransitionCache, find_nearest, get_transition_cache, octile_distance
+
+if TYPE_CHECKING:
+    from grid import Grid
+
+Coord3D = Tuple[int, int, int]  # (x, y, z)
+
+# Max tiles touched by one incremental update before falling back to a full relabel of the level
+REGION_UPDATE_BUDGET = 4096
+
+# Expansion cap for nearest_reachable's multi-target search
+NEAREST_MAX_NODES = 8000
+
+# The 8 neighbours in ring order (each is adjacent to the next)
+_RING = ((-1, -1), (0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0))
+_NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+
+
+class RegionIndex:
+    """Per-Z connected-region labels joined across levels by fire escapes."""
+
+    def __init__(self, grid: Grid):
+        self.grid = grid
+        self.width = grid.width
+        self.height = grid.height
+        self.plane = grid.width * grid.height
+
+        # labels[z][y * width + x] -> region label (0 = not walkable)
+        self.labels: List[array] = [array("i", [0]) * self.plane for _ in range(grid.depth)]
+        self._sizes: Dict[int, int] = {}
+        self._label_z: Dict[int, int] = {}
+        self._next_label = 1
+
+        # Fire escape links (node -> other node) and the label roots they produce
+        self._transition_cache = TransitionCache(grid)
+        self._transitions: Dict[int, int] = {}
+        self._roots: Dict[int, int] = {}
+        self._roots_dirty = True
+
+        # Z-levels awaiting a full relabel
+        self._dirty_levels: Set[int] = set(range(grid.depth))
+
+        # Stats for debugging/benchmarks
+        self.full_relabels = 0
+
+        grid.add_walkability_listener(self.on_walkability_changed)
+
+    # --- Labelling ---
+
+    def _new_label(self, z: int) -> int:
+        label = self._next_label
+        self._next_label += 1
+        self._sizes[label] = 0
+        self._label_z[label] = z
+        return label
+
+    def _flood(self, z: int, seed: int, match: int, label: int, limit: Optional[int] = None) -> int:
+        """Relabel the 8-connected tiles with label `match` around seed. Returns tiles relabelled, or -1 past limit."""
+        width = self.width
+        height = self.height
+        labels = self.labels[z]
+        labels[seed] = label
+        queue = deque([seed])
+        count = 1
+        while queue:
+            local = queue.popleft()
+            y, x = divmod(local, width)
+            for dx, dy in _NEIGHBORS:
+                nx = x + dx
+                ny = y + dy
+                if nx < 0 or ny < 0 or nx >= width or ny >= height:
+                    continue
+                neighbor = ny * width + nx
+                if labels[neighbor] == match:
+                    labels[neighbor] = label
+                    queue.append(neighbor)
+                    count += 1
+                    if limit is not None and count > limit:
+                        return -1
+        return count
+
+    def _relabel_level(self, z: int) -> None:
+        """Recompute every region on one Z-level from scratch.
+
+        Works on runs of walkable tiles rather than single tiles: each row is
+        split into runs (bytearray.find), runs touching a run of the row above
+        (diagonals included) are joined with union-find, and each region's runs
+        are written with slice assignment. Labels come out in row-major order of
+        each region's first tile.
+        """
+        self.full_relabels += 1
+        for label in [l for l, lz in self._label_z.items() if lz == z]:
+            del self._label_z[label]
+            del self._sizes[label]
+
+        width = self.width
+        walk = self.grid.walkable_flat[z]
+        starts: List[int] = []
+        ends: List[int] = []
+        parent: List[int] = []
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        prev_first = prev_last = 0  # Run ids [first, last) of the previous row
+        for y in range(self.height):
+            row = y * width
+            row_end = row + width
+            first = len(starts)
+            i = walk.find(1, row, row_end)
+            while i >= 0:
+                j = walk.find(0, i, row_end)
+                if j < 0:
+                    j = row_end
+                starts.append(i)
+                ends.append(j)
+                parent.append(len(parent))
+                i = walk.find(1, j, row_end) if j < row_end else -1
+            last = len(starts)
+
+            # Sweep both rows' runs left to right; runs touch when their column
+            # spans overlap or meet at a corner
+            p, c = prev_first, first
+            while p < prev_last and c < last:
+                p_start, p_end = starts[p] - row + width, ends[p] - row + width
+                c_start, c_end = starts[c] - row, ends[c] - row
+                if p_start <= c_end and c_start <= p_end:
+                    rp, rc = find(p), find(c)
+                    if rp != rc:
+                        if rp < rc:
+                            parent[rc] = rp
+                        else:
+                            parent[rp] = rc
+                if p_end < c_end:
+                    p += 1
+                else:
+                    c += 1
+            prev_first, prev_last = first, last
+
+        labels = array("i", [0]) * self.plane
+        run_labels: Dict[int, int] = {}
+        for run in range(len(starts)):
+            root = find(run)
+            label = run_labels.get(root)
+            if label is None:
+                label = run_labels[root] = self._new_label(z)
+            start, end = starts[run], ends[run]
+            labels[start:end] = array("i", [label]) * (end - start)
+            self._sizes[label] += end - start
+        self.labels[z] = labels
+        self._roots_dirty = True
+
+    def _refresh(self) -> None:
+        """Bring dirty levels and cross-level links up to date."""
+        if self._dirty_levels:
+            for z in sorted(self._dirty_levels):
+                self._relabel_level(z)
+            self._dirty_levels.clear()
+        if self._roots_dirty:
+            self._rebuild_roots()
+
+    # --- Incremental updates ---
+
+    def on_walkability_changed(self, x: int, y: int, z: int, walkable: bool) -> None:
+        """Grid listener: keep labels in sync with a single tile change."""
+        self._transition_cache.on_walkability_changed(x, y, z, walkable)
+        if z in self._dirty_levels:
+            return
+        self._roots_dirty = True
+        if walkable:
+            self._add_tile(x, y, z)
+        else:
+            self._remove_tile(x, y, z)
+
+    def _neighbor_labels(self, x: int, y: int, z: int) -> Dict[int, int]:
+        """Return {label: a local index carrying it} for the walkable neighbours of a tile."""
+        width = self.width
+        labels = self.labels[z]
+        found: Dict[int, int] = {}
+        for dx, dy in _NEIGHBORS:
+            nx = x + dx
+            ny = y + dy
+            if 0 <= nx < width and 0 <= ny < self.height:
+                local = ny * width + nx
+                label = labels[local]
+                if label > 0 and label not in found:
+                    found[label] = local
+        return found
+
+    def _add_tile(self, x: int, y: int, z: int) -> None:
+        local = y * self.width + x
+        neighbors = self._neighbor_labels(x, y, z)
+        if not neighbors:
+            label = self._new_label(z)
+            self.labels[z][local] = label
+            self._sizes[label] = 1
+            return
+
+        # Join the largest neighbouring region and pull the others into it
+        keep = max(neighbors, key=lambda l: self._sizes[l])
+        self.labels[z][local] = keep
+        self._sizes[keep] += 1
+        for label, seed in neighbors.items():
+            if label == keep:
+                continue
+            moved = self._flood(z, seed, label, keep, REGION_UPDATE_BUDGET)
+            if moved < 0:
+                self._dirty_levels.add(z)
+                return
+            self._sizes[keep] += moved
+            del self._sizes[label]
+            del self._label_z[label]
+
+    def _ring_groups(self, x: int, y: int, z: int) -> List[int]:
+        """Return one walkable tile per group of ring neighbours connected without passing through (x, y)."""
+        width = self.width
+        labels = self.labels[z]
+        ring: List[Optional[int]] = []
+        for dx, dy in _RING:
+            nx = x + dx
+            ny = y + dy
+            if 0 <= nx < width and 0 <= ny < self.height and labels[ny * width + nx] > 0:
+                ring.append(ny * width + nx)
+            else:
+                ring.append(None)
+
+        # Union-find over ring slots: consecutive slots touch, and so do
+        # cardinals two slots apart (diagonal to each other across a corner)
+        parent = list(range(8))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i in range(8):
+            if ring[i] is None:
+                continue
+            j = (i + 1) % 8
+            if ring[j] is not None:
+                parent[find(i)] = find(j)
+            if i % 2 == 1:
+                j = (i + 2) % 8
+                if ring[j] is not None:
+                    parent[find(i)] = find(j)
+
+        groups: Dict[int, int] = {}
+        for i in range(8):
+            if ring[i] is not None:
+                groups.setdefault(find(i), ring[i])
+        return list(groups.values())
+
+    def _remove_tile(self, x: int, y: int, z: int) -> None:
+        local = y * self.width + x
+        labels = self.labels[z]
+        old = labels[local]
+        if old <= 0:
+            return
+        labels[local] = 0
+        self._sizes[old] -= 1
+        if self._sizes[old] == 0:
+            del self._sizes[old]
+            del self._label_z[old]
+            return
+
+        seeds = self._ring_groups(x, y, z)
+        if len(seeds) > 1:
+            self._split(z, old, seeds)
+
+    def _split(self, z: int, old: int, seeds: List[int]) -> None:
+        """Flood from each seed in lockstep; fronts that exhaust alone become new regions."""
+        width = self.width
+        height = self.height
+        labels = self.labels[z]
+
+        owner: Dict[int, int] = {}
+        parent: Dict[int, int] = {}
+        queues: Dict[int, deque] = {}
+        tiles: Dict[int, List[int]] = {}
+        for i, seed in enumerate(seeds):
+            owner[seed] = i
+            parent[i] = i
+            queues[i] = deque([seed])
+            tiles[i] = [seed]
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        active = set(range(len(seeds)))
+        visited = len(seeds)
+        while len(active) > 1:
+            for front in list(active):
+                if front not in active or len(active) == 1:
+                    continue
+                queue = queues[front]
+                if not queue:
+                    # Closed off on its own: this piece becomes a new region
+                    active.discard(front)
+                    label = self._new_label(z)
+                    for tile in tiles[front]:
+                        labels[tile] = label
+                    self._sizes[label] = len(tiles[front])
+                    self._sizes[old] -= len(tiles[front])
+                    continue
+
+                cell = queue.popleft()
+                cy, cx = divmod(cell, width)
+                for dx, dy in _NEIGHBORS:
+                    nx = cx + dx
+                    ny = cy + dy
+                    if nx < 0 or ny < 0 or nx >= width or ny >= height:
+                        continue
+                    neighbor = ny * width + nx
+                    if labels[neighbor] != old:
+                        continue
+                    other = owner.get(neighbor)
+                    if other is None:
+                        owner[neighbor] = front
+                        queue.append(neighbor)
+                        tiles[front].append(neighbor)
+                        visited += 1
+                        continue
+                    other = find(other)
+                    if other != front:
+                        # Fronts met - they are the same region; merge into the bigger one
+                        big, small = (front, other) if len(tiles[front]) >= len(tiles[other]) else (other, front)
+                        parent[small] = big
+                        tiles[big].extend(tiles.pop(small))
+                        queues[big].extend(queues.pop(small))
+                        active.discard(small)
+                        front = big
+                        queue = queues[big]
+
+                if visited > REGION_UPDATE_BUDGET:
+                    self._dirty_levels.add(z)
+                    return
+
+    # --- Cross-level links ---
+
+    def set_transitions(self, platform_transitions: Dict[Coord3D, int] | None, version: int | None = None) -> None:
+        """Sync fire escape links with the current {(x, y, z): other_z} transition map.
+
+        With the buildings transition version, unchanged maps are skipped without re-indexing.
+        """
+        if self._transition_cache.update(platform_transitions, version):
+            self._transitions = self._transition_cache.index
+            self._roots_dirty = True
+
+    def _rebuild_roots(self) -> None:
+        roots: Dict[int, int] = {}
+
+        def find(label: int) -> int:
+            root = roots.get(label, label)
+            while root != roots.get(root, root):
+                root = roots.get(root, root)
+            return root
+
+        plane = self.plane
+        for node, other in self._transitions.items():
+            a = self.labels[node // plane][node % plane]
+            b = self.labels[other // plane][other % plane]
+            if a > 0 and b > 0:
+                ra, rb = find(a), find(b)
+                if ra != rb:
+                    roots[ra] = rb
+
+        self._roots = {label: find(label) for label in roots}
+        self._roots_dirty = False
+
+    # --- Queries ---
+
+    def region_at(self, x: int, y: int, z: int) -> int:
+        """Return the root region of a walkable tile (0 if unwalkable or out of bounds)."""
+        if not self.grid.in_bounds(x, y, z):
+            return 0
+        self._refresh()
+        label = self.labels[z][y * self.width + x]
+        return self._roots.get(label, label)
+
+    def _entry_regions(self, x: int, y: int, z: int) -> Set[int]:
+        """Root regions a tile can be entered from (its own, or its neighbours' if unwalkable)."""
+        label = self.labels[z][y * self.width + x]
+        if label > 0:
+            return {self._roots.get(label, label)}
+        regions = {self._roots.get(l, l) for l in self._neighbor_labels(x, y, z)}
+        # A search starting on an unwalkable platform can still take its fire escape
+        other = self._transitions.get(z * self.plane + y * self.width + x)
+        if other is not None:
+            label = self.labels[other // self.plane][other % self.plane]
+            if label > 0:
+                regions.add(self._roots.get(label, label))
+        return regions
+
+    def is_reachable(self, a: Coord3D, b: Coord3D) -> bool:
+        """Check whether a path can exist between tiles a and b.
+
+        Either end may be unwalkable (workstations, resource nodes); it then
+        counts as reachable through any walkable neighbour, like A* goals do.
+        """
+        if not self.grid.in_bounds(*a) or not self.grid.in_bounds(*b):
+            return False
+        if a[2] == b[2] and abs(a[0] - b[0]) <= 1 and abs(a[1] - b[1]) <= 1:
+            return True
+        self._refresh()
+        return not self._entry_regions(*a).isdisjoint(self._entry_regions(*b))
+
+
+# Module-level index for the active grid (built lazily)
+_REGIONS: Optional[RegionIndex] = None
+
+
+def get_region_index(grid: Grid) -> RegionIndex:
+    """Return the region index for grid, building it on first use."""
+    global _REGIONS
+    if _REGIONS is None or _REGIONS.grid is not grid:
+        _REGIONS = RegionIndex(grid)
+    return _REGIONS
+
+
+def is_reachable(a: Coord3D, b: Coord3D) -> bool:
+    """Check whether tile b can be reached from tile a on the active grid.
+
+    Uses the current completed fire escapes for Z-level links. Returns True
+    when no index has been built yet, so callers never skip work they can't check.
+    """
+    if _REGIONS is None:
+        return True
+    from buildings import get_platform_transitions, get_transitions_version
+    _REGIONS.set_transitions(get_platform_transitions(), get_transitions_version())
+    return _REGIONS.is_reachable(a, b)
+
+
+def nearest_reachable(start: Coord3D, candidate_tiles: Iterable[Coord3D]) -> Optional[Coord3D]:
+    """Return the candidate closest to start by walking distance on the active grid.
+
+    Candidates in other regions are dropped first, then a single multi-target
+    Dijkstra (pathfinding.find_nearest) picks the nearest of the rest. Returns
+    None if no candidate is reachable. Before any index exists, or if the
+    search hits NEAREST_MAX_NODES, falls back to straight-line distance.
+    """
+    candidates = list(candidate_tiles)
+    if not candidates:
+        return None
+
+    def straight_line(tile: Coord3D) -> float:
+        return octile_distance(*start, *tile)
+
+    if _REGIONS is None:
+        return min(candidates, key=straight_line)
+
+    from buildings import get_platform_transitions, get_transitions_version
+    platform_transitions = get_platform_transitions()
+    transitions_version = get_transitions_version()
+    _REGIONS.set_transitions(platform_transitions, transitions_version)
+    reachable = [tile for tile in candidates if _REGIONS.is_reachable(start, tile)]
+    if len(reachable) <= 1:
+        return reachable[0] if reachable else None
+
+    transitions = get_transition_cache(_REGIONS.grid)
+    transitions.update(platform_transitions, transitions_version)
+    nearest = find_nearest(_REGIONS.grid, start, reachable, max_nodes=NEAREST_MAX_NODES,
+                           transition_index=transitions.index)
+    return nearest if nearest is not None else min(reachable, key=straight_line)
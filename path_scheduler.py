@@ -0,0 +1,308 @@
+"""Time-sliced path request scheduler.
+
+Searches that miss the path cache, region check and flow fields used to run
+to completion inside Colonist.update, so a burst of requests (a wall finished
+across a main road, everyone waking up at once) landed in a single tick.
+Here they are queued instead and share a fixed budget of node expansions per
+game tick (PATH_NODE_BUDGET). A JPS expansion is charged for every tile its
+jumps scanned, not as one node, so open maps can't slip long scans past it:
+
+- submit() returns a PathRequest handle. Requests are advanced right away
+  with whatever budget is left this tick, so under light load a path is
+  still ready the same tick it was asked for.
+- tick() runs once per game tick from the main loop and spends the fresh
+  budget on the queue, highest effective priority first. A search that runs
+  out of budget is suspended (searches are generators, see
+  pathfinding.iter_find_path) and resumed next tick where it left off.
+  An expansion that scans past the end of the budget is charged in full,
+  and the overrun comes out of the next tick's budget.
+- Effective priority is the base priority plus PATH_PRIORITY_AGING per tick
+  waited, so urgent requests jump the queue but nothing starves.
+- Identical requests share one handle. Each submit() counts as one waiter;
+  a caller that no longer wants the result calls release(), and the search
+  is only cancelled once nobody is waiting on it.
+
+Until tick() has been called once (headless scripts, tests) the scheduler is
+inactive and callers should search synchronously.
+
+With config.PATH_WORKERS > 0 searches go to a process pool instead (see
+path_workers.py) and tick() collects the finished ones; the node budget then
+only applies if the pool could not be started.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import config
+from pathfinding import iter_find_path
+from path_workers import PathWorkerPool
+
+if TYPE_CHECKING:
+    from grid import Grid
+
+Coord3D = Tuple[int, int, int]  # (x, y, z)
+
+# Node expansions (A*) or scanned tiles (JPS) per game tick shared by all queued searches
+PATH_NODE_BUDGET = 6000
+
+# Base priorities (higher runs first)
+PATH_PRIORITY_NORMAL = 0
+PATH_PRIORITY_URGENT = 50  # Starving, exhausted or fighting
+
+# Priority gained per tick spent waiting in the queue
+PATH_PRIORITY_AGING = 1.0
+
+
+class PathPending(Exception):
+    """Raised by Colonist._calculate_path when its search was queued.
+
+    Colonist.update catches it and parks the colonist in the "planning" state
+    until the request is done.
+    """
+
+    def __init__(self, request: "PathRequest"):
+        super().__init__(request.goal)
+        self.request = request
+
+
+class PathRequest:
+    """Handle for one queued search. Poll done, then read result."""
+
+    __slots__ = ("start", "goal", "max_nodes", "priority", "submitted_tick",
+                 "done", "cancelled", "result", "expanded", "finished_tick", "walk_version",
+                 "waiters", "_search", "_future", "_transition_index")
+
+    def __init__(self, start: Coord3D, goal: Coord3D, max_nodes: Optional[int],
+                 priority: float, submitted_tick: int, search, walk_version: int = 0):
+        self.start = start
+        self.goal = goal
+        self.max_nodes = max_nodes
+        self.priority = priority
+        self.submitted_tick = submitted_tick
+        self.done = False
+        self.cancelled = False
+        self.result: List[Coord3D] = []
+        self.expanded = 0
+        self.finished_tick: Optional[int] = None
+        self.walk_version = walk_version  # Grid.walk_version when submitted
+        self.waiters = 1  # submit() calls sharing this handle, minus release() calls
+        self._search = search
+        self._future = None  # Worker pool future, if solved off-process
+        self._transition_index = None
+
+    @property
+    def key(self) -> Tuple[Coord3D, Coord3D, Optional[int]]:
+        return (self.start, self.goal, self.max_nodes)
+
+    def effective_priority(self, game_tick: int) -> float:
+        """Base priority plus aging for the ticks spent waiting."""
+        return self.priority + (game_tick - self.submitted_tick) * PATH_PRIORITY_AGING
+
+    def cancel(self) -> None:
+        """Drop the request; it is removed from the queue on the next scheduler pass."""
+        if not self.done:
+            self.cancelled = True
+            self.done = True
+            self._search = None
+            if self._future is not None:
+                self._future.cancel()
+                self._future = None
+
+
+class PathScheduler:
+    """Queue of path searches sharing a per-tick node expansion budget."""
+
+    def __init__(self, grid: Grid, node_budget: int = PATH_NODE_BUDGET):
+        self.grid = grid
+        self.node_budget = node_budget
+        self.active = False
+
+        self._queue: List[PathRequest] = []
+        self._remote: List[PathRequest] = []  # Requests out on the worker pool
+        self.pool: Optional[PathWorkerPool] = None
+        self._pending: Dict[Tuple[Coord3D, Coord3D, Optional[int]], PathRequest] = {}
+        self._tick = 0
+        self._spent = 0
+
+        # Stats for debugging/UI
+        self.nodes_last_tick = 0
+        self.completed = 0
+        self.deferred = 0
+        self.total_wait_ticks = 0
+        self.max_wait_ticks = 0
+
+    def set_worker_pool(self, pool: Optional[PathWorkerPool]) -> None:
+        """Solve new requests on pool (None, or a disabled pool, solves in-process)."""
+        if self.pool is not None and self.pool is not pool:
+            self.pool.shutdown()
+        self.pool = pool
+
+    # --- Requests ---
+
+    def submit(
+        self,
+        start: Coord3D,
+        goal: Coord3D,
+        priority: float = PATH_PRIORITY_NORMAL,
+        max_nodes: int | None = None,
+        transition_index: Dict[int, int] | None = None,
+    ) -> PathRequest:
+        """Queue a search and advance it with this tick's leftover budget.
+
+        An identical request still in the queue is shared rather than
+        searched twice (its priority is raised to the higher of the two).
+        """
+        key = (start, goal, max_nodes)
+        request = self._pending.get(key)
+        if request is not None and not request.done:
+            request.priority = max(request.priority, priority)
+            request.waiters += 1
+            return request
+
+        if self.pool is not None and self.pool.enabled:
+            request = PathRequest(start, goal, max_nodes, priority, self._tick, None,
+                                  self.grid.walk_version)
+            request._transition_index = transition_index
+            request._future = self.pool.submit(start, goal, max_nodes, transition_index)
+            self._remote.append(request)
+            self._pending[key] = request
+            self.deferred += 1
+            return request
+
+        search = iter_find_path(self.grid, start, goal, max_nodes=max_nodes,
+                                transition_index=transition_index)
+        request = PathRequest(start, goal, max_nodes, priority, self._tick, search,
+                              self.grid.walk_version)
+        self._queue.append(request)
+        self._pending[key] = request
+        self._run()
+        if not request.done:
+            self.deferred += 1
+        return request
+
+    def release(self, request: PathRequest) -> None:
+        """Drop one caller's interest in a request; cancel it once nobody else waits on it."""
+        request.waiters -= 1
+        if request.waiters <= 0:
+            request.cancel()
+
+    def tick(self, game_tick: int) -> None:
+        """Start a new tick's budget and spend it on the queue."""
+        self.active = True
+        if game_tick != self._tick:
+            self.nodes_last_tick = self._spent
+            self._tick = game_tick
+            # A scan that overran last tick's budget is paid for out of this one
+            self._spent = max(0, self._spent - self.node_budget)
+        if self._remote:
+            self._collect_remote()
+        self._run()
+
+    def _collect_remote(self) -> None:
+        """Resolve worker pool requests that finished; resubmit ones solved on an old map."""
+        still_running = []
+        for request in self._remote:
+            if request.cancelled:
+                continue
+            if not request._future.done():
+                still_running.append(request)
+                continue
+            path = self.pool.collect(request._future)
+            if path is None:
+                request._future = self.pool.submit(request.start, request.goal, request.max_nodes,
+                                                   request._transition_index)
+                still_running.append(request)
+                continue
+            self._finish(request, path)
+        for request in self._remote:
+            if request.done and self._pending.get(request.key) is request:
+                del self._pending[request.key]
+        self._remote = still_running
+
+    def _run(self) -> None:
+        """Advance queued searches, highest effective priority first, until the budget is spent."""
+        while self._queue and self._spent < self.node_budget:
+            request = max(self._queue, key=lambda r: r.effective_priority(self._tick))
+            if not request.done:
+                self._advance(request, self.node_budget - self._spent)
+            if request.done:
+                self._queue.remove(request)
+                if self._pending.get(request.key) is request:
+                    del self._pending[request.key]
+
+    def _advance(self, request: PathRequest, budget: int) -> None:
+        """Spend up to budget units on one search; mark it done if it finishes."""
+        step = request._search.__next__
+        used = 0
+        try:
+            while used < budget:
+                used += step() or 1
+        except StopIteration as finished:
+            self._finish(request, finished.value)
+        request.expanded += used
+        # Even a search that finishes without expanding costs one unit, so a
+        # burst of trivial requests still can't loop forever
+        self._spent += max(used, 1)
+
+    def _finish(self, request: PathRequest, path: Optional[List[Coord3D]]) -> None:
+        """Store a request's result and record how long it waited."""
+        request.result = path or []
+        request.done = True
+        request.finished_tick = self._tick
+        request._search = None
+        request._future = None
+        wait = self._tick - request.submitted_tick
+        self.completed += 1
+        self.total_wait_ticks += wait
+        self.max_wait_ticks = max(self.max_wait_ticks, wait)
+
+    def clear(self) -> None:
+        """Cancel every queued request (e.g. after loading a save)."""
+        for request in self._queue + self._remote:
+            request.cancel()
+        self._queue.clear()
+        self._remote.clear()
+        self._pending.clear()
+
+    def get_stats(self) -> dict:
+        """Return queue and budget counters for debugging/UI."""
+        return {
+            "queue_depth": len(self._queue) + len(self._remote),
+            "workers": self.pool.workers if self.pool is not None and self.pool.enabled else 0,
+            "node_budget": self.node_budget,
+            "nodes_this_tick": self._spent,
+            "nodes_last_tick": self.nodes_last_tick,
+            "completed": self.completed,
+            "deferred": self.deferred,
+            "avg_wait_ticks": self.total_wait_ticks / self.completed if self.completed else 0.0,
+            "max_wait_ticks": self.max_wait_ticks,
+        }
+
+
+# Module-level scheduler for the active grid (built lazily)
+_PATH_SCHEDULER: Optional[PathScheduler] = None
+
+
+def get_path_scheduler(grid: Grid) -> PathScheduler:
+    """Return the path scheduler for grid, building it on first use."""
+    global _PATH_SCHEDULER
+    if _PATH_SCHEDULER is None or _PATH_SCHEDULER.grid is not grid:
+        if _PATH_SCHEDULER is not None:
+            _PATH_SCHEDULER.set_worker_pool(None)
+        _PATH_SCHEDULER = PathScheduler(grid)
+        if config.PATH_WORKERS > 0:
+            _PATH_SCHEDULER.set_worker_pool(PathWorkerPool(grid, config.PATH_WORKERS))
+    return _PATH_SCHEDULER
+
+
+def update_path_scheduler(grid: Grid, game_tick: int) -> None:
+    """Main loop hook: spend this tick's node budget on queued searches."""
+    get_path_scheduler(grid).tick(game_tick)
+
+
+def get_path_scheduler_stats() -> dict:
+    """Return the active scheduler's stats (empty before any path was planned)."""
+    if _PATH_SCHEDULER is None:
+        return {}
+    return _PATH_SCHEDULER.get_stats()
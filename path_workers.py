@@ -0,0 +1,170 @@
+"""Optional process-pool backend for path searches.
+
+The grid's walkability (Grid.walkable_flat, every Z-level back to back) is
+published once as a multiprocessing.shared_memory block. Workers attach to it
+by name and run pathfinding.find_path against it directly, so a request only
+ships its endpoints and the fire escape index, never the map.
+
+The block starts with an 8-byte version stamp. The pool's walkability
+listener writes each change straight into shared memory and bumps the stamp,
+so workers always read the live map. A worker reports the stamp it started
+from, and any result whose stamp no longer matches (or that changed while the
+worker was searching) is discarded by PathWorkerPool.collect() and solved
+again.
+
+Enabled with config.PATH_WORKERS > 0 (see path_scheduler.get_path_scheduler).
+If shared memory or process pools are unavailable the pool reports itself
+disabled and callers stay on the in-process solver.
+"""
+
+from __future__ import annotations
+
+import atexit
+import struct
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from pathfinding import find_path
+
+if TYPE_CHECKING:
+    from grid import Grid
+
+try:
+    from multiprocessing import shared_memory
+    from concurrent.futures import ProcessPoolExecutor
+    HAS_WORKER_POOL = True
+except ImportError:
+    HAS_WORKER_POOL = False
+    print("[Pathfinding] multiprocessing unavailable - path searches stay in-process")
+
+Coord3D = Tuple[int, int, int]  # (x, y, z)
+
+# Shared memory layout: version stamp, then walkable bytes for Z=0..depth-1
+_HEADER = struct.Struct("<q")
+
+
+class _SharedGrid:
+    """The slice of the Grid interface find_path needs, backed by shared memory."""
+
+    def __init__(self, buf, width: int, height: int, depth: int):
+        self.width = width
+        self.height = height
+        self.depth = depth
+        plane = width * height
+        base = _HEADER.size
+        self._buf = buf
+        self.walkable_flat = [buf[base + z * plane: base + (z + 1) * plane] for z in range(depth)]
+
+    @property
+    def walk_version(self) -> int:
+        """The shared block's version stamp (bumped on every walkability change)."""
+        return _HEADER.unpack_from(self._buf)[0]
+
+    def in_bounds(self, x: int, y: int, z: int = 0) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height and 0 <= z < self.depth
+
+
+# Worker process state (set by _init_worker)
+_WORKER_SHM = None
+_WORKER_GRID: Optional[_SharedGrid] = None
+
+
+def _init_worker(name: str, width: int, height: int, depth: int) -> None:
+    global _WORKER_SHM, _WORKER_GRID
+    _WORKER_SHM = shared_memory.SharedMemory(name=name)
+    _WORKER_GRID = _SharedGrid(_WORKER_SHM.buf, width, height, depth)
+
+
+def _solve(start: Coord3D, goal: Coord3D, max_nodes: Optional[int],
+           transition_index: Dict[int, int]) -> Tuple[int, List[Coord3D]]:
+    """Worker entry point. Returns (version searched against, path); version -1 if the map moved mid-search."""
+    buf = _WORKER_SHM.buf
+    version = _HEADER.unpack_from(buf)[0]
+    path = find_path(_WORKER_GRID, start, goal, max_nodes=max_nodes, transition_index=transition_index)
+    if _HEADER.unpack_from(buf)[0] != version:
+        version = -1
+    return version, path
+
+
+class PathWorkerPool:
+    """Process pool solving path searches against a shared walkability snapshot."""
+
+    def __init__(self, grid: Grid, workers: int):
+        self.grid = grid
+        self.workers = workers
+        self.version = 0
+        self.enabled = False
+
+        self._shm = None
+        self._executor = None
+
+        # Stats for debugging/benchmarks
+        self.submitted = 0
+        self.stale_results = 0
+
+        if not HAS_WORKER_POOL or workers <= 0:
+            return
+        try:
+            self._publish()
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self._shm.name, grid.width, grid.height, grid.depth),
+            )
+        except (OSError, ValueError) as e:
+            print(f"[Pathfinding] Worker pool unavailable ({e}) - path searches stay in-process")
+            self.shutdown()
+            return
+        self.enabled = True
+        grid.add_walkability_listener(self.on_walkability_changed)
+        atexit.register(self.shutdown)
+
+    def _publish(self) -> None:
+        """Copy every Z-level's walkability into a new shared memory block."""
+        grid = self.grid
+        plane = grid.width * grid.height
+        self._shm = shared_memory.SharedMemory(create=True, size=_HEADER.size + plane * grid.depth)
+        buf = self._shm.buf
+        _HEADER.pack_into(buf, 0, self.version)
+        for z in range(grid.depth):
+            offset = _HEADER.size + z * plane
+            buf[offset:offset + plane] = grid.walkable_flat[z]
+
+    def on_walkability_changed(self, x: int, y: int, z: int, walkable: bool) -> None:
+        """Grid listener: mirror the change into shared memory and bump the version stamp."""
+        if self._shm is None:
+            return
+        grid = self.grid
+        self._shm.buf[_HEADER.size + z * grid.width * grid.height + y * grid.width + x] = 1 if walkable else 0
+        self.version += 1
+        _HEADER.pack_into(self._shm.buf, 0, self.version)
+
+    # --- Requests ---
+
+    def submit(self, start: Coord3D, goal: Coord3D, max_nodes: int | None = None,
+               transition_index: Dict[int, int] | None = None) -> Future:
+        """Start a search on a worker. The future resolves to (version, path)."""
+        self.submitted += 1
+        return self._executor.submit(_solve, start, goal, max_nodes, transition_index or {})
+
+    def collect(self, future: Future) -> Optional[List[Coord3D]]:
+        """Path from a finished future, or None if it was solved against an old map."""
+        version, path = future.result()
+        if version != self.version:
+            self.stale_results += 1
+            return None
+        return path
+
+    def shutdown(self) -> None:
+        """Stop the workers and release the shared memory block."""
+        self.enabled = False
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._shm is not None:
+            self._shm.close()
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._shm = None
@@ -0,0 +1,615 @@
+"""A* pathfinding over the world grid.
+
+Searches run on flat integer node indices instead of (x, y, z) tuples:
+
+    index = z * (width * height) + y * width + x
+
+Walkability comes from Grid.walkable_flat (one bytearray per Z-level) and each
+search keeps parent pointers, so the path is rebuilt once when the goal is
+reached instead of copying a partial path for every expanded neighbour.
+
+Movement rules (shared by every search mode):
+- 8-connected movement on a Z-level, cardinal cost 1.0, diagonal cost 1.4
+- Z-level changes only through fire escape platform transitions, cost 10
+- The goal tile itself may be unwalkable (workstations, resource nodes)
+
+Search modes:
+- "astar": plain A* over every neighbour
+- "jps": Jump Point Search for trips within one Z-level. Straight and
+  diagonal runs are scanned without queueing, and only tiles where the
+  optimal route may turn (jump points) are expanded. Levels with fire escape
+  platforms fall back to A* since transitions break JPS's uniform-grid
+  assumptions.
+
+Each mode is a generator underneath (iter_find_path) that yields once per
+expanded node, so a search can be paused and resumed across ticks; find_path
+just runs it to the end. Each yield gives the work done since the previous
+one: None for a single A* expansion, and for JPS the expansion plus every
+tile its jumps scanned, so budgets (path_scheduler.py) measure scanning work
+rather than jump points.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Dict, Generator, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from grid import Grid
+
+Coord3D = Tuple[int, int, int]  # (x, y, z)
+
+# Movement costs
+CARDINAL_COST = 1.0
+DIAGONAL_COST = 1.4
+Z_TRANSITION_COST = 10.0
+
+# (dx, dy, cost) for the 8 neighbours - cardinals first so ties prefer straight moves
+NEIGHBOR_OFFSETS = (
+    (1, 0, CARDINAL_COST), (-1, 0, CARDINAL_COST), (0, 1, CARDINAL_COST), (0, -1, CARDINAL_COST),
+    (1, 1, DIAGONAL_COST), (1, -1, DIAGONAL_COST), (-1, 1, DIAGONAL_COST), (-1, -1, DIAGONAL_COST),
+)
+
+_DIAGONAL_SAVING = DIAGONAL_COST - 2 * CARDINAL_COST
+
+# Default mode for find_path ("jps" or "astar")
+SEARCH_MODE = "jps"
+
+# Max tiles one JPS jump scans before it stops and makes the tile it reached
+# a jump point, so a single expansion stays bounded on open maps
+JPS_JUMP_LIMIT = 64
+
+# Padded JPS levels: z -> (grid, walk_version, level with a blocked border)
+_PADDED_LEVELS: Dict[int, Tuple[object, int, bytes]] = {}
+
+
+def octile_distance(ax: int, ay: int, az: int, bx: int, by: int, bz: int) -> float:
+    """Admissible distance estimate matching the 1.0 / 1.4 / 10 move costs."""
+    dx = abs(ax - bx)
+    dy = abs(ay - by)
+    return CARDINAL_COST * (dx + dy) + _DIAGONAL_SAVING * min(dx, dy) + Z_TRANSITION_COST * abs(az - bz)
+
+
+def build_transition_index(grid: Grid, platform_transitions: Dict[Coord3D, int] | None) -> Dict[int, int]:
+    """Convert {(x, y, z): other_z} platform transitions into {node: other_node}.
+
+    A transition is usable when the tile on the other level is a fire escape
+    platform or otherwise walkable.
+    """
+    if not platform_transitions:
+        return {}
+    width = grid.width
+    plane = width * grid.height
+    index: Dict[int, int] = {}
+    for (px, py, pz), other_z in platform_transitions.items():
+        if not grid.in_bounds(px, py, pz) or not grid.in_bounds(px, py, other_z):
+            continue
+        if grid.get_tile(px, py, other_z) != "fire_escape_platform" and not grid.is_walkable(px, py, other_z):
+            continue
+        index[pz * plane + py * width + px] = other_z * plane + py * width + px
+    return index
+
+
+class TransitionCache:
+    """Node-index form of the fire escape transition map, rebuilt only when needed.
+
+    buildings.get_platform_transitions() is versioned, so the index only has
+    to be rebuilt when the version changes, or when a tile at either end of a
+    link changes walkability (which decides whether the link is usable).
+    Register on_walkability_changed as a Grid walkability listener.
+    """
+
+    def __init__(self, grid: Grid):
+        self.grid = grid
+        self.index: Dict[int, int] = {}
+        self.version: Optional[int] = None
+        self._tiles: frozenset = frozenset()
+        self._stale = True
+
+    def update(self, platform_transitions: Dict[Coord3D, int] | None, version: int | None = None) -> bool:
+        """Sync with a {(x, y, z): other_z} map. Returns True if the index changed.
+
+        Without a version the map is always re-indexed.
+        """
+        if version is not None and version == self.version and not self._stale:
+            return False
+        index = build_transition_index(self.grid, platform_transitions)
+        self.version = version
+        self._tiles = frozenset(platform_transitions or ())
+        self._stale = False
+        if index == self.index:
+            return False
+        self.index = index
+        return True
+
+    def on_walkability_changed(self, x: int, y: int, z: int, walkable: bool) -> None:
+        """Grid listener: a link endpoint changed, re-check the links on next update."""
+        if (x, y, z) in self._tiles:
+            self._stale = True
+
+
+# Shared transition index for the active grid (built lazily)
+_TRANSITION_CACHE: Optional[TransitionCache] = None
+
+
+def get_transition_cache(grid: Grid) -> TransitionCache:
+    """Return the shared transition index for grid, building it on first use."""
+    global _TRANSITION_CACHE
+    if _TRANSITION_CACHE is None or _TRANSITION_CACHE.grid is not grid:
+        _TRANSITION_CACHE = TransitionCache(grid)
+        grid.add_walkability_listener(_TRANSITION_CACHE.on_walkability_changed)
+    return _TRANSITION_CACHE
+
+
+def _rebuild_path(parent: Dict[int, int], node: int, width: int, plane: int) -> List[Coord3D]:
+    """Walk parent pointers back from node. Excludes the start tile."""
+    path: List[Coord3D] = []
+    while parent[node] != -1:
+        z, rem = divmod(node, plane)
+        y, x = divmod(rem, width)
+        path.append((x, y, z))
+        node = parent[node]
+    path.reverse()
+    return path
+
+
+def find_path(
+    grid: Grid,
+    start: Coord3D,
+    goal: Coord3D,
+    platform_transitions: Dict[Coord3D, int] | None = None,
+    max_nodes: int | None = None,
+    mode: str | None = None,
+    stats: dict | None = None,
+    transition_index: Dict[int, int] | None = None,
+) -> List[Coord3D]:
+    """Find a path from start to goal.
+
+    Uses Jump Point Search when the trip stays on one Z-level that has no fire
+    escape platforms, and A* otherwise (or when mode="astar").
+
+    Args:
+        grid: World grid (uses walkable_flat for passability)
+        start: Starting tile (not included in the returned path)
+        goal: Target tile (included; may be unwalkable)
+        platform_transitions: {(x, y, z): other_z} fire escape links
+        max_nodes: Optional expansion limit; the search gives up past it
+        mode: "jps" or "astar" (default SEARCH_MODE)
+        stats: Optional dict that receives {"mode", "expanded"} for benchmarks
+        transition_index: Prebuilt {node: other_node} links (TransitionCache.index);
+            used instead of platform_transitions when given
+
+    Returns list of (x, y, z) steps, or [] if unreachable / start == goal.
+    """
+    return run_search(iter_find_path(grid, start, goal, platform_transitions, max_nodes,
+                                     mode, stats, transition_index))
+
+
+def iter_find_path(
+    grid: Grid,
+    start: Coord3D,
+    goal: Coord3D,
+    platform_transitions: Dict[Coord3D, int] | None = None,
+    max_nodes: int | None = None,
+    mode: str | None = None,
+    stats: dict | None = None,
+    transition_index: Dict[int, int] | None = None,
+) -> Generator[None, None, List[Coord3D]]:
+    """Resumable find_path: a generator that yields once per expanded node.
+
+    Each yield is the work since the previous one (None counts as 1; JPS
+    yields 1 + tiles scanned). The path is the generator's return value (StopIteration.value), so a
+    caller can spread one search over several ticks (see path_scheduler.py).
+    The search reads walkable_flat as it goes, except JPS which snapshots
+    its level when it starts. Arguments are the same as find_path.
+    """
+    if transition_index is None:
+        transition_index = build_transition_index(grid, platform_transitions)
+    if (mode or SEARCH_MODE) == "jps" and start[2] == goal[2]:
+        plane = grid.width * grid.height
+        z = start[2]
+        if all(node // plane != z for node in transition_index):
+            return _jps_search(grid, start, goal, max_nodes, stats)
+    return _astar_search(grid, start, goal, None, max_nodes, stats, transition_index)
+
+
+def run_search(search: Generator[None, None, List[Coord3D]]) -> List[Coord3D]:
+    """Drive a search generator to completion and return its path."""
+    step = search.__next__
+    try:
+        while True:
+            step()
+    except StopIteration as finished:
+        return finished.value
+
+
+def find_path_astar(
+    grid: Grid,
+    start: Coord3D,
+    goal: Coord3D,
+    platform_transitions: Dict[Coord3D, int] | None = None,
+    max_nodes: int | None = None,
+    stats: dict | None = None,
+    transition_index: Dict[int, int] | None = None,
+) -> List[Coord3D]:
+    """A* with an octile heuristic over every neighbour. See find_path for arguments."""
+    return run_search(_astar_search(grid, start, goal, platform_transitions, max_nodes, stats, transition_index))
+
+
+def _astar_search(grid, start, goal, platform_transitions, max_nodes, stats, transition_index):
+    """Generator body of find_path_astar: yields once per expanded node, returns the path."""
+    if stats is not None:
+        stats["mode"] = "astar"
+        stats["expanded"] = 0
+    width = grid.width
+    height = grid.height
+    if not grid.in_bounds(*start) or not grid.in_bounds(*goal):
+        return []
+    if start == goal:
+        return []
+
+    plane = width * height
+    walkable_flat = grid.walkable_flat
+    transitions = transition_index if transition_index is not None else build_transition_index(grid, platform_transitions)
+
+    gx, gy, gz = goal
+    start_node = start[2] * plane + start[1] * width + start[0]
+    goal_node = gz * plane + gy * width + gx
+
+    parent: Dict[int, int] = {start_node: -1}
+    g_score: Dict[int, float] = {start_node: 0.0}
+    closed = bytearray(plane * grid.depth)
+
+    counter = 0  # Tie-breaker for equal f-scores (FIFO among equals)
+    heap = [(octile_distance(start[0], start[1], start[2], gx, gy, gz), counter, start_node)]
+    expanded = 0
+
+    while heap:
+        _, _, node = heapq.heappop(heap)
+        if closed[node]:
+            continue
+        if node == goal_node:
+            return _rebuild_path(parent, node, width, plane)
+        closed[node] = 1
+
+        expanded += 1
+        if stats is not None:
+            stats["expanded"] = expanded
+        if max_nodes is not None and expanded > max_nodes:
+            return []
+        yield
+
+        z, rem = divmod(node, plane)
+        y, x = divmod(rem, width)
+        base = z * plane
+        walk = walkable_flat[z]
+        current_g = g_score[node]
+
+        for dx, dy, cost in NEIGHBOR_OFFSETS:
+            nx = x + dx
+            ny = y + dy
+            if nx < 0 or ny < 0 or nx >= width or ny >= height:
+                continue
+            local = ny * width + nx
+            neighbor = base + local
+            if closed[neighbor]:
+                continue
+            if neighbor != goal_node and not walk[local]:
+                continue
+            new_g = current_g + cost
+            if new_g < g_score.get(neighbor, float("inf")):
+                g_score[neighbor] = new_g
+                parent[neighbor] = node
+                counter += 1
+                heapq.heappush(heap, (new_g + octile_distance(nx, ny, z, gx, gy, gz), counter, neighbor))
+
+        # Z-level transition via fire escape platform
+        other = transitions.get(node)
+        if other is not None and not closed[other]:
+            new_g = current_g + Z_TRANSITION_COST
+            if new_g < g_score.get(other, float("inf")):
+                g_score[other] = new_g
+                parent[other] = node
+                oz = other // plane
+                counter += 1
+                heapq.heappush(heap, (new_g + octile_distance(x, y, oz, gx, gy, gz), counter, other))
+
+    return []
+
+
+def find_path_jps(
+    grid: Grid,
+    start: Coord3D,
+    goal: Coord3D,
+    max_nodes: int | None = None,
+    stats: dict | None = None,
+) -> List[Coord3D]:
+    """Jump Point Search on a single Z-level. See find_path for arguments."""
+    return run_search(_jps_search(grid, start, goal, max_nodes, stats))
+
+
+def _jps_search(grid, start, goal, max_nodes, stats):
+    """Generator body of find_path_jps: yields once per expanded jump point, returns the path.
+
+    Diagonal moves are allowed past corners (like A* here), so forced
+    neighbours appear wherever a blocked tile beside the run hides an open
+    tile one step further along it.
+
+    Scans run on the level padded with a blocked border (cached per
+    walk_version, see _padded_level), so the inner loops are plain index
+    arithmetic with no bounds checks. Each yield reports 1 + the tiles
+    scanned by the previous expansion's jumps. Jumps stop after
+    JPS_JUMP_LIMIT tiles; the tile reached becomes an extra jump point, which
+    keeps paths optimal and bounds the work between two yields.
+    """
+    if stats is not None:
+        stats["mode"] = "jps"
+        stats["expanded"] = 0
+        stats["scanned"] = 0
+    width = grid.width
+    height = grid.height
+    if not grid.in_bounds(*start) or not grid.in_bounds(*goal) or start[2] != goal[2]:
+        return []
+    if start == goal:
+        return []
+
+    z = start[2]
+    o = _padded_level(grid, z)
+    pw = width + 2  # padded row width
+
+    sx, sy = start[0], start[1]
+    gx, gy = goal[0], goal[1]
+    goal_i = (gy + 1) * pw + gx + 1
+    if not o[goal_i]:
+        # The goal may be unwalkable but is always enterable
+        o = bytearray(o)
+        o[goal_i] = 1
+
+    scanned = 0  # Tiles scanned by jumps since the last yield
+
+    def jump_straight(i: int, step: int, side: int, limit: int) -> int:
+        """Scan a straight run from index i; returns the next jump point index or -1.
+
+        side is the perpendicular offset (one row for horizontal runs, one column for vertical).
+        After limit tiles the tile reached is returned as an extra jump point.
+        """
+        nonlocal scanned
+        begin = i
+        end = i + step * limit
+        while True:
+            i += step
+            if not o[i]:
+                scanned += (i - begin) // step
+                return -1
+            if (i == goal_i or i == end
+                    or (not o[i + side] and o[i + side + step]) or (not o[i - side] and o[i - side + step])):
+                scanned += (i - begin) // step
+                return i
+
+    def jump(i: int, dx: int, dy: int) -> int:
+        """Find the next jump point from index i heading (dx, dy); -1 if none.
+
+        Scans at most about JPS_JUMP_LIMIT tiles, including the straight
+        runs checked from each diagonal step.
+        """
+        nonlocal scanned
+        if not dy:
+            return jump_straight(i, dx, pw, JPS_JUMP_LIMIT)
+        if not dx:
+            return jump_straight(i, dy * pw, 1, JPS_JUMP_LIMIT)
+        step = dy * pw + dx
+        row = dy * pw
+        limit = scanned + JPS_JUMP_LIMIT
+        while True:
+            i += step
+            scanned += 1
+            if not o[i]:
+                return -1
+            if i == goal_i:
+                return i
+            if (not o[i - dx] and o[i - dx + row]) or (not o[i - row] and o[i - row + dx]):
+                return i
+            if scanned >= limit or jump_straight(i, dx, pw, limit - scanned) >= 0:
+                return i
+            if scanned >= limit or jump_straight(i, row, 1, limit - scanned) >= 0:
+                return i
+
+    def directions(i: int, prev: int) -> List[Tuple[int, int]]:
+        """Pruned neighbour directions for index i reached from index prev."""
+        py, px = divmod(prev, pw)
+        y, x = divmod(i, pw)
+        dx = (x > px) - (x < px)
+        dy = (y > py) - (y < py)
+        row = dy * pw
+        if dx and dy:
+            dirs = [(dx, 0), (0, dy), (dx, dy)]
+            if not o[i - dx] and o[i - dx + row]:
+                dirs.append((-dx, dy))
+            if not o[i - row] and o[i - row + dx]:
+                dirs.append((dx, -dy))
+        elif dx:
+            dirs = [(dx, 0)]
+            if not o[i + pw] and o[i + pw + dx]:
+                dirs.append((dx, 1))
+            if not o[i - pw] and o[i - pw + dx]:
+                dirs.append((dx, -1))
+        else:
+            dirs = [(0, dy)]
+            if not o[i + 1] and o[i + 1 + row]:
+                dirs.append((1, dy))
+            if not o[i - 1] and o[i - 1 + row]:
+                dirs.append((-1, dy))
+        return dirs
+
+    start_i = (sy + 1) * pw + sx + 1
+    parent: Dict[int, int] = {start_i: -1}
+    g_score: Dict[int, float] = {start_i: 0.0}
+    closed = set()
+    counter = 0
+    heap = [(octile_distance(sx, sy, z, gx, gy, z), counter, start_i)]
+    all_dirs = [(dx, dy) for dx, dy, _ in NEIGHBOR_OFFSETS]
+    expanded = 0
+
+    while heap:
+        _, _, i = heapq.heappop(heap)
+        if i in closed:
+            continue
+        if i == goal_i:
+            return _rebuild_jump_path(parent, i, pw, z)
+        closed.add(i)
+
+        expanded += 1
+        if stats is not None:
+            stats["expanded"] = expanded
+            stats["scanned"] += scanned
+        if max_nodes is not None and expanded > max_nodes:
+            return []
+        work, scanned = 1 + scanned, 0
+        yield work
+
+        prev = parent[i]
+        dirs = all_dirs if prev < 0 else directions(i, prev)
+        y, x = divmod(i, pw)
+        current_g = g_score[i]
+        for dx, dy in dirs:
+            j = jump(i, dx, dy)
+            if j < 0 or j in closed:
+                continue
+            jy, jx = divmod(j, pw)
+            new_g = current_g + octile_distance(x, y, z, jx, jy, z)
+            if new_g < g_score.get(j, float("inf")):
+                g_score[j] = new_g
+                parent[j] = i
+                counter += 1
+                heapq.heappush(heap, (new_g + octile_distance(jx, jy, z, gx + 1, gy + 1, z), counter, j))
+
+    return []
+
+
+def _padded_level(grid: Grid, z: int) -> bytes:
+    """Return Z-level z with a blocked one-tile border, rebuilt only when walk_version moves.
+
+    Searches that are still suspended keep the snapshot they started with,
+    since a new version gets a new buffer instead of changing the old one.
+    """
+    entry = _PADDED_LEVELS.get(z)
+    if entry is not None and entry[0] is grid and entry[1] == grid.walk_version:
+        return entry[2]
+    version = grid.walk_version
+    width = grid.width
+    walk = grid.walkable_flat[z]
+    pw = width + 2
+    border = bytes(1)
+    rows = [bytes(pw)]
+    for y in range(grid.height):
+        rows.append(border + bytes(walk[y * width:(y + 1) * width]) + border)
+    rows.append(bytes(pw))
+    level = b"".join(rows)
+    _PADDED_LEVELS[z] = (grid, version, level)
+    return level
+
+
+def find_nearest(
+    grid: Grid,
+    start: Coord3D,
+    candidates,
+    max_nodes: int | None = None,
+    transition_index: Dict[int, int] | None = None,
+    stats: dict | None = None,
+) -> Optional[Coord3D]:
+    """Return the candidate tile closest to start by walking distance, or None.
+
+    One Dijkstra search outward from start that stops at the first candidate
+    it settles, instead of one A* per candidate. Candidates may be unwalkable
+    (like find_path goals). Follows the same movement rules as find_path;
+    gives up (returns None) past max_nodes expansions.
+    """
+    if stats is not None:
+        stats["expanded"] = 0
+    width = grid.width
+    height = grid.height
+    plane = width * height
+    if not grid.in_bounds(*start):
+        return None
+
+    targets = set()
+    for x, y, z in candidates:
+        if grid.in_bounds(x, y, z):
+            targets.add(z * plane + y * width + x)
+    if not targets:
+        return None
+
+    walkable_flat = grid.walkable_flat
+    transitions = transition_index if transition_index is not None else {}
+    start_node = start[2] * plane + start[1] * width + start[0]
+    g_score: Dict[int, float] = {start_node: 0.0}
+    closed = bytearray(plane * grid.depth)
+    counter = 0
+    heap = [(0.0, counter, start_node)]
+    expanded = 0
+
+    while heap:
+        current_g, _, node = heapq.heappop(heap)
+        if closed[node]:
+            continue
+        z, rem = divmod(node, plane)
+        y, x = divmod(rem, width)
+        if node in targets:
+            return (x, y, z)
+        closed[node] = 1
+
+        expanded += 1
+        if stats is not None:
+            stats["expanded"] = expanded
+        if max_nodes is not None and expanded > max_nodes:
+            return None
+
+        base = z * plane
+        walk = walkable_flat[z]
+        for dx, dy, cost in NEIGHBOR_OFFSETS:
+            nx = x + dx
+            ny = y + dy
+            if nx < 0 or ny < 0 or nx >= width or ny >= height:
+                continue
+            local = ny * width + nx
+            neighbor = base + local
+            if closed[neighbor]:
+                continue
+            if not walk[local] and neighbor not in targets:
+                continue
+            new_g = current_g + cost
+            if new_g < g_score.get(neighbor, float("inf")):
+                g_score[neighbor] = new_g
+                counter += 1
+                heapq.heappush(heap, (new_g, counter, neighbor))
+
+        other = transitions.get(node)
+        if other is not None and not closed[other]:
+            new_g = current_g + Z_TRANSITION_COST
+            if new_g < g_score.get(other, float("inf")):
+                g_score[other] = new_g
+                counter += 1
+                heapq.heappush(heap, (new_g, counter, other))
+
+    return None
+
+
+def _rebuild_jump_path(parent: Dict[int, int], i: int, pw: int, z: int) -> List[Coord3D]:
+    """Expand the chain of padded jump point indices into every tile along the way. Excludes the start tile."""
+    points: List[Tuple[int, int]] = []
+    while i != -1:
+        y, x = divmod(i, pw)
+        points.append((x - 1, y - 1))
+        i = parent[i]
+    points.reverse()
+
+    path: List[Coord3D] = []
+    for (ax, ay), (bx, by) in zip(points, points[1:]):
+        dx = (bx > ax) - (bx < ax)
+        dy = (by > ay) - (by < ay)
+        x, y = ax, ay
+        while (x, y) != (bx, by):
+            x += dx
+            y += dy
+            path.append((x, y, z))
+    return path
@@ -5,7 +5,7 @@ Spawns recreation jobs during recreation hours so colonists can socialize and re
 Recreation prevents burnout and provides mood bonuses.
 """
 
-from jobs import add_job, JOB_QUEUE
+from jobs import add_job, get_jobs_by_category
 from typing import List, Tuple
 
 
@@ -44,7 +44,7 @@ def spawn_recreation_jobs(colonists: List, grid, game_tick: int) -> None:
         return
     
     # Count existing recreation jobs
-    existing_recreation = sum(1 for j in JOB_QUEUE if j.category == "recreation" and not j.assigned)
+    existing_recreation = sum(1 for j in get_jobs_by_category("recreation") if not j.assigned)
     
     # Target: 1 recreation job per 2 colonists (so they can pair up or do solo activities)
     target_jobs = max(1, len(colonists) // 2)
@@ -17,9 +17,12 @@ from __future__ import annotations
 
 import random
 from enum import Enum
-from typing import Dict, Tuple, Optional
+from typing import Dict, Set, Tuple, Optional
 
 from config import GRID_W, GRID_H
+from haul_requests import HaulRequestQueue
+from jobs import JOB_QUEUE
+from timer_wheel import TIMERS
 
 
 # Node states for visual feedback
@@ -37,9 +40,20 @@ Coord3D = Tuple[int, int, int]  # (x, y, z)
 _RESOURCE_NODES: Dict[Coord, dict] = {}
 _RESOURCE_PILES: Dict[Coord, dict] = {}
 
+# Nodes marked depleted (harvested out, waiting to regrow or be removed)
+_DEPLETED_NODES: Set[Coord] = set()
+
+# Timer wheel kind for node regrowth (keyed by (x, y)). The timer only runs
+# while the node's tile is clear - picking up the dropped item starts it.
+NODE_REGROW_TIMER = "node_regrow"
+
 # Resource items use 3D coordinates - can exist on any Z-level
 _RESOURCE_ITEMS: Dict[Coord3D, dict] = {}  # Dropped resource items awaiting pickup
 
+# Tiles whose resource item was marked for hauling since the last
+# process_auto_haul_jobs pass (see haul_requests.py)
+_HAUL_REQUESTS = HaulRequestQueue("resource_haul_retry")
+
 # Global stockpile - total resources collected by the colony
 _STOCKPILE: Dict[str, int] = {
     "wood": 0,
@@ -207,6 +221,8 @@ def spawn_resource_item(x: int, y: int, z: int, resource_type: str, amount: int
             "amount": amount,
             "haul_requested": auto_haul,  # Whether this needs to be hauled
         }
+    if auto_haul:
+        _HAUL_REQUESTS.push(coord)
 
 
 def get_resource_item_at(x: int, y: int, z: int = 0) -> Optional[dict]:
@@ -237,6 +253,8 @@ def pickup_resource_item(x: int, y: int, z: int = 0) -> Optional[dict]:
     item = _RESOURCE_ITEMS.pop((x, y, z), None)
     if item:
         print(f"[DEBUG Resource] Picked up {item.get('amount')}x {item.get('type')} from ({x},{y},{z})")
+        if z == 0 and (x, y) in _DEPLETED_NODES:
+            _start_regrow(x, y)
     else:
         print(f"[DEBUG Resource] No item found at ({x},{y},{z}) to pick up")
     return item
@@ -265,6 +283,7 @@ def mark_item_for_hauling(x: int, y: int, z: int = 0) -> bool:
     if item is None:
         return False
     item["haul_requested"] = True
+    _HAUL_REQUESTS.push(coord)
     return True
 
 
@@ -317,18 +336,21 @@ def create_haul_job_for_item(jobs_module, x: int, y: int, z: int,
 def process_auto_haul_jobs(jobs_module, zones_module) -> int:
     """Create haul jobs for items marked for auto-hauling.
     
-    Called each tick from main loop. Finds items needing haul and creates
-    jobs to move them to stockpile zones.
+    Called each tick from main loop. Only looks at tiles pushed onto
+    _HAUL_REQUESTS since the last pass (plus retries that came due) and
+    creates jobs to move their items to stockpile zones.
     
     Returns number of jobs created.
     """
     jobs_created = 0
     
-    for (x, y, z), item in list(_RESOURCE_ITEMS.items()):
-        if not item.get("haul_requested", False):
+    for (x, y, z) in _HAUL_REQUESTS.pop(zones_module):
+        item = _RESOURCE_ITEMS.get((x, y, z))
+        if item is None or not item.get("haul_requested", False):
+            _HAUL_REQUESTS.done((x, y, z))
             continue
         
-        # Already has a job
+        # Already has a job - _on_job_removed re-queues the tile when it ends
         if jobs_module.get_job_at(x, y, z) is not None:
             continue
         
@@ -337,16 +359,37 @@ def process_auto_haul_jobs(jobs_module, zones_module) -> int:
             item.get("type", ""), z=z, from_x=x, from_y=y
         )
         if dest is None:
-            # No valid stockpile zone exists - skip this item
+            # No valid stockpile zone exists - try again later
+            _HAUL_REQUESTS.defer((x, y, z), zones_module)
             continue
         
         dest_x, dest_y, dest_z = dest
         if create_haul_job_for_item(jobs_module, x, y, z, dest_x, dest_y, dest_z):
+            _HAUL_REQUESTS.done((x, y, z))
             jobs_created += 1
     
     return jobs_created
 
 
+def _on_job_removed(job) -> None:
+    """Job board listener: re-request hauling for items a job left behind.
+    
+    Covers haul jobs that failed before pickup (the item goes back to being
+    haul-requested) and other jobs on the tile that made a request wait.
+    """
+    coord = (job.x, job.y, job.z)
+    item = _RESOURCE_ITEMS.get(coord)
+    if item is None:
+        return
+    if job.type == "haul" and job.resource_type == item.get("type"):
+        item["haul_requested"] = True
+    if item.get("haul_requested", False):
+        _HAUL_REQUESTS.push(coord)
+
+
+JOB_QUEUE.add_remove_listener(_on_job_removed)
+
+
 # Node type definitions with default properties
 # regrow_time: 0 = non-replenishable (node removed after harvest)
 # regrow_time: >0 = ticks until respawn after depletion
@@ -1571,46 +1614,62 @@ def is_resource_node(tile_value: Optional[str]) -> bool:
     return tile_value == "resource_node"
 
 
+def _start_regrow(x: int, y: int) -> None:
+    """Schedule regrowth (or removal) of a depleted node once its tile is clear.
+    
+    Resumes from node["regrow_timer"] if set, else the full regrow_time.
+    Non-replenishable nodes get a one-tick timer so they're removed next tick.
+    """
+    node = _RESOURCE_NODES.get((x, y))
+    if node is None or not node.get("depleted", False):
+        return
+    if (x, y, 0) in _RESOURCE_ITEMS:
+        return  # Dropped item still here - pickup_resource_item starts the timer
+    regrow_time = node.get("regrow_time", 0)
+    delay = (node.get("regrow_timer", 0) or regrow_time) if regrow_time > 0 else 1
+    TIMERS.schedule(NODE_REGROW_TIMER, (x, y), delay)
+
+
 def update_resource_nodes(grid) -> None:
-    """Tick respawn timers for depleted nodes and respawn when ready.
+    """Respawn depleted nodes whose regrow timer came due.
     
-    Call this once per game tick from the main loop.
+    Call this once per game tick from the main loop, after
+    timer_wheel.update_timers().
     Node cannot respawn while a dropped resource item is on the tile.
     Non-replenishable nodes (regrow_time=0) are removed once their dropped item is collected.
     """
     nodes_to_remove = []
     
-    for (x, y), node in _RESOURCE_NODES.items():
-        if not node.get("depleted", False):
+    for (x, y) in TIMERS.pop_due(NODE_REGROW_TIMER):
+        node = _RESOURCE_NODES.get((x, y))
+        if node is None or not node.get("depleted", False):
+            _DEPLETED_NODES.discard((x, y))
+            continue
+        
+        # Can't respawn if an item was dropped here meanwhile - pickup restarts it
+        if (x, y, 0) in _RESOURCE_ITEMS:
+            node["regrow_timer"] = 1
             continue
         
         regrow_time = node.get("regrow_time", 0)
         if regrow_time <= 0:
             # Non-replenishable node (e.g., scrap piles)
-            # Remove it once the dropped item has been collected
-            if (x, y) not in _RESOURCE_ITEMS:
-                nodes_to_remove.append((x, y))
-            continue
-        
-        # Can't respawn if there's a dropped item on this tile
-        if (x, y) in _RESOURCE_ITEMS:
+            nodes_to_remove.append((x, y))
             continue
         
-        # Tick down the timer
-        node["regrow_timer"] = node.get("regrow_timer", 0) - 1
-        
-        if node["regrow_timer"] <= 0:
-            # Respawn the node
-            node["amount"] = node.get("max_amount", 1)
-            node["depleted"] = False
-            node["state"] = NodeState.IDLE
-            node["regrow_timer"] = 0
-            # Make sure tile is still marked as resource_node
-            grid.set_tile(x, y, "resource_node")
+        # Respawn the node
+        node["amount"] = node.get("max_amount", 1)
+        node["depleted"] = False
+        node["state"] = NodeState.IDLE
+        node["regrow_timer"] = 0
+        _DEPLETED_NODES.discard((x, y))
+        # Make sure tile is still marked as resource_node
+        grid.set_tile(x, y, "resource_node")
     
     # Remove depleted non-replenishable nodes
     for (x, y) in nodes_to_remove:
         _RESOURCE_NODES.pop((x, y), None)
+        _DEPLETED_NODES.discard((x, y))
         grid.set_tile(x, y, "empty")
 
 
@@ -1642,6 +1701,8 @@ def set_node_state(x: int, y: int, state: NodeState) -> None:
 
 def _remove_node_at(x: int, y: int) -> None:
     _RESOURCE_NODES.pop((x, y), None)
+    _DEPLETED_NODES.discard((x, y))
+    TIMERS.cancel(NODE_REGROW_TIMER, (x, y))
 
 
 def clear_node_for_construction(x: int, y: int) -> bool:
@@ -1665,7 +1726,7 @@ def clear_node_for_construction(x: int, y: int) -> bool:
         spawn_resource_item(x, y, 0, resource_type, amount, auto_haul=True)
     
     # Remove the node permanently (no respawn)
-    _RESOURCE_NODES.pop((x, y), None)
+    _remove_node_at(x, y)
     return True
 
 
@@ -1712,10 +1773,12 @@ def harvest_tick(x: int, y: int, job_progress: int, job_required: int) -> bool:
         if node["amount"] <= 0:
             node["depleted"] = True
             node["state"] = NodeState.DEPLETED
+            _DEPLETED_NODES.add((x, y))
             # Start respawn timer if this node type can regrow
             regrow_time = node.get("regrow_time", 0)
             if regrow_time > 0:
                 node["regrow_timer"] = regrow_time
+            _start_regrow(x, y)
         
         return True
     
@@ -1726,7 +1789,8 @@ def harvest_resource(node: dict) -> Optional[dict]:
     """Harvest a single unit from *node* and return a resource item.
 
     The caller is responsible for handling depletion side effects such as
-    removing the node entry and updating the grid tile.
+    removing the node entry, updating the grid tile and adding the node's
+    coordinates to _DEPLETED_NODES so it regrows.
     """
 
     if node.get("amount", 0) <= 0:
@@ -1856,6 +1920,11 @@ def get_save_state() -> dict:
             "resource": node.get("resource"),
             "amount": node.get("amount", 0),
             "state": node.get("state", NodeState.IDLE).value if isinstance(node.get("state"), NodeState) else node.get("state", "idle"),
+            "max_amount": node.get("max_amount", 1),
+            "regrow_time": node.get("regrow_time", 0),
+            "depleted": node.get("depleted", False),
+            "regrow_timer": (TIMERS.remaining(NODE_REGROW_TIMER, coord)
+                             or node.get("regrow_timer", 0)),
         }
     
     # Resource items on ground
@@ -1881,7 +1950,10 @@ def load_save_state(state: dict):
     global _RESOURCE_NODES, _RESOURCE_ITEMS, _STOCKPILE, _RESERVED
     
     _RESOURCE_NODES.clear()
+    _DEPLETED_NODES.clear()
     _RESOURCE_ITEMS.clear()
+    _HAUL_REQUESTS.clear()
+    TIMERS.clear(NODE_REGROW_TIMER)
     
     # Restore nodes
     for key, node_data in state.get("nodes", {}).items():
@@ -1897,8 +1969,14 @@ def load_save_state(state: dict):
             "type": node_data.get("type"),
             "resource": node_data.get("resource"),
             "amount": node_data.get("amount", 0),
+            "max_amount": node_data.get("max_amount", node_data.get("amount", 0)),
+            "regrow_time": node_data.get("regrow_time", 0),
+            "regrow_timer": node_data.get("regrow_timer", 0),
+            "depleted": node_data.get("depleted", False),
             "state": node_state,
         }
+        if _RESOURCE_NODES[coord]["depleted"]:
+            _DEPLETED_NODES.add(coord)
     
     # Restore items
     for key, item_data in state.get("items", {}).items():
@@ -1910,6 +1988,10 @@ def load_save_state(state: dict):
             "reserved": False,  # Reset reservations on load
         }
     
+    # Restart regrowth for depleted nodes whose tile is clear
+    for (x, y) in _DEPLETED_NODES:
+        _start_regrow(x, y)
+    
     # Restore stockpile
     for res_type, amount in state.get("stockpile", {}).items():
         _STOCKPILE[res_type] = amount
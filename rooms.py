@@ -584,6 +584,17 @@ def _is_interior_tile(grid, x: int, y: int, z: int = 0) -> bool:
     return True
 
 
+def _scan_tiles(grid, z: int):
+    """Yield (x, y) for room detection to scan on level z.
+    
+    Skips chunks of upper levels with nothing built near them (Grid.iter_chunks).
+    """
+    for x0, y0, x1, y1 in grid.iter_chunks(z, halo=True):
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                yield x, y
+
+
 def _is_entrance_tile(grid, x: int, y: int, z: int = 0) -> bool:
     """Check if a tile is an entrance (door or window - required for room detection).
     
@@ -695,14 +706,16 @@ def detect_rooms(grid) -> None:
     
     # Reset grid env_data for room-related fields before re-detecting
     # This ensures hover/tooltips and AI see up-to-date room info.
+    # (upper levels only hold data in chunks that were written to)
     for z_level in range(grid.depth):
-        for y in range(grid.height):
-            for x in range(grid.width):
-                # Clear room assignment
-                grid.set_env_param(x, y, z_level, "room_id", None)
-                # Recompute base tile-level exits (adjacent walkable tiles)
-                base_exits = grid.calculate_exit_count(x, y, z_level)
-                grid.set_env_param(x, y, z_level, "exit_count", base_exits)
+        for x0, y0, x1, y1 in grid.iter_chunks(z_level):
+            for y in range(y0, y1):
+                for x in range(x0, x1):
+                    # Clear room assignment
+                    grid.set_env_param(x, y, z_level, "room_id", None)
+            # Recompute base tile-level exits (adjacent walkable tiles) for the area
+            grid.env_engine.mark_rect_dirty(z_level, x0, y0, x1, y1)
+    grid.update_env_fields()
     
     # Track which rooms are new vs continuing
     new_room_ids: Set[int] = set()
@@ -712,62 +725,63 @@ def detect_rooms(grid) -> None:
         # Track visited interior tiles per Z-level
         visited: Set[Coord] = set()
         
-        # Scan all tiles for interior tiles on this Z-level
-        for y in range(grid.height):
-            for x in range(grid.width):
-                if (x, y) in visited:
-                    continue
+        # Scan all tiles for interior tiles on this Z-level. On upper levels
+        # only chunks with something built (plus the ones around them, where
+        # a room's first interior tile can be) are scanned.
+        for x, y in _scan_tiles(grid, z):
+            if (x, y) in visited:
+                continue
                 
-                if _is_interior_tile(grid, x, y, z):
-                    # Found an unvisited interior tile - flood fill to find potential room
-                    interior_tiles, boundary_tiles, is_enclosed, has_entrance = _flood_fill_room(grid, x, y, z, visited)
+            if _is_interior_tile(grid, x, y, z):
+                # Found an unvisited interior tile - flood fill to find potential room
+                interior_tiles, boundary_tiles, is_enclosed, has_entrance = _flood_fill_room(grid, x, y, z, visited)
                     
-                    # Room requires: enclosed + has entrance (door/window) + has interior tiles
-                    if is_enclosed and has_entrance and interior_tiles:
-                        # This is a valid room
-                        room_id = _next_room_id
-                        _next_room_id += 1
+                # Room requires: enclosed + has entrance (door/window) + has interior tiles
+                if is_enclosed and has_entrance and interior_tiles:
+                    # This is a valid room
+                    room_id = _next_room_id
+                    _next_room_id += 1
                         
-                        # Compute entrances (doors/windows) on the room boundary
-                        entrances: List[Coord] = []
-                        for bx, by in boundary_tiles:
-                            if _is_entrance_tile(grid, bx, by, z):
-                                entrances.append((bx, by))
-
-                        # Collect simple contents by tile type for interior tiles
-                        contents: Dict[str, int] = {}
-                        for tx, ty in interior_tiles:
-                            tile_type = grid.get_tile(tx, ty, z)
-                            if tile_type is None:
-                                continue
-                            contents[tile_type] = contents.get(tile_type, 0) + 1
+                    # Compute entrances (doors/windows) on the room boundary
+                    entrances: List[Coord] = []
+                    for bx, by in boundary_tiles:
+                        if _is_entrance_tile(grid, bx, by, z):
+                            entrances.append((bx, by))
+
+                    # Collect simple contents by tile type for interior tiles
+                    contents: Dict[str, int] = {}
+                    for tx, ty in interior_tiles:
+                        tile_type = grid.get_tile(tx, ty, z)
+                        if tile_type is None:
+                            continue
+                        contents[tile_type] = contents.get(tile_type, 0) + 1
                         
-                        # Classify room type and compute room-level effects from contents
-                        room_type, room_effects = _classify_room_from_contents(contents, interior_tiles, z, grid, entrances)
+                    # Classify room type and compute room-level effects from contents
+                    room_type, room_effects = _classify_room_from_contents(contents, interior_tiles, z, grid, entrances)
                         
-                        # Store room with Z-level info, entrances, contents, classification, and effects
-                        _ROOMS[room_id] = {
-                            "tiles": interior_tiles,
-                            "z": z,
-                            "entrances": entrances,
-                            "contents": contents,
-                            "room_type": room_type,
-                            "effects": room_effects,
-                        }
-                        for tx, ty in interior_tiles:
-                            _TILE_TO_ROOM[(tx, ty, z)] = room_id
-                            # Update env data so hover/AI can see room membership
-                            grid.set_env_param(tx, ty, z, "room_id", room_id)
-                            # For interior tiles, use room-level exit count (number of entrances)
-                            grid.set_env_param(tx, ty, z, "exit_count", len(entrances))
+                    # Store room with Z-level info, entrances, contents, classification, and effects
+                    _ROOMS[room_id] = {
+                        "tiles": interior_tiles,
+                        "z": z,
+                        "entrances": entrances,
+                        "contents": contents,
+                        "room_type": room_type,
+                        "effects": room_effects,
+                    }
+                    for tx, ty in interior_tiles:
+                        _TILE_TO_ROOM[(tx, ty, z)] = room_id
+                        # Update env data so hover/AI can see room membership
+                        grid.set_env_param(tx, ty, z, "room_id", room_id)
+                        # For interior tiles, use room-level exit count (number of entrances)
+                        grid.set_env_param(tx, ty, z, "exit_count", len(entrances))
                         
-                        new_room_ids.add(room_id)
-                        z_info = f" on Z={z}" if z > 0 else ""
-                        print(f"[Rooms] Created room {room_id} with {len(interior_tiles)} tile(s){z_info}")
+                    new_room_ids.add(room_id)
+                    z_info = f" on Z={z}" if z > 0 else ""
+                    print(f"[Rooms] Created room {room_id} with {len(interior_tiles)} tile(s){z_info}")
                         
-                        # Add roof for this room on Z+1 - covers interior AND boundary walls/doors
-                        all_roof_tiles = interior_tiles + boundary_tiles
-                        _add_roof_for_room(room_id, all_roof_tiles, z, grid)
+                    # Add roof for this room on Z+1 - covers interior AND boundary walls/doors
+                    all_roof_tiles = interior_tiles + boundary_tiles
+                    _add_roof_for_room(room_id, all_roof_tiles, z, grid)
     
     # Find destroyed rooms and remove their roofs
     destroyed_rooms: Set[int] = set()
@@ -33,14 +33,12 @@ def get_game_state(grid, colonists, zones_module, buildings_module, resources_mo
         "tiles": {}
     }
     
-    # Save non-empty tiles
+    # Save non-empty tiles (iter_tiles skips unbuilt chunks of upper levels)
     for z in range(depth):
-        for y in range(grid.height):
-            for x in range(grid.width):
-                tile = grid.get_tile(x, y, z)
-                if tile != "empty":
-                    key = f"{x},{y},{z}"
-                    grid_state["tiles"][key] = tile
+        for x, y, tile in grid.iter_tiles(z):
+            if tile != "empty":
+                key = f"{x},{y},{z}"
+                grid_state["tiles"][key] = tile
     
     # Colonist state
     colonist_state = []
@@ -129,18 +127,18 @@ def load_game(grid, colonists, zones_module, buildings_module, resources_module,
         grid_state = state.get("grid", {})
         depth = getattr(grid, "depth", getattr(grid, "z_levels", 1))
         
-        # Clear existing tiles
-        for z in range(depth):
-            for y in range(grid.height):
-                for x in range(grid.width):
-                    grid.set_tile(x, y, "empty", z)
-        
-        # Restore tiles
-        for key, tile in grid_state.get("tiles", {}).items():
-            parts = key.split(",")
-            x, y, z = int(parts[0]), int(parts[1]), int(parts[2])
-            if 0 <= z < depth:
-                grid.set_tile(x, y, tile, z)
+        # Reset and restore tiles in one batch, so renderer callbacks and exit
+        # counts run once per tile instead of on every set_tile
+        with grid.batch():
+            # Clear existing tiles, walkability and env data
+            grid.reset()
+            
+            # Restore tiles
+            for key, tile in grid_state.get("tiles", {}).items():
+                parts = key.split(",")
+                x, y, z = int(parts[0]), int(parts[1]), int(parts[2])
+                if 0 <= z < depth:
+                    grid.set_tile(x, y, tile, z)
         
         saved_z = grid_state.get("current_z", 0)
         try:
@@ -0,0 +1,250 @@
+"""Test script for Grid storage.
+
+Run this to verify:
+1. Upper Z-levels only allocate chunks that were written to
+2. set_tile logs changes and per-chunk versions for incremental consumers
+3. batch() runs renderer callbacks and exit counts once per touched tile
+4. Env fields follow tile changes, neighbours included, region by region
+5. Lazy city generation only fills the chunks that are asked for
+"""
+
+import contextlib
+import io
+import random
+
+import city_generator
+import grid as grid_module
+from city_generator import CityGenerator, GEN_CHUNK_SIZE
+from grid import Grid, CHUNK_SIZE
+
+
+def test_sparse_upper_levels():
+    """Test chunked storage for upper Z-levels."""
+    print("=" * 60)
+    print("TEST 1: Sparse Upper Levels")
+    print("=" * 60)
+
+    grid = Grid(width=40, height=40, depth=3)
+    assert list(grid.iter_chunks(0)) == [(0, 0, 40, 40)]  # Ground is dense
+    assert list(grid.iter_chunks(1)) == []
+    assert grid.get_tile(20, 20, 1) == "empty"
+    assert not grid.is_walkable(20, 20, 1)
+
+    # Writing a default value doesn't allocate a chunk
+    grid.set_env_param(20, 20, 1, "integrity", 1.0)
+    assert list(grid.iter_chunks(1)) == []
+
+    grid.set_tile(20, 20, "roof", 1)
+    grid.set_tile(39, 39, "finished_floor", 1)
+    assert grid.get_tile(20, 20, 1) == "roof"
+    assert grid.is_walkable(20, 20, 1)
+    assert list(grid.iter_chunks(1)) == [(16, 16, 32, 32), (32, 32, 40, 40)]
+    built = [(x, y, tile) for x, y, tile in grid.iter_tiles(1) if tile != "empty"]
+    assert built == [(20, 20, "roof"), (39, 39, "finished_floor")]
+    assert grid.tile_ids[1].count(0) == 40 * 40 - 2
+    assert list(grid.iter_chunks(2)) == []
+    print(f"\nZ=1 chunks: {list(grid.iter_chunks(1))} ({CHUNK_SIZE}x{CHUNK_SIZE})")
+
+    print("\n✓ Sparse upper levels correct\n")
+
+
+def test_change_log():
+    """Test the tile change log and chunk versions."""
+    print("=" * 60)
+    print("TEST 2: Change Log")
+    print("=" * 60)
+
+    grid = Grid(width=40, height=40, depth=2)
+    seen = grid.version
+    grid.game_tick = 7
+    grid.set_tile(3, 3, "finished_wall")
+    grid.set_tile(3, 3, "finished_wall")  # Same value: not a change
+    grid.set_tile(35, 2, "roof", 1)
+
+    changes = grid.changes_since(seen)
+    assert changes == [
+        (1, 7, 3, 3, 0, "empty", "finished_wall"),
+        (2, 7, 35, 2, 1, "empty", "roof"),
+    ]
+    assert grid.changes_since(grid.version) == []
+    assert list(grid.chunks_changed_since(0, seen)) == [(0, 0, 16, 16)]
+    assert list(grid.chunks_changed_since(1, 1)) == [(32, 0, 40, 16)]
+
+    # Once the log has moved past a version, callers are told to rescan
+    grid.change_log = grid_module.deque(grid.change_log, maxlen=4)
+    for x in range(6):
+        grid.set_tile(x, 10, "finished_floor")
+    assert grid.changes_since(seen) is None
+    assert [change[0] for change in grid.changes_since(grid.version - 2)] == [grid.version - 1, grid.version]
+    print(f"\nversion {grid.version}, {len(grid.change_log)} changes kept")
+
+    print("\n✓ Change log correct\n")
+
+
+def test_load_over_dirty_grid():
+    """Test that loading a save resets walkability and env data left by the running game."""
+    print("=" * 60)
+    print("TEST 3: Load Over Dirty Grid")
+    print("=" * 60)
+
+    import json
+    import os
+    import tempfile
+    from types import SimpleNamespace
+
+    import save_system
+
+    saved = Grid(width=20, height=20, depth=2)
+    saved.set_tile(2, 2, "finished_wall")
+    saved.set_tile(5, 5, "roof", 1)
+    none = SimpleNamespace()
+    state = save_system.get_game_state(saved, [], none, none, none, none)
+
+    grid = Grid(width=20, height=20, depth=2)
+    grid.set_tile(3, 3, "finished_wall")
+    grid.set_walkable(7, 7, 0, False)  # Empty tile left unwalkable
+    grid.set_walkable(9, 9, 1, True)
+    grid.set_env_param(8, 8, 0, "room_id", 3)
+    grid.set_env_param(1, 1, 0, "noise", 5)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "save.json")
+        with open(path, "w") as f:
+            json.dump(state, f)
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert save_system.load_game(grid, [], none, none, none, none, path)
+
+    for z in range(2):
+        assert ([t for t in grid.iter_tiles(z) if t[2] != "empty"]
+                == [t for t in saved.iter_tiles(z) if t[2] != "empty"])
+        assert grid.walkable_flat[z] == saved.walkable_flat[z]
+    assert grid.get_env_data(8, 8, 0)["room_id"] is None
+    assert "noise" not in grid.get_env_data(1, 1, 0)
+    assert grid.get_env_data(3, 3, 0) == saved.get_env_data(3, 3, 0)
+    print("\nWalkability and env data match the saved grid")
+
+    print("\n✓ Load resets the grid\n")
+
+
+def test_batch():
+    """Test deferred callbacks in Grid.batch / set_tiles_bulk."""
+    print("=" * 60)
+    print("TEST 4: Batched Tile Changes")
+    print("=" * 60)
+
+    grid = Grid(width=20, height=20, depth=1)
+    grid.set_tile(6, 5, "finished_wall_autotile")
+    calls = []
+    grid.on_tile_change = lambda x, y, z: calls.append((x, y, z))
+
+    with grid.batch():
+        grid.set_tile(5, 5, "wall")
+        grid.set_tile(5, 5, "finished_wall_autotile")
+        grid.set_tiles_bulk([(4, 5, 0, "finished_wall_autotile"), (5, 6, 0, "finished_floor")])
+        assert calls == []  # Nothing fires until the outermost batch closes
+        assert grid.get_tile(5, 5) == "finished_wall_autotile"
+        assert not grid.is_walkable(5, 5)
+
+    # Each touched tile once, then the autotiled neighbour (6, 5)
+    assert calls == [(5, 5, 0), (4, 5, 0), (5, 6, 0), (6, 5, 0)]
+    # Exit counts use the final map: (5, 6) has walls to the north only
+    assert grid.get_env_data(5, 6)["exit_count"] == 3
+    print(f"\ncallbacks: {calls}")
+
+    print("\n✓ Batched tile changes correct\n")
+
+
+def test_env_fields():
+    """Test the env field engine's exit counts and spreading."""
+    print("=" * 60)
+    print("TEST 5: Env Fields")
+    print("=" * 60)
+
+    grid = Grid(width=40, height=40, depth=1)
+    grid.update_env_fields()
+    grid.set_tile(10, 10, "finished_wall")
+    assert grid.env_engine.dirty
+
+    # Neighbours of the wall lose an exit, not just the wall tile itself
+    assert grid.get_env_data(10, 11)["exit_count"] == 3
+    assert grid.get_env_data(9, 10)["exit_count"] == 3
+    assert not grid.env_engine.dirty
+    assert grid.get_env_data(10, 10)["is_outside"] is False
+
+    # Ruins keep their values inside and spread into the tiles around them
+    for y in range(20, 25):
+        for x in range(20, 25):
+            grid.set_tile(x, y, "debris")
+    inside = grid.get_env_data(22, 22)
+    edge = grid.get_env_data(25, 22)
+    assert abs(inside["echo"] - 0.3) < 1e-6 and abs(inside["integrity"] - 0.4) < 1e-6
+    assert 0.0 < edge["echo"] < inside["echo"]
+    assert grid.get_env_data(30, 22)["echo"] == 0.0
+
+    # Only the regions around a change are recomputed
+    before = grid.env_engine.regions_recomputed
+    grid.set_tile(35, 35, "finished_wall")
+    grid.update_env_fields()
+    assert grid.env_engine.regions_recomputed - before == 1
+    print(f"\nedge echo {edge['echo']:.3f}, {grid.env_engine.regions_recomputed} regions recomputed")
+
+    print("\n✓ Env fields correct\n")
+
+
+def test_lazy_generation():
+    """Test per-chunk city generation for large maps."""
+    print("=" * 60)
+    print("TEST 6: Lazy Generation")
+    print("=" * 60)
+
+    random.seed(1)
+    grid = Grid(width=160, height=160, depth=2)
+    radius = city_generator.LARGE_MAP_GEN_RADIUS
+    city_generator.LARGE_MAP_GEN_RADIUS = 20
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            worldgen = CityGenerator(grid, lazy=True)
+            spawn_x, spawn_y = worldgen.generate_city()
+    finally:
+        city_generator.LARGE_MAP_GEN_RADIUS = radius
+
+    # Around spawn is populated, the far corner isn't yet
+    total = (160 // GEN_CHUNK_SIZE) ** 2
+    assert 0 < total - len(worldgen.pending_chunks) < total
+    assert grid.get_tile(spawn_x, spawn_y) != "empty"
+    assert (0, 0) in worldgen.pending_chunks and grid.get_tile(0, 0) == "empty"
+
+    # Colonists near the corner pull in the nearest chunk first
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert worldgen.generate_around([(2, 2)], radius=8) == 1
+    assert (0, 0) not in worldgen.pending_chunks
+
+    # Generating the rest leaves no ground tile unfilled
+    with contextlib.redirect_stdout(io.StringIO()):
+        worldgen.ensure_generated(0, 0, 160, 160)
+    assert not worldgen.pending_chunks
+    assert all(tile != "empty" for _, _, tile in grid.iter_tiles(0))
+    print(f"\nspawn ({spawn_x}, {spawn_y}), {total} chunks")
+
+    print("\n✓ Lazy generation correct\n")
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 60)
+    print("GRID STORAGE TEST")
+    print("=" * 60 + "\n")
+
+    try:
+        test_sparse_upper_levels()
+        test_change_log()
+        test_load_over_dirty_grid()
+        test_batch()
+        test_env_fields()
+        test_lazy_generation()
+
+        print("=" * 60)
+        print("ALL TESTS PASSED ✓")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
@@ -0,0 +1,489 @@
+"""Test script for the job board.
+
+Run this to verify:
+1. Jobs are indexed by type, category, position and assignment state
+2. Assigning, waiting and moving a job keep the indexes current
+3. Nearest-job queries return the closest open jobs per category
+4. The batch assigner matches idle colonists to jobs without conflicts
+5. Construction jobs become startable once their site is ready
+6. Wait, door-close and regrow timers fire from the timer wheel
+7. Supply jobs are planned only for sites whose needs changed
+8. Auto-haul jobs come from a request queue with backoff
+"""
+
+import jobs
+from jobs import JOB_QUEUE
+from timer_wheel import TIMERS, update_timers
+
+
+def _tick() -> None:
+    """Advance the timer wheel one tick and release due job waits."""
+    update_timers()
+    jobs.update_job_timers()
+
+
+def test_job_board():
+    """Test JobBoard indexes through the module-level helpers."""
+    print("=" * 60)
+    print("TEST 1: Job Board")
+    print("=" * 60)
+
+    JOB_QUEUE.clear()
+    wall = jobs.add_job("construction", 5, 5, subtype="wall")
+    tree = jobs.add_job("gathering", 8, 2, resource_type="wood")
+    haul = jobs.add_job("haul", 8, 2, dest_x=1, dest_y=1)
+    assert len(JOB_QUEUE) == 3 and list(JOB_QUEUE) == [wall, tree, haul]
+    assert jobs.get_jobs_by_type("gathering") == [tree]
+    assert jobs.get_jobs_by_category("harvest") == [tree]
+    assert jobs.has_job_of_type_at(8, 2, 0, "haul")
+    assert not jobs.has_job_of_type_at(8, 2, 1, "haul")
+    assert jobs.get_job_at(8, 2, 0) is haul  # Newest job on the tile
+    assert jobs.get_job_at(5, 5) is wall
+
+    # Assigned and waiting jobs drop out of the available set
+    wall.assigned = True
+    tree.wait_timer = 2
+    assert jobs.get_all_available_jobs() == [haul]
+    assert jobs.get_next_job() is tree
+    _tick()
+    assert tree.wait_timer == 1
+    _tick()
+    assert tree.wait_timer == 0
+    assert jobs.get_all_available_jobs(skip_types=["haul"]) == [tree]
+
+    # Moving a job re-indexes its tile
+    tree.x, tree.y = 12, 12
+    assert jobs.get_job_at(12, 12, 0) is tree
+    assert jobs.get_job_at(8, 2, 0) is haul
+
+    # Removal clears every index
+    jobs.remove_job(haul)
+    assert not jobs.is_job_in_queue(haul)
+    assert not jobs.has_job_of_type_at(8, 2, 0, "haul")
+    assert jobs.remove_job_at(12, 12, 0)
+    assert jobs.get_all_available_jobs() == []
+    haul.assigned = False  # Detached jobs no longer touch the board
+    assert jobs.get_all_available_jobs() == []
+    print(f"\n{len(JOB_QUEUE)} job left: {list(JOB_QUEUE)}")
+    JOB_QUEUE.clear()
+
+    print("\n✓ Job board correct\n")
+
+
+def test_nearest_jobs():
+    """Test the per-category nearest open job query against a full scan."""
+    print("=" * 60)
+    print("TEST 2: Nearest Jobs")
+    print("=" * 60)
+
+    import random
+    rng = random.Random(7)
+    JOB_QUEUE.clear()
+    for _ in range(300):
+        jobs.add_job(rng.choice(["construction", "gathering", "haul"]),
+                     rng.randrange(200), rng.randrange(200), z=rng.randrange(3))
+
+    def distance(job, x, y, z):
+        return max(abs(job.x - x), abs(job.y - y)) + abs(job.z - z) * jobs.JOB_Z_DISTANCE
+
+    def expected(x, y, z, k, accept=lambda job: True):
+        found = []
+        for category in {job.category for job in JOB_QUEUE.open.values()}:
+            ranked = sorted((job for job in JOB_QUEUE.open.values()
+                             if job.category == category and accept(job)),
+                            key=lambda job: (distance(job, x, y, z), job.id))
+            found.extend(ranked[:k])
+        return sorted(found, key=lambda job: (distance(job, x, y, z), job.id))
+
+    # Close some jobs so the query has to skip them
+    for job in list(JOB_QUEUE)[::5]:
+        job.assigned = True
+    for job in list(JOB_QUEUE)[1::7]:
+        job.wait_timer = 3
+    list(JOB_QUEUE)[2].x = 150  # Moving an open job moves its cell
+
+    for x, y, z in [(0, 0, 0), (100, 100, 1), (199, 40, 2), (500, 500, 0)]:
+        for k in (1, 4):
+            assert JOB_QUEUE.nearest_open(x, y, z, per_category=k) == expected(x, y, z, k)
+    even = lambda job: job.x % 2 == 0
+    assert JOB_QUEUE.nearest_open(60, 60, 0, per_category=3, accept=even) == \
+        expected(60, 60, 0, 3, even)
+    nearby = jobs.get_nearby_available_jobs(60, 60, 0, per_category=2, skip_types=["haul"])
+    assert nearby == expected(60, 60, 0, 2, lambda job: job.type != "haul")
+    print(f"\nNearest 2 non-haul jobs to (60, 60, 0): {nearby}")
+
+    # Filtering out a whole category up front stops the search early; rejecting
+    # it in accept() makes the search visit every job of that category
+    JOB_QUEUE.clear()
+    for i in range(400):
+        jobs.add_job("haul", i % 200, i // 2, category="haul")
+    for i in range(3):
+        jobs.add_job("construction", 2 + i, 2, category="construction")
+    visited = []
+
+    def counting(job):
+        visited.append(job)
+        return job.category == "construction"
+
+    assert len(JOB_QUEUE.nearest_open(0, 0, 0, per_category=2, accept=counting)) == 2
+    assert len(visited) >= 400
+    visited.clear()
+    found = JOB_QUEUE.nearest_open(0, 0, 0, per_category=2, accept=counting,
+                                   categories={"construction"})
+    assert [job.x for job in found] == [2, 3] and len(visited) == 3
+    print(f"\nCategory filter: {len(visited)} jobs visited instead of 403")
+
+    # Unready construction is skipped without being visited either
+    for job in JOB_QUEUE.of_type("construction"):
+        job.ready = False
+    visited.clear()
+    assert JOB_QUEUE.nearest_open(0, 0, 0, accept=counting, categories={"construction"},
+                                  startable_only=True) == []
+    assert not visited
+
+    # Emptying the board empties the cells
+    for job in list(JOB_QUEUE):
+        jobs.remove_job(job)
+    assert not JOB_QUEUE.open_cells and not JOB_QUEUE.open_levels and not JOB_QUEUE.open_kinds
+    assert JOB_QUEUE.nearest_open(0, 0, 0) == []
+
+    print("\n✓ Nearest jobs correct\n")
+
+
+class _Worker:
+    """Minimal colonist for the assigner: scores jobs by priority only."""
+
+    def __init__(self, uid, x, y):
+        self.uid, self.x, self.y, self.z = uid, x, y, 0
+        self.state = "idle"
+        self.current_job = None
+        self.is_dead = self.is_sleeping = self.in_combat = False
+        self.combat_target = None
+        self.searches = 0
+
+    def find_job_candidates(self, grid=None):
+        self.searches += 1
+        return jobs.get_nearby_available_jobs(self.x, self.y, self.z)
+
+    def score_job(self, job, grid=None):
+        return jobs.get_job_priority(job)
+
+    def _assign_job(self, job, grid=None):
+        job.assigned = True
+        self.current_job = job
+        self.state = "moving_to_job"
+
+
+def test_batch_assignment():
+    """Test the per-tick job assigner's matching, budget and stats."""
+    print("=" * 60)
+    print("TEST 3: Batch Assignment")
+    print("=" * 60)
+
+    from job_assignment import JobAssigner
+
+    JOB_QUEUE.clear()
+    wall = jobs.add_job("construction", 10, 10, subtype="wall")
+    tree = jobs.add_job("gathering", 12, 10)
+    near, far = _Worker(1, 11, 10), _Worker(2, 40, 10)
+
+    # Both want the wall; the nearer colonist gets it, the other the tree
+    assigner = JobAssigner()
+    matched = assigner.assign([far, near], None, game_tick=5)
+    assert near.current_job is wall and far.current_job is tree
+    assert len(matched) == 2 and wall.assigned and tree.assigned
+    stats = assigner.get_stats()
+    assert stats["assigned"] == 2 and stats["distance_last_tick"] == 1 + 28
+    print(f"\nAssigned {stats['assigned']} jobs, {stats['distance_last_tick']} tiles of travel")
+
+    # Out of budget after the first row: the rest wait, deferred first next tick
+    JOB_QUEUE.clear()
+    jobs.add_job("haul", 5, 5)
+    a, b = _Worker(3, 0, 0), _Worker(4, 9, 9)
+    assigner = JobAssigner(budget_ms=0.0)
+    assigner.assign([a, b], None, game_tick=0)
+    assert a.current_job is not None and b.current_job is None
+    assert assigner.get_stats()["deferred"] == 1
+    jobs.add_job("haul", 6, 6)
+    c = _Worker(5, 6, 6)
+    assigner.assign([c, b], None, game_tick=4)
+    assert b.current_job is not None and c.current_job is None
+    assert assigner.get_stats()["max_wait_ticks"] == 4
+    JOB_QUEUE.clear()
+
+    # Cached rows: nothing changed -> no searches; a board change only
+    # rescores this tick's stagger group; moving rescores right away
+    workers = [_Worker(10 + i, i, 0) for i in range(6)]
+    assigner = JobAssigner()
+    assigner.assign(workers, None, game_tick=0)
+    assert [w.searches for w in workers] == [1] * 6
+    assigner.assign(workers, None, game_tick=1)
+    assert [w.searches for w in workers] == [1] * 6
+    jobs.remove_job(jobs.add_job("haul", 50, 50))
+    workers[0].x = 30
+    assigner.assign(workers, None, game_tick=2)
+    assert [w.searches for w in workers] == [2, 1, 2, 1, 1, 2]
+    assert assigner.get_stats()["rescored_last_tick"] == 3
+
+    # Walls and the schedule hour feed find_job_candidates too: a walkability
+    # change or a new hour stales rows the same way a board change does
+    from types import SimpleNamespace
+    from time_system import TICKS_PER_HOUR, get_game_time
+    grid = SimpleNamespace(walk_version=0)
+    assigner.assign(workers, grid, game_tick=3)
+    assigner.assign(workers, grid, game_tick=4)
+    assert [w.searches for w in workers] == [2, 2, 2, 2, 2, 2]
+    grid.walk_version += 1
+    assigner.assign(workers, grid, game_tick=5)
+    assert [w.searches for w in workers] == [2, 2, 3, 2, 2, 3]
+    game_time = get_game_time()
+    saved_ticks = game_time.total_ticks
+    game_time.total_ticks += TICKS_PER_HOUR
+    try:
+        assigner.assign(workers, grid, game_tick=6)
+    finally:
+        game_time.total_ticks = saved_ticks
+    assert [w.searches for w in workers] == [3, 2, 3, 3, 2, 3]
+
+    print("\n✓ Batch assignment correct\n")
+
+
+def test_construction_readiness():
+    """Test the cached ready flag on construction sites and jobs."""
+    print("=" * 60)
+    print("TEST 4: Construction Readiness")
+    print("=" * 60)
+
+    import buildings
+
+    JOB_QUEUE.clear()
+    buildings._CONSTRUCTION_SITES[(3, 3, 0)] = {
+        "type": "wall",
+        "materials_needed": {"wood": 2},
+        "materials_delivered": {"wood": 0},
+        "awaiting_stockpile_clear": True,
+        "z": 0,
+    }
+    wall = jobs.add_job("construction", 3, 3, subtype="wall")
+    assert not wall.ready and not JOB_QUEUE.ready_construction
+    assert jobs.get_all_available_jobs(skip_unready_construction=True) == []
+
+    # Partial delivery keeps it unready; the last unit and the stockpile clear finish it
+    assert buildings.deliver_material(3, 3, "wood", 1) == 1
+    assert not wall.ready
+    assert buildings.deliver_material(3, 3, "wood", 5) == 1
+    assert not wall.ready
+    buildings.clear_stockpile_wait(3, 3)
+    assert wall.ready and list(JOB_QUEUE.ready_construction.values()) == [wall]
+    assert jobs.get_all_available_jobs(skip_unready_construction=True) == [wall]
+
+    # Jobs without a site (or whose site is gone) are always ready
+    buildings.remove_construction_site(3, 3)
+    assert wall.ready and jobs.add_job("construction", 4, 4).ready
+    JOB_QUEUE.clear()
+    assert not JOB_QUEUE.ready_construction
+
+    print("\n✓ Construction readiness correct\n")
+
+
+def test_timer_wheel():
+    """Test job waits, door closing and regrowth driven by the timer wheel."""
+    print("=" * 60)
+    print("TEST 5: Timer Wheel")
+    print("=" * 60)
+
+    import buildings
+    import resources
+    from timer_wheel import TimerWheel
+
+    # Far deadlines cascade down the levels and fire on the exact tick
+    wheel = TimerWheel()
+    for key, delay in enumerate((1, 63, 64, 65, 4095, 4096, 300000)):
+        wheel.schedule("t", key, delay)
+    wheel.schedule("t", 1, 70)  # Rescheduling replaces the old deadline
+    wheel.cancel("t", 5)
+    fired = {}
+    for _ in range(300000):
+        wheel.advance()
+        for key in wheel.pop_due("t"):
+            fired[key] = wheel.tick
+    assert fired == {0: 1, 1: 70, 2: 64, 3: 65, 4: 4095, 6: 300000}
+    assert len(wheel) == 0
+
+    # Removing a waiting job cancels its timer
+    JOB_QUEUE.clear()
+    job = jobs.add_job("haul", 1, 1)
+    job.wait_timer = 5
+    assert TIMERS.is_scheduled(jobs.JOB_WAIT_TIMER, job)
+    jobs.remove_job(job)
+    assert not TIMERS.is_scheduled(jobs.JOB_WAIT_TIMER, job)
+
+    # Doors close when their timer comes due; saves keep the ticks left
+    buildings._DOOR_STATES[(2, 2, 0)] = {"open": False}
+    buildings.open_door(2, 2)
+    for _ in range(buildings.DOOR_CLOSE_DELAY - 10):
+        update_timers()
+        buildings.update_doors()
+    assert buildings.is_door_open(2, 2)
+    saved = buildings.get_save_state()
+    assert saved["doors"]["2,2,0"]["close_timer"] == 10
+    buildings.load_save_state(saved)
+    for _ in range(10):
+        update_timers()
+        buildings.update_doors()
+    assert not buildings.is_door_open(2, 2)
+    buildings.load_save_state({})
+
+    # Regrowth starts once the dropped item is picked up
+    class _Grid:
+        def set_tile(self, x, y, tile, z=0):
+            pass
+
+    resources._RESOURCE_NODES[(4, 4)] = {
+        "type": "tree", "resource": "wood", "amount": 0, "max_amount": 3,
+        "regrow_time": 5, "regrow_timer": 5, "depleted": True,
+    }
+    resources._DEPLETED_NODES.add((4, 4))
+    resources.spawn_resource_item(4, 4, 0, "wood", 1)
+    resources._start_regrow(4, 4)
+    assert not TIMERS.is_scheduled(resources.NODE_REGROW_TIMER, (4, 4))
+    resources.pickup_resource_item(4, 4, 0)
+    for _ in range(5):
+        update_timers()
+        resources.update_resource_nodes(_Grid())
+    assert resources._RESOURCE_NODES[(4, 4)]["amount"] == 3
+    assert (4, 4) not in resources._DEPLETED_NODES
+    resources._remove_node_at(4, 4)
+
+    print("\n✓ Timer wheel correct\n")
+
+
+def test_supply_planning():
+    """Test event-driven supply planning for construction sites."""
+    print("=" * 60)
+    print("TEST 6: Supply Planning")
+    print("=" * 60)
+
+    import buildings
+
+    class _Zones:
+        """Stockpile stand-in: one wood tile once stocked."""
+        stock = None
+        version = 0
+
+        def find_stockpile_with_resource(self, resource_type, z=None, from_pos=None):
+            return self.stock if resource_type == "wood" else None
+
+        def get_stock_version(self, resource_type):
+            return self.version
+
+    zones_stub = _Zones()
+    JOB_QUEUE.clear()
+    buildings.load_save_state({})
+    buildings._CONSTRUCTION_SITES[(6, 6, 0)] = {
+        "type": "wall",
+        "materials_needed": {"wood": 4},
+        "materials_delivered": {"wood": 0},
+        "z": 0,
+    }
+    buildings.mark_site_needs_supply(6, 6, 0)
+
+    # No stock: the site is parked and not re-planned every tick
+    assert buildings.process_supply_jobs(jobs, zones_stub) == 0
+    assert not buildings._SUPPLY_DIRTY_SITES
+    assert buildings.process_supply_jobs(jobs, zones_stub) == 0
+
+    # Stock shows up: the site wakes and gets one supply job
+    zones_stub.stock, zones_stub.version = (1, 1, 0), 1
+    assert buildings.process_supply_jobs(jobs, zones_stub) == 1
+    assert buildings.process_supply_jobs(jobs, zones_stub) == 0
+    supply = jobs.get_jobs_by_type("supply")[0]
+    assert supply.delivery_queue == [(6, 6, 0, 4)]
+    assert buildings.has_pending_supply_job(6, 6, 0, "wood")
+
+    # Partial delivery and cancelling the job re-plan the rest
+    assert buildings.deliver_material(6, 6, "wood", 1) == 1
+    jobs.remove_job(supply)
+    assert not buildings.has_pending_supply_job(6, 6, 0, "wood")
+    assert buildings.process_supply_jobs(jobs, zones_stub) == 1
+    assert jobs.get_jobs_by_type("supply")[0].delivery_queue == [(6, 6, 0, 3)]
+
+    JOB_QUEUE.clear()
+    assert not buildings._PENDING_SUPPLY_JOBS
+    buildings.load_save_state({})
+
+    print("\n✓ Supply planning correct\n")
+
+
+def test_haul_requests():
+    """Test the auto-haul request queue, backoff and re-queueing."""
+    print("=" * 60)
+    print("TEST 7: Haul Requests")
+    print("=" * 60)
+
+    import resources
+    from haul_requests import HAUL_RETRY_BASE
+
+    class _Zones:
+        """Stockpile stand-in: one tile once a stockpile exists."""
+        dest = None
+        version = 0
+
+        def find_stockpile_tile_for_resource(self, resource_type, z=None, from_x=None, from_y=None):
+            return self.dest
+
+        def get_zone_version(self):
+            return self.version
+
+    zones_stub = _Zones()
+    JOB_QUEUE.clear()
+    resources.spawn_resource_item(7, 7, 0, "wood", 2, auto_haul=True)
+    resources.spawn_resource_item(8, 8, 0, "wood", 1)  # Not requested
+
+    # No stockpile: parked with backoff, not retried every pass
+    assert resources.process_auto_haul_jobs(jobs, zones_stub) == 0
+    assert resources._HAUL_REQUESTS.attempts == {(7, 7, 0): 1}
+    assert resources.process_auto_haul_jobs(jobs, zones_stub) == 0
+    for _ in range(HAUL_RETRY_BASE):
+        update_timers()
+    assert resources.process_auto_haul_jobs(jobs, zones_stub) == 0
+    assert resources._HAUL_REQUESTS.attempts == {(7, 7, 0): 2}
+
+    # A new stockpile wakes parked requests right away
+    zones_stub.dest, zones_stub.version = (1, 1, 0), 1
+    assert resources.process_auto_haul_jobs(jobs, zones_stub) == 1
+    haul = jobs.get_jobs_by_type("haul")[0]
+    assert (haul.x, haul.y) == (7, 7) and not resources._HAUL_REQUESTS.attempts
+
+    # A haul job that ends before pickup puts the item back in the queue
+    jobs.remove_job(haul)
+    assert resources.process_auto_haul_jobs(jobs, zones_stub) == 1
+
+    JOB_QUEUE.clear()
+    resources.load_save_state({})
+
+    print("\n✓ Haul requests correct\n")
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 60)
+    print("JOB BOARD TEST")
+    print("=" * 60 + "\n")
+
+    try:
+        test_job_board()
+        test_nearest_jobs()
+        test_batch_assignment()
+        test_construction_readiness()
+        test_timer_wheel()
+        test_supply_planning()
+        test_haul_requests()
+
+        print("=" * 60)
+        print("ALL TESTS PASSED ✓")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
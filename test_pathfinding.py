@@ -0,0 +1,628 @@
+"""Test script for the pathfinding module.
+
+Run this to verify:
+1. Straight and diagonal paths use the 1.0 / 1.4 move costs
+2. Paths route around walls and stop at unreachable goals
+3. Fire escape platforms link Z-levels
+4. Unwalkable goal tiles (workstations, nodes) can still be targeted
+5. The cluster hierarchy plans long routes and follows wall changes
+6. The region index tracks reachability as walls split and rejoin areas
+7. The shared path cache reuses paths and drops exactly the ones a wall crosses
+8. Flow fields lead to the nearest destination as cheaply as A*
+9. Jump Point Search matches A* costs and falls back near fire escapes
+10. The fire escape transition graph is prebuilt and versioned in buildings
+11. The path scheduler spreads searches over ticks within its node budget
+12. The worker pool solves against shared walkability and drops stale results
+13. Per-tile walkability versions let paths be re-validated incrementally
+14. The multi-target search picks the nearest candidate by walking distance
+"""
+
+from grid import Grid
+import random
+
+import buildings
+from pathfinding import find_path, find_nearest, octile_distance, TransitionCache, JPS_JUMP_LIMIT
+from path_hierarchy import PathHierarchy
+from path_regions import RegionIndex
+from path_cache import PathCache
+from flow_fields import FlowFields, FLOW_FIELD_REBUILD_INTERVAL, FLOW_FIELD_MEMBER_REBUILD_INTERVAL
+from path_scheduler import PathScheduler, PathPending, PATH_PRIORITY_URGENT
+from path_workers import PathWorkerPool
+
+
+def _path_cost(start, path):
+    """Sum move costs along a path (excluding Z transitions)."""
+    cost = 0.0
+    px, py, pz = start
+    for x, y, z in path:
+        if z != pz:
+            cost += 10
+        elif x != px and y != py:
+            cost += 1.4
+        else:
+            cost += 1.0
+        px, py, pz = x, y, z
+    return cost
+
+
+def test_open_ground():
+    """Test shortest paths on an empty level."""
+    print("=" * 60)
+    print("TEST 1: Open Ground")
+    print("=" * 60)
+
+    grid = Grid(width=20, height=20, depth=2)
+
+    path = find_path(grid, (0, 0, 0), (5, 0, 0))
+    print(f"\nStraight: {path}")
+    assert path[-1] == (5, 0, 0)
+    assert len(path) == 5
+
+    path = find_path(grid, (0, 0, 0), (4, 4, 0))
+    print(f"Diagonal: {path}")
+    assert len(path) == 4
+    assert abs(_path_cost((0, 0, 0), path) - octile_distance(0, 0, 0, 4, 4, 0)) < 1e-9
+
+    assert find_path(grid, (3, 3, 0), (3, 3, 0)) == []
+
+    print("\n✓ Open ground paths are optimal\n")
+
+
+def test_walls_and_unreachable():
+    """Test routing around walls and failing on enclosed goals."""
+    print("=" * 60)
+    print("TEST 2: Walls and Unreachable Goals")
+    print("=" * 60)
+
+    grid = Grid(width=20, height=20, depth=1)
+
+    # Vertical wall at x=5 with a gap at y=10
+    for y in range(20):
+        if y != 10:
+            grid.set_tile(5, y, "finished_wall", z=0)
+
+    path = find_path(grid, (2, 2, 0), (8, 2, 0))
+    print(f"\nAround wall: {len(path)} steps")
+    assert path[-1] == (8, 2, 0)
+    assert (5, 10, 0) in path
+    assert all(grid.is_walkable(x, y, z) for x, y, z in path)
+
+    # Seal the gap - goal is now unreachable
+    grid.set_tile(5, 10, "finished_wall", z=0)
+    assert find_path(grid, (2, 2, 0), (8, 2, 0)) == []
+    print("Sealed wall: no path")
+
+    # Unwalkable goal tile is still a valid target
+    grid.set_tile(2, 5, "finished_stove", z=0)
+    path = find_path(grid, (2, 2, 0), (2, 5, 0))
+    print(f"Unwalkable goal: {path}")
+    assert path[-1] == (2, 5, 0)
+
+    print("\n✓ Walls respected\n")
+
+
+def test_fire_escape_transition():
+    """Test Z-level transitions through fire escape platforms."""
+    print("=" * 60)
+    print("TEST 3: Fire Escape Transitions")
+    print("=" * 60)
+
+    grid = Grid(width=20, height=20, depth=2)
+    grid.set_tile(10, 10, "fire_escape_platform", z=0)
+    grid.set_tile(10, 10, "fire_escape_platform", z=1)
+    for x in range(10, 16):
+        grid.set_tile(x, 10, "roof", z=1)
+    grid.set_tile(10, 10, "fire_escape_platform", z=1)
+
+    transitions = {(10, 10, 0): 1, (10, 10, 1): 0}
+
+    # No transitions - upper level unreachable
+    assert find_path(grid, (2, 2, 0), (15, 10, 1)) == []
+
+    path = find_path(grid, (2, 2, 0), (15, 10, 1), transitions)
+    print(f"\nUp the fire escape: {path}")
+    assert (10, 10, 0) in path and (10, 10, 1) in path
+    assert path[-1] == (15, 10, 1)
+
+    path = find_path(grid, (15, 10, 1), (2, 2, 0), transitions)
+    assert path[-1] == (2, 2, 0)
+    print("Down the fire escape: OK")
+
+    print("\n✓ Fire escape transitions working\n")
+
+
+def _walk_hierarchy(grid, hierarchy, start, goal):
+    """Follow hierarchical segments from start until goal (or failure)."""
+    current = start
+    steps = []
+    for _ in range(50):
+        if current == goal:
+            break
+        waypoints = hierarchy.find_waypoints(current, goal)
+        if waypoints is None:
+            segment = find_path(grid, current, goal)
+        elif not waypoints:
+            segment = []
+        else:
+            segment = find_path(grid, current, hierarchy.next_segment_target(current, waypoints))
+        if not segment:
+            break
+        steps.extend(segment)
+        current = segment[-1]
+    return current, steps
+
+
+def test_hierarchy():
+    """Test HPA* routing and incremental cluster patching."""
+    print("=" * 60)
+    print("TEST 4: Cluster Hierarchy")
+    print("=" * 60)
+
+    grid = Grid(width=64, height=64, depth=1)
+    hierarchy = PathHierarchy(grid, cluster_size=8)
+
+    # Long wall across the map with a single gap near the bottom
+    for y in range(64):
+        if y != 60:
+            grid.set_tile(30, y, "finished_wall", z=0)
+
+    start, goal = (2, 2, 0), (60, 4, 0)
+    current, steps = _walk_hierarchy(grid, hierarchy, start, goal)
+    print(f"\nThrough the gap: {len(steps)} steps (A*: {len(find_path(grid, start, goal))})")
+    assert current == goal
+    assert (30, 60, 0) in steps
+    assert all(grid.is_walkable(x, y, z) for x, y, z in steps)
+
+    # Close the gap and open another near the top - only nearby clusters are patched
+    grid.set_tile(30, 60, "finished_wall", z=0)
+    assert hierarchy.find_waypoints(start, goal) == []
+    grid.set_tile(30, 3, "empty", z=0)
+    current, steps = _walk_hierarchy(grid, hierarchy, start, goal)
+    print(f"New gap: {len(steps)} steps")
+    assert current == goal
+    assert (30, 3, 0) in steps
+
+    # Same cluster - caller should use a local search
+    assert hierarchy.find_waypoints((1, 1, 0), (3, 3, 0)) is None
+
+    print("\n✓ Hierarchy routes and patches correctly\n")
+
+
+def test_regions():
+    """Test incremental region labels against real searches."""
+    print("=" * 60)
+    print("TEST 5: Region Reachability")
+    print("=" * 60)
+
+    grid = Grid(width=20, height=20, depth=2)
+    regions = RegionIndex(grid)
+    a, b = (2, 2, 0), (15, 15, 0)
+    assert regions.is_reachable(a, b)
+
+    # Enclose b in a ring of walls - split detected, then rejoined through a door gap
+    for x in range(12, 19):
+        for y in range(12, 19):
+            if x in (12, 18) or y in (12, 18):
+                grid.set_tile(x, y, "finished_wall", z=0)
+    assert not regions.is_reachable(a, b)
+    assert find_path(grid, a, b) == []
+    print("\nEnclosed goal: unreachable")
+
+    grid.set_tile(12, 15, "empty", z=0)
+    assert regions.is_reachable(a, b)
+    print("Opened gap: reachable")
+
+    # Unwalkable goal counts as reachable through its neighbours
+    grid.set_tile(2, 8, "finished_stove", z=0)
+    assert regions.is_reachable(a, (2, 8, 0))
+
+    # Upper level only through a fire escape link
+    grid.set_tile(5, 5, "fire_escape_platform", z=0)
+    grid.set_tile(5, 5, "fire_escape_platform", z=1)
+    grid.set_tile(6, 5, "roof", z=1)
+    assert not regions.is_reachable(a, (6, 5, 1))
+    regions.set_transitions({(5, 5, 0): 1, (5, 5, 1): 0})
+    assert regions.is_reachable(a, (6, 5, 1))
+    print("Fire escape joins levels")
+
+    print(f"\n✓ Regions correct ({regions.full_relabels} full relabels)\n")
+
+
+def test_path_cache():
+    """Test shared path reuse, per-tile invalidation and LRU eviction."""
+    print("=" * 60)
+    print("TEST 6: Shared Path Cache")
+    print("=" * 60)
+
+    grid = Grid(width=40, height=40, depth=1)
+    cache = PathCache(grid, max_entries=2)
+
+    start, goal = (1, 1, 0), (30, 1, 0)
+    cache.put(start, goal, find_path(grid, start, goal))
+
+    # Another colonist on the path, and one nearby in the same start region
+    assert cache.get((5, 1, 0), goal)[-1] == goal
+    joined = cache.get((2, 3, 0), goal)
+    assert joined[-1] == goal
+    assert cache.hits == 2
+
+    # Joins use the shared transition index instead of re-indexing per hit
+    import pathfinding
+    built = []
+    original = pathfinding.build_transition_index
+    pathfinding.build_transition_index = lambda *args: built.append(1) or original(*args)
+    try:
+        for _ in range(3):
+            assert cache.get((2, 4, 0), goal, 0, {(3, 3, 0): 0}, transitions_version=7)[-1] == goal
+    finally:
+        pathfinding.build_transition_index = original
+    assert len(built) == 1
+    print(f"\nShared hits: {cache.get_stats()}")
+
+    # Wall off the corridor elsewhere - no effect; wall on the path - dropped
+    grid.set_tile(20, 20, "finished_wall", z=0)
+    assert cache.get(start, goal) is not None
+    grid.set_tile(10, 1, "finished_wall", z=0)
+    assert cache.get(start, goal) is None
+    assert cache.invalidations == 1
+    print("Wall on path invalidates it")
+
+    # LRU bound
+    for i in range(3):
+        cache.put((1, 10 + i * 8, 0), goal, find_path(grid, (1, 10 + i * 8, 0), goal))
+    assert cache.get_stats()["entries"] == 2 and cache.evictions == 1
+
+    print("\n✓ Path cache correct\n")
+
+
+def test_flow_fields():
+    """Test multi-source descent, goal matching and lazy rebuilds."""
+    print("=" * 60)
+    print("TEST 7: Flow Fields")
+    print("=" * 60)
+
+    grid = Grid(width=30, height=30, depth=1)
+    for y in range(25):
+        grid.set_tile(15, y, "finished_wall", z=0)
+    fields = FlowFields(grid)
+    fields.set_static_sources("depots", [(25, 2, 0), (2, 28, 0)])
+
+    # Nearest depot by walking distance, not straight line
+    start = (10, 2, 0)
+    path = fields.path_to_group("depots", start, game_tick=1)
+    print(f"\nDescent: {len(path)} steps to {path[-1]}")
+    assert path[-1] == (2, 28, 0)
+    assert abs(_path_cost(start, path) - _path_cost(start, find_path(grid, start, (2, 28, 0)))) < 1e-9
+    assert all(grid.is_walkable(x, y, z) for x, y, z in path)
+
+    # Goal-specific lookups only succeed for the nearest depot
+    assert fields.path_to_goal(start, (2, 28, 0), game_tick=1)[-1] == (2, 28, 0)
+    assert fields.path_to_goal(start, (25, 2, 0), game_tick=1) is None
+
+    # Blocking the descent: stale field refuses, rebuilt field routes around
+    grid.set_tile(path[3][0], path[3][1], "finished_wall", z=0)
+    assert fields.path_to_group("depots", start, game_tick=2) is None
+    path = fields.path_to_group("depots", start, game_tick=2 + FLOW_FIELD_REBUILD_INTERVAL)
+    assert path and all(grid.is_walkable(x, y, z) for x, y, z in path)
+    print(f"After rebuild: {len(path)} steps ({fields.rebuilds} builds)")
+
+    # Member changes are rate limited: gone members are refused, new ones wait,
+    # and only one field is rebuilt per tick
+    members = {(25, 2, 0)}
+    fields.register_group("meals", lambda: frozenset(members))
+    fields.set_static_sources("doors", [(2, 2, 0)])
+    built = fields.rebuilds
+    assert fields.path_to_group("meals", start, game_tick=400)[-1] == (25, 2, 0)
+    members.clear()
+    members.add((5, 5, 0))
+    assert fields.path_to_group("meals", start, game_tick=401) is None
+    assert fields.path_to_goal(start, (5, 5, 0), game_tick=401) is None
+    assert fields.rebuilds == built + 1
+    fields.get_field("doors", game_tick=400 + FLOW_FIELD_MEMBER_REBUILD_INTERVAL)
+    assert fields.path_to_group("meals", start, game_tick=400 + FLOW_FIELD_MEMBER_REBUILD_INTERVAL) is None
+    path = fields.path_to_group("meals", start, game_tick=401 + FLOW_FIELD_MEMBER_REBUILD_INTERVAL)
+    assert path[-1] == (5, 5, 0) and fields.rebuilds == built + 3
+
+    # Large-map fields stop at a walking radius; agents beyond it get None
+    near = FlowFields(grid)
+    near.max_distance = 10
+    near.set_static_sources("depots", [(25, 2, 0)])
+    field = near.get_field("depots", game_tick=3)
+    assert field.distance(25, 8, 0) == 6
+    assert field.distance(25, 20, 0) is None
+    assert near.path_to_group("depots", (25, 20, 0), game_tick=3) is None
+
+    print("\n✓ Flow fields correct\n")
+
+
+def test_jump_point_search():
+    """Test JPS against A* on random obstacle maps."""
+    print("=" * 60)
+    print("TEST 8: Jump Point Search")
+    print("=" * 60)
+
+    rng = random.Random(7)
+    grid = Grid(width=30, height=30, depth=2)
+    for y in range(30):
+        for x in range(30):
+            if rng.random() < 0.25:
+                grid.set_tile(x, y, "finished_wall", z=0)
+
+    compared = 0
+    for _ in range(200):
+        a = (rng.randrange(30), rng.randrange(30), 0)
+        b = (rng.randrange(30), rng.randrange(30), 0)
+        if not grid.is_walkable(*a):
+            continue
+        astar = find_path(grid, a, b, mode="astar")
+        stats = {}
+        jps = find_path(grid, a, b, mode="jps", stats=stats)
+        assert stats["mode"] == "jps"
+        assert bool(astar) == bool(jps)
+        if jps:
+            assert jps[-1] == b
+            assert abs(_path_cost(a, astar) - _path_cost(a, jps)) < 1e-9
+            compared += 1
+    print(f"\n{compared} paths match A* cost")
+
+    # Fire escape platform on the level - falls back to A*
+    stats = {}
+    find_path(grid, (0, 0, 1), (5, 5, 1), {(3, 3, 1): 0}, stats=stats)
+    assert stats["mode"] == "astar"
+    print("Fire escape level: A* fallback")
+
+    print("\n✓ JPS correct\n")
+
+
+def test_transition_graph():
+    """Test fire escape transition graph versioning."""
+    print("=" * 60)
+    print("TEST 9: Fire Escape Transition Graph")
+    print("=" * 60)
+
+    grid = Grid(width=20, height=20, depth=2)
+    grid.set_tile(10, 10, "finished_wall", z=0)
+    cache = TransitionCache(grid)
+    grid.add_walkability_listener(cache.on_walkability_changed)
+    version = buildings.get_transitions_version()
+
+    # Under construction - no transition yet
+    assert buildings.place_fire_escape(grid, 10, 10, 0)
+    assert buildings.get_transitions_version() == version
+    platform = buildings.get_fire_escape_platform(10, 10, 0)
+
+    buildings.mark_fire_escape_complete(10, 10, 0)
+    assert buildings.get_transitions_version() == version + 1
+    transitions = buildings.get_platform_transitions()
+    assert transitions[(platform[0], platform[1], 0)] == 1
+    print(f"\nCompleted: {transitions}")
+
+    # Same version - no re-index; platform tile changes force one
+    grid.set_tile(platform[0], platform[1], "fire_escape_platform", z=0)
+    grid.set_tile(platform[0], platform[1], "fire_escape_platform", z=1)
+    assert cache.update(transitions, buildings.get_transitions_version())
+    assert not cache.update(transitions, buildings.get_transitions_version())
+    grid.set_tile(platform[0], platform[1], "finished_wall", z=1)
+    assert cache.update(transitions, buildings.get_transitions_version())
+    assert len(cache.index) == 1  # Only the way down is usable now
+
+    buildings.demolish_tile(grid, 10, 10, 0)
+    assert buildings.get_transitions_version() == version + 2
+    assert buildings.get_platform_transitions() == {}
+    print("Demolished: graph empty")
+
+    print("\n✓ Transition graph versioned\n")
+
+
+def test_path_scheduler():
+    """Test time-sliced searches, the node budget and priority order."""
+    print("=" * 60)
+    print("TEST 10: Path Request Scheduler")
+    print("=" * 60)
+
+    grid = Grid(width=40, height=40, depth=1)
+    for y in range(1, 40):
+        grid.set_tile(20, y, "finished_wall", z=0)
+    start, goal = (2, 38, 0), (38, 38, 0)
+    expected = find_path(grid, start, goal, mode="astar")
+
+    scheduler = PathScheduler(grid, node_budget=2)
+    scheduler.tick(1)
+    first = scheduler.submit(start, goal)
+    assert not first.done
+    assert scheduler.submit(start, goal) is first  # Identical requests share one search
+
+    # Later but urgent - runs before the older normal request
+    urgent = scheduler.submit((2, 2, 0), (5, 2, 0), priority=PATH_PRIORITY_URGENT)
+    assert not urgent.done  # This tick's budget is already spent
+
+    # A JPS step is charged for the tiles it scanned; overruns carry into the next tick
+    max_step = 1 + 8 * (JPS_JUMP_LIMIT + 1)
+    tick = 1
+    while not first.done:
+        tick += 1
+        scheduler.tick(tick)
+        assert scheduler.get_stats()["nodes_this_tick"] < 2 + max_step
+    assert urgent.done and urgent.result == [(3, 2, 0), (4, 2, 0), (5, 2, 0)]
+    assert urgent.finished_tick < first.finished_tick
+    assert abs(_path_cost(start, first.result) - _path_cost(start, expected)) < 1e-6
+    stats = {}
+    find_path(grid, start, goal, stats=stats)
+    assert first.expanded == stats["expanded"] + stats["scanned"] > stats["expanded"]
+    print(f"\nDone after {tick - 1} ticks, {first.expanded} nodes: {scheduler.get_stats()}")
+
+    # A shared request survives one waiter letting go; the last release cancels it
+    cancelled = scheduler.submit(start, (38, 1, 0))
+    assert scheduler.submit(start, (38, 1, 0)) is cancelled
+    scheduler.release(cancelled)
+    assert not cancelled.done
+    scheduler.release(cancelled)
+    scheduler.tick(tick + 1)
+    assert cancelled.done and cancelled.cancelled and scheduler.get_stats()["queue_depth"] == 0
+
+    print("\n✓ Scheduler budget respected\n")
+
+
+def test_path_workers():
+    """Test the process pool backend and its version stamp."""
+    print("=" * 60)
+    print("TEST 11: Path Worker Pool")
+    print("=" * 60)
+
+    grid = Grid(width=30, height=30, depth=1)
+    pool = PathWorkerPool(grid, workers=1)
+    if not pool.enabled:
+        print("\nWorker pool unavailable - skipped\n")
+        return
+    try:
+        start, goal = (2, 15, 0), (27, 15, 0)
+        assert pool.collect(pool.submit(start, goal)) == find_path(grid, start, goal)
+
+        # Solved before the wall went up - the result is discarded
+        stale = pool.submit(start, goal)
+        stale.result()
+        for y in range(30):
+            grid.set_tile(15, y, "finished_wall", z=0)
+        assert pool.collect(stale) is None
+
+        # Workers see the wall through shared memory
+        assert pool.collect(pool.submit(start, goal)) == []
+
+        scheduler = PathScheduler(grid)
+        scheduler.set_worker_pool(pool)
+        scheduler.tick(1)
+        grid.set_tile(15, 3, "floor", z=0)
+        request = scheduler.submit(start, goal)
+        tick = 1
+        while not request.done:
+            tick += 1
+            request._future.result()
+            scheduler.tick(tick)
+        assert request.result == find_path(grid, start, goal)
+        print(f"\nStats: {scheduler.get_stats()}, stale results: {pool.stale_results}")
+    finally:
+        pool.shutdown()
+
+    print("\n✓ Worker pool correct\n")
+
+
+def test_path_versions():
+    """Test per-tile walkability versions and colonist path re-validation."""
+    print("=" * 60)
+    print("TEST 12: Path Validity Versions")
+    print("=" * 60)
+
+    from colonist import Colonist
+
+    grid = Grid(width=20, height=20, depth=1)
+    colonist = Colonist(2, 10)
+    colonist.current_path = colonist._calculate_path(grid, 17, 10, 0)
+    planned = grid.walk_version
+    assert colonist._path_version == planned
+    assert colonist._check_path_still_valid(grid)
+
+    # A wall off the path bumps the grid but leaves the path valid
+    grid.set_tile(5, 2, "finished_wall", z=0)
+    assert grid.walk_version == planned + 1
+    assert grid.tile_versions[0][2 * 20 + 5] == grid.walk_version
+    assert colonist._check_path_still_valid(grid)
+    assert colonist._path_version == grid.walk_version  # Re-checked once, O(1) again
+
+    # A wall on the path invalidates it
+    x, y, z = colonist.current_path[3]
+    grid.set_tile(x, y, "finished_wall", z=z)
+    assert not colonist._check_path_still_valid(grid)
+    print(f"\nwalk_version {grid.walk_version}, path blocked at {(x, y, z)}")
+
+    # A time-sliced search that finishes after the map changed isn't shared
+    from path_cache import get_path_cache
+    from path_scheduler import get_path_scheduler
+
+    grid = Grid(width=20, height=20, depth=1)
+    scheduler = get_path_scheduler(grid)
+    scheduler.node_budget = 1
+    scheduler.tick(1)
+    colonist = Colonist(2, 10)
+    colonist._defer_paths = True
+    try:
+        colonist._calculate_path(grid, 17, 12, 0)
+        raise AssertionError("search should have been queued")
+    except PathPending:
+        pass
+    grid.set_tile(10, 2, "finished_wall", z=0)
+    tick = 1
+    while not colonist._path_request.done:
+        tick += 1
+        scheduler.tick(tick)
+    colonist.state = "planning"
+    assert colonist._resume_after_planning()
+    assert colonist._calculate_path(grid, 17, 12, 0)
+    assert colonist._path_version < grid.walk_version
+    assert get_path_cache(grid).get((2, 10, 0), (17, 12, 0)) is None
+
+    print("\n✓ Path versions correct\n")
+
+
+def test_nearest_reachable():
+    """Test the multi-target nearest search against one A* per candidate."""
+    print("=" * 60)
+    print("TEST 13: Nearest Reachable Target")
+    print("=" * 60)
+
+    # Straight-line nearest target is behind a long wall
+    grid = Grid(width=40, height=40, depth=1)
+    for y in range(0, 35):
+        grid.set_tile(20, y, "finished_wall", z=0)
+    start = (18, 5, 0)
+    behind_wall, around_corner = (23, 5, 0), (5, 30, 0)
+    assert find_nearest(grid, start, [behind_wall, around_corner]) == around_corner
+
+    rng = random.Random(7)
+    for _ in range(20):
+        grid = Grid(width=30, height=30, depth=1)
+        for _ in range(200):
+            grid.set_tile(rng.randrange(30), rng.randrange(30), "finished_wall", z=0)
+        start = (rng.randrange(30), rng.randrange(30), 0)
+        grid.set_tile(start[0], start[1], "empty", z=0)
+        candidates = [(rng.randrange(30), rng.randrange(30), 0) for _ in range(6)]
+        costs = {}
+        for tile in candidates:
+            path = find_path(grid, start, tile, mode="astar")
+            if path or tile == start:
+                costs[tile] = _path_cost(start, path)
+        nearest = find_nearest(grid, start, candidates)
+        if not costs:
+            assert nearest is None
+        else:
+            assert abs(costs[nearest] - min(costs.values())) < 1e-6
+
+    print("\nMatches the cheapest single-target search on 20 maps")
+    print("\n✓ Nearest target correct\n")
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 60)
+    print("PATHFINDING TEST")
+    print("=" * 60 + "\n")
+
+    try:
+        test_open_ground()
+        test_walls_and_unreachable()
+        test_fire_escape_transition()
+        test_hierarchy()
+        test_regions()
+        test_path_cache()
+        test_flow_fields()
+        test_jump_point_search()
+        test_transition_graph()
+        test_path_scheduler()
+        test_path_workers()
+        test_path_versions()
+        test_nearest_reachable()
+
+        print("=" * 60)
+        print("ALL TESTS PASSED ✓")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
@@ -0,0 +1,249 @@
+"""Tile type registry: stable integer IDs and precomputed tile properties.
+
+Grid stores one uint16 ID per tile instead of a string. Names are interned
+on first use, so any tile string the game produces (autotile variants,
+furniture, city generator ground types) gets an ID without being listed up
+front. IDs are only valid for the running process - saves keep tile names.
+
+"empty" is always ID 0, so freshly allocated (zeroed) tile arrays read as
+empty tiles.
+
+Each ID also gets a TileInfo with the properties the hot paths need
+(walkability, autotiling, construction sprite mapping, env defaults, render
+layer), worked out once from the name when it is registered. Grid.set_tile,
+the autotiler and the Arcade renderer read these instead of repeating
+tuple-membership and substring checks on every call.
+"""
+
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+# Max distinct tile names (IDs are stored as uint16)
+MAX_TILE_IDS = 65536
+
+# Render layers (GridRenderer draws roads, then floors, resources, structures)
+LAYER_GROUND = 0     # ground_* tiles - drawn by the concrete/overlay passes only
+LAYER_ROAD = 1
+LAYER_FLOOR = 2
+LAYER_RESOURCE = 3
+LAYER_STRUCTURE = 4
+
+# Finished buildings/walls block movement, not those under construction
+BLOCKING_TILES = frozenset((
+    "finished_building", "finished_wall", "finished_wall_autotile", "finished_wall_advanced",
+    "finished_salvagers_bench", "finished_generator", "finished_stove", "finished_gutter_forge",
+    "finished_skinshop_loom", "finished_cortex_spindle", "finished_barracks",
+))
+
+# Tiles colonists can walk on. Doors can be opened, windows climbed through,
+# fire escapes are transition points and roofs are walkable by default.
+# Anything not listed here or in BLOCKING_TILES leaves walkability unchanged.
+WALKABLE_TILES = frozenset((
+    "finished_window",
+    "empty", "building", "wall", "wall_advanced", "door", "floor", "finished_floor",
+    "roof", "roof_floor", "roof_access", "fire_escape", "finished_fire_escape", "window_tile",
+    "fire_escape_platform", "window", "bridge", "finished_bridge",
+    "salvagers_bench", "generator", "stove", "gutter_forge", "skinshop_loom", "cortex_spindle", "barracks",
+    "street", "street_cracked", "street_scar", "street_ripped", "street_designated",
+    "sidewalk", "sidewalk_designated", "debris", "weeds", "prop_barrel", "prop_sign", "prop_scrap",
+    "dirt", "grass", "rock", "scorched", "gutter_slab", "crash_bed",
+))
+
+# Environmental parameters set when a tile is placed. Tiles not listed here
+# keep their current values and are marked outside.
+_RUIN_ENV = {"echo": 0.3, "integrity": 0.4, "interference": 0.1, "is_outside": True}
+_BUILT_ENV = {"echo": 0.0, "integrity": 1.0, "interference": 0.0, "is_outside": False}
+
+ENV_DEFAULTS: Dict[str, dict] = {}
+# Ruins have degraded environmental values
+for _name in ("debris", "weeds", "prop_barrel", "prop_sign", "prop_scrap"):
+    ENV_DEFAULTS[_name] = _RUIN_ENV
+# New and finished construction has clean values and is inside
+for _name in ("building", "wall", "wall_advanced", "floor", "door", "window",
+              "salvagers_bench", "generator", "stove", "gutter_forge", "skinshop_loom", "cortex_spindle",
+              "bridge", "fire_escape", "gutter_slab", "crash_bed",
+              "finished_building", "finished_wall", "finished_wall_advanced",
+              "finished_floor", "finished_window", "finished_bridge",
+              "finished_salvagers_bench", "finished_generator", "finished_stove",
+              "finished_gutter_forge", "finished_skinshop_loom", "finished_cortex_spindle"):
+    ENV_DEFAULTS[_name] = _BUILT_ENV
+
+# Construction tiles render with their finished sprite (darkened until built)
+CONSTRUCTION_TO_FINISHED = {
+    # Structures
+    "wall": "finished_wall_autotile",
+    "wall_advanced": "finished_wall_autotile",
+    "floor": "finished_floor",
+    "door": "finished_door",
+    "bar_door": "finished_bar_door",
+    "window": "finished_window",
+    "bridge": "finished_bridge",
+    "fire_escape": "window_tile",  # Fire escape under construction shows window_tile sprite
+    "stage": "finished_stage",
+    "stage_stairs": "finished_stage_stairs",
+    "building": "finished_building",
+    # Workstations - ALL use finished_ sprites
+    "gutter_still": "finished_gutter_still",
+    "spark_bench": "finished_spark_bench",
+    "tinker_station": "finished_tinker_station",
+    "salvagers_bench": "finished_salvagers_bench",
+    "generator": "finished_generator",
+    "stove": "finished_stove",
+    "gutter_forge": "finished_gutter_forge",
+    "skinshop_loom": "finished_skinshop_loom",
+    "cortex_spindle": "finished_cortex_spindle",
+    "barracks": "finished_barracks",
+    "plant_bed": "finished_plant_bed",
+    # Furniture
+    "scrap_bar_counter": "finished_scrap_bar_counter",
+    "crash_bed": "finished_crash_bed",
+    "comfort_chair": "finished_comfort_chair",
+    "bar_stool": "finished_bar_stool",
+    "storage_locker": "finished_storage_locker",
+    "dining_table": "finished_dining_table",
+    "wall_lamp": "finished_wall_lamp",
+    "workshop_table": "finished_workshop_table",
+    "tool_rack": "finished_tool_rack",
+    "weapon_rack": "finished_weapon_rack",
+    "gutter_slab": "finished_gutter_slab",
+}
+
+# Autotile connection groups - defines which tile types connect to each other.
+# A tile uses the first group whose key is part of its name; a neighbour
+# connects if any group member is part of the neighbour's name.
+AUTOTILE_GROUPS = {
+    # Roads connect to all road types
+    "street": {"street", "road", "street_autotile"},
+    "road": {"street", "road", "street_autotile"},
+
+    # Walls connect to walls (autotiled)
+    "finished_wall": {"finished_wall", "finished_wall_autotile"},
+    "wall": {"wall", "finished_wall", "finished_wall_autotile"},
+    "finished_wall_autotile": {"finished_wall", "finished_wall_autotile"},
+
+    # Bridges connect to bridges
+    "finished_bridge": {"finished_bridge"},
+
+    # Floors connect to floors
+    "finished_floor": {"finished_floor"},
+
+    # Ground overlays connect to same material type
+    "ground_dirt_overlay_autotile": {"ground_dirt_overlay_autotile"},
+    "ground_rubble_overlay_autotile": {"ground_rubble_overlay_autotile"},
+    "ground_overgrown_overlay_autotile": {"ground_overgrown_overlay_autotile"},
+}
+
+# Roads, walls, bridges, floors and ground overlays use autotiling.
+# Walls use autotiling when they have the _autotile suffix.
+_AUTOTILE_KEYWORDS = ("street", "road", "bridge", "path", "overlay_autotile", "_autotile")
+
+# Placing one of these makes autotiled neighbours recalculate their variant
+_NEIGHBOUR_REFRESH_KEYWORDS = ("_autotile", "wall", "road", "street")
+
+
+class TileInfo:
+    """Precomputed properties of one tile type."""
+
+    __slots__ = ("id", "name", "walkable", "blocks_light", "is_overlay", "autotiled",
+                 "refresh_neighbours", "finished", "env_defaults", "render_layer", "connect_set")
+
+    def __init__(self, tid: int, name: str):
+        self.id = tid
+        self.name = name
+        # True/False forces walkability when placed, None leaves it unchanged
+        if name in BLOCKING_TILES:
+            self.walkable: Optional[bool] = False
+        elif name in WALKABLE_TILES:
+            self.walkable = True
+        else:
+            self.walkable = None
+        # Solid finished structures
+        self.blocks_light = self.walkable is False
+        # Dirt/grass/rubble live in Grid.overlay_tiles, not the tile array
+        self.is_overlay = "overlay_autotile" in name
+        self.autotiled = any(keyword in name for keyword in _AUTOTILE_KEYWORDS)
+        self.refresh_neighbours = any(keyword in name for keyword in _NEIGHBOUR_REFRESH_KEYWORDS)
+        # Sprite to draw (construction tiles use the finished sprite)
+        self.finished = CONSTRUCTION_TO_FINISHED.get(name, name)
+        self.env_defaults: Optional[dict] = ENV_DEFAULTS.get(name)
+
+        if "street" in name or "road" in name:
+            self.render_layer = LAYER_ROAD
+        elif "floor" in name:
+            self.render_layer = LAYER_FLOOR
+        elif name in ("resource_node", "salvage_object"):
+            self.render_layer = LAYER_RESOURCE
+        elif "ground_" in name:
+            self.render_layer = LAYER_GROUND
+        else:
+            self.render_layer = LAYER_STRUCTURE
+
+        # Autotile connection set ID (see tile_connect_set), resolved on first use
+        self.connect_set = -1
+
+
+# id -> name, name -> id and id -> properties
+TILE_NAMES: List[str] = []
+TILE_IDS: Dict[str, int] = {}
+TILE_INFO: List[TileInfo] = []
+
+# Autotile connection sets: members, whether they match the overlay layer,
+# and one byte per tile ID saying whether that tile connects
+CONNECT_SETS: List[FrozenSet[str]] = []
+CONNECT_OVERLAY: List[bool] = []
+CONNECT_MATCH: List[bytearray] = []
+_CONNECT_SET_IDS: Dict[FrozenSet[str], int] = {}
+
+
+def tile_id(name: str) -> int:
+    """Return the ID for a tile name, registering it if new."""
+    tid = TILE_IDS.get(name)
+    if tid is None:
+        tid = len(TILE_NAMES)
+        if tid >= MAX_TILE_IDS:
+            raise ValueError(f"Tile registry full, cannot register '{name}'")
+        TILE_NAMES.append(name)
+        TILE_IDS[name] = tid
+        TILE_INFO.append(TileInfo(tid, name))
+        for members, match in zip(CONNECT_SETS, CONNECT_MATCH):
+            match.append(1 if any(member in name for member in members) else 0)
+    return tid
+
+
+def tile_name(tid: int) -> str:
+    """Return the tile name for an ID."""
+    return TILE_NAMES[tid]
+
+
+def tile_info(name: str) -> TileInfo:
+    """Return the properties of a tile name, registering it if new."""
+    tid = TILE_IDS.get(name)
+    if tid is None:
+        tid = tile_id(name)
+    return TILE_INFO[tid]
+
+
+def connect_set_id(members: Iterable[str]) -> int:
+    """Return the ID of an autotile connection set, registering it if new."""
+    key = members if isinstance(members, frozenset) else frozenset(members)
+    set_id = _CONNECT_SET_IDS.get(key)
+    if set_id is None:
+        set_id = len(CONNECT_SETS)
+        CONNECT_SETS.append(key)
+        CONNECT_OVERLAY.append(any("overlay_autotile" in member for member in key))
+        CONNECT_MATCH.append(bytearray(
+            1 if any(member in name for member in key) else 0 for name in TILE_NAMES
+        ))
+        _CONNECT_SET_IDS[key] = set_id
+    return set_id
+
+
+def tile_connect_set(tid: int) -> int:
+    """Connection set ID a tile autotiles against (its group, else only itself)."""
+    info = TILE_INFO[tid]
+    if info.connect_set < 0:
+        group = next((members for key, members in AUTOTILE_GROUPS.items() if key in info.name), None)
+        info.connect_set = connect_set_id(group if group is not None else (info.name,))
+    return info.connect_set
+
+
+tile_id("empty")
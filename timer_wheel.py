@@ -0,0 +1,177 @@
+"""Shared hierarchical timer wheel for per-tick countdowns.
+
+Job wait timers, door/window auto-close and resource node regrowth used to
+be counters that their update functions decremented on every entry, every
+tick. They register deadlines here instead, and only the entries that come
+due are touched:
+
+- schedule(kind, key, delay) sets a deadline delay ticks from now. Each
+  (kind, key) has at most one timer - scheduling again replaces it, and
+  cancel() drops it (e.g. when a job or door is removed).
+- update_timers() runs once per game tick from the main loop and advances
+  the wheel. Due entries are collected per kind; the owning module drains
+  them with pop_due(kind) in its own update function (update_job_timers,
+  update_doors, update_windows, update_resource_nodes), so the per-tick
+  order of those systems is unchanged.
+- remaining(kind, key) gives the ticks left, which is what save files store.
+
+The wheel has WHEEL_LEVELS levels of WHEEL_SLOTS slots. Level 0 holds
+deadlines within WHEEL_SLOTS ticks, one slot per tick; each higher level
+covers WHEEL_SLOTS times the span of the one below and is cascaded down a
+slot at a time as the wheel turns. Deadlines past the top level wait in an
+overflow list that is re-filed once per top-level turn.
+
+The wheel itself isn't saved: owners save remaining() with their own data
+and schedule again in their load_save_state.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Hashable, List, Optional, Tuple
+
+# Slots per level (power of two) and number of levels
+WHEEL_BITS = 6
+WHEEL_SLOTS = 1 << WHEEL_BITS
+WHEEL_LEVELS = 3
+
+TimerKey = Tuple[str, Hashable]  # (kind, key)
+
+
+class Timer:
+    """One scheduled deadline."""
+
+    __slots__ = ("kind", "key", "deadline")
+
+    def __init__(self, kind: str, key: Hashable, deadline: int):
+        self.kind = kind
+        self.key = key
+        self.deadline = deadline
+
+
+class TimerWheel:
+    """Hierarchical timing wheel keyed by game tick."""
+
+    def __init__(self):
+        self.tick = 0
+        self.levels: List[List[List[Timer]]] = [
+            [[] for _ in range(WHEEL_SLOTS)] for _ in range(WHEEL_LEVELS)
+        ]
+        self.overflow: List[Timer] = []
+        # Live timer per (kind, key); slot lists may still hold replaced or
+        # cancelled timers, which are skipped when their slot comes up
+        self.timers: Dict[TimerKey, Timer] = {}
+        # Fired but not yet drained: kind -> {key: None} (ordered set)
+        self.due: Dict[str, Dict[Hashable, None]] = {}
+        self.fired_total = 0
+
+    def __len__(self) -> int:
+        return len(self.timers)
+
+    def schedule(self, kind: str, key: Hashable, delay: int) -> Timer:
+        """Fire (kind, key) in delay ticks (at least 1), replacing any earlier timer."""
+        self.due.get(kind, {}).pop(key, None)
+        timer = Timer(kind, key, self.tick + max(1, int(delay)))
+        self.timers[(kind, key)] = timer
+        self._file(timer)
+        return timer
+
+    def cancel(self, kind: str, key: Hashable) -> bool:
+        """Drop the timer for (kind, key), due or not. Returns True if there was one."""
+        pending = self.timers.pop((kind, key), None) is not None
+        fired = self.due.get(kind, {}).pop(key, 0) is None
+        return pending or fired
+
+    def clear(self, kind: Optional[str] = None) -> None:
+        """Drop every timer, or every timer of one kind."""
+        if kind is None:
+            self.timers.clear()
+            self.due.clear()
+            for level in self.levels:
+                for slot in level:
+                    slot.clear()
+            self.overflow.clear()
+            return
+        for timer_key in [k for k in self.timers if k[0] == kind]:
+            del self.timers[timer_key]
+        self.due.pop(kind, None)
+
+    def remaining(self, kind: str, key: Hashable) -> int:
+        """Ticks until (kind, key) fires; 0 if it has fired or isn't scheduled."""
+        timer = self.timers.get((kind, key))
+        return timer.deadline - self.tick if timer is not None else 0
+
+    def is_scheduled(self, kind: str, key: Hashable) -> bool:
+        return (kind, key) in self.timers
+
+    def pop_due(self, kind: str) -> List[Hashable]:
+        """Take the keys of kind that have come due since the last call."""
+        due = self.due.pop(kind, None)
+        return list(due) if due else []
+
+    def advance(self) -> int:
+        """Move to the next tick and collect what fires. Returns how many fired."""
+        self.tick += 1
+        tick = self.tick
+        # Cascade higher levels down when the level below wraps around
+        for level in range(1, WHEEL_LEVELS + 1):
+            if (tick >> (WHEEL_BITS * (level - 1))) & (WHEEL_SLOTS - 1):
+                break
+        else:
+            level = WHEEL_LEVELS + 1
+        for upper in range(min(level, WHEEL_LEVELS + 1) - 1, 0, -1):
+            self._cascade(upper)
+
+        slot = self.levels[0][tick & (WHEEL_SLOTS - 1)]
+        fired = 0
+        for timer in slot:
+            if self.timers.get((timer.kind, timer.key)) is timer:
+                del self.timers[(timer.kind, timer.key)]
+                self.due.setdefault(timer.kind, {})[timer.key] = None
+                fired += 1
+        slot.clear()
+        self.fired_total += fired
+        return fired
+
+    def _cascade(self, level: int) -> None:
+        """Re-file the current slot of level (or the overflow list) one level down."""
+        if level >= WHEEL_LEVELS:
+            timers, self.overflow = self.overflow, []
+        else:
+            index = (self.tick >> (WHEEL_BITS * level)) & (WHEEL_SLOTS - 1)
+            timers = self.levels[level][index]
+            self.levels[level][index] = []
+        for timer in timers:
+            if self.timers.get((timer.kind, timer.key)) is timer:
+                self._file(timer)
+
+    def _file(self, timer: Timer) -> None:
+        delta = timer.deadline - self.tick
+        for level in range(WHEEL_LEVELS):
+            if delta < 1 << (WHEEL_BITS * (level + 1)):
+                index = (timer.deadline >> (WHEEL_BITS * level)) & (WHEEL_SLOTS - 1)
+                self.levels[level][index].append(timer)
+                return
+        self.overflow.append(timer)
+
+    def get_stats(self) -> dict:
+        counts: Dict[str, int] = {}
+        for kind, _ in self.timers:
+            counts[kind] = counts.get(kind, 0) + 1
+        return {
+            "tick": self.tick,
+            "scheduled": len(self.timers),
+            "by_kind": counts,
+            "fired_total": self.fired_total,
+        }
+
+
+TIMERS = TimerWheel()
+
+
+def update_timers() -> None:
+    """Main loop hook: advance the shared wheel by one game tick."""
+    TIMERS.advance()
+
+
+def get_timer_stats() -> dict:
+    return TIMERS.get_stats()
@@ -5,7 +5,7 @@ Spawns training jobs at barracks during morning drill hours.
 Fighters prioritize training to improve combat skills.
 """
 
-from jobs import add_job, JOB_QUEUE
+from jobs import add_job, get_jobs_by_category
 from typing import List
 
 
@@ -50,7 +50,7 @@ def spawn_training_jobs(colonists: List, grid, game_tick: int) -> None:
         return  # No barracks built yet
     
     # Count existing training jobs
-    existing_training = sum(1 for j in JOB_QUEUE if j.category == "training" and not j.assigned)
+    existing_training = sum(1 for j in get_jobs_by_category("training") if not j.assigned)
     
     # Count fighters (colonists with fighter role)
     fighter_count = sum(1 for c in colonists if getattr(c, 'role', 'generalist') == "fighter")
@@ -222,6 +222,9 @@ class Dashboard:
             bold=True
         )
 
+        self._draw_path_scheduler_stats(game_data)
+        self._draw_job_assignment_stats(game_data)
+
         # 3. Navigation Rail
         self._draw_nav_rail(mouse_x, mouse_y)
 
@@ -247,6 +250,42 @@ class Dashboard:
         # 5. Detail Panel
         self._draw_detail_panel(game_data, mouse_x, mouse_y)
 
+    def _draw_path_scheduler_stats(self, game_data):
+        """Header readout of the path request queue and this tick's node budget."""
+        stats = game_data.get("path_scheduler")
+        if not stats:
+            return
+        used = stats.get("nodes_last_tick", 0)
+        budget = stats.get("node_budget", 0)
+        depth = stats.get("queue_depth", 0)
+        color = COLOR_WARNING if budget and used >= budget else COLOR_TEXT_DIM
+        arcade.draw_text(
+            f"PATH QUEUE {depth}  |  NODES {used}/{budget}  |  AVG WAIT {stats.get('avg_wait_ticks', 0.0):.1f}t",
+            self.screen_width - 20, self.screen_height - 38,
+            color,
+            font_size=11,
+            font_name=UI_FONT_MONO,
+            anchor_x="right"
+        )
+
+    def _draw_job_assignment_stats(self, game_data):
+        """Header readout of the batch job assignment phase."""
+        stats = game_data.get("job_assignment")
+        if not stats:
+            return
+        ms = stats.get("ms_last_tick", 0.0)
+        budget = stats.get("budget_ms", 0.0)
+        color = COLOR_WARNING if budget and ms >= budget else COLOR_TEXT_DIM
+        arcade.draw_text(
+            f"ASSIGN {ms:.2f}/{budget:.1f}ms  |  AVG WALK {stats.get('avg_distance', 0.0):.1f}  |  "
+            f"AVG IDLE {stats.get('avg_wait_ticks', 0.0):.1f}t",
+            self.screen_width - 20, self.screen_height - 54,
+            color,
+            font_size=11,
+            font_name=UI_FONT_MONO,
+            anchor_x="right"
+        )
+
     def _draw_nav_rail(self, mouse_x, mouse_y):
         """Draw left navigation tabs."""
         arcade.draw_lrbt_rectangle_filled(0, self.nav_width, 0, self.screen_height - self.header_height, COLOR_BG_DARK)
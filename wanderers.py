@@ -13,6 +13,7 @@ Wanderers are potential colonists who appear at map edges and can be recruited.
 import random
 from typing import Optional, List, Tuple
 from config import GRID_W, GRID_H
+from flow_fields import get_flow_fields
 
 # Wanderer state
 _wanderers: List[dict] = []
@@ -218,6 +219,7 @@ def _create_wanderer(colony_center: Tuple[int, int], grid) -> Optional[dict]:
 def update_wanderers(grid, colony_center: Tuple[int, int], game_tick: int) -> None:
     """Update all wanderers. Call once per tick."""
     to_remove = []
+    get_flow_fields(grid).set_static_sources("colony_center", [(colony_center[0], colony_center[1], 0)])
     
     for wanderer in _wanderers:
         colonist = wanderer["colonist"]
@@ -232,7 +234,7 @@ def update_wanderers(grid, colony_center: Tuple[int, int], game_tick: int) -> No
         
         if wanderer["state"] == "approaching":
             # Move toward colony center
-            _move_toward_target(colonist, wanderer["target"], grid)
+            _move_toward_target(colonist, wanderer["target"], grid, "colony_center", game_tick)
             
             # Check if close enough to wait
             dist = abs(colonist.x - colony_center[0]) + abs(colonist.y - colony_center[1])
@@ -256,7 +258,7 @@ def update_wanderers(grid, colony_center: Tuple[int, int], game_tick: int) -> No
         elif wanderer["state"] == "leaving":
             # Move toward map edge
             edge_target = _get_nearest_edge(colonist.x, colonist.y)
-            _move_toward_target(colonist, edge_target, grid)
+            _move_toward_target(colonist, edge_target, grid, "map_edge", game_tick)
             
             # Check if off map
             if colonist.x <= 2 or colonist.x >= GRID_W - 2 or colonist.y <= 2 or colonist.y >= GRID_H - 2:
@@ -268,12 +270,25 @@ def update_wanderers(grid, colony_center: Tuple[int, int], game_tick: int) -> No
         _wanderers.remove(w)
 
 
-def _move_toward_target(colonist, target: Tuple[int, int], grid) -> None:
-    """Simple movement toward target."""
+def _move_toward_target(colonist, target: Tuple[int, int], grid, group: str = None, game_tick: int = 0) -> None:
+    """Move one step toward target.
+    
+    With a flow field group ("colony_center", "map_edge") the step follows the
+    field downhill around walls; otherwise (or if the field has no usable step)
+    it falls back to a straight-line step.
+    """
     if colonist.move_cooldown > 0:
         colonist.move_cooldown -= 1
         return
     
+    if group is not None:
+        field = get_flow_fields(grid).get_field(group, game_tick)
+        step = field.next_step(colonist.x, colonist.y, 0) if field is not None else None
+        if step is not None and step[2] == 0 and grid.is_walkable(step[0], step[1], 0):
+            colonist.x, colonist.y = step[0], step[1]
+            colonist.move_cooldown = colonist.move_speed
+            return
+    
     tx, ty = target
     dx = 0 if colonist.x == tx else (1 if tx > colonist.x else -1)
     dy = 0 if colonist.y == ty else (1 if ty > colonist.y else -1)
@@ -463,6 +478,7 @@ def _create_fixer(colony_center: Tuple[int, int], grid) -> Optional[dict]:
 def update_fixers(grid, colony_center: Tuple[int, int], game_tick: int) -> None:
     """Update all fixers."""
     to_remove = []
+    get_flow_fields(grid).set_static_sources("colony_center", [(colony_center[0], colony_center[1], 0)])
     
     for fixer in _fixers:
         colonist = fixer["colonist"]
@@ -470,7 +486,7 @@ def update_fixers(grid, colony_center: Tuple[int, int], game_tick: int) -> None:
         fixer["y"] = colonist.y
         
         if fixer["state"] == "approaching":
-            _move_toward_target(colonist, fixer["target"], grid)
+            _move_toward_target(colonist, fixer["target"], grid, "colony_center", game_tick)
             
             dist = abs(colonist.x - colony_center[0]) + abs(colonist.y - colony_center[1])
             if dist < 15:
@@ -494,7 +510,7 @@ def update_fixers(grid, colony_center: Tuple[int, int], game_tick: int) -> None:
         
         elif fixer["state"] == "leaving":
             edge_target = _get_nearest_edge(colonist.x, colonist.y)
-            _move_toward_target(colonist, edge_target, grid)
+            _move_toward_target(colonist, edge_target, grid, "map_edge", game_tick)
             
             if colonist.x <= 2 or colonist.x >= GRID_W - 2 or colonist.y <= 2 or colonist.y >= GRID_H - 2:
                 to_remove.append(fixer)
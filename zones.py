@@ -18,6 +18,8 @@ All coordinates are 3D (x, y, z) to support multi-level buildings.
 
 from typing import Dict, List, Tuple, Optional, Set
 
+from path_regions import nearest_reachable
+
 Coord3D = Tuple[int, int, int]  # (x, y, z)
 
 
@@ -38,6 +40,15 @@ _TILE_TO_ZONE: Dict[Coord3D, int] = {}
 # Per-tile storage: {(x, y, z): {"type": "wood", "amount": 5}}
 _TILE_STORAGE: Dict[Coord3D, dict] = {}
 
+# Bumped whenever stock of a resource (or equipment item ID) is stored, so
+# consumers waiting for a resource can tell when to look again
+_STOCK_VERSIONS: Dict[str, int] = {}
+_STOCK_VERSION_TOTAL = 0
+
+# Bumped when stockpile space may have opened up (zone created, filter
+# changed, stock removed), so haul requests parked with no destination retry
+_ZONE_VERSION = 0
+
 # Tiles pending removal - items need to be relocated before zone is fully removed
 # Key: (x, y, z), Value: True if pending
 _PENDING_REMOVAL: Dict[Coord3D, bool] = {}
@@ -135,6 +146,7 @@ def create_stockpile_zone(tiles: List[Coord3D], grid=None, z: int = 0) -> int:
     # Register tiles
     for tile in valid_tiles:
         _TILE_TO_ZONE[tile] = zone_id
+    _bump_zone_version()
     
     return zone_id
 
@@ -261,11 +273,15 @@ def find_stockpile_tile_for_resource(resource_type: str, exclude_pending: bool =
     1. Nearest tile already storing this resource type with space
     2. Nearest empty stockpile tile
     
+    With a source position the nearest tile is found by walking distance
+    (path_regions.nearest_reachable), so stockpiles behind walls lose to ones
+    that are closer on foot and unreachable stockpiles are never chosen.
+    
     Args:
         resource_type: Type of resource to store
         exclude_pending: If True, exclude tiles marked for removal
-        z: If specified, prefer tiles on this Z-level
-        from_x, from_y: Source position for distance calculation (Manhattan)
+        z: If specified, prefer tiles on this Z-level (and the source's Z-level)
+        from_x, from_y: Source position for distance calculation
     
     Returns coordinates (x, y, z) of an available tile, or None if no space.
     """
@@ -311,11 +327,40 @@ def find_stockpile_tile_for_resource(resource_type: str, exclude_pending: bool =
     if not candidates:
         return None
     
+    if from_x is not None and from_y is not None:
+        return nearest_reachable((from_x, from_y, z if z is not None else 0), [c[2] for c in candidates])
+    
     # Sort by distance first, then by priority (same-type preferred at equal distance)
     candidates.sort(key=lambda x: (x[0], x[1]))
     return candidates[0][2]
 
 
+def _bump_stock_version(resource_type: str) -> None:
+    global _STOCK_VERSION_TOTAL
+    _STOCK_VERSIONS[resource_type] = _STOCK_VERSIONS.get(resource_type, 0) + 1
+    _STOCK_VERSION_TOTAL += 1
+
+
+def _bump_zone_version() -> None:
+    global _ZONE_VERSION
+    _ZONE_VERSION += 1
+
+
+def get_zone_version() -> int:
+    """Counter that changes whenever stockpile space may have opened up."""
+    return _ZONE_VERSION
+
+
+def get_stock_version(resource_type: str) -> int:
+    """Counter that changes whenever resource_type is stored in a stockpile.
+    
+    Tag searches ('@meat') use the counter for all stock.
+    """
+    if resource_type.startswith("@"):
+        return _STOCK_VERSION_TOTAL
+    return _STOCK_VERSIONS.get(resource_type, 0)
+
+
 def get_tile_storage(x: int, y: int, z: int = 0) -> Optional[dict]:
     """Get storage info for a stockpile tile."""
     return _TILE_STORAGE.get((x, y, z))
@@ -353,6 +398,7 @@ def add_to_tile_storage(x: int, y: int, z: int, resource_type: str, amount: int)
         # Empty tile - start new stack
         stored = min(amount, STOCKPILE_TILE_CAPACITY)
         _TILE_STORAGE[coord] = {"type": resource_type, "amount": stored}
+        _bump_stock_version(resource_type)
         return stored
     
     if storage.get("type") != resource_type:
@@ -364,6 +410,8 @@ def add_to_tile_storage(x: int, y: int, z: int, resource_type: str, amount: int)
     space = STOCKPILE_TILE_CAPACITY - current
     stored = min(amount, space)
     storage["amount"] = current + stored
+    if stored > 0:
+        _bump_stock_version(resource_type)
     return stored
 
 
@@ -388,6 +436,7 @@ def remove_from_tile_storage(x: int, y: int, z: int, amount: int) -> Optional[di
     storage["amount"] = current - removed
     if storage["amount"] <= 0:
         del _TILE_STORAGE[coord]
+    _bump_zone_version()
     
     return result
 
@@ -471,6 +520,7 @@ def store_equipment_at_tile(x: int, y: int, z: int, item: dict) -> bool:
         _EQUIPMENT_STORAGE[coord] = []
     
     _EQUIPMENT_STORAGE[coord].append(item)
+    _bump_stock_version(item.get("id", ""))
     return True
 
 
@@ -523,7 +573,8 @@ def get_all_zones() -> Dict[int, dict]:
     return _ZONES.copy()
 
 
-def find_stockpile_with_resource(resource_type: str, z: int = None, required_species: str = None) -> Optional[Coord3D]:
+def find_stockpile_with_resource(resource_type: str, z: int = None, required_species: str = None,
+                                 from_pos: Coord3D = None, prefer: Coord3D = None) -> Optional[Coord3D]:
     """Find a stockpile tile that has the specified resource.
     
     Used for construction supply - colonists need to fetch materials.
@@ -536,11 +587,14 @@ def find_stockpile_with_resource(resource_type: str, z: int = None, required_spe
         resource_type: Type of resource to find (e.g., 'wood', 'wire', 'chip', 'corpse', '@meat', '@vegetable')
         z: If specified, prefer tiles on this Z-level
         required_species: For corpses, filter by source_species metadata
+        from_pos: If given, return the matching tile nearest to it by walking
+            distance (path_regions.nearest_reachable) instead of any match
+        prefer: Tile to keep returning while it still matches (a colonist's
+            current target), so repeat lookups don't search again
     
     Returns coordinates (x, y, z) of a tile with the resource, or None.
     """
-    preferred = None
-    fallback = None
+    matches = []
     
     # Check if this is a tag-based search
     search_by_tag = resource_type.startswith("@")
@@ -552,13 +606,10 @@ def find_stockpile_with_resource(resource_type: str, z: int = None, required_spe
     if not search_by_tag:
         for coord, storage in _TILE_STORAGE.items():
             if storage.get("type") == resource_type and storage.get("amount", 0) > 0:
-                if z is not None and coord[2] == z:
-                    preferred = coord
-                elif fallback is None:
-                    fallback = coord
+                matches.append(coord)
         
-        if preferred or fallback:
-            return preferred or fallback
+        if matches:
+            return _pick_source(matches, z, from_pos, prefer)
     
     # If not found in tile storage, check equipment storage for component items
     # Components like wire, chip, resistor, etc. are stored as item objects
@@ -573,10 +624,7 @@ def find_stockpile_with_resource(resource_type: str, z: int = None, required_spe
                     if required_species and item.get("source_species") != required_species:
                         continue
                     
-                    if z is not None and coord[2] == z:
-                        preferred = coord
-                    elif fallback is None:
-                        fallback = coord
+                    matches.append(coord)
                     break  # Found at this coord, check next coord
             else:
                 # Exact ID match
@@ -585,13 +633,26 @@ def find_stockpile_with_resource(resource_type: str, z: int = None, required_spe
                     if required_species and item.get("source_species") != required_species:
                         continue
                     
-                    if z is not None and coord[2] == z:
-                        preferred = coord
-                    elif fallback is None:
-                        fallback = coord
+                    matches.append(coord)
                     break  # Found at this coord, check next coord
     
-    return preferred or fallback
+    if not matches:
+        return None
+    return _pick_source(matches, z, from_pos, prefer)
+
+
+def _pick_source(matches: List[Coord3D], z: Optional[int], from_pos: Optional[Coord3D],
+                 prefer: Optional[Coord3D] = None) -> Optional[Coord3D]:
+    """Choose among matching source tiles: nearest on foot to from_pos, else one on Z-level z."""
+    if prefer is not None and prefer in matches:
+        return prefer
+    if from_pos is not None:
+        return nearest_reachable(from_pos, matches)
+    if z is not None:
+        for coord in reversed(matches):
+            if coord[2] == z:
+                return coord
+    return matches[0]
 
 
 def get_total_stored(resource_type: str) -> int:
@@ -755,6 +816,7 @@ def set_zone_filter(zone_id: int, resource_type: str, allowed: bool) -> bool:
     
     filter_key = f"allow_{resource_type}"
     zone[filter_key] = allowed
+    _bump_zone_version()
     return True
 
 
@@ -770,6 +832,7 @@ def toggle_zone_filter(zone_id: int, resource_type: str) -> Optional[bool]:
     filter_key = f"allow_{resource_type}"
     current = zone.get(filter_key, True)
     zone[filter_key] = not current
+    _bump_zone_version()
     return not current
 
 
@@ -852,3 +915,5 @@ def load_save_state(state: dict):
         parts = key.split(",")
         coord = (int(parts[0]), int(parts[1]), int(parts[2]))
         _TILE_STORAGE[coord] = storage
+        _bump_stock_version(storage.get("type", ""))
+    _bump_zone_version()